@@ -0,0 +1 @@
+"""Benchmarks de desempenho (executar com ``python -m benchmarks.<modulo>``)."""
@@ -0,0 +1,110 @@
+"""Benchmark de concorrência dos serviços assíncronos.
+
+Compara o processamento sequencial síncrono com ``processar_e_salvar_async``
+em diferentes níveis de concorrência, medindo vazão e o maior atraso
+observado no event loop (um heartbeat de 1 ms roda em paralelo).
+
+Uso:
+    python -m benchmarks.bench_async --pedidos 5000 --concorrencia 1 10 100
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src.application.services.pedido_service import PedidoService
+from src.domain.models.cliente import Cliente
+from src.domain.services.produto_factory import ProdutoFactory
+from src.repositories.escritor_agrupado import ConfiguracaoEscrita
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+from src.repositories.repositorio_async import PedidoRepositoryAsync
+
+ITENS = [{"produto_tipo": "diesel", "quantidade": 600, "cupom_codigo": "MEGA10"}]
+
+
+def _clientes(total: int) -> list[Cliente]:
+    return [
+        Cliente(email=f"c{i}@empresa.com", nome=f"Cliente {i}", cnpj=f"{i:014d}")
+        for i in range(total)
+    ]
+
+
+def medir_sincrono(diretorio: Path, total: int) -> float:
+    repository = PedidoRepositoryArquivo(str(diretorio / "sync.txt"))
+    service = PedidoService(repository)
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    inicio = time.perf_counter()
+    for cliente in _clientes(total):
+        service.processar_e_salvar(cliente, ITENS, catalogo)
+    return time.perf_counter() - inicio
+
+
+async def _heartbeat(parar: asyncio.Event, atrasos: list[float]) -> None:
+    while not parar.is_set():
+        antes = time.perf_counter()
+        await asyncio.sleep(0.001)
+        atrasos.append(time.perf_counter() - antes - 0.001)
+
+
+async def medir_assincrono(
+    diretorio: Path, total: int, concorrencia: int, agrupado: bool
+) -> tuple[float, float]:
+    escrita = ConfiguracaoEscrita(intervalo=None) if agrupado else None
+    nome = f"async_{concorrencia}_{int(agrupado)}.txt"
+    repository = PedidoRepositoryArquivo(
+        str(diretorio / nome), ConfiguracaoArquivo(escrita=escrita)
+    )
+    service = PedidoService(repository, PedidoRepositoryAsync(repository))
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    fila = iter(_clientes(total))
+    atrasos: list[float] = []
+    parar = asyncio.Event()
+
+    async def trabalhador():
+        for cliente in fila:
+            await service.processar_e_salvar_async(cliente, ITENS, catalogo)
+
+    batimento = asyncio.create_task(_heartbeat(parar, atrasos))
+    inicio = time.perf_counter()
+    await asyncio.gather(*(trabalhador() for _ in range(concorrencia)))
+    duracao = time.perf_counter() - inicio
+    parar.set()
+    await batimento
+    await service.repository_async.aclose()
+    repository.close()
+    return duracao, max(atrasos, default=0.0)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pedidos", type=int, default=5000)
+    parser.add_argument("--concorrencia", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args(argv)
+
+    linhas = []
+    with TemporaryDirectory() as temp, open(os.devnull, "w", encoding="utf-8") as nulo:
+        diretorio = Path(temp)
+        with contextlib.redirect_stdout(nulo):
+            duracao = medir_sincrono(diretorio, args.pedidos)
+        linhas.append(("síncrono sequencial", duracao, None))
+        for agrupado in (False, True):
+            for concorrencia in args.concorrencia:
+                with contextlib.redirect_stdout(nulo):
+                    duracao, atraso = asyncio.run(
+                        medir_assincrono(diretorio, args.pedidos, concorrencia, agrupado)
+                    )
+                modo = "agrupado" if agrupado else "direto"
+                linhas.append((f"async c={concorrencia} ({modo})", duracao, atraso))
+
+    print(f"{'cenário':<28}{'pedidos/s':>12}{'atraso máx loop (ms)':>24}")
+    for cenario, duracao, atraso in linhas:
+        atraso_txt = "-" if atraso is None else f"{atraso * 1000:.2f}"
+        print(f"{cenario:<28}{args.pedidos / duracao:>12.0f}{atraso_txt:>24}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,191 @@
+"""Teste de estresse: vários processos gravando pedidos no mesmo arquivo.
+
+Cada processo grava ``--pedidos`` pedidos grandes (``--itens`` itens, mais
+de uma página por registro) com ``PedidoRepositoryArquivo.salvar``, no
+arquivo principal (trava por registro) ou em segmentos próprios
+(``--segmentos``). Ao final, confere que todos os pedidos estão no arquivo
+exatamente uma vez, íntegros, e que índice e totais por cliente batem.
+
+Uso:
+    python -m benchmarks.bench_concorrencia --processos 4 --pedidos 2000 [--segmentos]
+"""
+
+import argparse
+import contextlib
+import multiprocessing
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.produto_factory import ProdutoFactory
+from src.repositories.escritor_agrupado import ConfiguracaoEscrita
+from src.repositories.formatos import ERROS_DECODIFICACAO
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+
+
+@dataclass
+class ResultadoEstresse:
+    """Vazão alcançada e problemas encontrados na conferência."""
+
+    processos: int
+    pedidos: int
+    duracao: float
+    erros: list[str] = field(default_factory=list)
+
+    @property
+    def pedidos_por_segundo(self) -> float:
+        return self.pedidos / self.duracao if self.duracao else 0.0
+
+
+def _cnpj(escritor: int) -> str:
+    return f"{escritor:014d}"
+
+
+def _escrever(
+    caminho: str,
+    escritor: int,
+    quantidade: int,
+    itens: int,
+    segmentos: bool,
+    escrita: ConfiguracaoEscrita | None,
+    largada,
+) -> None:
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    repository = PedidoRepositoryArquivo(
+        caminho,
+        ConfiguracaoArquivo(
+            escrita=escrita, segmento=f"escritor-{escritor}" if segmentos else None
+        ),
+    )
+    largada.wait()
+    with open(os.devnull, "w", encoding="utf-8") as nulo, contextlib.redirect_stdout(nulo):
+        for sequencia in range(quantidade):
+            cliente = Cliente(
+                email=f"e{escritor}@empresa.com",
+                nome=f"escritor-{escritor}-{sequencia}",
+                cnpj=_cnpj(escritor),
+            )
+            pedido = Pedido(
+                cliente=cliente,
+                itens=[ItemPedido(catalogo["diesel"], 1 + sequencia, CupomFactory.criar("MEGA10"))]
+                * itens,
+            )
+            repository.salvar(pedido)
+        repository.close()
+
+
+def _conferir(caminho: Path, processos: int, quantidade: int, itens: int) -> list[str]:
+    repository = PedidoRepositoryArquivo(str(caminho))
+    erros = []
+    try:
+        registros = list(repository.iterar_registros())
+    except ERROS_DECODIFICACAO as error:
+        return [f"registro corrompido: {error}"]
+
+    vistos = Counter(dados["cliente"]["nome"] for dados in registros)
+    for escritor in range(processos):
+        for sequencia in range(quantidade):
+            ocorrencias = vistos.pop(f"escritor-{escritor}-{sequencia}", 0)
+            if ocorrencias != 1:
+                erros.append(f"escritor-{escritor}-{sequencia}: {ocorrencias} ocorrência(s)")
+    erros.extend(f"registro inesperado: {nome}" for nome in vistos)
+    erros.extend(
+        f"{dados['cliente']['nome']}: {len(dados['itens'])} itens"
+        for dados in registros
+        if len(dados["itens"]) != itens
+    )
+
+    for escritor in range(processos):
+        cnpj = _cnpj(escritor)
+        encontrados = len(repository.buscar_por_cliente(cnpj))
+        if encontrados != quantidade:
+            erros.append(f"índice de {cnpj}: {encontrados} pedidos")
+        agregado = repository.agregado_cliente(cnpj)
+        if agregado is None or agregado.pedidos != quantidade:
+            erros.append(f"totais de {cnpj}: {agregado and agregado.pedidos} pedidos")
+    return erros
+
+
+def estressar(
+    caminho: Path,
+    processos: int = 4,
+    pedidos_por_processo: int = 500,
+    itens_por_pedido: int = 40,
+    segmentos: bool = False,
+    escrita: ConfiguracaoEscrita | None = None,
+) -> ResultadoEstresse:
+    """Roda os escritores em paralelo sobre ``caminho`` e confere o resultado."""
+    PedidoRepositoryArquivo(str(caminho))
+    largada = multiprocessing.Event()
+    escritores = [
+        multiprocessing.Process(
+            target=_escrever,
+            args=(
+                str(caminho),
+                escritor,
+                pedidos_por_processo,
+                itens_por_pedido,
+                segmentos,
+                escrita,
+                largada,
+            ),
+        )
+        for escritor in range(processos)
+    ]
+    for processo in escritores:
+        processo.start()
+    inicio = time.perf_counter()
+    largada.set()
+    for processo in escritores:
+        processo.join()
+    duracao = time.perf_counter() - inicio
+
+    resultado = ResultadoEstresse(processos, processos * pedidos_por_processo, duracao)
+    resultado.erros.extend(
+        f"escritor {indice} saiu com código {processo.exitcode}"
+        for indice, processo in enumerate(escritores)
+        if processo.exitcode != 0
+    )
+    resultado.erros.extend(_conferir(caminho, processos, pedidos_por_processo, itens_por_pedido))
+    return resultado
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--pedidos", type=int, default=2000, help="Pedidos por processo")
+    parser.add_argument("--itens", type=int, default=40, help="Itens por pedido")
+    parser.add_argument("--segmentos", action="store_true", help="Um segmento por escritor")
+    parser.add_argument("--agrupada", action="store_true", help="Escrita agrupada (lotes)")
+    parser.add_argument("--diretorio", type=Path, help="Onde gerar o arquivo (padrão: temp)")
+    args = parser.parse_args(argv)
+
+    escrita = ConfiguracaoEscrita(intervalo=None) if args.agrupada else None
+    with TemporaryDirectory(dir=args.diretorio) as temp:
+        resultado = estressar(
+            Path(temp) / "pedidos.txt",
+            args.processos,
+            args.pedidos,
+            args.itens,
+            args.segmentos,
+            escrita,
+        )
+    modo = "segmentos" if args.segmentos else "arquivo único"
+    print(
+        f"{resultado.processos} processos ({modo}): {resultado.pedidos} pedidos em "
+        f"{resultado.duracao:.2f}s ({resultado.pedidos_por_segundo:.0f} pedidos/s)"
+    )
+    for erro in resultado.erros:
+        print(f"✗ {erro}")
+    return 1 if resultado.erros else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+"""Benchmark do custo dos eventos por pedido em gravações em massa.
+
+Mede ``PedidoService.processar_e_salvar`` (percentis por pedido) com os
+eventos escritos no console (um pipe com buffer de linha, lido por outro
+processo, como ao redirecionar a saída), gravados em JSON lines em segundo
+plano, filtrados por nível e silenciados.
+
+Uso:
+    python -m benchmarks.bench_eventos --pedidos 20000
+"""
+
+import argparse
+import contextlib
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks.suite import ResultadoBenchmark, medir
+from src.application.services.pedido_service import PedidoService
+from src.domain.models.cliente import Cliente
+from src.domain.services.produto_factory import ProdutoFactory
+from src.infrastructure.eventos import eventos_configurados
+from src.repositories.escritor_agrupado import ConfiguracaoEscrita
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+
+ITENS = [{"produto_tipo": "diesel", "quantidade": 600, "cupom_codigo": "MEGA10"}]
+
+
+def medir_cenario(
+    diretorio: Path, nome: str, total: int, nivel: str, jsonl: Path | None = None
+) -> ResultadoBenchmark:
+    repository = PedidoRepositoryArquivo(
+        str(diretorio / f"{nome}.txt"),
+        ConfiguracaoArquivo(escrita=ConfiguracaoEscrita(intervalo=None)),
+    )
+    service = PedidoService(repository)
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    cliente = Cliente(email="a@empresa.com", nome="TransLog", cnpj="11222333000181")
+
+    def processar() -> None:
+        service.processar_e_salvar(cliente, ITENS, catalogo)
+
+    with eventos_configurados(nivel, jsonl):
+        resultado = medir(nome, total, processar, amostras=total)
+    repository.close()
+    return resultado
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pedidos", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    resultados = []
+    with TemporaryDirectory() as temp:
+        diretorio = Path(temp)
+        leitor = subprocess.Popen(
+            [sys.executable, "-c", "import sys\nfor _ in sys.stdin: pass"],
+            stdin=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        cenarios = [
+            ("console", "debug", None),
+            ("jsonl_assincrono", "debug", diretorio / "eventos.jsonl"),
+            ("console_so_info", "info", None),
+            ("silencio", "silencio", None),
+        ]
+        with leitor, contextlib.redirect_stdout(leitor.stdin):
+            for nome, nivel, jsonl in cenarios:
+                resultados.append(medir_cenario(diretorio, nome, args.pedidos, nivel, jsonl))
+
+    print(f"{'cenário':<20}{'pedidos/s':>12}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}")
+    for r in resultados:
+        print(
+            f"{r.nome:<20}{r.ops_por_segundo:>12.0f}{r.p50_us:>10.1f}"
+            f"{r.p95_us:>10.1f}{r.p99_us:>10.1f}"
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark de memória por item: objetos ``Pedido`` vs ``PedidoBatch``.
+
+Mede com ``tracemalloc`` os bytes alocados por pedido (um item cada) ao
+manter um histórico em memória como lista de ``Pedido`` e como lote colunar.
+
+Uso:
+    python -m benchmarks.bench_memoria --pedidos 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.lote_pedidos import ItemPedidoBatch, PedidoBatch
+from src.domain.models.pedido import Pedido
+from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.precificacao_lote import PrecificadorLote
+from src.domain.services.produto_factory import ProdutoFactory
+
+CUPONS = (None, "MEGA10", None, "LUB2")
+
+
+def _medir(construir: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    resultado = construir()
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return atual
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pedidos", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    total = args.pedidos
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    tipos = list(catalogo)
+    clientes = [Cliente(email=f"c{i}@empresa.com", nome=f"C{i}", cnpj=str(i)) for i in range(100)]
+
+    def objetos() -> list[Pedido]:
+        return [
+            Pedido(
+                cliente=clientes[i % 100],
+                itens=[
+                    ItemPedido(
+                        produto=catalogo[tipos[i % 4]],
+                        quantidade=i % 2000 + 1,
+                        cupom=CupomFactory.criar(CUPONS[i % 4]),
+                    )
+                ],
+            )
+            for i in range(total)
+        ]
+
+    def lote_de_objetos() -> PedidoBatch:
+        return PedidoBatch.de_pedidos(
+            Pedido(
+                cliente=clientes[i % 100],
+                itens=[
+                    ItemPedido(
+                        produto=catalogo[tipos[i % 4]],
+                        quantidade=i % 2000 + 1,
+                        cupom=CupomFactory.criar(CUPONS[i % 4]),
+                    )
+                ],
+            )
+            for i in range(total)
+        )
+
+    def itens_precificados() -> ItemPedidoBatch:
+        return PrecificadorLote.precificar_itens(
+            [tipos[i % 4] for i in range(total)],
+            [i % 2000 + 1 for i in range(total)],
+            [CUPONS[i % 4] for i in range(total)],
+            catalogo,
+        )
+
+    cenarios = [
+        ("list[Pedido] (slots)", objetos),
+        ("PedidoBatch", lote_de_objetos),
+        ("PrecificadorLote.precificar_itens", itens_precificados),
+    ]
+    print(f"{'representação':<36}{'bytes/item':>12}")
+    for nome, construir in cenarios:
+        print(f"{nome:<36}{_medir(construir) / total:>12.1f}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark da latência de pedidos com notificações em destinos lentos.
+
+Mede ``PedidoService.processar_e_salvar`` (percentis por pedido) sem
+notificações, com o destino chamado na própria requisição e com o
+``DespachanteNotificacoes`` entregando a destinos rápidos e lentos em
+segundo plano. Com o despachante, a latência não deve depender do destino.
+
+Uso:
+    python -m benchmarks.bench_notificacoes --pedidos 2000 --atraso-ms 2
+"""
+
+import argparse
+import contextlib
+import os
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks.suite import ResultadoBenchmark, medir
+from src.application.services.notificacao_service import NotificacaoService
+from src.application.services.pedido_service import PedidoService
+from src.domain.models.cliente import Cliente
+from src.domain.services.produto_factory import ProdutoFactory
+from src.infrastructure.notificacoes import (
+    ConfiguracaoDespacho,
+    DespachanteNotificacoes,
+    DestinoNotificacao,
+    Notificacao,
+    PoliticaFilaCheia,
+)
+from src.repositories.escritor_agrupado import ConfiguracaoEscrita
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+
+# Metade dos pedidos passa do limite de alto valor (duas notificações)
+ITENS = (
+    [{"produto_tipo": "diesel", "quantidade": 600, "cupom_codigo": "MEGA10"}],
+    [{"produto_tipo": "diesel", "quantidade": 2000}],
+)
+
+
+class DestinoLento(DestinoNotificacao):
+    """Destino que leva ``atraso`` segundos por lote (ex.: webhook remoto)."""
+
+    nome = "lento"
+
+    def __init__(self, atraso: float):
+        self._atraso = atraso
+
+    def enviar(self, lote: list[Notificacao]) -> None:
+        if self._atraso:
+            time.sleep(self._atraso)
+
+
+class DespachoSincrono:
+    """Entrega cada notificação ao destino na própria chamada (sem fila)."""
+
+    def __init__(self, destino: DestinoNotificacao):
+        self._destino = destino
+
+    def publicar(self, notificacao: Notificacao) -> bool:
+        self._destino.enviar([notificacao])
+        return True
+
+
+def medir_cenario(diretorio: Path, nome: str, total: int, despachante=None) -> ResultadoBenchmark:
+    repository = PedidoRepositoryArquivo(
+        str(diretorio / f"{nome}.txt"),
+        ConfiguracaoArquivo(escrita=ConfiguracaoEscrita(intervalo=None)),
+    )
+    notificacoes = None if despachante is None else NotificacaoService(despachante)
+    service = PedidoService(repository, notificacoes=notificacoes)
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    cliente = Cliente(email="a@empresa.com", nome="TransLog", cnpj="11222333000181")
+    contador = iter(range(total))
+
+    def processar() -> None:
+        service.processar_e_salvar(cliente, ITENS[next(contador) % 2], catalogo)
+
+    resultado = medir(nome, total, processar, amostras=total)
+    repository.close()
+    return resultado
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pedidos", type=int, default=2000)
+    parser.add_argument("--atraso-ms", type=float, default=2.0, help="Atraso do destino lento")
+    args = parser.parse_args(argv)
+    atraso = args.atraso_ms / 1000
+
+    resultados = []
+    with TemporaryDirectory() as temp, open(os.devnull, "w", encoding="utf-8") as nulo:
+        diretorio = Path(temp)
+        cenarios = [
+            ("sem_notificacoes", lambda: None),
+            ("sincrono_destino_lento", lambda: DespachoSincrono(DestinoLento(atraso))),
+            ("despachante_destino_rapido", lambda: DespachanteNotificacoes([DestinoLento(0)])),
+            ("despachante_destino_lento", lambda: DespachanteNotificacoes([DestinoLento(atraso)])),
+            (
+                "despachante_lento_descartando",
+                lambda: DespachanteNotificacoes(
+                    [DestinoLento(atraso)],
+                    ConfiguracaoDespacho(capacidade=100, politica=PoliticaFilaCheia.DESCARTAR),
+                ),
+            ),
+        ]
+        for nome, criar in cenarios:
+            despachante = criar()
+            with contextlib.redirect_stdout(nulo):
+                resultados.append(medir_cenario(diretorio, nome, args.pedidos, despachante))
+            if isinstance(despachante, DespachanteNotificacoes):
+                despachante.fechar()
+
+    print(f"{'cenário':<32}{'pedidos/s':>12}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}")
+    for r in resultados:
+        print(
+            f"{r.nome:<32}{r.ops_por_segundo:>12.0f}{r.p50_us:>10.1f}"
+            f"{r.p95_us:>10.1f}{r.p99_us:>10.1f}"
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark de busca por CNPJ: varredura completa vs mmap vs índice.
+
+Gera um arquivo de pedidos com o tamanho pedido (``--mb``) e mede quanto
+cada estratégia leva para achar os pedidos de um CNPJ:
+- ``decodificar tudo``: ``formato.iterar`` decodificando todas as linhas
+- ``mmap``: ``PedidoRepositoryArquivo(config=ConfiguracaoArquivo(busca="mmap"))``
+- ``índice``: construção do sidecar e consulta com ele pronto
+
+Uso:
+    python -m benchmarks.bench_varredura --mb 2048 --formato jsonl
+"""
+
+import argparse
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks.suite import CLIENTES_POR_ARQUIVO, popular_pedidos
+from src.repositories.formatos import obter_formato
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+
+# Tamanho médio de um pedido de um item no formato jsonl
+_BYTES_POR_PEDIDO = 290
+
+
+def _cronometrar(funcao) -> tuple[float, int]:
+    inicio = time.perf_counter()
+    encontrados = funcao()
+    return time.perf_counter() - inicio, encontrados
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=int, default=256, help="Tamanho aproximado do arquivo")
+    parser.add_argument("--formato", default="jsonl")
+    parser.add_argument("--diretorio", type=Path, help="Onde gerar o arquivo (padrão: temp)")
+    args = parser.parse_args(argv)
+
+    with TemporaryDirectory(dir=args.diretorio) as temp:
+        caminho = Path(temp) / "pedidos.txt"
+        pedidos = args.mb * 1024 * 1024 // _BYTES_POR_PEDIDO
+        print(f"Gerando {pedidos} pedidos...", flush=True)
+        popular_pedidos(caminho, pedidos, formato=obter_formato(args.formato))
+        tamanho_mb = caminho.stat().st_size / 1024 / 1024
+        cnpj = f"{CLIENTES_POR_ARQUIVO // 2:014d}"
+
+        repository = PedidoRepositoryArquivo(str(caminho))
+        repository_mmap = PedidoRepositoryArquivo(str(caminho), ConfiguracaoArquivo(busca="mmap"))
+        formato, inicio = obter_formato(args.formato), len(obter_formato(args.formato).cabecalho)
+
+        def decodificar_tudo() -> int:
+            with caminho.open("rb") as file:
+                return sum(
+                    1 for _, _, d in formato.iterar(file, inicio) if d["cliente"]["cnpj"] == cnpj
+                )
+
+        cenarios = [
+            ("decodificar tudo", decodificar_tudo),
+            ("mmap", lambda: sum(1 for _ in repository_mmap.varrer_por_cnpj(cnpj))),
+            ("índice (construção + consulta)", lambda: len(repository.buscar_por_cliente(cnpj))),
+            ("índice (consulta)", lambda: len(repository.buscar_por_cliente(cnpj))),
+        ]
+        print(f"Arquivo: {tamanho_mb:.0f} MB, formato {args.formato}")
+        print(f"{'estratégia':<32}{'segundos':>10}{'MB/s':>10}{'pedidos':>10}")
+        for nome, funcao in cenarios:
+            duracao, encontrados = _cronometrar(funcao)
+            print(f"{nome:<32}{duracao:>10.3f}{tamanho_mb / duracao:>10.0f}{encontrados:>10}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
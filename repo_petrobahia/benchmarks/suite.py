@@ -0,0 +1,510 @@
+"""Suíte de benchmarks dos caminhos críticos.
+
+Mede vazão e percentis de latência de:
+- construção de ``ItemPedido`` (precificação)
+- ``ValidadorPedido.validar``
+- ``calcular_descontos_lote`` da política por faixas (1000 itens)
+- ``CupomFactory.criar``
+- ``ClienteValidator.validar_cnpj`` e ``validar_lote`` (10 000 linhas)
+- ``PedidoService.criar_pedido`` com métricas desligadas e ligadas
+- ``PedidoRepositoryArquivo.salvar``, ``buscar_por_cliente`` (``Pedido`` e views) e
+  ``varrer_por_cnpj`` (mmap)
+- ``buscar_pagina_por_cliente`` e ``listar_pagina`` a partir do meio do arquivo
+- ``buscar_por_periodo`` de uma janela com 1% dos pedidos (índice de tempo)
+- ``PedidoRepositoryParticionado``: compactação (gzip) do histórico migrado e
+  ``buscar_por_cliente`` sobre a parte compactada
+- ``ClienteRepositoryArquivo.buscar_por_cnpj``, ``salvar`` e ``cadastrar`` (novo e duplicado)
+- as mesmas operações nos repositórios SQLite (prefixo ``sqlite_``), sobre
+  um banco carregado com os mesmos arquivos pelo importador
+
+Os benchmarks de repositório rodam sobre arquivos pré-populados com cada
+tamanho pedido. Operações muito curtas são cronometradas em rajadas e a
+latência de cada amostra é o tempo da rajada dividido pelo seu tamanho.
+
+Uso:
+    python -m benchmarks.suite --tamanhos 1000 100000 1000000 --saida resultados.json
+    python -m benchmarks.suite --baseline resultados.json --tolerancia 0.15
+
+Com ``--baseline``, sai com código 1 se algum benchmark regrediu.
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable, Iterator
+
+from src.application.services.pedido_service import PedidoService
+from src.domain.exceptions import ClienteDuplicadoError
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.produto_factory import ProdutoFactory
+from src.domain.services.validar_cliente import ClienteValidator
+from src.domain.services.validar_pedido import ValidadorPedido
+from src.infrastructure.metricas import Metricas
+from src.repositories import migrar_particoes
+from src.repositories.cliente_repository import ClienteRepositoryArquivo
+from src.repositories.cliente_repository_sqlite import ClienteRepositorySQLite
+from src.repositories.formatos import FormatoRegistro, obter_formato
+from src.repositories.importar_sqlite import importar
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+from src.repositories.pedido_repository_particionado import PedidoRepositoryParticionado
+from src.repositories.pedido_repository_sqlite import PedidoRepositorySQLite
+from src.repositories.serializacao_pedido import pedido_para_dict
+
+TAMANHOS_PADRAO = (1_000, 100_000, 1_000_000)
+CLIENTES_POR_ARQUIVO = 1_000
+# Pedidos gerados são criados um por segundo a partir deste instante
+INICIO_PEDIDOS = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class ResultadoBenchmark:
+    """Medição de um benchmark em um tamanho de dados."""
+
+    nome: str
+    tamanho: int
+    operacoes: int
+    duracao: float
+    ops_por_segundo: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+
+    @property
+    def chave(self) -> str:
+        return f"{self.nome}@{self.tamanho}"
+
+    def para_dict(self) -> dict:
+        return asdict(self)
+
+
+def medir(
+    nome: str,
+    tamanho: int,
+    operacao: Callable[[], object],
+    amostras: int = 200,
+    rajada: int = 1,
+) -> ResultadoBenchmark:
+    """Executa ``operacao`` ``amostras * rajada`` vezes e resume as latências."""
+    latencias = []
+    inicio_total = time.perf_counter()
+    for _ in range(amostras):
+        inicio = time.perf_counter()
+        for _ in range(rajada):
+            operacao()
+        latencias.append((time.perf_counter() - inicio) / rajada)
+    duracao = time.perf_counter() - inicio_total
+    percentis = statistics.quantiles(latencias, n=100, method="inclusive")
+    operacoes = amostras * rajada
+    return ResultadoBenchmark(
+        nome=nome,
+        tamanho=tamanho,
+        operacoes=operacoes,
+        duracao=duracao,
+        ops_por_segundo=operacoes / duracao if duracao else float("inf"),
+        p50_us=percentis[49] * 1e6,
+        p95_us=percentis[94] * 1e6,
+        p99_us=percentis[98] * 1e6,
+    )
+
+
+def _cnpj(indice: int) -> str:
+    return f"{indice:014d}"
+
+
+def _cliente(indice: int) -> Cliente:
+    return Cliente(email=f"c{indice}@empresa.com", nome=f"Cliente {indice}", cnpj=_cnpj(indice))
+
+
+def popular_pedidos(
+    caminho: Path, tamanho: int, semente: int = 42, formato: FormatoRegistro | None = None
+) -> None:
+    """Gera um arquivo de pedidos com ``tamanho`` registros (jsonl por padrão)."""
+    aleatorio = random.Random(semente)
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    tipos = list(catalogo)
+    formato = formato or obter_formato("jsonl")
+    with caminho.open("wb") as file:
+        file.write(formato.cabecalho)
+        for indice in range(tamanho):
+            cliente = _cliente(aleatorio.randrange(CLIENTES_POR_ARQUIVO))
+            item = ItemPedido(
+                produto=catalogo[aleatorio.choice(tipos)],
+                quantidade=aleatorio.randrange(1, 2000),
+                cupom=CupomFactory.criar(aleatorio.choice((None, "MEGA10", "LUB2"))),
+            )
+            criado_em = INICIO_PEDIDOS + timedelta(seconds=indice)
+            pedido = Pedido(cliente=cliente, itens=[item], criado_em=criado_em)
+            file.write(formato.codificar(pedido_para_dict(pedido)))
+
+
+def popular_clientes(caminho: Path, tamanho: int) -> None:
+    """Gera um arquivo de clientes com ``tamanho`` registros no formato padrão."""
+    formato = obter_formato("jsonl")
+    with caminho.open("wb") as file:
+        file.write(formato.cabecalho)
+        for indice in range(tamanho):
+            cliente = _cliente(indice)
+            file.write(
+                formato.codificar(
+                    {"nome": cliente.nome, "email": cliente.email, "cnpj": cliente.cnpj}
+                )
+            )
+
+
+def _benchmarks_dominio() -> Iterator[ResultadoBenchmark]:
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    cupom = CupomFactory.criar("MEGA10")
+    produto = catalogo["diesel"]
+    pedido = Pedido(cliente=_cliente(1), itens=[ItemPedido(produto, 1200, cupom)])
+
+    yield medir(
+        "item_pedido", 1, lambda: ItemPedido(produto, 1200, cupom), amostras=500, rajada=200
+    )
+    yield medir(
+        "validar_pedido", 1, lambda: ValidadorPedido.validar(pedido), amostras=500, rajada=200
+    )
+    quantidades = [random.Random(3).randrange(1, 2000) for _ in range(1000)]
+    precos = [produto.preco] * len(quantidades)
+    yield medir(
+        "desconto_faixas_lote",
+        len(quantidades),
+        lambda: produto.politica_desconto.calcular_descontos_lote(precos, quantidades),
+        amostras=200,
+    )
+    yield medir("cupom_factory", 1, lambda: CupomFactory.criar("MEGA10"), amostras=500, rajada=200)
+    yield medir("cupom_factory_nulo", 1, lambda: CupomFactory.criar(None), amostras=500, rajada=200)
+    yield medir(
+        "validar_cnpj",
+        1,
+        lambda: ClienteValidator.validar_cnpj("12.345.678/0001-95"),
+        amostras=500,
+        rajada=200,
+    )
+    emails = [f"c{indice}@empresa.com" for indice in range(10_000)]
+    cnpjs = ["12.345.678/0001-95", "11222333000181", "11222333000182", "123"] * 2_500
+    yield medir(
+        "validar_lote",
+        len(cnpjs),
+        lambda: ClienteValidator.validar_lote(emails, cnpjs),
+        amostras=50,
+    )
+
+    itens = [{"produto_tipo": "diesel", "quantidade": 1200, "cupom_codigo": "MEGA10"}]
+    for nome, metricas in (
+        ("criar_pedido", Metricas()),
+        ("criar_pedido_com_metricas", Metricas(ativo=True)),
+    ):
+        service = PedidoService(None, metricas=metricas)
+        yield medir(
+            nome,
+            1,
+            lambda s=service: s.criar_pedido(pedido.cliente, itens, catalogo),
+            amostras=500,
+            rajada=50,
+        )
+
+
+def _benchmarks_repositorio(diretorio: Path, tamanho: int) -> Iterator[ResultadoBenchmark]:
+    aleatorio = random.Random(7)
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+
+    caminho_pedidos = diretorio / f"pedidos_{tamanho}.txt"
+    popular_pedidos(caminho_pedidos, tamanho)
+    pedido_repo = PedidoRepositoryArquivo(str(caminho_pedidos))
+    # Primeira consulta constrói o índice; medida separadamente
+    inicio = time.perf_counter()
+    pedido_repo.buscar_por_cliente(_cnpj(0))
+    duracao = time.perf_counter() - inicio
+    yield ResultadoBenchmark(
+        "pedido_indice_construcao", tamanho, 1, duracao, 1 / duracao, *[duracao * 1e6] * 3
+    )
+    yield medir(
+        "pedido_buscar_por_cliente",
+        tamanho,
+        lambda: pedido_repo.buscar_por_cliente(_cnpj(aleatorio.randrange(CLIENTES_POR_ARQUIVO))),
+        amostras=200,
+    )
+    # Página do meio do histórico: o custo não deve crescer com o arquivo
+    meio = pedido_repo.buscar_pagina_por_cliente(
+        _cnpj(0), max(1, tamanho // CLIENTES_POR_ARQUIVO // 2)
+    ).proximo
+    yield medir(
+        "pedido_pagina_por_cliente",
+        tamanho,
+        lambda: pedido_repo.buscar_pagina_por_cliente(_cnpj(0), 20, meio),
+        amostras=500,
+    )
+    # Janela com 1% dos pedidos em posição aleatória; a primeira consulta constrói o índice
+    janela = timedelta(seconds=max(1, tamanho // 100))
+    list(pedido_repo.buscar_por_periodo(INICIO_PEDIDOS, INICIO_PEDIDOS + janela))
+
+    def janela_aleatoria() -> tuple[datetime, datetime]:
+        inicio_janela = INICIO_PEDIDOS + timedelta(seconds=aleatorio.randrange(tamanho))
+        return inicio_janela, inicio_janela + janela
+
+    yield medir(
+        "pedido_buscar_por_periodo",
+        tamanho,
+        lambda: list(pedido_repo.buscar_por_periodo(*janela_aleatoria())),
+        amostras=100,
+    )
+    repo_visao = PedidoRepositoryArquivo(
+        str(caminho_pedidos), ConfiguracaoArquivo(hidratacao="visao")
+    )
+    yield medir(
+        "pedido_buscar_por_cliente_visao",
+        tamanho,
+        lambda: repo_visao.buscar_por_cliente(_cnpj(aleatorio.randrange(CLIENTES_POR_ARQUIVO))),
+        amostras=200,
+    )
+    repo_mmap = PedidoRepositoryArquivo(str(caminho_pedidos), ConfiguracaoArquivo(busca="mmap"))
+    yield medir(
+        "pedido_varredura_mmap",
+        tamanho,
+        lambda: list(repo_mmap.varrer_por_cnpj(_cnpj(aleatorio.randrange(CLIENTES_POR_ARQUIVO)))),
+        amostras=20,
+    )
+    pedido = Pedido(
+        cliente=_cliente(1), itens=[ItemPedido(catalogo["diesel"], 600, CupomFactory.criar(None))]
+    )
+    yield medir("pedido_salvar", tamanho, lambda: pedido_repo.salvar(pedido), amostras=500)
+
+    # O mesmo histórico como período encerrado de um repositório particionado
+    diretorio_particoes = diretorio / f"pedidos_{tamanho}.particoes"
+    migrar_particoes.migrar(caminho_pedidos, diretorio_particoes, "2020-01")
+    particionado = PedidoRepositoryParticionado(str(diretorio_particoes))
+    inicio = time.perf_counter()
+    particionado.compactar("gzip")
+    duracao = time.perf_counter() - inicio
+    yield ResultadoBenchmark(
+        "particionado_compactacao", tamanho, 1, duracao, 1 / duracao, *[duracao * 1e6] * 3
+    )
+    particionado.salvar(pedido)
+    yield medir(
+        "particionado_buscar_por_cliente",
+        tamanho,
+        lambda: particionado.buscar_por_cliente(_cnpj(aleatorio.randrange(CLIENTES_POR_ARQUIVO))),
+        amostras=200,
+    )
+
+    caminho_clientes = diretorio / f"clientes_{tamanho}.txt"
+    popular_clientes(caminho_clientes, min(tamanho, 100_000))
+    cliente_repo = ClienteRepositoryArquivo(str(caminho_clientes))
+    cliente_repo.buscar_por_cnpj(_cnpj(0))
+    cliente_repo.cnpj_cadastrado(_cnpj(0))
+    total_clientes = min(tamanho, 100_000)
+    yield medir(
+        "cliente_buscar_por_cnpj",
+        total_clientes,
+        lambda: cliente_repo.buscar_por_cnpj(_cnpj(aleatorio.randrange(total_clientes))),
+        amostras=500,
+        rajada=20,
+    )
+    yield medir(
+        "cliente_salvar", total_clientes, lambda: cliente_repo.salvar(_cliente(1)), amostras=500
+    )
+    meio_clientes = cliente_repo.listar_pagina(max(1, total_clientes // 2)).proximo
+    yield medir(
+        "cliente_listar_pagina",
+        total_clientes,
+        lambda: cliente_repo.listar_pagina(50, meio_clientes),
+        amostras=500,
+    )
+    novos = itertools.count(total_clientes)
+    yield medir(
+        "cliente_cadastrar_novo",
+        total_clientes,
+        lambda: cliente_repo.cadastrar(_cliente(next(novos))),
+        amostras=500,
+    )
+
+    def cadastrar_duplicado() -> None:
+        with contextlib.suppress(ClienteDuplicadoError):
+            cliente_repo.cadastrar(_cliente(aleatorio.randrange(total_clientes)))
+
+    yield medir(
+        "cliente_cadastrar_duplicado",
+        total_clientes,
+        cadastrar_duplicado,
+        amostras=500,
+        rajada=20,
+    )
+
+    banco = diretorio / f"petrobahia_{tamanho}.db"
+    inicio = time.perf_counter()
+    importar(banco, caminho_clientes, caminho_pedidos)
+    duracao = time.perf_counter() - inicio
+    yield ResultadoBenchmark(
+        "sqlite_importacao", tamanho, 1, duracao, 1 / duracao, *[duracao * 1e6] * 3
+    )
+    with PedidoRepositorySQLite(banco) as pedido_sqlite:
+        yield medir(
+            "sqlite_pedido_buscar_por_cliente",
+            tamanho,
+            lambda: pedido_sqlite.buscar_por_cliente(
+                _cnpj(aleatorio.randrange(CLIENTES_POR_ARQUIVO))
+            ),
+            amostras=200,
+        )
+        yield medir(
+            "sqlite_pedido_buscar_por_periodo",
+            tamanho,
+            lambda: list(pedido_sqlite.buscar_por_periodo(*janela_aleatoria())),
+            amostras=100,
+        )
+        yield medir(
+            "sqlite_pedido_salvar", tamanho, lambda: pedido_sqlite.salvar(pedido), amostras=500
+        )
+    with ClienteRepositorySQLite(banco) as cliente_sqlite:
+        yield medir(
+            "sqlite_cliente_buscar_por_cnpj",
+            total_clientes,
+            lambda: cliente_sqlite.buscar_por_cnpj(_cnpj(aleatorio.randrange(total_clientes))),
+            amostras=500,
+            rajada=20,
+        )
+        yield medir(
+            "sqlite_cliente_salvar",
+            total_clientes,
+            lambda: cliente_sqlite.salvar(_cliente(1)),
+            amostras=500,
+        )
+
+
+def executar_suite(
+    tamanhos: tuple[int, ...] = TAMANHOS_PADRAO,
+    filtro: str | None = None,
+    progresso: Callable[[ResultadoBenchmark], None] | None = None,
+) -> list[ResultadoBenchmark]:
+    """Roda todos os benchmarks e retorna os resultados."""
+    resultados = []
+
+    def registrar(resultado: ResultadoBenchmark) -> None:
+        if filtro and filtro not in resultado.nome:
+            return
+        resultados.append(resultado)
+        if progresso is not None:
+            progresso(resultado)
+
+    # Serviços e repositórios ainda escrevem no console a cada registro
+    with open(os.devnull, "w", encoding="utf-8") as nulo, TemporaryDirectory() as temp:
+        with contextlib.redirect_stdout(nulo):
+            resultados_dominio = list(_benchmarks_dominio())
+        for resultado in resultados_dominio:
+            registrar(resultado)
+        for tamanho in tamanhos:
+            with contextlib.redirect_stdout(nulo):
+                resultados_tamanho = list(_benchmarks_repositorio(Path(temp), tamanho))
+            for resultado in resultados_tamanho:
+                registrar(resultado)
+    return resultados
+
+
+@dataclass
+class Regressao:
+    """Diferença acima da tolerância em relação à baseline."""
+
+    chave: str
+    metrica: str
+    baseline: float
+    atual: float
+
+    @property
+    def variacao(self) -> float:
+        return (self.atual - self.baseline) / self.baseline if self.baseline else 0.0
+
+
+def comparar(
+    resultados: list[ResultadoBenchmark], baseline: dict, tolerancia: float = 0.10
+) -> list[Regressao]:
+    """Compara resultados com uma baseline gerada por ``para_json``.
+
+    Regressão: vazão abaixo de ``(1 - tolerancia)`` da baseline ou p95 acima
+    de ``(1 + tolerancia)``. Benchmarks ausentes na baseline são ignorados.
+    """
+    anteriores = {f"{r['nome']}@{r['tamanho']}": r for r in baseline.get("resultados", [])}
+    regressoes = []
+    for resultado in resultados:
+        anterior = anteriores.get(resultado.chave)
+        if anterior is None:
+            continue
+        if resultado.ops_por_segundo < anterior["ops_por_segundo"] * (1 - tolerancia):
+            regressoes.append(
+                Regressao(
+                    resultado.chave,
+                    "ops_por_segundo",
+                    anterior["ops_por_segundo"],
+                    resultado.ops_por_segundo,
+                )
+            )
+        if resultado.p95_us > anterior["p95_us"] * (1 + tolerancia):
+            regressoes.append(
+                Regressao(resultado.chave, "p95_us", anterior["p95_us"], resultado.p95_us)
+            )
+    return regressoes
+
+
+def para_json(resultados: list[ResultadoBenchmark]) -> dict:
+    """Monta o documento JSON de resultados (mesmo formato da baseline)."""
+    return {
+        "versao": 1,
+        "gerado_em": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "resultados": [r.para_dict() for r in resultados],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=list(TAMANHOS_PADRAO))
+    parser.add_argument("--filtro", help="Roda só benchmarks cujo nome contém o texto")
+    parser.add_argument("--saida", type=Path, help="Arquivo JSON de resultados")
+    parser.add_argument("--baseline", type=Path, help="Resultados anteriores para comparação")
+    parser.add_argument("--tolerancia", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'benchmark':<34}{'tamanho':>10}{'ops/s':>14}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}"
+    )
+
+    def progresso(r: ResultadoBenchmark) -> None:
+        print(
+            f"{r.nome:<34}{r.tamanho:>10}{r.ops_por_segundo:>14.0f}"
+            f"{r.p50_us:>10.1f}{r.p95_us:>10.1f}{r.p99_us:>10.1f}",
+            flush=True,
+        )
+
+    resultados = executar_suite(tuple(args.tamanhos), args.filtro, progresso)
+    if args.saida is not None:
+        args.saida.write_text(json.dumps(para_json(resultados), indent=2), encoding="utf-8")
+    if args.baseline is None:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressoes = comparar(resultados, baseline, args.tolerancia)
+    for regressao in regressoes:
+        print(
+            f"REGRESSÃO {regressao.chave} {regressao.metrica}: "
+            f"{regressao.baseline:.1f} -> {regressao.atual:.1f} ({regressao.variacao:+.0%})"
+        )
+    if not regressoes:
+        print(f"Sem regressões acima de {args.tolerancia:.0%}.")
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
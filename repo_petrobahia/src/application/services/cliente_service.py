@@ -1,29 +1,81 @@
 from typing import Iterable
 
+from src.application.services.notificacao_service import NotificacaoService
 from src.domain.models.cliente import Cliente
 from src.domain.services.validar_cliente import ClienteValidator
+from src.infrastructure.eventos import EVENTOS, RegistroEventos
 from src.repositories.interfaces.i_cliente_repository import IClienteRepository
+from src.repositories.interfaces.i_cliente_repository_async import IClienteRepositoryAsync
+from src.repositories.interfaces.pagina import Pagina
 
 
 class ClienteService:
     """Serviço de aplicação para gerenciar clientes.
 
     Orquestra operações de criação, validação e consulta de clientes.
+    Com ``notificacoes``, notifica cada cliente criado.
     """
 
-    def __init__(self, cliente_repository: IClienteRepository):
+    def __init__(
+        self,
+        cliente_repository: IClienteRepository,
+        cliente_repository_async: IClienteRepositoryAsync | None = None,
+        notificacoes: NotificacaoService | None = None,
+        eventos: RegistroEventos | None = None,
+    ):
         self.cliente_repository = cliente_repository
+        self._cliente_repository_async = cliente_repository_async
+        self._notificacoes = notificacoes
+        self._eventos = eventos if eventos is not None else EVENTOS
+
+    @property
+    def cliente_repository_async(self) -> IClienteRepositoryAsync:
+        """Repositório assíncrono usado por ``criar_cliente_async``.
+
+        Raises:
+            RuntimeError: Se o serviço foi criado sem ``cliente_repository_async``
+        """
+        if self._cliente_repository_async is None:
+            raise RuntimeError("ClienteService criado sem cliente_repository_async.")
+        return self._cliente_repository_async
 
     def criar_cliente(self, email: str, nome: str, cnpj: str) -> Cliente:
-        """Cria e persiste um cliente após validações."""
+        """Cria e persiste um cliente após validações.
+
+        Raises:
+            ValidationError: Se e-mail ou CNPJ forem inválidos
+            ClienteDuplicadoError: Se o CNPJ já estiver cadastrado
+        """
+        cliente = self._validar_e_montar(email, nome, cnpj)
+        self.cliente_repository.cadastrar(cliente)
+        self._eventos.debug("cliente_criado", "Cliente criado: {cnpj}", cnpj=cnpj)
+        if self._notificacoes is not None:
+            self._notificacoes.notificar_cliente_criado(cliente)
+        return cliente
+
+    async def criar_cliente_async(self, email: str, nome: str, cnpj: str) -> Cliente:
+        """Versão assíncrona de ``criar_cliente``; a E/S não bloqueia o event loop."""
+        cliente = self._validar_e_montar(email, nome, cnpj)
+        await self.cliente_repository_async.cadastrar(cliente)
+        self._eventos.debug("cliente_criado", "Cliente criado: {cnpj}", cnpj=cnpj)
+        if self._notificacoes is not None:
+            self._notificacoes.notificar_cliente_criado(cliente)
+        return cliente
+
+    @staticmethod
+    def _validar_e_montar(email: str, nome: str, cnpj: str) -> Cliente:
         ClienteValidator.validar_email(email)
         ClienteValidator.validar_cnpj(cnpj)
+        return Cliente(email=email, nome=nome, cnpj=cnpj)
 
-        cliente = Cliente(email=email, nome=nome, cnpj=cnpj)
-        self.cliente_repository.salvar(cliente)
-        print(f"Cliente criado: {cnpj}")
-        return cliente
+    def buscar_por_cnpj(self, cnpj: str) -> Cliente | None:
+        """Retorna o cliente com o CNPJ informado, ou None."""
+        return self.cliente_repository.buscar_por_cnpj(cnpj)
 
     def listar_todos(self) -> Iterable[Cliente]:
         """Retorna todos os clientes cadastrados."""
         return self.cliente_repository.listar()
+
+    def listar_pagina(self, limite: int, cursor: str | None = None) -> Pagina[Cliente]:
+        """Página de clientes; passe ``pagina.proximo`` para a seguinte."""
+        return self.cliente_repository.listar_pagina(limite, cursor)
@@ -0,0 +1,220 @@
+"""Importação em massa de clientes e pedidos (Application Service).
+
+Os pedidos são lidos em lotes de linhas e distribuídos para um pool de
+processos, que precificam e validam via ``MontadorPedido.montar``.
+O processo principal é o único escritor: persiste os pedidos aceitos na
+ordem do arquivo de entrada e registra as linhas rejeitadas (com o erro)
+em um arquivo JSON lines.
+"""
+
+import csv
+import json
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Iterator
+
+from src.domain.exceptions import ValidationError
+from src.domain.models.cliente import Cliente
+from src.domain.models.pedido import Pedido
+from src.domain.services.montagem_pedido import MontadorPedido
+from src.domain.services.produto_factory import ProdutoFactory
+from src.domain.services.validar_cliente import ClienteValidator, normalizar_cnpj
+from src.infrastructure.eventos import LOGGER, Nivel, nivel_minimo
+from src.repositories.interfaces.i_cliente_repository import IClienteRepository
+from src.repositories.interfaces.i_pedido_repository import IPedidoRepository
+
+# (número da linha, pedido aceito, erro, linha original)
+ResultadoLinha = tuple[int, Pedido | None, str | None, str]
+
+_contexto: dict = {}
+
+
+def _chave_cliente(cnpj) -> str | None:
+    # Mesma chave do índice de unicidade: CNPJ com ou sem pontuação
+    if not isinstance(cnpj, str):
+        return None
+    return normalizar_cnpj(cnpj) or cnpj
+
+
+def _preparar_contexto(clientes: dict[str, tuple[str, str, str]]) -> None:
+    _contexto["clientes"] = {
+        chave: Cliente(email=email, nome=nome, cnpj=cnpj)
+        for chave, (email, nome, cnpj) in clientes.items()
+    }
+    _contexto["catalogo"] = ProdutoFactory.criar_catalogo_padrao()
+
+
+def _inicializar_worker(clientes: dict[str, tuple[str, str, str]]) -> None:
+    # Workers também descartam os eventos por pedido (ver ``importar``)
+    LOGGER.setLevel(max(LOGGER.getEffectiveLevel(), Nivel.INFO))
+    _preparar_contexto(clientes)
+
+
+def _processar_lote(linhas: list[tuple[int, str]]) -> list[ResultadoLinha]:
+    # Workers só precificam e validam; a persistência fica com o processo principal
+    resultados: list[ResultadoLinha] = []
+    for numero, linha in linhas:
+        try:
+            dados = json.loads(linha)
+            cliente = _contexto["clientes"].get(_chave_cliente(dados.get("cnpj")))
+            if cliente is None:
+                raise ValueError(f"Cliente '{dados.get('cnpj')}' não encontrado.")
+            pedido = MontadorPedido.montar(cliente, dados.get("itens"), _contexto["catalogo"])
+            resultados.append((numero, pedido, None, linha))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            resultados.append((numero, None, f"{type(error).__name__}: {error}", linha))
+    return resultados
+
+
+@dataclass
+class ResumoImportacao:
+    """Contadores de uma execução de importação."""
+
+    clientes_importados: int = 0
+    clientes_rejeitados: int = 0
+    pedidos_importados: int = 0
+    pedidos_rejeitados: int = 0
+    duracao: float = 0.0
+
+
+class ImportacaoService:
+    """Importa arquivos de clientes (CSV) e pedidos (JSON lines).
+
+    Clientes com CNPJ já cadastrado (inclusive por linha anterior do mesmo
+    arquivo) são rejeitados.
+
+    Formato de cada linha de pedidos:
+        {"cnpj": "...", "itens": [{"produto_tipo": "...", "quantidade": 1,
+         "cupom_codigo": null}]}
+    """
+
+    def __init__(
+        self, cliente_repository: IClienteRepository, pedido_repository: IPedidoRepository
+    ):
+        self._cliente_repository = cliente_repository
+        self._pedido_repository = pedido_repository
+
+    def importar(
+        self,
+        caminho_clientes: Path | None,
+        caminho_pedidos: Path | None,
+        caminho_rejeitados: Path,
+        workers: int = 1,
+        tamanho_lote: int = 1000,
+    ) -> ResumoImportacao:
+        """Importa clientes e depois pedidos, gravando rejeições.
+
+        Args:
+            caminho_clientes: CSV com colunas nome, email, cnpj (opcional)
+            caminho_pedidos: JSON lines de pedidos (opcional)
+            caminho_rejeitados: Destino das linhas rejeitadas
+            workers: Processos de precificação; 1 processa no próprio processo
+            tamanho_lote: Linhas de pedidos enviadas por tarefa ao pool (e de
+                clientes validadas por vez com ``ClienteValidator.validar_lote``)
+        """
+        if workers < 1 or tamanho_lote < 1:
+            raise ValueError("workers e tamanho_lote devem ser positivos.")
+
+        inicio = time.perf_counter()
+        resumo = ResumoImportacao()
+        clientes = {
+            _chave_cliente(c.cnpj): (c.email, c.nome, c.cnpj)
+            for c in self._cliente_repository.listar()
+        }
+        # Eventos por registro (nível DEBUG) não interessam em importações em massa
+        with caminho_rejeitados.open("w", encoding="utf-8") as rejeitados, nivel_minimo(Nivel.INFO):
+            if caminho_clientes is not None:
+                self._importar_clientes(
+                    caminho_clientes, clientes, rejeitados, resumo, tamanho_lote
+                )
+            if caminho_pedidos is not None:
+                self._importar_pedidos(
+                    caminho_pedidos, clientes, rejeitados, resumo, workers, tamanho_lote
+                )
+        resumo.duracao = time.perf_counter() - inicio
+        return resumo
+
+    def _importar_clientes(
+        self, caminho: Path, clientes: dict, rejeitados, resumo, tamanho_lote: int
+    ) -> None:
+        with caminho.open("r", encoding="utf-8", newline="") as file:
+            linhas = enumerate(csv.DictReader(file), start=2)
+            while lote := list(islice(linhas, tamanho_lote)):
+                validacao = ClienteValidator.validar_lote(
+                    [linha.get("email") for _, linha in lote],
+                    [linha.get("cnpj") for _, linha in lote],
+                )
+                for indice, (numero, linha) in enumerate(lote):
+                    try:
+                        if validacao.erros[indice]:
+                            raise ValidationError(" ".join(validacao.mensagens(indice)))
+                        cliente = Cliente(
+                            email=linha["email"], nome=linha["nome"], cnpj=linha["cnpj"]
+                        )
+                        self._cliente_repository.cadastrar(cliente)
+                    except Exception as error:  # pylint: disable=broad-exception-caught
+                        self._rejeitar(rejeitados, "clientes", numero, error, linha)
+                        resumo.clientes_rejeitados += 1
+                        continue
+                    clientes[_chave_cliente(cliente.cnpj)] = (
+                        cliente.email,
+                        cliente.nome,
+                        cliente.cnpj,
+                    )
+                    resumo.clientes_importados += 1
+
+    def _importar_pedidos(
+        self, caminho: Path, clientes: dict, rejeitados, resumo, workers: int, tamanho_lote: int
+    ) -> None:
+        with caminho.open("r", encoding="utf-8") as file:
+            lotes = self._lotes(file, tamanho_lote)
+            if workers == 1:
+                _preparar_contexto(clientes)
+                for lote in lotes:
+                    self._gravar(_processar_lote(lote), rejeitados, resumo)
+                return
+
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_inicializar_worker, initargs=(clientes,)
+            ) as pool:
+                # Limita lotes em voo para manter a memória constante
+                em_voo: deque[Future] = deque()
+                for lote in lotes:
+                    em_voo.append(pool.submit(_processar_lote, lote))
+                    if len(em_voo) >= workers * 2:
+                        self._gravar(em_voo.popleft().result(), rejeitados, resumo)
+                while em_voo:
+                    self._gravar(em_voo.popleft().result(), rejeitados, resumo)
+
+    def _gravar(self, resultados: list[ResultadoLinha], rejeitados, resumo) -> None:
+        for numero, pedido, erro, linha in resultados:
+            if pedido is None:
+                self._rejeitar(rejeitados, "pedidos", numero, erro, linha)
+                resumo.pedidos_rejeitados += 1
+                continue
+            try:
+                self._pedido_repository.salvar(pedido)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self._rejeitar(rejeitados, "pedidos", numero, error, linha)
+                resumo.pedidos_rejeitados += 1
+                continue
+            resumo.pedidos_importados += 1
+
+    @staticmethod
+    def _lotes(file, tamanho_lote: int) -> Iterator[list[tuple[int, str]]]:
+        linhas = (
+            (numero, linha.rstrip("\n"))
+            for numero, linha in enumerate(file, start=1)
+            if linha.strip()
+        )
+        while lote := list(islice(linhas, tamanho_lote)):
+            yield lote
+
+    @staticmethod
+    def _rejeitar(rejeitados, origem: str, numero: int, erro, dados) -> None:
+        registro = {"origem": origem, "linha": numero, "erro": str(erro), "dados": dados}
+        rejeitados.write(json.dumps(registro, ensure_ascii=False) + "\n")
@@ -2,25 +2,72 @@
 
 from src.domain.models.cliente import Cliente
 from src.domain.models.pedido import Pedido
+from src.infrastructure.eventos import EVENTOS, Nivel, RegistroEventos
+from src.infrastructure.notificacoes import DespachanteNotificacoes, Notificacao
 
 
 class NotificacaoService:
-    """Application Service para notificações simples via console."""
+    """Application Service para notificações de clientes e pedidos.
 
-    @staticmethod
-    def notificar_cliente_criado(cliente: Cliente) -> None:
+    Com ``despachante``, as notificações são só enfileiradas e entregues em
+    segundo plano aos destinos dele. Sem despachante, viram eventos em
+    ``eventos`` (``EVENTOS`` por padrão), escritos pelos handlers do logger
+    na própria chamada.
+
+    Args:
+        despachante: Quem entrega as notificações; não é fechado pelo serviço
+        eventos: Registro de eventos usado sem despachante
+    """
+
+    def __init__(
+        self,
+        despachante: DespachanteNotificacoes | None = None,
+        eventos: RegistroEventos | None = None,
+    ):
+        self._despachante = despachante
+        self._eventos = eventos if eventos is not None else EVENTOS
+
+    def notificar_cliente_criado(self, cliente: Cliente) -> None:
         """Notifica sobre novo cliente cadastrado."""
-        print(f"✓ Cliente cadastrado: {cliente.nome} ({cliente.email})")
+        self._publicar(
+            Notificacao(
+                "cliente_criado",
+                f"✓ Cliente cadastrado: {cliente.nome} ({cliente.email})",
+                {"cnpj": cliente.cnpj, "nome": cliente.nome, "email": cliente.email},
+            )
+        )
 
-    @staticmethod
-    def notificar_pedido_criado(pedido: Pedido) -> None:
+    def notificar_pedido_criado(self, pedido: Pedido) -> None:
         """Notifica sobre novo pedido criado."""
-        print(f"✓ Pedido criado para {pedido.cliente.nome}: R$ {pedido.preco_total:.2f}")
+        self._publicar(
+            Notificacao(
+                "pedido_criado",
+                f"✓ Pedido criado para {pedido.cliente.nome}: R$ {pedido.preco_total:.2f}",
+                self._dados_pedido(pedido),
+            )
+        )
 
-    @staticmethod
-    def notificar_pedido_valor_alto(pedido: Pedido, limite: float = 5000.0) -> None:
+    def notificar_pedido_valor_alto(self, pedido: Pedido, limite: float = 5000.0) -> None:
         """Alerta sobre pedido de alto valor."""
         if pedido.preco_total >= limite:
-            print(
-                f"⚠ ALERTA: Pedido de alto valor - {pedido.cliente.nome}: R$ {pedido.preco_total:.2f}"
+            self._publicar(
+                Notificacao(
+                    "pedido_valor_alto",
+                    f"⚠ ALERTA: Pedido de alto valor - {pedido.cliente.nome}: "
+                    f"R$ {pedido.preco_total:.2f}",
+                    {**self._dados_pedido(pedido), "limite": limite},
+                ),
+                Nivel.AVISO,
             )
+
+    @staticmethod
+    def _dados_pedido(pedido: Pedido) -> dict:
+        return {"cnpj": pedido.cliente.cnpj, "preco_total": pedido.preco_total}
+
+    def _publicar(self, notificacao: Notificacao, nivel: Nivel = Nivel.INFO) -> None:
+        if self._despachante is not None:
+            self._despachante.publicar(notificacao)
+            return
+        # A mensagem já vem pronta: chaves escapadas sobrevivem ao ``format`` dos eventos
+        mensagem = notificacao.mensagem.replace("{", "{{").replace("}", "}}")
+        self._eventos.emitir(nivel, notificacao.tipo, mensagem, **notificacao.dados)
@@ -1,10 +1,27 @@
+from datetime import datetime
+from time import perf_counter
+from typing import Iterator, Sequence
+
+from src.application.services.notificacao_service import NotificacaoService
 from src.domain.models.cliente import Cliente
 from src.domain.models.item_pedido import ItemPedido
 from src.domain.models.pedido import Pedido
 from src.domain.models.produto import Produto
 from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.montagem_pedido import MontadorPedido
+from src.domain.services.precificacao_lote import PrecificadorLote, ResultadoLote
 from src.domain.services.validar_pedido import ValidadorPedido
+from src.infrastructure.eventos import EVENTOS, RegistroEventos
+from src.infrastructure.metricas import (
+    ETAPA_PEDIDO,
+    METRICAS,
+    PEDIDOS_CRIADOS,
+    PEDIDOS_REJEITADOS,
+    Metricas,
+)
 from src.repositories.interfaces.i_pedido_repository import IPedidoRepository
+from src.repositories.interfaces.i_pedido_repository_async import IPedidoRepositoryAsync
+from src.repositories.interfaces.pagina import Pagina
 
 
 class PedidoService:
@@ -12,10 +29,40 @@ class PedidoService:
 
     Orquestra criação de pedidos, aplicação de cupons, validações e persistência.
     Segue princípios SOLID: SRP (responsabilidade única), DIP (depende de interface).
+
+    Com ``metricas`` ativas, registra o tempo de cada etapa de
+    ``criar_pedido`` (catalogo, cupom, precificacao, validacao) e de
+    ``salvar`` em ``petrobahia_pedido_etapa_segundos``.
     """
 
-    def __init__(self, pedido_repository: IPedidoRepository):
+    def __init__(
+        self,
+        pedido_repository: IPedidoRepository,
+        pedido_repository_async: IPedidoRepositoryAsync | None = None,
+        metricas: Metricas | None = None,
+        notificacoes: NotificacaoService | None = None,
+        eventos: RegistroEventos | None = None,
+    ):
         self._repository = pedido_repository
+        self._repository_async = pedido_repository_async
+        self._metricas = metricas if metricas is not None else METRICAS
+        self._notificacoes = notificacoes
+        self._eventos = eventos if eventos is not None else EVENTOS
+        self._etapas = {
+            etapa: self._metricas.histograma(ETAPA_PEDIDO, etapa=etapa)
+            for etapa in ("catalogo", "cupom", "precificacao", "validacao", "salvar")
+        }
+
+    @property
+    def repository_async(self) -> IPedidoRepositoryAsync:
+        """Repositório assíncrono usado pelos métodos ``*_async``.
+
+        Raises:
+            RuntimeError: Se o serviço foi criado sem ``pedido_repository_async``
+        """
+        if self._repository_async is None:
+            raise RuntimeError("PedidoService criado sem pedido_repository_async.")
+        return self._repository_async
 
     def criar_pedido(
         self,
@@ -37,47 +84,167 @@ class PedidoService:
             ValueError: Se produto não existir no catálogo ou dados inválidos
             ValidationError: Se regras de negócio forem violadas
         """
-        if not cliente:
-            raise ValueError("Cliente deve ser informado.")
-        if not itens_dados:
-            raise ValueError("Pedido deve ter ao menos um item.")
+        try:
+            pedido = self._montar_pedido(cliente, itens_dados, catalogo_produtos)
+        except Exception as error:
+            self._metricas.incrementar(PEDIDOS_REJEITADOS, motivo=type(error).__name__)
+            raise
+        self._metricas.incrementar(PEDIDOS_CRIADOS)
+
+        self._eventos.debug(
+            "pedido_criado",
+            "Pedido criado para {nome} com total: {total:.2f}",
+            nome=cliente.nome,
+            cnpj=cliente.cnpj,
+            total=pedido.preco_total,
+        )
+        return pedido
+
+    def _montar_pedido(
+        self,
+        cliente: Cliente,
+        itens_dados: list[dict],
+        catalogo_produtos: dict[str, Produto],
+    ) -> Pedido:
+        # Com métricas desligadas, nenhuma leitura de relógio é feita
+        if not self._metricas.ativo:
+            return MontadorPedido.montar(cliente, itens_dados, catalogo_produtos)
 
+        MontadorPedido.validar_entrada(cliente, itens_dados)
+        catalogo = cupons = precificacao = 0.0
         itens = []
         for dados in itens_dados:
-            produto_tipo = dados.get("produto_tipo")
-            quantidade = dados.get("quantidade")
-            cupom_codigo = dados.get("cupom_codigo")
-
-            if not produto_tipo or quantidade is None:
-                raise ValueError("Item deve ter produto_tipo e quantidade.")
-
-            produto = catalogo_produtos.get(produto_tipo)
-            if not produto:
-                raise ValueError(f"Produto '{produto_tipo}' não encontrado no catálogo.")
+            produto_tipo, quantidade, cupom_codigo = MontadorPedido.ler_item(dados)
 
+            inicio = perf_counter()
+            produto = MontadorPedido.produto(catalogo_produtos, produto_tipo)
+            apos_catalogo = perf_counter()
             cupom = CupomFactory.criar(cupom_codigo)
-            item = ItemPedido(produto=produto, quantidade=quantidade, cupom=cupom)
-            itens.append(item)
+            apos_cupom = perf_counter()
+            itens.append(ItemPedido(produto=produto, quantidade=quantidade, cupom=cupom))
+            fim = perf_counter()
+
+            catalogo += apos_catalogo - inicio
+            cupons += apos_cupom - apos_catalogo
+            precificacao += fim - apos_cupom
 
         pedido = Pedido(cliente=cliente, itens=itens)
 
         # Validação de regras de negócio
+        inicio = perf_counter()
         ValidadorPedido.validar(pedido)
+        validacao = perf_counter() - inicio
+        self._etapas["catalogo"].observar(catalogo)
+        self._etapas["cupom"].observar(cupons)
+        self._etapas["precificacao"].observar(precificacao)
+        self._etapas["validacao"].observar(validacao)
 
-        print(f"Pedido criado para {cliente.nome} com total: {pedido.preco_total:.2f}")
         return pedido
 
+    def precificar_lote(
+        self,
+        produtos_tipos: Sequence[str],
+        quantidades: Sequence[int],
+        cupons_codigos: Sequence[str | None],
+        catalogo_produtos: dict[str, Produto],
+    ) -> ResultadoLote:
+        """Precifica um lote de itens sem instanciar ``ItemPedido``.
+
+        Args:
+            produtos_tipos: Coluna com o tipo de produto de cada item
+            quantidades: Coluna com as quantidades
+            cupons_codigos: Coluna com o código de cupom (ou None) de cada item
+            catalogo_produtos: Mapa de tipo de produto para instância Produto
+
+        Returns:
+            Colunas preco_unitario, preco_bruto, desconto_produto,
+            desconto_cupom e preco_final, na ordem das entradas
+
+        Raises:
+            ValueError: Se colunas divergirem, produto não existir ou quantidade inválida
+        """
+        return PrecificadorLote.precificar(
+            produtos_tipos, quantidades, cupons_codigos, catalogo_produtos
+        )
+
     def processar_e_salvar(
         self,
         cliente: Cliente,
         itens_dados: list[dict],
         catalogo_produtos: dict[str, Produto],
     ) -> Pedido:
-        """Cria e persiste um pedido."""
+        """Cria e persiste um pedido e, com ``notificacoes``, notifica a criação."""
         pedido = self.criar_pedido(cliente, itens_dados, catalogo_produtos)
-        self._repository.salvar(pedido)
+        if not self._metricas.ativo:
+            self._repository.salvar(pedido)
+        else:
+            inicio = perf_counter()
+            self._repository.salvar(pedido)
+            self._etapas["salvar"].observar(perf_counter() - inicio)
+        self._notificar(pedido)
         return pedido
 
+    def _notificar(self, pedido: Pedido) -> None:
+        if self._notificacoes is not None:
+            self._notificacoes.notificar_pedido_criado(pedido)
+            self._notificacoes.notificar_pedido_valor_alto(pedido)
+
     def buscar_pedidos_cliente(self, cnpj: str) -> list[Pedido]:
         """Retorna histórico de pedidos de um cliente pelo CNPJ."""
         return self._repository.buscar_por_cliente(cnpj)
+
+    def buscar_pagina_pedidos_cliente(
+        self, cnpj: str, limite: int, cursor: str | None = None
+    ) -> Pagina[Pedido]:
+        """Página do histórico do cliente; passe ``pagina.proximo`` para a seguinte."""
+        return self._repository.buscar_pagina_por_cliente(cnpj, limite, cursor)
+
+    def buscar_pedidos_periodo(
+        self, inicio: datetime, fim: datetime, cnpj: str | None = None
+    ) -> Iterator[Pedido]:
+        """Pedidos criados em ``[inicio, fim)``, opcionalmente só de um cliente."""
+        return self._repository.buscar_por_periodo(inicio, fim, cnpj)
+
+    async def criar_pedido_async(
+        self,
+        cliente: Cliente,
+        itens_dados: list[dict],
+        catalogo_produtos: dict[str, Produto],
+    ) -> Pedido:
+        """Versão assíncrona de ``criar_pedido``.
+
+        A precificação é CPU pura e curta, então roda no próprio event loop;
+        despachá-la para threads só acrescentaria troca de contexto.
+        """
+        return self.criar_pedido(cliente, itens_dados, catalogo_produtos)
+
+    async def processar_e_salvar_async(
+        self,
+        cliente: Cliente,
+        itens_dados: list[dict],
+        catalogo_produtos: dict[str, Produto],
+    ) -> Pedido:
+        """Cria e persiste um pedido sem bloquear o event loop.
+
+        Gravações concorrentes são agrupadas pelo repositório assíncrono.
+        """
+        pedido = await self.criar_pedido_async(cliente, itens_dados, catalogo_produtos)
+        await self.repository_async.salvar(pedido)
+        self._notificar(pedido)
+        return pedido
+
+    async def buscar_pedidos_cliente_async(self, cnpj: str) -> list[Pedido]:
+        """Versão assíncrona de ``buscar_pedidos_cliente``."""
+        return await self.repository_async.buscar_por_cliente(cnpj)
+
+    async def buscar_pagina_pedidos_cliente_async(
+        self, cnpj: str, limite: int, cursor: str | None = None
+    ) -> Pagina[Pedido]:
+        """Versão assíncrona de ``buscar_pagina_pedidos_cliente``."""
+        return await self.repository_async.buscar_pagina_por_cliente(cnpj, limite, cursor)
+
+    async def buscar_pedidos_periodo_async(
+        self, inicio: datetime, fim: datetime, cnpj: str | None = None
+    ) -> list[Pedido]:
+        """Versão assíncrona de ``buscar_pedidos_periodo``."""
+        return await self.repository_async.buscar_por_periodo(inicio, fim, cnpj)
@@ -0,0 +1,199 @@
+"""Relatórios de vendas em streaming sobre o arquivo de pedidos.
+
+Os registros persistidos passam por um pipeline de geradores até o
+``AgregadorVendas``: nenhum ``Pedido`` é montado e nada é reprecificado,
+os valores gravados em ``salvar`` são somados como estão. A memória
+depende só da quantidade de produtos, cupons e clientes distintos, não da
+quantidade de pedidos.
+
+Com ``workers > 1``, o arquivo é dividido em faixas alinhadas a registros
+(``PedidoRepositoryArquivo.particionar``), agregadas em processos
+separados e combinadas no final.
+"""
+
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Iterable, Iterator
+
+from src.repositories.pedido_repository import PedidoRepositoryArquivo
+
+SEM_CUPOM = "(sem cupom)"
+# Registros gravados antes de o código do cupom ser persistido
+CUPOM_NAO_REGISTRADO = "(não registrado)"
+
+
+@dataclass(slots=True)
+class Totais:
+    """Somatórios de um grupo de vendas."""
+
+    pedidos: int = 0
+    itens: int = 0
+    quantidade: int = 0
+    bruto: float = 0.0
+    desconto_produto: float = 0.0
+    desconto_cupom: float = 0.0
+    receita: float = 0.0
+
+    def somar(self, outro: "Totais") -> None:
+        self.pedidos += outro.pedidos
+        self.itens += outro.itens
+        self.quantidade += outro.quantidade
+        self.bruto += outro.bruto
+        self.desconto_produto += outro.desconto_produto
+        self.desconto_cupom += outro.desconto_cupom
+        self.receita += outro.receita
+
+
+@dataclass
+class RelatorioVendas:
+    """Resultado consolidado de um relatório de vendas."""
+
+    totais: Totais
+    por_produto: dict[str, Totais]
+    por_cupom: dict[str, Totais]
+    top_clientes: list[tuple[str, str, Totais]] = field(default_factory=list)
+    top_produtos: list[tuple[str, Totais]] = field(default_factory=list)
+
+    def para_dict(self) -> dict:
+        return {
+            "totais": asdict(self.totais),
+            "por_produto": {tipo: asdict(t) for tipo, t in self.por_produto.items()},
+            "por_cupom": {codigo: asdict(t) for codigo, t in self.por_cupom.items()},
+            "top_clientes": [
+                {"cnpj": cnpj, "nome": nome, **asdict(t)} for cnpj, nome, t in self.top_clientes
+            ],
+            "top_produtos": [{"produto_tipo": tipo, **asdict(t)} for tipo, t in self.top_produtos],
+        }
+
+
+def itens_vendidos(registros: Iterable[dict]) -> Iterator[tuple[dict, dict, bool]]:
+    """Etapa do pipeline: explode pedidos em (pedido, item, primeiro_item_do_pedido)."""
+    for registro in registros:
+        primeiro = True
+        for item in registro["itens"]:
+            yield registro, item, primeiro
+            primeiro = False
+
+
+class AgregadorVendas:
+    """Acumula totais gerais, por produto, por cupom e por cliente."""
+
+    def __init__(self):
+        self.totais = Totais()
+        self.por_produto: dict[str, Totais] = {}
+        self.por_cupom: dict[str, Totais] = {}
+        self.por_cliente: dict[str, Totais] = {}
+        self.nomes: dict[str, str] = {}
+
+    def consumir(self, registros: Iterable[dict]) -> "AgregadorVendas":
+        """Agrega um fluxo de registros de pedidos e retorna o próprio agregador."""
+        grupos_do_pedido: set[int] = set()
+        for registro, item, primeiro in itens_vendidos(registros):
+            cliente = registro["cliente"]
+            cnpj = cliente["cnpj"]
+            if primeiro:
+                grupos_do_pedido.clear()
+                self.nomes[cnpj] = cliente["nome"]
+                self.totais.pedidos += 1
+                self._grupo(self.por_cliente, cnpj).pedidos += 1
+
+            quantidade = item["quantidade"]
+            bruto = item["preco_unitario"] * quantidade
+            desconto_produto = item["desconto_produto"]
+            desconto_cupom = item["desconto_cupom"]
+            receita = item["preco_final"]
+            grupos = (
+                self.totais,
+                self._grupo(self.por_produto, item["produto_tipo"]),
+                self._grupo(self.por_cupom, self._codigo_cupom(item)),
+                self._grupo(self.por_cliente, cnpj),
+            )
+            for grupo in grupos:
+                grupo.itens += 1
+                grupo.quantidade += quantidade
+                grupo.bruto += bruto
+                grupo.desconto_produto += desconto_produto
+                grupo.desconto_cupom += desconto_cupom
+                grupo.receita += receita
+            # Produtos e cupons contam o pedido uma vez, mesmo com vários itens
+            for grupo in grupos[1:3]:
+                if id(grupo) not in grupos_do_pedido:
+                    grupos_do_pedido.add(id(grupo))
+                    grupo.pedidos += 1
+        return self
+
+    def combinar(self, outro: "AgregadorVendas") -> "AgregadorVendas":
+        """Soma os totais de outro agregador (de outra faixa do arquivo)."""
+        self.totais.somar(outro.totais)
+        for destino, origem in (
+            (self.por_produto, outro.por_produto),
+            (self.por_cupom, outro.por_cupom),
+            (self.por_cliente, outro.por_cliente),
+        ):
+            for chave, totais in origem.items():
+                self._grupo(destino, chave).somar(totais)
+        self.nomes.update(outro.nomes)
+        return self
+
+    def relatorio(self, top_n: int = 10) -> RelatorioVendas:
+        """Monta o relatório com os ``top_n`` maiores clientes e produtos por receita."""
+        top_clientes = heapq.nlargest(
+            top_n, self.por_cliente.items(), key=lambda par: par[1].receita
+        )
+        top_produtos = heapq.nlargest(
+            top_n, self.por_produto.items(), key=lambda par: par[1].receita
+        )
+        return RelatorioVendas(
+            totais=self.totais,
+            por_produto=dict(sorted(self.por_produto.items())),
+            por_cupom=dict(sorted(self.por_cupom.items())),
+            top_clientes=[(cnpj, self.nomes.get(cnpj, ""), t) for cnpj, t in top_clientes],
+            top_produtos=top_produtos,
+        )
+
+    @staticmethod
+    def _grupo(grupos: dict[str, Totais], chave: str) -> Totais:
+        totais = grupos.get(chave)
+        if totais is None:
+            totais = grupos[chave] = Totais()
+        return totais
+
+    @staticmethod
+    def _codigo_cupom(item: dict) -> str:
+        if "cupom_codigo" not in item:
+            return CUPOM_NAO_REGISTRADO if item["desconto_cupom"] else SEM_CUPOM
+        return item["cupom_codigo"] or SEM_CUPOM
+
+
+def _agregar_faixa(caminho: str, inicio: int, fim: int) -> AgregadorVendas:
+    repository = PedidoRepositoryArquivo(caminho)
+    return AgregadorVendas().consumir(repository.iterar_registros(inicio, fim))
+
+
+class RelatorioService:
+    """Gera relatórios de vendas a partir do repositório de pedidos em arquivo."""
+
+    def __init__(self, pedido_repository: PedidoRepositoryArquivo):
+        self._repository = pedido_repository
+
+    def gerar(self, top_n: int = 10, workers: int = 1) -> RelatorioVendas:
+        """Percorre o arquivo uma vez e retorna o relatório consolidado.
+
+        Args:
+            top_n: Quantidade de clientes e produtos no ranking
+            workers: Processos de agregação; 1 agrega no próprio processo
+        """
+        if top_n < 0 or workers < 1:
+            raise ValueError("top_n não pode ser negativo e workers deve ser positivo.")
+        if workers == 1:
+            return AgregadorVendas().consumir(self._repository.iterar_registros()).relatorio(top_n)
+
+        faixas = self._repository.particionar(workers)
+        caminho = str(self._repository.caminho)
+        agregador = AgregadorVendas()
+        with ProcessPoolExecutor(max_workers=max(len(faixas), 1)) as pool:
+            parciais = [pool.submit(_agregar_faixa, caminho, inicio, fim) for inicio, fim in faixas]
+            for parcial in parciais:
+                agregador.combinar(parcial.result())
+        return agregador.relatorio(top_n)
@@ -2,3 +2,11 @@ class ValidationError(ValueError):
     """Erro de validação de regras de domínio."""
 
     pass
+
+
+class ClienteDuplicadoError(ValidationError):
+    """Já existe cliente cadastrado com o CNPJ."""
+
+    def __init__(self, cnpj: str):
+        super().__init__(f"CNPJ já cadastrado: {cnpj}")
+        self.cnpj = cnpj
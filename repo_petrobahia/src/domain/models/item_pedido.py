@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
 
 from src.domain.models.produto import Produto
-from src.domain.policies.cupom import Cupom, CupomNulo
+from src.domain.policies.cupom import CUPOM_NULO, Cupom
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemPedido:
     """Representa um item dentro de um pedido.
 
@@ -14,7 +14,7 @@ class ItemPedido:
 
     produto: Produto
     quantidade: int
-    cupom: Cupom = field(default_factory=CupomNulo)
+    cupom: Cupom = CUPOM_NULO
 
     preco_unitario: float = field(init=False)
     preco_bruto: float = field(init=False)
@@ -32,3 +32,30 @@ class ItemPedido:
         self.desconto_cupom = self.cupom.calcular_desconto(self.preco_bruto, self.produto.tipo)
 
         self.preco_final = max(self.preco_bruto - self.desconto_produto - self.desconto_cupom, 0.0)
+
+    @classmethod
+    def restaurar(
+        cls,
+        produto: Produto,
+        quantidade: int,
+        cupom: Cupom,
+        preco_unitario: float,
+        desconto_produto: float,
+        desconto_cupom: float,
+        preco_final: float,
+    ) -> "ItemPedido":
+        """Recria um item com valores já calculados, sem reaplicar os descontos.
+
+        Usado ao ler pedidos gravados: os valores são os do momento da venda,
+        mesmo que preços, faixas ou cupons tenham mudado depois.
+        """
+        item = object.__new__(cls)
+        item.produto = produto
+        item.quantidade = quantidade
+        item.cupom = cupom
+        item.preco_unitario = preco_unitario
+        item.preco_bruto = preco_unitario * quantidade
+        item.desconto_produto = desconto_produto
+        item.desconto_cupom = desconto_cupom
+        item.preco_final = preco_final
+        return item
@@ -0,0 +1,248 @@
+"""Representação colunar de pedidos e itens para cargas em massa.
+
+Em vez de um objeto por item, ``ItemPedidoBatch`` guarda cada campo em um
+``array`` contíguo; produtos e cupons ficam em tabelas pequenas e cada item
+guarda só o índice. ``PedidoBatch`` agrupa os itens por faixas de índices
+(como em uma matriz esparsa CSR). O acesso por linha devolve views leves,
+com os mesmos atributos de ``ItemPedido`` e ``Pedido``.
+"""
+
+from array import array
+from typing import Iterable, Iterator
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.models.produto import Produto
+from src.domain.policies.cupom import CUPOM_NULO, Cupom, CupomNulo
+
+
+class ItemPedidoView:
+    """Linha de um ``ItemPedidoBatch`` com a interface de leitura de ``ItemPedido``."""
+
+    __slots__ = ("_lote", "_indice")
+
+    def __init__(self, lote: "ItemPedidoBatch", indice: int):
+        self._lote = lote
+        self._indice = indice
+
+    @property
+    def produto(self) -> Produto:
+        return self._lote.produtos[self._lote.produto_idx[self._indice]]
+
+    @property
+    def cupom(self) -> Cupom:
+        return self._lote.cupons[self._lote.cupom_idx[self._indice]]
+
+    @property
+    def quantidade(self) -> int:
+        return self._lote.quantidade[self._indice]
+
+    @property
+    def preco_unitario(self) -> float:
+        return self._lote.preco_unitario[self._indice]
+
+    @property
+    def preco_bruto(self) -> float:
+        return self._lote.preco_bruto[self._indice]
+
+    @property
+    def desconto_produto(self) -> float:
+        return self._lote.desconto_produto[self._indice]
+
+    @property
+    def desconto_cupom(self) -> float:
+        return self._lote.desconto_cupom[self._indice]
+
+    @property
+    def preco_final(self) -> float:
+        return self._lote.preco_final[self._indice]
+
+    def __repr__(self) -> str:
+        return (
+            f"ItemPedidoView(produto={self.produto.tipo!r}, quantidade={self.quantidade}, "
+            f"preco_final={self.preco_final})"
+        )
+
+
+class ItemPedidoBatch:
+    """Itens de pedido armazenados em colunas.
+
+    Para criar o lote já precificado, ver ``PrecificadorLote.precificar_itens``.
+    """
+
+    __slots__ = (
+        "produtos",
+        "cupons",
+        "_produto_pos",
+        "_cupom_pos",
+        "produto_idx",
+        "cupom_idx",
+        "quantidade",
+        "preco_unitario",
+        "preco_bruto",
+        "desconto_produto",
+        "desconto_cupom",
+        "preco_final",
+    )
+
+    def __init__(self):
+        # Índice 0 é sempre o cupom nulo, compartilhado por todos os itens sem cupom
+        self.produtos: list[Produto] = []
+        self.cupons: list[Cupom] = [CUPOM_NULO]
+        self._produto_pos: dict[int, int] = {}
+        self._cupom_pos: dict[str | int, int] = {}
+        self.produto_idx = array("I")
+        self.cupom_idx = array("I")
+        self.quantidade = array("q")
+        self.preco_unitario = array("d")
+        self.preco_bruto = array("d")
+        self.desconto_produto = array("d")
+        self.desconto_cupom = array("d")
+        self.preco_final = array("d")
+
+    def adicionar(self, item: ItemPedido) -> None:
+        """Copia os valores de um ``ItemPedido`` para as colunas."""
+        self.produto_idx.append(self.posicao_produto(item.produto))
+        self.cupom_idx.append(self.posicao_cupom(item.cupom))
+        self.quantidade.append(item.quantidade)
+        self.preco_unitario.append(item.preco_unitario)
+        self.preco_bruto.append(item.preco_bruto)
+        self.desconto_produto.append(item.desconto_produto)
+        self.desconto_cupom.append(item.desconto_cupom)
+        self.preco_final.append(item.preco_final)
+
+    def __len__(self) -> int:
+        return len(self.quantidade)
+
+    def __getitem__(self, indice: int) -> ItemPedidoView:
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de item fora do lote.")
+        return ItemPedidoView(self, indice)
+
+    def __iter__(self) -> Iterator[ItemPedidoView]:
+        return (ItemPedidoView(self, indice) for indice in range(len(self)))
+
+    def nbytes(self) -> int:
+        """Bytes ocupados pelas colunas (sem as tabelas de produtos e cupons)."""
+        colunas = (getattr(self, nome) for nome in self.__slots__ if not nome.startswith("_"))
+        return sum(c.itemsize * len(c) for c in colunas if isinstance(c, array))
+
+    def posicao_produto(self, produto: Produto) -> int:
+        """Índice do produto em ``produtos``, acrescentado na primeira vez."""
+        posicao = self._produto_pos.get(id(produto))
+        if posicao is None:
+            posicao = self._produto_pos[id(produto)] = len(self.produtos)
+            self.produtos.append(produto)
+        return posicao
+
+    def posicao_cupom(self, cupom: Cupom) -> int:
+        """Índice do cupom em ``cupons`` (0 para o cupom nulo).
+
+        Cupons com o mesmo ``codigo`` ocupam uma única posição, mesmo sendo
+        instâncias diferentes (ex.: itens copiados de outro processo); a
+        tabela guarda o primeiro. Cupons sem código são separados por
+        instância.
+        """
+        if isinstance(cupom, CupomNulo):
+            return 0
+        chave = cupom.codigo if cupom.codigo is not None else id(cupom)
+        posicao = self._cupom_pos.get(chave)
+        if posicao is None:
+            posicao = self._cupom_pos[chave] = len(self.cupons)
+            self.cupons.append(cupom)
+        return posicao
+
+
+class PedidoView:
+    """Linha de um ``PedidoBatch`` com a interface de leitura de ``Pedido``."""
+
+    __slots__ = ("_lote", "_indice")
+
+    def __init__(self, lote: "PedidoBatch", indice: int):
+        self._lote = lote
+        self._indice = indice
+
+    @property
+    def cliente(self) -> Cliente:
+        return self._lote.clientes[self._lote.cliente_idx[self._indice]]
+
+    @property
+    def itens(self) -> list[ItemPedidoView]:
+        inicio, fim = self._faixa()
+        return [ItemPedidoView(self._lote.itens, i) for i in range(inicio, fim)]
+
+    @property
+    def preco_total(self) -> float:
+        inicio, fim = self._faixa()
+        return sum(self._lote.itens.preco_final[inicio:fim])
+
+    def _faixa(self) -> tuple[int, int]:
+        return self._lote.inicio_itens[self._indice], self._lote.inicio_itens[self._indice + 1]
+
+
+class PedidoBatch:
+    """Pedidos armazenados em colunas, com itens em um ``ItemPedidoBatch``.
+
+    Os itens do pedido ``i`` ocupam ``inicio_itens[i]:inicio_itens[i + 1]``.
+    Clientes são guardados uma vez por CNPJ.
+    """
+
+    __slots__ = ("clientes", "_cliente_pos", "cliente_idx", "inicio_itens", "itens")
+
+    def __init__(self):
+        self.clientes: list[Cliente] = []
+        self._cliente_pos: dict[str, int] = {}
+        self.cliente_idx = array("l")
+        self.inicio_itens = array("q", [0])
+        self.itens = ItemPedidoBatch()
+
+    @classmethod
+    def de_pedidos(cls, pedidos: Iterable[Pedido]) -> "PedidoBatch":
+        """Converte pedidos em objetos para a forma colunar."""
+        lote = cls()
+        for pedido in pedidos:
+            lote.adicionar(pedido)
+        return lote
+
+    def adicionar(self, pedido: Pedido) -> None:
+        """Acrescenta um pedido e seus itens ao lote.
+
+        Raises:
+            ValueError: Se o cliente tiver o CNPJ de um cliente já no lote,
+                mas dados diferentes
+        """
+        cliente = pedido.cliente
+        posicao = self._cliente_pos.get(cliente.cnpj)
+        if posicao is None:
+            posicao = self._cliente_pos[cliente.cnpj] = len(self.clientes)
+            self.clientes.append(cliente)
+        elif self.clientes[posicao] is not cliente and self.clientes[posicao] != cliente:
+            raise ValueError(f"Cliente {cliente.cnpj} com dados divergentes no lote.")
+        self.cliente_idx.append(posicao)
+        for item in pedido.itens:
+            self.itens.adicionar(item)
+        self.inicio_itens.append(len(self.itens))
+
+    def __len__(self) -> int:
+        return len(self.cliente_idx)
+
+    def __getitem__(self, indice: int) -> PedidoView:
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de pedido fora do lote.")
+        return PedidoView(self, indice)
+
+    def __iter__(self) -> Iterator[PedidoView]:
+        return (PedidoView(self, indice) for indice in range(len(self)))
+
+    def nbytes(self) -> int:
+        """Bytes ocupados pelas colunas de pedidos e itens."""
+        return (
+            self.cliente_idx.itemsize * len(self.cliente_idx)
+            + self.inicio_itens.itemsize * len(self.inicio_itens)
+            + self.itens.nbytes()
+        )
@@ -1,14 +1,22 @@
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 
 from src.domain.models.cliente import Cliente
 
 from .item_pedido import ItemPedido
 
 
-@dataclass
+def agora_utc() -> datetime:
+    """Instante atual em UTC (momento de criação padrão de um pedido)."""
+    return datetime.now(timezone.utc)
+
+
+@dataclass(slots=True)
 class Pedido:
     cliente: Cliente
     itens: list[ItemPedido] = field(default_factory=list)
+    # None em pedidos gravados antes de o momento de criação ser registrado
+    criado_em: datetime | None = field(default_factory=agora_utc)
 
     @property
     def preco_total(self) -> float:
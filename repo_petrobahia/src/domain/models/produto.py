@@ -6,7 +6,7 @@ from src.domain.policies.desconto.politica_desconto_produto_none import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Produto:
     """Produto de catálogo com política de desconto associada."""
 
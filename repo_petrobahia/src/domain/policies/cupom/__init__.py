@@ -2,22 +2,23 @@
 
 Estrutura:
 - base.py: Interface Cupom
-- nulo.py: CupomNulo
+- nulo.py: CupomNulo (e a instância compartilhada CUPOM_NULO)
 - percentual.py: CupomPercentual
 - valor_fixo.py: CupomValorFixo
 - lubrificante.py: CupomLubrificante
-- factory.py: CupomFactory
+- tabela_cupons.py: Tabela de cupons lida de cupons.json
 """
 
 from .base import Cupom
 from .lubrificante import CupomLubrificante
-from .nulo import CupomNulo
+from .nulo import CUPOM_NULO, CupomNulo
 from .percentual import CupomPercentual
 from .valor_fixo import CupomValorFixo
 
 __all__ = [
     "Cupom",
     "CupomNulo",
+    "CUPOM_NULO",
     "CupomPercentual",
     "CupomValorFixo",
     "CupomLubrificante",
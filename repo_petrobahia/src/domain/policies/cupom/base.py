@@ -1,10 +1,26 @@
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 
 class Cupom(ABC):
-    """Abstração para cupons de desconto (Strategy Pattern)."""
+    """Abstração para cupons de desconto (Strategy Pattern).
+
+    ``codigo`` é o código da tabela que originou o cupom (gravado com os
+    itens do pedido); cupons avulsos e o cupom nulo não têm código.
+    """
+
+    __slots__ = ("codigo",)
+
+    def __init__(self, codigo: str | None = None):
+        self.codigo = codigo
 
     @abstractmethod
     def calcular_desconto(self, preco_bruto: float, produto_tipo: str = "") -> float:
         """Calcula o valor de desconto a partir do preço bruto."""
         raise NotImplementedError
+
+    def calcular_descontos_lote(
+        self, precos_brutos: Sequence[float], produto_tipo: str = ""
+    ) -> list[float]:
+        """Calcula o desconto de vários preços brutos do mesmo tipo de produto."""
+        return [self.calcular_desconto(preco_bruto, produto_tipo) for preco_bruto in precos_brutos]
@@ -1,8 +1,13 @@
+from typing import Sequence
+
 from .base import Cupom
 
 
 class CupomLubrificante(Cupom):
-    def __init__(self, valor: float):
+    __slots__ = ("_valor",)
+
+    def __init__(self, valor: float, codigo: str | None = None):
+        super().__init__(codigo)
         if valor < 0:
             raise ValueError("Valor fixo deve ser não-negativo.")
         self._valor = valor
@@ -11,4 +16,11 @@ class CupomLubrificante(Cupom):
         if produto_tipo.lower() == "lubrificante":
             return min(self._valor, preco_bruto)
         return 0.0
-        
+
+    def calcular_descontos_lote(
+        self, precos_brutos: Sequence[float], produto_tipo: str = ""
+    ) -> list[float]:
+        if produto_tipo.lower() != "lubrificante":
+            return [0.0] * len(precos_brutos)
+        valor = self._valor
+        return [min(valor, preco_bruto) for preco_bruto in precos_brutos]
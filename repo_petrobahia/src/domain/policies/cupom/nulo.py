@@ -1,6 +1,19 @@
+from typing import Sequence
+
 from .base import Cupom
 
 
 class CupomNulo(Cupom):
+    __slots__ = ()
+
     def calcular_desconto(self, preco_bruto: float, produto_tipo: str = "") -> float:
         return 0.0
+
+    def calcular_descontos_lote(
+        self, precos_brutos: Sequence[float], produto_tipo: str = ""
+    ) -> list[float]:
+        return [0.0] * len(precos_brutos)
+
+
+CUPOM_NULO = CupomNulo()
+"""Instância compartilhada: o cupom nulo não tem estado."""
@@ -1,11 +1,22 @@
+from typing import Sequence
+
 from .base import Cupom
 
 
 class CupomPercentual(Cupom):
-    def __init__(self, percentual: float):
+    __slots__ = ("_percentual",)
+
+    def __init__(self, percentual: float, codigo: str | None = None):
+        super().__init__(codigo)
         if not 0 <= percentual <= 1:
             raise ValueError("Percentual deve estar entre 0 e 1.")
         self._percentual = percentual
 
     def calcular_desconto(self, preco_bruto: float, produto_tipo: str = "") -> float:
         return preco_bruto * self._percentual
+
+    def calcular_descontos_lote(
+        self, precos_brutos: Sequence[float], produto_tipo: str = ""
+    ) -> list[float]:
+        percentual = self._percentual
+        return [preco_bruto * percentual for preco_bruto in precos_brutos]
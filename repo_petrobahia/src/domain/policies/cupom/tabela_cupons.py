@@ -0,0 +1,71 @@
+"""Tabela de cupons carregada de arquivo JSON.
+
+O arquivo mapeia o código do cupom para seu tipo e valor::
+
+    {"MEGA10": {"tipo": "percentual", "valor": 0.10}, ...}
+
+Tipos aceitos: ``percentual`` (fração do preço bruto), ``fixo`` (valor por
+item) e ``lubrificante`` (valor por item, só em lubrificantes). Sem caminho
+informado, usa ``PETROBAHIA_CUPONS`` ou o ``cupons.json`` distribuído junto
+a este módulo.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from .base import Cupom
+from .lubrificante import CupomLubrificante
+from .percentual import CupomPercentual
+from .valor_fixo import CupomValorFixo
+
+CAMINHO_PADRAO = Path(__file__).with_name("cupons.json")
+
+TIPOS: dict[str, type[Cupom]] = {
+    "percentual": CupomPercentual,
+    "fixo": CupomValorFixo,
+    "lubrificante": CupomLubrificante,
+}
+
+
+def caminho_configurado() -> Path:
+    """Arquivo de cupons em uso (variável de ambiente ou padrão)."""
+    return Path(os.environ.get("PETROBAHIA_CUPONS") or CAMINHO_PADRAO)
+
+
+def carregar_definicoes(caminho: Path | str | None = None) -> dict[str, tuple[str, float]]:
+    """Lê o arquivo e valida o par (tipo, valor) de cada código.
+
+    Raises:
+        ValueError: Se o arquivo não for um objeto JSON de cupons válidos
+    """
+    caminho = Path(caminho) if caminho is not None else caminho_configurado()
+    dados = json.loads(caminho.read_text(encoding="utf-8"))
+    if not isinstance(dados, dict):
+        raise ValueError(f"{caminho}: esperado um objeto código -> cupom.")
+    definicoes = {}
+    for codigo, cupom in dados.items():
+        try:
+            definicao = (cupom["tipo"], float(cupom["valor"]))
+            criar_cupom(*definicao)
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"{caminho}: cupom '{codigo}' inválido: {error}") from error
+        definicoes[codigo] = definicao
+    return definicoes
+
+
+def criar_cupom(tipo: str, valor: float, codigo: str | None = None) -> Cupom:
+    """Instancia o cupom de um tipo da tabela, identificado por ``codigo``.
+
+    Raises:
+        ValueError: Se o tipo for desconhecido ou o valor inválido para ele
+    """
+    classe = TIPOS.get(tipo)
+    if classe is None:
+        raise ValueError(f"Tipo de cupom desconhecido: {tipo}. Use um de {tuple(TIPOS)}.")
+    return classe(valor, codigo)
+
+
+def carregar_cupons(caminho: Path | str | None = None) -> dict[str, Cupom]:
+    """Cupons do arquivo, um por código."""
+    return {codigo: criar_cupom(*d, codigo) for codigo, d in carregar_definicoes(caminho).items()}
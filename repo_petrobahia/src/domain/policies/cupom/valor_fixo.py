@@ -1,11 +1,22 @@
+from typing import Sequence
+
 from .base import Cupom
 
 
 class CupomValorFixo(Cupom):
-    def __init__(self, valor: float):
+    __slots__ = ("_valor",)
+
+    def __init__(self, valor: float, codigo: str | None = None):
+        super().__init__(codigo)
         if valor < 0:
             raise ValueError("Valor fixo deve ser não-negativo.")
         self._valor = valor
 
     def calcular_desconto(self, preco_bruto: float, produto_tipo: str = "") -> float:
         return min(self._valor, preco_bruto)
+
+    def calcular_descontos_lote(
+        self, precos_brutos: Sequence[float], produto_tipo: str = ""
+    ) -> list[float]:
+        valor = self._valor
+        return [min(valor, preco_bruto) for preco_bruto in precos_brutos]
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from types import SimpleNamespace
+from typing import Sequence
 
 
 class PoliticaDesconto(ABC):
@@ -11,3 +13,16 @@ class PoliticaDesconto(ABC):
     def calcular_desconto(self, item) -> float:  # item: ItemPedido (evita import circular)
         """Retorna o valor de desconto para o item informado."""
         raise NotImplementedError
+
+    def calcular_descontos_lote(
+        self, precos_unitarios: Sequence[float], quantidades: Sequence[int]
+    ) -> list[float]:
+        """Calcula o desconto de vários itens de uma vez (colunas alinhadas).
+
+        Implementação padrão delega item a item; políticas concretas
+        sobrescrevem com uma expressão por coluna.
+        """
+        return [
+            self.calcular_desconto(SimpleNamespace(preco_unitario=preco, quantidade=quantidade))
+            for preco, quantidade in zip(precos_unitarios, quantidades)
+        ]
@@ -0,0 +1,77 @@
+import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+from .politica_desconto import PoliticaDesconto
+
+PERCENTUAL = "percentual"
+VALOR_FIXO = "fixo"
+
+
+@dataclass(frozen=True, slots=True)
+class FaixaDesconto:
+    """Desconto aplicado a quantidades estritamente acima de ``acima_de``.
+
+    ``tipo`` percentual: ``valor`` é a fração do preço bruto (0.10 = 10%);
+    ``tipo`` fixo: ``valor`` é o desconto em reais por item.
+    """
+
+    acima_de: int
+    tipo: str
+    valor: float
+
+    def __post_init__(self):
+        if self.tipo not in (PERCENTUAL, VALOR_FIXO):
+            raise ValueError(f"Tipo de faixa inválido: {self.tipo}.")
+        if not isinstance(self.acima_de, int):
+            raise ValueError(f"Limite da faixa deve ser inteiro: {self.acima_de!r}.")
+        if self.acima_de < 0:
+            raise ValueError("Limite da faixa não pode ser negativo.")
+        if not math.isfinite(self.valor) or self.valor < 0:
+            raise ValueError(f"Valor inválido para faixa {self.tipo}: {self.valor}.")
+        if self.tipo == PERCENTUAL and self.valor > 1:
+            raise ValueError(f"Valor inválido para faixa {self.tipo}: {self.valor}.")
+
+
+class PoliticaDescontoFaixas(PoliticaDesconto):
+    """Descontos por faixa de quantidade, definidos por dados.
+
+    As faixas são pré-computadas em tuplas ordenadas: ``limites`` guarda a
+    primeira quantidade de cada faixa (``acima_de + 1``; quantidades são
+    inteiras) e ``bisect_right`` dá a posição da faixa em ``tipos`` e
+    ``valores``. A posição 0 é a das quantidades abaixo de todas as faixas
+    (desconto fixo zero).
+    """
+
+    def __init__(self, faixas: Iterable[FaixaDesconto]):
+        self._faixas = tuple(sorted(faixas, key=lambda faixa: faixa.acima_de))
+        self._limites = tuple(faixa.acima_de + 1 for faixa in self._faixas)
+        if len(set(self._limites)) != len(self._limites):
+            raise ValueError("Faixas de desconto com limites repetidos.")
+        self._tipos = (VALOR_FIXO,) + tuple(faixa.tipo for faixa in self._faixas)
+        self._valores = (0.0,) + tuple(faixa.valor for faixa in self._faixas)
+
+    @property
+    def faixas(self) -> tuple[FaixaDesconto, ...]:
+        """Faixas em ordem crescente de limite."""
+        return self._faixas
+
+    def calcular_desconto(self, item) -> float:
+        posicao = bisect_right(self._limites, item.quantidade)
+        if self._tipos[posicao] == PERCENTUAL:
+            return item.preco_unitario * item.quantidade * self._valores[posicao]
+        return self._valores[posicao]
+
+    def calcular_descontos_lote(
+        self, precos_unitarios: Sequence[float], quantidades: Sequence[int]
+    ) -> list[float]:
+        limites, tipos, valores = self._limites, self._tipos, self._valores
+        descontos = []
+        for preco, quantidade in zip(precos_unitarios, quantidades):
+            posicao = bisect_right(limites, quantidade)
+            if tipos[posicao] == PERCENTUAL:
+                descontos.append(preco * quantidade * valores[posicao])
+            else:
+                descontos.append(valores[posicao])
+        return descontos
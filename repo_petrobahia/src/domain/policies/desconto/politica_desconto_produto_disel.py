@@ -1,12 +1,9 @@
-from .politica_desconto import PoliticaDesconto
+from .politica_desconto_faixas import PoliticaDescontoFaixas
+from .tabela_descontos import tabela_configurada
 
 
-class PoliticaDescontoProdutoDisel(PoliticaDesconto):
-    """Descontos progressivos para Diesel."""
+class PoliticaDescontoProdutoDisel(PoliticaDescontoFaixas):
+    """Descontos progressivos para Diesel (faixas da tabela configurada)."""
 
-    def calcular_desconto(self, item):
-        if item.quantidade > 1000:
-            return item.preco_unitario * item.quantidade * 0.10
-        if item.quantidade > 500:
-            return item.preco_unitario * item.quantidade * 0.05
-        return 0.0
+    def __init__(self):
+        super().__init__(tabela_configurada()["diesel"].faixas)
@@ -1,10 +1,9 @@
-from .politica_desconto import PoliticaDesconto
+from .politica_desconto_faixas import PoliticaDescontoFaixas
+from .tabela_descontos import tabela_configurada
 
 
-class PoliticaDescontoProdutoEtanol(PoliticaDesconto):
-    """Desconto simples para etanol acima de 80 unidades."""
+class PoliticaDescontoProdutoEtanol(PoliticaDescontoFaixas):
+    """Desconto percentual para grandes quantidades de etanol (faixas da tabela configurada)."""
 
-    def calcular_desconto(self, item):
-        if item.quantidade > 80:
-            return item.preco_unitario * item.quantidade * 0.03
-        return 0.0
+    def __init__(self):
+        super().__init__(tabela_configurada()["etanol"].faixas)
@@ -1,10 +1,9 @@
-from .politica_desconto import PoliticaDesconto
+from .politica_desconto_faixas import PoliticaDescontoFaixas
+from .tabela_descontos import tabela_configurada
 
 
-class PoliticaDescontoProdutoGasolina(PoliticaDesconto):
-    """Desconto fixo para grandes quantidades de gasolina."""
+class PoliticaDescontoProdutoGasolina(PoliticaDescontoFaixas):
+    """Desconto fixo para grandes quantidades de gasolina (faixas da tabela configurada)."""
 
-    def calcular_desconto(self, item):
-        if item.quantidade > 200:
-            return 100.0
-        return 0.0
+    def __init__(self):
+        super().__init__(tabela_configurada()["gasolina"].faixas)
@@ -1,3 +1,5 @@
+from typing import Sequence
+
 from .politica_desconto import PoliticaDesconto
 
 
@@ -6,3 +8,8 @@ class PoliticaDescontoProdutoNone(PoliticaDesconto):
 
     def calcular_desconto(self, item):
         return 0.0
+
+    def calcular_descontos_lote(
+        self, precos_unitarios: Sequence[float], quantidades: Sequence[int]
+    ) -> list[float]:
+        return [0.0] * len(quantidades)
@@ -0,0 +1,67 @@
+"""Tabela de descontos por produto carregada de arquivo JSON.
+
+O arquivo mapeia o tipo de produto para sua lista de faixas::
+
+    {"diesel": [{"acima_de": 500, "tipo": "percentual", "valor": 0.05}, ...]}
+
+Sem caminho informado, usa ``PETROBAHIA_DESCONTOS`` ou o ``descontos.json``
+distribuído junto a este módulo.
+"""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from .politica_desconto_faixas import FaixaDesconto, PoliticaDescontoFaixas
+
+CAMINHO_PADRAO = Path(__file__).with_name("descontos.json")
+
+
+def caminho_configurado() -> Path:
+    """Arquivo de descontos em uso (variável de ambiente ou padrão)."""
+    return Path(os.environ.get("PETROBAHIA_DESCONTOS") or CAMINHO_PADRAO)
+
+
+def carregar_tabela(caminho: Path | str | None = None) -> dict[str, PoliticaDescontoFaixas]:
+    """Lê o arquivo e compila uma política por tipo de produto.
+
+    Raises:
+        ValueError: Se o arquivo não for um objeto JSON de listas de faixas
+            válidas
+    """
+    caminho = Path(caminho) if caminho is not None else caminho_configurado()
+    dados = json.loads(caminho.read_text(encoding="utf-8"))
+    if not isinstance(dados, dict):
+        raise ValueError(f"{caminho}: esperado um objeto tipo de produto -> faixas.")
+    tabela = {}
+    for tipo, faixas in dados.items():
+        try:
+            tabela[tipo] = PoliticaDescontoFaixas(
+                FaixaDesconto(_limite(f["acima_de"]), f["tipo"], float(f["valor"])) for f in faixas
+            )
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"{caminho}: faixas inválidas para '{tipo}': {error}") from error
+    return tabela
+
+
+def _limite(valor) -> int:
+    # ``int`` truncaria 1000.5 em silêncio e a faixa mudaria de lugar
+    if isinstance(valor, float) and valor.is_integer():
+        return int(valor)
+    if isinstance(valor, bool) or not isinstance(valor, int):
+        raise ValueError(f"limite deve ser inteiro: {valor!r}")
+    return valor
+
+
+def tabela_configurada() -> dict[str, PoliticaDescontoFaixas]:
+    """Tabela do arquivo configurado (``PETROBAHIA_DESCONTOS`` ou padrão).
+
+    Cada arquivo é lido uma única vez; as políticas são compartilhadas.
+    """
+    return _tabela_do_arquivo(caminho_configurado())
+
+
+@lru_cache(maxsize=8)
+def _tabela_do_arquivo(caminho: Path) -> dict[str, PoliticaDescontoFaixas]:
+    return carregar_tabela(caminho)
@@ -1,22 +1,63 @@
+import threading
+from pathlib import Path
+
 from src.domain.policies.cupom.base import Cupom
-from src.domain.policies.cupom.lubrificante import CupomLubrificante
-from src.domain.policies.cupom.nulo import CupomNulo
-from src.domain.policies.cupom.percentual import CupomPercentual
-from src.domain.policies.cupom.valor_fixo import CupomValorFixo
+from src.domain.policies.cupom.nulo import CUPOM_NULO
+from src.domain.services.registro_cupons import RegistroCupons
 
 
 class CupomFactory:
-    """Factory para instanciar cupons a partir de códigos (Domain Service)."""
+    """Factory para instanciar cupons a partir de códigos (Domain Service).
+
+    Os cupons vêm do ``RegistroCupons`` do arquivo configurado (ver
+    ``tabela_cupons``), criado na primeira consulta ou por
+    ``configurar_cupons`` e recarregado quando o arquivo muda.
+    """
 
-    _CUPONS = {
-        "MEGA10": CupomPercentual(0.10),
-        "NOVO5": CupomPercentual(0.05),
-        "LUB2": CupomLubrificante(2.0),
-    }
+    _registro: RegistroCupons | None = None
+    _criacao = threading.Lock()
 
     @classmethod
-    def criar(cls, codigo: str | None) -> Cupom:
-        """Retorna o cupom correspondente ou CupomNulo se inválido."""
+    def criar(cls, codigo: str | None, itens: int = 1) -> Cupom:
+        """Retorna o cupom correspondente ou o cupom nulo se vazio/inválido.
+
+        Conta ``itens`` usos do código (ver ``RegistroCupons.criar``).
+        """
         if not codigo:
-            return CupomNulo()
-        return cls._CUPONS.get(codigo, CupomNulo())
+            return CUPOM_NULO
+        return (cls._registro or cls.registro()).criar(codigo, itens)
+
+    @classmethod
+    def obter(cls, codigo: str | None) -> Cupom:
+        """Como ``criar``, sem contar em ``usos`` (hidratação de pedidos gravados)."""
+        if not codigo:
+            return CUPOM_NULO
+        return (cls._registro or cls.registro()).obter(codigo)
+
+    @classmethod
+    def registro(cls) -> RegistroCupons:
+        """Registro em uso (carregado sob demanda)."""
+        if cls._registro is None:
+            with cls._criacao:
+                if cls._registro is None:
+                    cls._registro = RegistroCupons()
+        return cls._registro
+
+    @classmethod
+    def configurar_cupons(
+        cls, caminho: Path | str | None = None, intervalo_verificacao: float | None = 1.0
+    ) -> RegistroCupons:
+        """Troca o registro por um do arquivo ``caminho`` (``None``: configurado/padrão).
+
+        Raises:
+            OSError: Se o arquivo não puder ser lido
+            ValueError: Se o arquivo tiver cupons inválidos
+        """
+        registro = RegistroCupons(caminho, intervalo_verificacao)
+        cls._registro = registro
+        return registro
+
+    @classmethod
+    def usos(cls) -> dict[str, int]:
+        """Itens atendidos por código no registro em uso."""
+        return cls.registro().usos()
@@ -0,0 +1,74 @@
+"""Montagem de pedidos a partir de dados brutos."""
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.models.produto import Produto
+from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.validar_pedido import ValidadorPedido
+
+
+class MontadorPedido:
+    """Domain Service que precifica e valida pedidos, sem persistência.
+
+    Usado por ``PedidoService.criar_pedido`` e pelos workers da importação
+    em massa, que só precificam e validam.
+    """
+
+    @classmethod
+    def montar(
+        cls,
+        cliente: Cliente,
+        itens_dados: list[dict],
+        catalogo_produtos: dict[str, Produto],
+    ) -> Pedido:
+        """Cria, precifica e valida um pedido.
+
+        Args:
+            cliente: Instância de Cliente
+            itens_dados: Lista de dicts com 'produto_tipo', 'quantidade', 'cupom_codigo' (opcional)
+            catalogo_produtos: Mapa de tipo de produto para instância Produto
+
+        Raises:
+            ValueError: Se produto não existir no catálogo ou dados inválidos
+            ValidationError: Se regras de negócio forem violadas
+        """
+        cls.validar_entrada(cliente, itens_dados)
+        itens = []
+        for dados in itens_dados:
+            produto_tipo, quantidade, cupom_codigo = cls.ler_item(dados)
+            itens.append(
+                ItemPedido(
+                    produto=cls.produto(catalogo_produtos, produto_tipo),
+                    quantidade=quantidade,
+                    cupom=CupomFactory.criar(cupom_codigo),
+                )
+            )
+        pedido = Pedido(cliente=cliente, itens=itens)
+        ValidadorPedido.validar(pedido)
+        return pedido
+
+    @staticmethod
+    def validar_entrada(cliente: Cliente, itens_dados: list[dict]) -> None:
+        """Recusa pedido sem cliente ou sem itens."""
+        if not cliente:
+            raise ValueError("Cliente deve ser informado.")
+        if not itens_dados:
+            raise ValueError("Pedido deve ter ao menos um item.")
+
+    @staticmethod
+    def ler_item(dados: dict) -> tuple[str, int, str | None]:
+        """Tipo de produto, quantidade e código de cupom de um item."""
+        produto_tipo = dados.get("produto_tipo")
+        quantidade = dados.get("quantidade")
+        if not produto_tipo or quantidade is None:
+            raise ValueError("Item deve ter produto_tipo e quantidade.")
+        return produto_tipo, quantidade, dados.get("cupom_codigo")
+
+    @staticmethod
+    def produto(catalogo_produtos: dict[str, Produto], produto_tipo: str) -> Produto:
+        """Produto do catálogo pelo tipo."""
+        produto = catalogo_produtos.get(produto_tipo)
+        if not produto:
+            raise ValueError(f"Produto '{produto_tipo}' não encontrado no catálogo.")
+        return produto
@@ -0,0 +1,133 @@
+"""Precificação de itens em lote, coluna a coluna (Domain Service)."""
+
+from array import array
+from dataclasses import dataclass
+from typing import Sequence
+
+from src.domain.models.lote_pedidos import ItemPedidoBatch
+from src.domain.models.produto import Produto
+from src.domain.services.cupom_factory import CupomFactory
+
+
+@dataclass
+class ResultadoLote:
+    """Colunas de preço alinhadas com as entradas do lote."""
+
+    preco_unitario: array
+    preco_bruto: array
+    desconto_produto: array
+    desconto_cupom: array
+    preco_final: array
+
+    def __len__(self) -> int:
+        return len(self.preco_final)
+
+
+class PrecificadorLote:
+    """Precifica muitos itens de uma vez, com os mesmos valores de ``ItemPedido``.
+
+    Os itens são agrupados por tipo de produto (política de desconto) e por
+    par cupom/produto; cada grupo é calculado em uma única chamada
+    ``calcular_descontos_lote``, que opera sobre colunas inteiras.
+
+    Os usos de cupom são contados só em ``precificar``: um por item, com
+    ``CupomFactory.criar(codigo, itens)`` por grupo, o mesmo total que
+    ``MontadorPedido.montar`` conta item a item. ``precificar_itens`` usa
+    ``precificar`` e só consulta os cupons com ``CupomFactory.obter``, que
+    não conta; chamar os dois métodos para o mesmo lote conta os usos duas
+    vezes.
+    """
+
+    @classmethod
+    def precificar(
+        cls,
+        produtos_tipos: Sequence[str],
+        quantidades: Sequence[int],
+        cupons_codigos: Sequence[str | None],
+        catalogo_produtos: dict[str, Produto],
+    ) -> ResultadoLote:
+        """Calcula as colunas de preço do lote.
+
+        Raises:
+            ValueError: Se as colunas tiverem tamanhos diferentes, algum
+                produto não existir no catálogo ou alguma quantidade não for
+                positiva
+        """
+        total = len(produtos_tipos)
+        if len(quantidades) != total or len(cupons_codigos) != total:
+            raise ValueError("Colunas do lote devem ter o mesmo tamanho.")
+
+        grupos_produto: dict[str, list[int]] = {}
+        for indice, produto_tipo in enumerate(produtos_tipos):
+            grupos_produto.setdefault(produto_tipo, []).append(indice)
+
+        precos = array("d", bytes(8 * total))
+        brutos = array("d", bytes(8 * total))
+        descontos_produto = array("d", bytes(8 * total))
+        for produto_tipo, indices in grupos_produto.items():
+            produto = catalogo_produtos.get(produto_tipo)
+            if not produto:
+                raise ValueError(f"Produto '{produto_tipo}' não encontrado no catálogo.")
+            qtds = [quantidades[i] for i in indices]
+            if min(qtds) <= 0:
+                raise ValueError("Quantidade deve ser positiva.")
+            preco = produto.preco
+            descontos = produto.politica_desconto.calcular_descontos_lote([preco] * len(qtds), qtds)
+            for i, quantidade, desconto in zip(indices, qtds, descontos):
+                precos[i] = preco
+                brutos[i] = preco * quantidade
+                descontos_produto[i] = desconto
+
+        grupos_cupom: dict[tuple[str | None, str], list[int]] = {}
+        for indice, (codigo, produto_tipo) in enumerate(zip(cupons_codigos, produtos_tipos)):
+            grupos_cupom.setdefault((codigo, produto_tipo), []).append(indice)
+
+        descontos_cupom = array("d", bytes(8 * total))
+        for (codigo, produto_tipo), indices in grupos_cupom.items():
+            # Um uso por item precificado, como em ``ItemPedido``
+            cupom = CupomFactory.criar(codigo, len(indices))
+            descontos = cupom.calcular_descontos_lote([brutos[i] for i in indices], produto_tipo)
+            for i, desconto in zip(indices, descontos):
+                descontos_cupom[i] = desconto
+
+        finais = array(
+            "d",
+            (
+                max(bruto - desc_produto - desc_cupom, 0.0)
+                for bruto, desc_produto, desc_cupom in zip(
+                    brutos, descontos_produto, descontos_cupom
+                )
+            ),
+        )
+        return ResultadoLote(precos, brutos, descontos_produto, descontos_cupom, finais)
+
+    @classmethod
+    def precificar_itens(
+        cls,
+        produtos_tipos: Sequence[str],
+        quantidades: Sequence[int],
+        cupons_codigos: Sequence[str | None],
+        catalogo_produtos: dict[str, Produto],
+    ) -> ItemPedidoBatch:
+        """Cria o ``ItemPedidoBatch`` já precificado, sem instanciar ``ItemPedido``.
+
+        Raises:
+            ValueError: Mesmas condições de ``precificar``
+        """
+        resultado = cls.precificar(produtos_tipos, quantidades, cupons_codigos, catalogo_produtos)
+        lote = ItemPedidoBatch()
+        lote.produto_idx = array(
+            "I", (lote.posicao_produto(catalogo_produtos[tipo]) for tipo in produtos_tipos)
+        )
+        # Os usos já foram contados em ``precificar`` (ver docstring da classe)
+        cupons = {codigo: CupomFactory.obter(codigo) for codigo in set(cupons_codigos)}
+        lote.cupom_idx = array(
+            "I", (lote.posicao_cupom(cupons[codigo]) for codigo in cupons_codigos)
+        )
+        lote.quantidade = array("q", quantidades)
+        lote.preco_unitario = resultado.preco_unitario
+        lote.preco_bruto = resultado.preco_bruto
+        lote.desconto_produto = resultado.desconto_produto
+        lote.desconto_cupom = resultado.desconto_cupom
+        lote.preco_final = resultado.preco_final
+        return lote
@@ -2,31 +2,21 @@
 
 from src.domain.models.produto import Produto
 from src.domain.policies.desconto.politica_desconto import PoliticaDesconto
-from src.domain.policies.desconto.politica_desconto_produto_disel import (
-    PoliticaDescontoProdutoDisel,
-)
-from src.domain.policies.desconto.politica_desconto_produto_etanol import (
-    PoliticaDescontoProdutoEtanol,
-)
-from src.domain.policies.desconto.politica_desconto_produto_gasolina import (
-    PoliticaDescontoProdutoGasolina,
-)
 from src.domain.policies.desconto.politica_desconto_produto_none import (
     PoliticaDescontoProdutoNone,
 )
+from src.domain.policies.desconto.tabela_descontos import carregar_tabela, tabela_configurada
 
 
 class ProdutoFactory:
     """Factory para criação de produtos com regras de negócio (Domain Service).
 
-    Centraliza lógica de criação e mapeamento de políticas de desconto.
+    Centraliza lógica de criação e mapeamento de políticas de desconto. As
+    políticas vêm da tabela de faixas (ver ``tabela_descontos``), carregada
+    na primeira criação ou por ``configurar_descontos``.
     """
 
-    _POLITICAS_PADRAO = {
-        "diesel": PoliticaDescontoProdutoDisel,
-        "gasolina": PoliticaDescontoProdutoGasolina,
-        "etanol": PoliticaDescontoProdutoEtanol,
-    }
+    _politicas: dict[str, PoliticaDesconto] | None = None
 
     _PRECOS_PADRAO = {
         "diesel": 5.50,
@@ -55,11 +45,28 @@ class ProdutoFactory:
         preco_final = preco if preco is not None else cls._PRECOS_PADRAO.get(tipo, 0.0)
 
         if politica is None:
-            politica_cls = cls._POLITICAS_PADRAO.get(tipo, PoliticaDescontoProdutoNone)
-            politica = politica_cls()
+            politica = cls.politicas().get(tipo) or PoliticaDescontoProdutoNone()
 
         return Produto(tipo=tipo, preco=preco_final, politica_desconto=politica)
 
+    @classmethod
+    def politicas(cls) -> dict[str, PoliticaDesconto]:
+        """Políticas de desconto por tipo de produto (carregadas sob demanda)."""
+        if cls._politicas is None:
+            cls._politicas = dict(tabela_configurada())
+        return cls._politicas
+
+    @classmethod
+    def configurar_descontos(cls, caminho: str | None = None) -> None:
+        """Recarrega a tabela de faixas (``None``: arquivo configurado/padrão).
+
+        Afeta apenas produtos criados depois da chamada.
+
+        Raises:
+            ValueError: Se o arquivo tiver faixas inválidas
+        """
+        cls._politicas = dict(carregar_tabela(caminho))
+
     @classmethod
     def criar_catalogo_padrao(cls) -> dict[str, Produto]:
         """Retorna catálogo completo com produtos padrão."""
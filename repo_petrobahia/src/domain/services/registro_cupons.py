@@ -0,0 +1,151 @@
+"""Registro de cupons por código, recarregado quando o arquivo muda.
+
+A consulta lê um único dicionário ``código -> cupom``, trocado por inteiro
+a cada recarga: quem consulta vê a tabela antiga ou a nova,
+nunca uma mistura, e não espera a recarga terminar. A verificação do
+arquivo (um ``stat``) acontece no máximo uma vez por intervalo, feita pela
+primeira consulta que o encontra vencido; as demais seguem com a tabela
+atual.
+
+Cupons com a mesma definição (tipo e valor) continuam sendo a mesma
+instância depois da recarga. Cada cupom leva o próprio código
+(``Cupom.codigo``): itens criados antes da recarga, ou copiados para outro
+processo, ainda são gravados com ele.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+from src.domain.policies.cupom.base import Cupom
+from src.domain.policies.cupom.nulo import CUPOM_NULO
+from src.domain.policies.cupom.tabela_cupons import (
+    caminho_configurado,
+    carregar_definicoes,
+    criar_cupom,
+)
+
+
+class RegistroCupons:
+    """Cupons de um arquivo, com recarga atômica e contagem de uso por código.
+
+    Args:
+        caminho: Arquivo de cupons (``None``: ``PETROBAHIA_CUPONS`` ou o padrão)
+        intervalo_verificacao: Segundos entre verificações do arquivo
+            (``None`` desliga a recarga automática)
+
+    Raises:
+        OSError: Se o arquivo não puder ser lido na criação
+        ValueError: Se o arquivo tiver cupons inválidos na criação
+    """
+
+    def __init__(
+        self, caminho: Path | str | None = None, intervalo_verificacao: float | None = 1.0
+    ):
+        self._caminho = Path(caminho) if caminho is not None else caminho_configurado()
+        self._intervalo = intervalo_verificacao
+        self._recarga = threading.Lock()
+        self._contagem = threading.Lock()
+        self._entradas: dict[str, Cupom] = {}
+        self._definicoes: dict[str, tuple[str, float]] = {}
+        self._usos: dict[str, int] = {}
+        self._invalidos = 0
+        self._assinatura: tuple[int, int, int] | None = None
+        self._proxima_verificacao = float("inf")
+        self.ultimo_erro: Exception | None = None
+        self.recarregar()
+
+    @property
+    def caminho(self) -> Path:
+        return self._caminho
+
+    def criar(self, codigo: str | None, itens: int = 1) -> Cupom:
+        """Cupom do código, ou o cupom nulo compartilhado se vazio/desconhecido.
+
+        Conta ``itens`` usos do código: precificações em lote pedem o cupom
+        uma vez para todos os itens do grupo.
+        """
+        if not codigo:
+            return CUPOM_NULO
+        if time.monotonic() >= self._proxima_verificacao:
+            self._verificar()
+        cupom = self._entradas.get(codigo)
+        with self._contagem:
+            if cupom is None:
+                self._invalidos += itens
+                return CUPOM_NULO
+            self._usos[codigo] += itens
+        return cupom
+
+    def obter(self, codigo: str | None) -> Cupom:
+        """Como ``criar``, sem contar a consulta (ex.: ao reler pedidos gravados)."""
+        if not codigo:
+            return CUPOM_NULO
+        if time.monotonic() >= self._proxima_verificacao:
+            self._verificar()
+        return self._entradas.get(codigo, CUPOM_NULO)
+
+    def codigos(self) -> list[str]:
+        """Códigos da tabela atual."""
+        return list(self._entradas)
+
+    def usos(self) -> dict[str, int]:
+        """Itens atendidos por código desde a criação (inclui códigos removidos)."""
+        with self._contagem:
+            return dict(self._usos)
+
+    @property
+    def invalidos(self) -> int:
+        """Itens com código desconhecido (atendidos com o cupom nulo)."""
+        return self._invalidos
+
+    def recarregar(self) -> None:
+        """Relê o arquivo agora, mesmo que não tenha mudado.
+
+        Raises:
+            OSError: Se o arquivo não puder ser lido
+            ValueError: Se o arquivo tiver cupons inválidos (a tabela atual é mantida)
+        """
+        with self._recarga:
+            self._carregar()
+            self._agendar()
+
+    def _verificar(self) -> None:
+        if not self._recarga.acquire(blocking=False):
+            return
+        try:
+            self._agendar()
+            if self._assinatura_arquivo() != self._assinatura:
+                self._carregar()
+            self.ultimo_erro = None
+        except (OSError, ValueError) as error:
+            # Arquivo sendo editado ou inválido: segue com a tabela atual e
+            # tenta de novo na próxima verificação
+            self.ultimo_erro = error
+        finally:
+            self._recarga.release()
+
+    def _agendar(self) -> None:
+        if self._intervalo is not None:
+            self._proxima_verificacao = time.monotonic() + self._intervalo
+
+    def _assinatura_arquivo(self) -> tuple[int, int, int]:
+        estado = self._caminho.stat()
+        return estado.st_mtime_ns, estado.st_size, estado.st_ino
+
+    def _carregar(self) -> None:
+        assinatura = self._assinatura_arquivo()
+        definicoes = carregar_definicoes(self._caminho)
+        entradas = {}
+        for codigo, definicao in definicoes.items():
+            atual = self._entradas.get(codigo)
+            if atual is not None and self._definicoes.get(codigo) == definicao:
+                entradas[codigo] = atual
+            else:
+                entradas[codigo] = criar_cupom(*definicao, codigo)
+        with self._contagem:
+            for codigo in entradas:
+                self._usos.setdefault(codigo, 0)
+        self._definicoes = definicoes
+        self._assinatura = assinatura
+        self._entradas = entradas
@@ -0,0 +1 @@
+"""Infraestrutura transversal (métricas, observabilidade, notificações e eventos)."""
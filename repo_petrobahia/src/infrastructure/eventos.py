@@ -0,0 +1,240 @@
+"""Eventos estruturados com níveis, sobre ``logging`` (logger ``petrobahia``).
+
+Serviços, repositórios e ``main.executar`` emitem eventos por um
+``RegistroEventos`` (``EVENTOS`` por padrão): cada evento é um registro do
+logger ``petrobahia`` com o tipo e os dados do evento em ``extra``
+(``record.tipo`` e ``record.dados``). Eventos abaixo do nível do logger
+voltam em ``isEnabledFor``, sem formatar a mensagem. Mensagens seguem
+``str.format`` com os dados do evento.
+
+Quem escreve os eventos são os handlers do logger, escolhidos pela
+aplicação. Sem configuração, o logger só tem um ``NullHandler``;
+``eventos_configurados`` instala os do ``main``:
+
+- console (``ManipuladorConsole``): escreve a mensagem na própria chamada;
+- JSON lines: um ``QueueHandler`` só enfileira e um ``QueueListener``
+  grava com ``FormatadorJson`` em segundo plano.
+
+O nível vem do argumento ou da variável de ambiente ``PETROBAHIA_EVENTOS``
+(``debug``, ``info``, ``aviso``, ``erro`` ou ``silencio``), validada ao
+configurar.
+"""
+
+import json
+import logging
+import os
+import queue
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from enum import IntEnum
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Iterator, TextIO
+
+NOME_LOGGER = "petrobahia"
+
+LOGGER = logging.getLogger(NOME_LOGGER)
+LOGGER.addHandler(logging.NullHandler())
+
+
+class Nivel(IntEnum):
+    """Severidade dos eventos (níveis do ``logging``); ``SILENCIO`` não deixa passar nenhum."""
+
+    DEBUG = logging.DEBUG
+    INFO = logging.INFO
+    AVISO = logging.WARNING
+    ERRO = logging.ERROR
+    SILENCIO = 100
+
+    @classmethod
+    def por_nome(cls, nome: str) -> "Nivel":
+        """Nível pelo nome, sem diferenciar maiúsculas.
+
+        Raises:
+            ValueError: Se o nome não for de um nível
+        """
+        try:
+            return cls[nome.upper()]
+        except KeyError:
+            nomes = ", ".join(nivel.name.lower() for nivel in cls)
+            mensagem = f"Nível de eventos desconhecido: {nome}. Use um de {nomes}."
+            raise ValueError(mensagem) from None
+
+
+def nivel_configurado(nivel: Nivel | str | None = None) -> Nivel:
+    """Nível informado ou, sem ele, o de ``PETROBAHIA_EVENTOS`` (padrão ``debug``).
+
+    Raises:
+        ValueError: Se o nome (ou o valor da variável) não for de um nível
+    """
+    if isinstance(nivel, Nivel):
+        return nivel
+    return Nivel.por_nome(nivel or os.environ.get("PETROBAHIA_EVENTOS") or "debug")
+
+
+class FormatadorJson(logging.Formatter):
+    """Um objeto JSON por evento: nível, tipo, mensagem, dados e instante (UTC)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        try:
+            nivel = Nivel(record.levelno).name
+        except ValueError:
+            nivel = record.levelname
+        return json.dumps(
+            {
+                "nivel": nivel.lower(),
+                "tipo": getattr(record, "tipo", record.name),
+                "mensagem": record.getMessage(),
+                "dados": getattr(record, "dados", {}),
+                "criado_em": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+
+
+class ManipuladorConsole(logging.StreamHandler):
+    """Escreve a mensagem de cada evento na hora, como ``print``.
+
+    Sem ``saida``, usa o ``sys.stdout`` do momento da escrita (e não o da
+    criação), para acompanhar redirecionamentos.
+    """
+
+    def __init__(self, saida: TextIO | None = None):
+        super().__init__(saida)
+        self._saida = saida
+        self.setFormatter(logging.Formatter("%(message)s"))
+
+    @property
+    def stream(self) -> TextIO:
+        return self._saida if self._saida is not None else sys.stdout
+
+    @stream.setter
+    def stream(self, saida: TextIO) -> None:
+        self._saida = saida
+
+
+class _FilaEventos(QueueHandler):
+    """``QueueHandler`` que enfileira sem copiar os registros já prontos.
+
+    Os eventos de ``RegistroEventos`` chegam com a mensagem formatada e sem
+    ``args`` nem exceção: a cópia e a formatação de ``prepare`` só custariam
+    tempo na thread que emite.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args or record.exc_info:
+            return super().prepare(record)
+        return record
+
+
+class RegistroEventos:
+    """Emite eventos ``tipo`` com dados estruturados em um logger.
+
+    Args:
+        logger: Logger dos eventos (padrão: ``petrobahia``)
+    """
+
+    def __init__(self, logger: logging.Logger | None = None):
+        self.logger = logger if logger is not None else LOGGER
+
+    def ativo(self, nivel: Nivel) -> bool:
+        """Se eventos de ``nivel`` chegam aos handlers."""
+        return self.logger.isEnabledFor(nivel)
+
+    def emitir(self, nivel: Nivel, tipo: str, mensagem: str, **dados) -> None:
+        """Emite o evento ``tipo``; ``mensagem`` é formatada com ``dados``."""
+        logger = self.logger
+        if logger.isEnabledFor(nivel):
+            # ``makeRecord`` + ``handle`` em vez de ``log``: a origem (arquivo e
+            # linha) não é usada e buscá-la na pilha é a parte mais cara
+            registro = logger.makeRecord(
+                logger.name,
+                nivel,
+                "",
+                0,
+                mensagem.format(**dados) if dados else mensagem,
+                None,
+                None,
+                extra={"tipo": tipo, "dados": dados},
+            )
+            logger.handle(registro)
+
+    def debug(self, tipo: str, mensagem: str, **dados) -> None:
+        self.emitir(Nivel.DEBUG, tipo, mensagem, **dados)
+
+    def info(self, tipo: str, mensagem: str, **dados) -> None:
+        self.emitir(Nivel.INFO, tipo, mensagem, **dados)
+
+    def aviso(self, tipo: str, mensagem: str, **dados) -> None:
+        self.emitir(Nivel.AVISO, tipo, mensagem, **dados)
+
+    def erro(self, tipo: str, mensagem: str, **dados) -> None:
+        self.emitir(Nivel.ERRO, tipo, mensagem, **dados)
+
+
+@contextmanager
+def eventos_configurados(
+    nivel: Nivel | str | None = None,
+    jsonl: str | Path | None = None,
+    logger: logging.Logger | None = None,
+) -> Iterator[logging.Logger]:
+    """Escreve os eventos no console ou, com ``jsonl``, no arquivo durante o bloco.
+
+    O arquivo é gravado em segundo plano (``QueueHandler`` e
+    ``QueueListener``); ao sair, os eventos pendentes são gravados e o
+    logger volta à configuração anterior. Os eventos não são repassados
+    aos handlers dos loggers ancestrais durante o bloco.
+
+    Args:
+        nivel: Menor nível escrito (``None``: ver ``nivel_configurado``)
+        jsonl: Arquivo JSON lines, anexado
+        logger: Logger configurado (padrão: ``petrobahia``)
+
+    Raises:
+        ValueError: Se o nível (ou ``PETROBAHIA_EVENTOS``) não for de um nível
+    """
+    logger = logger if logger is not None else LOGGER
+    minimo = nivel_configurado(nivel)
+    ouvinte = None
+    if jsonl is None:
+        manipulador: logging.Handler = ManipuladorConsole()
+    else:
+        arquivo = logging.FileHandler(jsonl, encoding="utf-8", delay=True)
+        arquivo.setFormatter(FormatadorJson())
+        fila: queue.SimpleQueue = queue.SimpleQueue()
+        manipulador = _FilaEventos(fila)
+        ouvinte = QueueListener(fila, arquivo)
+        ouvinte.start()
+    nivel_anterior, propagacao_anterior = logger.level, logger.propagate
+    logger.setLevel(minimo)
+    logger.propagate = False
+    logger.addHandler(manipulador)
+    try:
+        yield logger
+    finally:
+        logger.removeHandler(manipulador)
+        logger.setLevel(nivel_anterior)
+        logger.propagate = propagacao_anterior
+        if ouvinte is not None:
+            ouvinte.stop()
+            for handler in ouvinte.handlers:
+                handler.close()
+        manipulador.close()
+
+
+@contextmanager
+def nivel_minimo(nivel: Nivel, logger: logging.Logger | None = None) -> Iterator[None]:
+    """Descarta os eventos abaixo de ``nivel`` durante o bloco (nunca baixa o nível)."""
+    logger = logger if logger is not None else LOGGER
+    anterior = logger.level
+    logger.setLevel(max(logger.getEffectiveLevel(), nivel))
+    try:
+        yield
+    finally:
+        logger.setLevel(anterior)
+
+
+# Registro compartilhado pelos serviços, repositórios e ``main``
+EVENTOS = RegistroEventos()
@@ -0,0 +1,301 @@
+"""Contadores e histogramas de latência dos caminhos críticos.
+
+As métricas ficam desligadas por padrão. Os pontos instrumentados leem
+``metricas.ativo`` uma vez por chamada e, desligado, não chamam o relógio
+nem tocam nos histogramas. Ligue com ``METRICAS.ativar()`` ou com a
+variável de ambiente ``PETROBAHIA_METRICAS=1``.
+
+Exportação em texto Prometheus (para o textfile collector do
+node_exporter) ou em snapshot JSON, com percentis estimados pelos buckets.
+"""
+
+import functools
+import json
+import os
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterator, TypeVar
+
+# Limites superiores dos buckets, em segundos (1 µs a 1 s)
+LIMITES_PADRAO = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    1e-2,
+    2.5e-2,
+    5e-2,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+ETAPA_PEDIDO = "petrobahia_pedido_etapa_segundos"
+OPERACAO_REPOSITORIO = "petrobahia_repositorio_segundos"
+PEDIDOS_CRIADOS = "petrobahia_pedidos_criados_total"
+PEDIDOS_REJEITADOS = "petrobahia_pedidos_rejeitados_total"
+NOTIFICACOES = "petrobahia_notificacoes_total"
+
+DESCRICOES = {
+    ETAPA_PEDIDO: "Tempo de cada etapa de PedidoService.criar_pedido",
+    OPERACAO_REPOSITORIO: "Tempo das operações de leitura e escrita em repositórios",
+    PEDIDOS_CRIADOS: "Pedidos criados por PedidoService",
+    PEDIDOS_REJEITADOS: "Pedidos rejeitados por PedidoService",
+    NOTIFICACOES: "Notificações por destino e resultado (enviada, descartada, falha)",
+}
+
+Rotulos = tuple[tuple[str, str], ...]
+F = TypeVar("F", bound=Callable)
+
+
+class Histograma:
+    """Histograma de buckets fixos, no modelo do Prometheus."""
+
+    __slots__ = ("limites", "contagens", "soma", "total", "_lock")
+
+    def __init__(self, limites: tuple[float, ...] = LIMITES_PADRAO):
+        self.limites = limites
+        # Último bucket acumula observações acima do maior limite (+Inf)
+        self.contagens = [0] * (len(limites) + 1)
+        self.soma = 0.0
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def observar(self, valor: float) -> None:
+        posicao = bisect_left(self.limites, valor)
+        with self._lock:
+            self.contagens[posicao] += 1
+            self.soma += valor
+            self.total += 1
+
+    def zerar(self) -> None:
+        with self._lock:
+            self.contagens = [0] * len(self.contagens)
+            self.soma = 0.0
+            self.total = 0
+
+    def acumulados(self) -> list[int]:
+        """Contagens cumulativas por bucket, incluindo +Inf."""
+        acumulados, corrente = [], 0
+        for contagem in self.contagens:
+            corrente += contagem
+            acumulados.append(corrente)
+        return acumulados
+
+    def percentil(self, fracao: float) -> float | None:
+        """Limite superior do bucket que contém o percentil, ou None se vazio."""
+        if not self.total:
+            return None
+        alvo = fracao * self.total
+        for limite, acumulado in zip(self.limites, self.acumulados()):
+            if acumulado >= alvo:
+                return limite
+        return float("inf")
+
+
+class Metricas:
+    """Registro de contadores e histogramas identificados por nome e rótulos."""
+
+    def __init__(self, ativo: bool = False, limites: tuple[float, ...] = LIMITES_PADRAO):
+        self.ativo = ativo
+        self._limites = limites
+        self._contadores: dict[tuple[str, Rotulos], float] = {}
+        self._histogramas: dict[tuple[str, Rotulos], Histograma] = {}
+        self._lock = threading.Lock()
+
+    def ativar(self) -> None:
+        self.ativo = True
+
+    def desativar(self) -> None:
+        self.ativo = False
+
+    def zerar(self) -> None:
+        """Zera os valores; histogramas obtidos por ``histograma`` continuam válidos."""
+        with self._lock:
+            self._contadores.clear()
+            for histograma in self._histogramas.values():
+                histograma.zerar()
+
+    def histograma(self, nome: str, **rotulos: str) -> Histograma:
+        """Histograma da série, criado na primeira consulta.
+
+        Pontos quentes guardam o retorno para observar sem montar a chave a
+        cada chamada; cabe a eles conferir ``ativo`` antes de observar.
+        """
+        chave = (nome, tuple(sorted(rotulos.items())))
+        histograma = self._histogramas.get(chave)
+        if histograma is None:
+            with self._lock:
+                histograma = self._histogramas.setdefault(chave, Histograma(self._limites))
+        return histograma
+
+    def incrementar(self, nome: str, valor: float = 1, **rotulos: str) -> None:
+        """Soma ``valor`` ao contador (ignorado se desligado)."""
+        if not self.ativo:
+            return
+        chave = (nome, tuple(sorted(rotulos.items())))
+        with self._lock:
+            self._contadores[chave] = self._contadores.get(chave, 0) + valor
+
+    def observar(self, nome: str, segundos: float, **rotulos: str) -> None:
+        """Registra uma latência no histograma (ignorado se desligado)."""
+        if not self.ativo:
+            return
+        self.histograma(nome, **rotulos).observar(segundos)
+
+    def snapshot(self) -> dict:
+        """Cópia das métricas em estruturas serializáveis em JSON."""
+        with self._lock:
+            contadores = [
+                {"nome": nome, "rotulos": dict(rotulos), "valor": valor}
+                for (nome, rotulos), valor in sorted(self._contadores.items())
+            ]
+            histogramas = [
+                {
+                    "nome": nome,
+                    "rotulos": dict(rotulos),
+                    "contagem": h.total,
+                    "soma": h.soma,
+                    "buckets": dict(zip([*map(str, h.limites), "+Inf"], h.acumulados())),
+                    "p50": h.percentil(0.50),
+                    "p95": h.percentil(0.95),
+                    "p99": h.percentil(0.99),
+                }
+                for (nome, rotulos), h in sorted(self._histogramas.items())
+            ]
+        return {"contadores": contadores, "histogramas": histogramas}
+
+    def exportar_prometheus(self) -> str:
+        """Métricas no formato texto de exposição do Prometheus."""
+        snapshot = self.snapshot()
+        linhas: list[str] = []
+        vistos: set[str] = set()
+
+        def cabecalho(nome: str, tipo: str) -> None:
+            if nome in vistos:
+                return
+            vistos.add(nome)
+            if nome in DESCRICOES:
+                linhas.append(f"# HELP {nome} {DESCRICOES[nome]}")
+            linhas.append(f"# TYPE {nome} {tipo}")
+
+        for contador in snapshot["contadores"]:
+            cabecalho(contador["nome"], "counter")
+            linhas.append(f"{contador['nome']}{_rotulos(contador['rotulos'])} {contador['valor']}")
+        for h in snapshot["histogramas"]:
+            nome, rotulos = h["nome"], h["rotulos"]
+            cabecalho(nome, "histogram")
+            for limite, acumulado in h["buckets"].items():
+                linhas.append(f"{nome}_bucket{_rotulos({**rotulos, 'le': limite})} {acumulado}")
+            linhas.append(f"{nome}_sum{_rotulos(rotulos)} {h['soma']!r}")
+            linhas.append(f"{nome}_count{_rotulos(rotulos)} {h['contagem']}")
+        return "\n".join(linhas) + "\n"
+
+    def gravar_prometheus(self, caminho: Path) -> None:
+        """Grava o texto Prometheus de forma atômica (o coletor nunca lê pela metade)."""
+        _gravar_atomico(Path(caminho), self.exportar_prometheus())
+
+    def gravar_json(self, caminho: Path) -> None:
+        """Grava o snapshot JSON de forma atômica."""
+        _gravar_atomico(Path(caminho), json.dumps(self.snapshot(), indent=2))
+
+
+def cronometrado(nome: str, **rotulos: str) -> Callable[[F], F]:
+    """Decorator de método que observa sua duração em ``self._metricas``.
+
+    Com métricas desligadas, chama o método diretamente, sem ler o relógio.
+    """
+
+    def decorar(metodo: F) -> F:
+        @functools.wraps(metodo)
+        def cronometrar(self, *args, **kwargs):
+            metricas: Metricas = self._metricas
+            if not metricas.ativo:
+                return metodo(self, *args, **kwargs)
+            inicio = perf_counter()
+            try:
+                return metodo(self, *args, **kwargs)
+            finally:
+                metricas.histograma(nome, **rotulos).observar(perf_counter() - inicio)
+
+        return cronometrar  # type: ignore[return-value]
+
+    return decorar
+
+
+def cronometrado_fluxo(nome: str, **rotulos: str) -> Callable[[F], F]:
+    """Como ``cronometrado``, para métodos que devolvem iteradores em fluxo.
+
+    A duração observada é a da chamada mais a de cada ``next`` no iterador
+    devolvido (sem o tempo de quem consome), registrada quando ele se esgota
+    ou é fechado. Iteradores nunca percorridos não são observados.
+    """
+
+    def decorar(metodo: F) -> F:
+        @functools.wraps(metodo)
+        def cronometrar(self, *args, **kwargs):
+            metricas: Metricas = self._metricas
+            if not metricas.ativo:
+                return metodo(self, *args, **kwargs)
+            histograma = metricas.histograma(nome, **rotulos)
+            inicio = perf_counter()
+            try:
+                iterador = iter(metodo(self, *args, **kwargs))
+            except BaseException:
+                histograma.observar(perf_counter() - inicio)
+                raise
+            return _iterar_cronometrado(iterador, histograma, perf_counter() - inicio)
+
+        return cronometrar  # type: ignore[return-value]
+
+    return decorar
+
+
+def _iterar_cronometrado(iterador: Iterator, histograma: Histograma, duracao: float) -> Iterator:
+    try:
+        while True:
+            inicio = perf_counter()
+            try:
+                item = next(iterador)
+            except StopIteration:
+                return
+            finally:
+                duracao += perf_counter() - inicio
+            yield item
+    finally:
+        # Repassa o fechamento antecipado (libera arquivos e travas do iterador)
+        fechar = getattr(iterador, "close", None)
+        if fechar is not None:
+            fechar()
+        histograma.observar(duracao)
+
+
+def _rotulos(rotulos: dict[str, str]) -> str:
+    if not rotulos:
+        return ""
+    return "{" + ",".join(f'{chave}="{_escapar(valor)}"' for chave, valor in rotulos.items()) + "}"
+
+
+def _escapar(valor: str) -> str:
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _gravar_atomico(caminho: Path, conteudo: str) -> None:
+    temporario = caminho.with_name(caminho.name + ".tmp")
+    temporario.write_text(conteudo, encoding="utf-8")
+    os.replace(temporario, caminho)
+
+
+# Registro compartilhado pelos serviços e repositórios
+METRICAS = Metricas(ativo=os.environ.get("PETROBAHIA_METRICAS", "") not in ("", "0"))
@@ -0,0 +1,323 @@
+"""Despacho de notificações em segundo plano, em lotes, para vários destinos.
+
+``DespachanteNotificacoes.publicar`` só enfileira: cada destino (console,
+arquivo JSON lines, webhook) tem uma fila limitada e uma thread própria,
+que junta as notificações em lotes de até ``max_lote`` (ou as que
+chegarem em ``intervalo`` segundos) e os envia de uma vez. Um destino
+lento atrasa só a própria fila, nunca quem publica nem os outros destinos.
+
+Com a fila cheia, a ``PoliticaFilaCheia`` decide entre esperar espaço
+(``BLOQUEAR``, contrapressão sobre quem publica) e descartar a notificação
+(``DESCARTAR``). Falhas de um destino descartam o lote e não param a
+thread. Descartes e falhas são contados em ``estatisticas`` e, com
+métricas ligadas, em ``petrobahia_notificacoes_total``.
+
+``fechar`` (ou o gerenciador de contexto) envia o que estiver pendente
+antes de encerrar as threads.
+"""
+
+import json
+import queue
+import sys
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import TextIO
+
+from src.infrastructure.metricas import METRICAS, NOTIFICACOES, Metricas
+
+
+@dataclass(frozen=True, slots=True)
+class Notificacao:
+    """Evento a notificar: tipo, texto legível e dados estruturados."""
+
+    tipo: str
+    mensagem: str
+    dados: dict = field(default_factory=dict)
+    criado_em: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def para_dict(self) -> dict:
+        return {
+            "tipo": self.tipo,
+            "mensagem": self.mensagem,
+            "dados": self.dados,
+            "criado_em": self.criado_em.isoformat(),
+        }
+
+
+class DestinoNotificacao(ABC):
+    """Destino que recebe as notificações em lotes."""
+
+    nome: str = "destino"
+
+    @abstractmethod
+    def enviar(self, lote: list[Notificacao]) -> None:
+        """Entrega o lote; exceções descartam o lote (ver ``DespachanteNotificacoes``)."""
+        raise NotImplementedError
+
+    def fechar(self) -> None:
+        """Libera recursos depois do último lote."""
+
+
+class DestinoConsole(DestinoNotificacao):
+    """Escreve a mensagem de cada notificação, uma por linha (stdout por padrão)."""
+
+    nome = "console"
+
+    def __init__(self, saida: TextIO | None = None):
+        self._saida = saida
+
+    def enviar(self, lote: list[Notificacao]) -> None:
+        saida = self._saida or sys.stdout
+        saida.write("".join(f"{notificacao.mensagem}\n" for notificacao in lote))
+        saida.flush()
+
+
+class DestinoArquivo(DestinoNotificacao):
+    """Anexa as notificações a um arquivo JSON lines, uma escrita por lote."""
+
+    nome = "arquivo"
+
+    def __init__(self, caminho: str | Path):
+        self._file = Path(caminho).open("a", encoding="utf-8")
+
+    def enviar(self, lote: list[Notificacao]) -> None:
+        self._file.write(
+            "".join(
+                json.dumps(notificacao.para_dict(), ensure_ascii=False) + "\n"
+                for notificacao in lote
+            )
+        )
+        self._file.flush()
+
+    def fechar(self) -> None:
+        self._file.close()
+
+
+class DestinoWebhook(DestinoNotificacao):
+    """Envia cada lote como um array JSON em um POST para ``url``.
+
+    Respostas de erro (HTTP 4xx/5xx) e falhas de conexão levantam exceção.
+    """
+
+    nome = "webhook"
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        self._url = url
+        self._timeout = timeout
+
+    def enviar(self, lote: list[Notificacao]) -> None:
+        corpo = json.dumps([notificacao.para_dict() for notificacao in lote], ensure_ascii=False)
+        requisicao = urllib.request.Request(
+            self._url,
+            data=corpo.encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(requisicao, timeout=self._timeout) as resposta:
+            resposta.read()
+
+
+class PoliticaFilaCheia(Enum):
+    """O que ``publicar`` faz quando a fila de um destino está cheia."""
+
+    BLOQUEAR = "bloquear"
+    DESCARTAR = "descartar"
+
+
+@dataclass(frozen=True)
+class ConfiguracaoDespacho:
+    """Capacidade das filas, tamanho dos lotes e política de fila cheia."""
+
+    capacidade: int = 10_000
+    max_lote: int = 100
+    intervalo: float = 0.05
+    politica: PoliticaFilaCheia = PoliticaFilaCheia.BLOQUEAR
+
+    def __post_init__(self):
+        if self.capacidade <= 0 or self.max_lote <= 0:
+            raise ValueError("Capacidade e tamanho do lote devem ser positivos.")
+        if self.intervalo < 0:
+            raise ValueError("Intervalo não pode ser negativo.")
+
+
+# Marca o fim da fila em ``fechar``
+_FIM = object()
+
+
+def _restante(prazo: float | None) -> float | None:
+    return None if prazo is None else max(prazo - time.monotonic(), 0.0)
+
+
+class _FilaDestino:
+    """Fila limitada e thread de envio de um destino."""
+
+    def __init__(
+        self, destino: DestinoNotificacao, config: ConfiguracaoDespacho, metricas: Metricas
+    ):
+        self.destino = destino
+        self.enviadas = 0
+        self.descartadas = 0
+        self.falhas = 0
+        self._config = config
+        self._metricas = metricas
+        self._lock = threading.Lock()
+        self._fila: queue.Queue = queue.Queue(config.capacidade)
+        self._thread = threading.Thread(
+            target=self._laco, name=f"notificacoes-{destino.nome}", daemon=True
+        )
+        self._thread.start()
+
+    def publicar(self, notificacao: Notificacao) -> bool:
+        if self._config.politica is PoliticaFilaCheia.BLOQUEAR:
+            self._fila.put(notificacao)
+            return True
+        try:
+            self._fila.put_nowait(notificacao)
+        except queue.Full:
+            with self._lock:
+                self.descartadas += 1
+            self._contar("descartada")
+            return False
+        return True
+
+    def aguardar(self) -> None:
+        self._fila.join()
+
+    def encerrar(self, prazo: float | None) -> None:
+        """Envia o marcador de fim e espera a thread até ``prazo`` (``time.monotonic``).
+
+        Se a fila não abrir espaço para o marcador ou a thread não terminar
+        no prazo, o destino fica aberto e a thread (daemon) segue esvaziando.
+        """
+        try:
+            self._fila.put(_FIM, timeout=_restante(prazo))
+        except queue.Full:
+            return
+        self._thread.join(_restante(prazo))
+        if not self._thread.is_alive():
+            self.destino.fechar()
+
+    def _laco(self) -> None:
+        while True:
+            lote, fim = self._proximo_lote()
+            if lote:
+                self._enviar(lote)
+            # Um task_done por item retirado, inclusive o marcador
+            for _ in range(len(lote) + fim):
+                self._fila.task_done()
+            if fim:
+                return
+
+    def _proximo_lote(self) -> tuple[list[Notificacao], bool]:
+        """Espera a primeira notificação e junta as que chegarem até o prazo do lote."""
+        item = self._fila.get()
+        prazo = time.monotonic() + self._config.intervalo
+        lote = []
+        while item is not _FIM:
+            lote.append(item)
+            if len(lote) == self._config.max_lote:
+                return lote, False
+            try:
+                item = self._fila.get(timeout=max(prazo - time.monotonic(), 0))
+            except queue.Empty:
+                return lote, False
+        return lote, True
+
+    def _enviar(self, lote: list[Notificacao]) -> None:
+        try:
+            self.destino.enviar(lote)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.falhas += len(lote)
+            self._contar("falha", len(lote))
+            return
+        self.enviadas += len(lote)
+        self._contar("enviada", len(lote))
+
+    def _contar(self, resultado: str, quantidade: int = 1) -> None:
+        self._metricas.incrementar(
+            NOTIFICACOES, quantidade, destino=self.destino.nome, resultado=resultado
+        )
+
+
+class DespachanteNotificacoes:
+    """Entrega notificações a vários destinos em segundo plano, em lotes por destino.
+
+    Args:
+        destinos: Destinos das notificações; nomes repetidos são aceitos,
+            mas se somam em ``estatisticas`` e nas métricas
+        config: Capacidade das filas, lotes e política de fila cheia
+        metricas: Registro para os contadores (padrão: ``METRICAS``)
+    """
+
+    def __init__(
+        self,
+        destinos: list[DestinoNotificacao],
+        config: ConfiguracaoDespacho | None = None,
+        metricas: Metricas | None = None,
+    ):
+        config = config or ConfiguracaoDespacho()
+        metricas = metricas if metricas is not None else METRICAS
+        self._filas = [_FilaDestino(destino, config, metricas) for destino in destinos]
+        self._lock = threading.Lock()
+        self._fechado = False
+
+    def __enter__(self) -> "DespachanteNotificacoes":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.fechar()
+
+    def publicar(self, notificacao: Notificacao) -> bool:
+        """Enfileira a notificação para todos os destinos.
+
+        Com ``BLOQUEAR``, espera espaço nas filas cheias.
+
+        Returns:
+            False se algum destino descartou a notificação (fila cheia)
+
+        Raises:
+            ValueError: Se o despachante já foi fechado
+        """
+        if self._fechado:
+            raise ValueError("Despachante de notificações já foi fechado.")
+        aceita = True
+        for fila in self._filas:
+            aceita &= fila.publicar(notificacao)
+        return aceita
+
+    def flush(self) -> None:
+        """Espera até que todas as notificações publicadas tenham sido enviadas."""
+        for fila in self._filas:
+            fila.aguardar()
+
+    def fechar(self, timeout: float | None = None) -> None:
+        """Envia as notificações pendentes, encerra as threads e fecha os destinos.
+
+        Com ``timeout``, espera no máximo esse total de segundos por todos os
+        destinos; os que não terminarem a tempo continuam abertos.
+        """
+        with self._lock:
+            if self._fechado:
+                return
+            self._fechado = True
+        prazo = None if timeout is None else time.monotonic() + timeout
+        for fila in self._filas:
+            fila.encerrar(prazo)
+
+    def estatisticas(self) -> dict[str, dict[str, int]]:
+        """Notificações enviadas, descartadas e com falha, por nome de destino."""
+        resultado: dict[str, dict[str, int]] = {}
+        for fila in self._filas:
+            contagem = resultado.setdefault(
+                fila.destino.nome, {"enviadas": 0, "descartadas": 0, "falhas": 0}
+            )
+            contagem["enviadas"] += fila.enviadas
+            contagem["descartadas"] += fila.descartadas
+            contagem["falhas"] += fila.falhas
+        return resultado
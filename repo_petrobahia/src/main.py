@@ -1,17 +1,44 @@
+import argparse
+import json
+import os
+from datetime import timedelta
+from pathlib import Path
+
 from src.application.services.cliente_service import ClienteService
+from src.application.services.importacao_service import ImportacaoService
 from src.application.services.pedido_service import PedidoService
-from src.domain.exceptions import ValidationError
+from src.application.services.relatorio_service import RelatorioService
+from src.domain.exceptions import ClienteDuplicadoError, ValidationError
 from src.domain.services.produto_factory import ProdutoFactory
+from src.infrastructure.eventos import EVENTOS, Nivel, eventos_configurados, nivel_configurado
+from src.infrastructure.metricas import METRICAS
+from src.repositories.blocos_comprimidos import COMPRESSOES
 from src.repositories.cliente_repository import ClienteRepositoryArquivo
-from src.repositories.pedido_repository import PedidoRepositoryArquivo
+from src.repositories.cliente_repository_sqlite import ClienteRepositorySQLite
+from src.repositories.escritor_agrupado import ConfiguracaoEscrita
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+from src.repositories.pedido_repository_particionado import PedidoRepositoryParticionado
+from src.repositories.pedido_repository_sqlite import PedidoRepositorySQLite
+
+REPOSITORIOS = ("arquivo", "particionado", "sqlite")
+
 
+def criar_repositorios(repositorio: str = "arquivo", banco: str = "petrobahia.db"):
+    """Instancia os repositórios de clientes e pedidos da implementação escolhida."""
+    if repositorio == "arquivo":
+        return ClienteRepositoryArquivo(), PedidoRepositoryArquivo()
+    if repositorio == "particionado":
+        return ClienteRepositoryArquivo(), PedidoRepositoryParticionado()
+    if repositorio == "sqlite":
+        return ClienteRepositorySQLite(banco), PedidoRepositorySQLite(banco)
+    raise ValueError(f"Repositório desconhecido: {repositorio}. Use um de {REPOSITORIOS}.")
 
-def executar():
+
+def executar(repositorio: str = "arquivo", banco: str = "petrobahia.db"):
 
     ########### Setup repositórios e serviços ##############
 
-    cliente_repo = ClienteRepositoryArquivo()
-    pedido_repo = PedidoRepositoryArquivo()
+    cliente_repo, pedido_repo = criar_repositorios(repositorio, banco)
     cliente_service = ClienteService(cliente_repo)
     pedido_service = PedidoService(pedido_repo)
     catalogo = ProdutoFactory.criar_catalogo_padrao()
@@ -30,28 +57,43 @@ def executar():
         {
             "nome": "EcoFrota",
             "email": "ecofrota@empresa.com",
-            "cnpj": "12.345.678/0001-90",
+            "cnpj": "12.345.678/0001-95",
         },
         {
             "nome": "PetroPark",
             "email": "petropark@empresa.com",
-            "cnpj": "98.765.432/0001-10",
+            "cnpj": "98.765.432/0001-98",
         },
     ]
 
-    print("Início processamento PetroBahia")
-    print("\n[1] Cadastrando clientes...")
+    EVENTOS.info("inicio", "Início processamento PetroBahia")
+    EVENTOS.info("etapa", "\n[1] Cadastrando clientes...")
     clientes_criados = {}
     for client in clientes:
         try:
             cliente = cliente_service.criar_cliente(client["email"], client["nome"], client["cnpj"])
             clientes_criados[client["nome"]] = cliente
-            print(f"✓ Cliente salvo: {client['nome']}")
+            EVENTOS.info("cliente_cadastrado", "✓ Cliente salvo: {nome}", nome=client["nome"])
+        except ClienteDuplicadoError:
+            clientes_criados[client["nome"]] = cliente_service.buscar_por_cnpj(client["cnpj"])
+            EVENTOS.info(
+                "cliente_existente", "• Cliente já cadastrado: {nome}", nome=client["nome"]
+            )
         except ValidationError as error:
-            print(f"✗ Falha validação {client['nome']}: {error}")
+            EVENTOS.aviso(
+                "cliente_invalido",
+                "✗ Falha validação {nome}: {erro}",
+                nome=client["nome"],
+                erro=str(error),
+            )
         except Exception as error:
-            print(f"✗ Erro inesperado {client['nome']}: {error}")
-    print("\n[2] Criando pedidos...")
+            EVENTOS.erro(
+                "cliente_erro",
+                "✗ Erro inesperado {nome}: {erro}",
+                nome=client["nome"],
+                erro=str(error),
+            )
+    EVENTOS.info("etapa", "\n[2] Criando pedidos...")
     pedidos_dados = [
         {"cliente": "TransLog", "produto": "diesel", "qtd": 1200, "cupom": "MEGA10"},
         {"cliente": "MoveMais", "produto": "gasolina", "qtd": 300, "cupom": None},
@@ -63,7 +105,11 @@ def executar():
         try:
             cliente = clientes_criados.get(pedido_dados["cliente"])
             if not cliente:
-                print(f"✗ Cliente '{pedido_dados['cliente']}' não encontrado")
+                EVENTOS.aviso(
+                    "cliente_ausente",
+                    "✗ Cliente '{nome}' não encontrado",
+                    nome=pedido_dados["cliente"],
+                )
                 continue
 
             itens_dados = [
@@ -75,19 +121,192 @@ def executar():
             ]
 
             pedido = pedido_service.processar_e_salvar(cliente, itens_dados, catalogo)
-            print(f"✓ Pedido criado para {cliente.nome}: R$ {pedido.preco_total:.2f}")
+            EVENTOS.info(
+                "pedido_processado",
+                "✓ Pedido criado para {nome}: R$ {total:.2f}",
+                nome=cliente.nome,
+                total=pedido.preco_total,
+            )
         except ValidationError as error:
-            print(f"✗ Erro validação pedido {pedido_dados['cliente']}: {error}")
+            EVENTOS.aviso(
+                "pedido_invalido",
+                "✗ Erro validação pedido {nome}: {erro}",
+                nome=pedido_dados["cliente"],
+                erro=str(error),
+            )
         except Exception as error:
-            print(f"✗ Erro inesperado pedido {pedido_dados['cliente']}: {error}")
+            EVENTOS.erro(
+                "pedido_erro",
+                "✗ Erro inesperado pedido {nome}: {erro}",
+                nome=pedido_dados["cliente"],
+                erro=str(error),
+            )
 
-    print("\nFim processamento PetroBahia")
+    EVENTOS.info("fim", "\nFim processamento PetroBahia")
 
     # Exemplo de leitura
-    print("\n[3] Clientes persistidos:")
+    EVENTOS.info("etapa", "\n[3] Clientes persistidos:")
     for cliente in cliente_repo.listar():
-        print(f"- {cliente}")
+        EVENTOS.info("cliente_persistido", "- {cliente}", cliente=str(cliente), cnpj=cliente.cnpj)
+
+
+def importar(args: argparse.Namespace) -> None:
+    """Importa arquivos de clientes e pedidos com pool de processos."""
+    escrita = ConfiguracaoEscrita(intervalo=None)
+    with (
+        ClienteRepositoryArquivo(args.clientes_destino, escrita=escrita) as cliente_repo,
+        PedidoRepositoryArquivo(
+            args.pedidos_destino, ConfiguracaoArquivo(escrita=escrita)
+        ) as pedido_repo,
+    ):
+        resumo = ImportacaoService(cliente_repo, pedido_repo).importar(
+            args.clientes, args.pedidos, args.rejeitados, args.workers, args.tamanho_lote
+        )
+
+    print(f"Clientes importados: {resumo.clientes_importados}")
+    print(f"Clientes rejeitados: {resumo.clientes_rejeitados}")
+    print(f"Pedidos importados: {resumo.pedidos_importados}")
+    print(f"Pedidos rejeitados: {resumo.pedidos_rejeitados}")
+    total = resumo.pedidos_importados + resumo.pedidos_rejeitados
+    if resumo.duracao > 0:
+        print(f"Tempo: {resumo.duracao:.2f}s ({total / resumo.duracao:.0f} pedidos/s)")
+    if resumo.clientes_rejeitados or resumo.pedidos_rejeitados:
+        print(f"Rejeições gravadas em {args.rejeitados}")
+
+
+def relatorio(args: argparse.Namespace) -> None:
+    """Imprime o relatório de vendas do arquivo de pedidos."""
+    resultado = RelatorioService(PedidoRepositoryArquivo(args.pedidos)).gerar(
+        args.top, args.workers
+    )
+    if args.json:
+        print(json.dumps(resultado.para_dict(), ensure_ascii=False, indent=2))
+        return
+
+    totais = resultado.totais
+    print(f"Pedidos: {totais.pedidos} | Itens: {totais.itens} | Quantidade: {totais.quantidade}")
+    print(f"Bruto: R$ {totais.bruto:.2f}")
+    print(f"Desconto produto: R$ {totais.desconto_produto:.2f}")
+    print(f"Desconto cupom: R$ {totais.desconto_cupom:.2f}")
+    print(f"Receita: R$ {totais.receita:.2f}")
+    print("\nPor cupom:")
+    for codigo, t in resultado.por_cupom.items():
+        print(f"- {codigo}: {t.pedidos} pedidos, desconto R$ {t.desconto_cupom:.2f}")
+    print(f"\nTop {args.top} produtos:")
+    for tipo, t in resultado.top_produtos:
+        print(f"- {tipo}: R$ {t.receita:.2f} ({t.quantidade} un.)")
+    print(f"\nTop {args.top} clientes:")
+    for cnpj, nome, t in resultado.top_clientes:
+        print(f"- {nome} ({cnpj}): R$ {t.receita:.2f} em {t.pedidos} pedidos")
+
+
+def agregados(args: argparse.Namespace) -> None:
+    """Consulta (ou reconstrói) os totais de pedidos por cliente."""
+    pedido_repo = PedidoRepositoryArquivo(args.pedidos)
+    if args.reconstruir:
+        pedido_repo.reconstruir_agregados()
+        print("Totais por cliente reconstruídos.")
+    if args.cnpj:
+        totais = [pedido_repo.agregado_cliente(cnpj) for cnpj in args.cnpj]
+    else:
+        totais = list(pedido_repo.listar_agregados())
+    for cnpj, agregado in zip(args.cnpj or [a.cnpj for a in totais], totais):
+        if agregado is None:
+            print(f"- {cnpj}: sem pedidos")
+            continue
+        print(
+            f"- {cnpj}: {agregado.pedidos} pedidos, R$ {agregado.total:.2f} "
+            f"(desconto produto R$ {agregado.desconto_produto:.2f}, "
+            f"cupom R$ {agregado.desconto_cupom:.2f})"
+        )
+
+
+def compactar(args: argparse.Namespace) -> None:
+    """Compacta os períodos encerrados do repositório particionado de pedidos."""
+    pedido_repo = PedidoRepositoryParticionado(args.pedidos)
+    periodos = pedido_repo.compactar(args.compressao, timedelta(hours=args.carencia_horas))
+    print(f"Período(s) compactado(s): {', '.join(periodos) or 'nenhum'}.")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Ponto de entrada de linha de comando."""
+    parser = argparse.ArgumentParser(prog="python -m src.main")
+    parser.add_argument(
+        "--metricas-prometheus", type=Path, help="Grava métricas em texto Prometheus ao final"
+    )
+    parser.add_argument("--metricas-json", type=Path, help="Grava snapshot JSON das métricas")
+    parser.add_argument(
+        "--repositorio",
+        choices=REPOSITORIOS,
+        default="arquivo",
+        help="Persistência usada no processamento padrão",
+    )
+    parser.add_argument("--banco", default="petrobahia.db", help="Banco do repositório sqlite")
+    parser.add_argument(
+        "--eventos-nivel",
+        choices=[nivel.name.lower() for nivel in Nivel],
+        help="Menor nível de evento registrado (padrão: PETROBAHIA_EVENTOS ou debug; "
+        "silencio desliga os eventos)",
+    )
+    parser.add_argument(
+        "--eventos-jsonl", type=Path, help="Grava os eventos em JSON lines, em segundo plano"
+    )
+    comandos = parser.add_subparsers(dest="comando")
+
+    parser_importar = comandos.add_parser("importar", help="Importação em massa")
+    parser_importar.add_argument("--clientes", type=Path, help="CSV com nome, email, cnpj")
+    parser_importar.add_argument("--pedidos", type=Path, help="JSON lines de pedidos")
+    parser_importar.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser_importar.add_argument("--tamanho-lote", type=int, default=1000)
+    parser_importar.add_argument("--rejeitados", type=Path, default=Path("rejeitados.jsonl"))
+    parser_importar.add_argument("--clientes-destino", default="clientes.txt")
+    parser_importar.add_argument("--pedidos-destino", default="pedidos.txt")
+
+    parser_relatorio = comandos.add_parser("relatorio", help="Relatório de vendas")
+    parser_relatorio.add_argument("--pedidos", default="pedidos.txt")
+    parser_relatorio.add_argument("--top", type=int, default=10)
+    parser_relatorio.add_argument("--workers", type=int, default=1)
+    parser_relatorio.add_argument("--json", action="store_true", help="Saída em JSON")
+
+    parser_agregados = comandos.add_parser("agregados", help="Totais de pedidos por cliente")
+    parser_agregados.add_argument("--pedidos", default="pedidos.txt")
+    parser_agregados.add_argument("--cnpj", action="append", help="Consulta só estes CNPJs")
+    parser_agregados.add_argument(
+        "--reconstruir", action="store_true", help="Recalcula a tabela a partir dos pedidos"
+    )
+
+    parser_compactar = comandos.add_parser(
+        "compactar", help="Compacta os períodos encerrados dos pedidos particionados"
+    )
+    parser_compactar.add_argument("--pedidos", default="pedidos.particoes")
+    parser_compactar.add_argument("--compressao", choices=sorted(COMPRESSOES), default="nenhuma")
+    parser_compactar.add_argument(
+        "--carencia-horas", type=float, default=24, help="Espera após o fim do período"
+    )
+
+    args = parser.parse_args(argv)
+    if args.metricas_prometheus or args.metricas_json:
+        METRICAS.ativar()
+    try:
+        nivel_eventos = nivel_configurado(args.eventos_nivel)
+    except ValueError as error:
+        parser.error(str(error))
+    with eventos_configurados(nivel_eventos, args.eventos_jsonl):
+        if args.comando == "importar":
+            importar(args)
+        elif args.comando == "relatorio":
+            relatorio(args)
+        elif args.comando == "agregados":
+            agregados(args)
+        elif args.comando == "compactar":
+            compactar(args)
+        else:
+            executar(args.repositorio, args.banco)
+    if args.metricas_prometheus:
+        METRICAS.gravar_prometheus(args.metricas_prometheus)
+    if args.metricas_json:
+        METRICAS.gravar_json(args.metricas_json)
 
 
 if __name__ == "__main__":  # pragma: no cover
-    executar()
+    main()
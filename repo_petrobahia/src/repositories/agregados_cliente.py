@@ -0,0 +1,215 @@
+"""Totais por CNPJ mantidos incrementalmente a cada pedido salvo.
+
+A tabela fica em memória e é persistida em um sidecar JSON lines ao lado
+do arquivo de pedidos. Cada atualização anexa o estado novo dos clientes
+afetados (a última linha de cada CNPJ vale), junto com o offset ``fim``
+do arquivo de pedidos que ela já reflete. Quando as linhas obsoletas
+passam a dominar o sidecar, ele é compactado (reescrito com uma linha por
+cliente, de forma atômica).
+
+Como no ``IndiceCnpj``, o maior ``fim`` indica até onde o arquivo de
+pedidos está coberto: registros anexados por fora são somados na próxima
+consulta e, se o arquivo encolheu, a tabela é reconstruída do zero. Se
+quem anexou foi outro processo com a mesma tabela, as linhas que ele
+acrescentou ao sidecar são lidas no lugar dos registros.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Callable, Iterator
+
+from src.repositories.formatos import ERROS_DECODIFICACAO
+from src.repositories.trava_arquivo import AcompanhamentoSidecar
+
+# (offset, fim, dados) de cada registro a partir de um offset inicial
+IteradorDados = Callable[[int], Iterator[tuple[int, int, dict]]]
+
+# Compacta quando há mais linhas que este múltiplo da quantidade de clientes
+_FATOR_COMPACTACAO = 4
+_MINIMO_COMPACTACAO = 1024
+
+
+@dataclass(slots=True)
+class AgregadoCliente:
+    """Totais dos pedidos de um cliente."""
+
+    cnpj: str
+    pedidos: int = 0
+    quantidade: int = 0
+    bruto: float = 0.0
+    desconto_produto: float = 0.0
+    desconto_cupom: float = 0.0
+    total: float = 0.0
+    ultimo_pedido_offset: int = -1
+    ultimo_pedido_total: float = 0.0
+
+    def somar_pedido(self, dados: dict, offset: int) -> None:
+        """Soma um registro de pedido persistido."""
+        self.pedidos += 1
+        for item in dados["itens"]:
+            self.quantidade += item["quantidade"]
+            self.bruto += item["preco_unitario"] * item["quantidade"]
+            self.desconto_produto += item["desconto_produto"]
+            self.desconto_cupom += item["desconto_cupom"]
+        self.total += dados["preco_total"]
+        self.ultimo_pedido_offset = offset
+        self.ultimo_pedido_total = dados["preco_total"]
+
+
+_CAMPOS = tuple(campo.name for campo in fields(AgregadoCliente))
+
+
+class AgregadosClientes:
+    """Tabela CNPJ -> ``AgregadoCliente`` persistida em sidecar."""
+
+    def __init__(self, caminho_tabela: Path, caminho_dados: Path, iterar: IteradorDados):
+        self._path = caminho_tabela
+        self._dados = caminho_dados
+        self._iterar = iterar
+        self._tabela: dict[str, AgregadoCliente] = {}
+        self._linhas = 0
+        self._coberto = 0
+        self._carregado = False
+        self._acompanhamento = AcompanhamentoSidecar(caminho_tabela)
+
+    def obter(self, cnpj: str) -> AgregadoCliente | None:
+        """Totais do cliente (cópia), sincronizando antes; None se não houver pedidos."""
+        self.sincronizar()
+        agregado = self._tabela.get(cnpj)
+        return None if agregado is None else AgregadoCliente(**asdict(agregado))
+
+    def listar(self) -> Iterator[AgregadoCliente]:
+        """Percorre os totais de todos os clientes."""
+        self.sincronizar()
+        for agregado in list(self._tabela.values()):
+            yield AgregadoCliente(**asdict(agregado))
+
+    def registrar_lote(self, entradas: list[tuple[dict, int, int]]) -> None:
+        """Soma registros recém-anexados, em ordem de offset, como (dados, offset, fim)."""
+        if not entradas:
+            return
+        if not self._carregado:
+            self._carregar()
+        offset, fim = entradas[0][1], entradas[-1][2]
+        if offset > self._coberto:
+            self._acompanhar()
+        if fim <= self._coberto:
+            # Já somados pela carga/reconstrução que acabou de ocorrer
+            return
+        if offset < self._coberto:
+            self.reconstruir()
+            return
+        if offset > self._coberto:
+            # Outro escritor anexou registros desde a última sincronização
+            self._somar(self._ler_de(self._coberto, ate=offset))
+        self._somar(entradas)
+
+    def sincronizar(self) -> None:
+        """Garante que a tabela cobre o arquivo de pedidos inteiro."""
+        if not self._carregado:
+            self._carregar()
+        tamanho = self._dados.stat().st_size if self._dados.exists() else 0
+        if tamanho < self._coberto:
+            self.reconstruir()
+        elif tamanho > self._coberto:
+            self._acompanhar()
+        if self._coberto < tamanho:
+            try:
+                self._somar(self._ler_de(self._coberto))
+            except ERROS_DECODIFICACAO:
+                # O trecho coberto não termina mais em um registro: arquivo reescrito
+                self.reconstruir()
+
+    def reconstruir(self) -> None:
+        """Recalcula a tabela a partir do arquivo de pedidos inteiro."""
+        self._tabela = {}
+        self._coberto = 0
+        self._carregado = True
+        for offset, fim, dados in self._iterar(0):
+            self._agregado(dados["cliente"]["cnpj"]).somar_pedido(dados, offset)
+            self._coberto = fim
+        self._compactar()
+
+    def _carregar(self) -> None:
+        self._carregado = True
+        if not self._path.exists():
+            self.reconstruir()
+            return
+        with self._path.open("rb") as file:
+            for linha in file:
+                entrada = self._entrada(linha)
+                if entrada is None:
+                    # Entrada truncada por interrupção: o trecho é somado de novo
+                    continue
+                agregado, fim = entrada
+                self._tabela[agregado.cnpj] = agregado
+                self._coberto = max(self._coberto, fim)
+                self._linhas += 1
+            self._acompanhamento.marcar(file.tell())
+
+    def _acompanhar(self) -> None:
+        """Incorpora linhas anexadas ao sidecar por outros processos."""
+        coberto = self._coberto
+        for entrada in map(self._entrada, self._acompanhamento.linhas_novas() or ()):
+            # Linhas com ``fim`` já coberto são as deste processo ou anteriores
+            if entrada is not None and entrada[1] > coberto:
+                agregado, fim = entrada
+                self._tabela[agregado.cnpj] = agregado
+                self._coberto = max(self._coberto, fim)
+                self._linhas += 1
+
+    @staticmethod
+    def _entrada(linha: bytes) -> tuple[AgregadoCliente, int] | None:
+        try:
+            entrada = json.loads(linha)
+            return AgregadoCliente(**{campo: entrada[campo] for campo in _CAMPOS}), entrada["fim"]
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def _ler_de(self, inicio: int, ate: int | None = None) -> list[tuple[dict, int, int]]:
+        entradas = []
+        for offset, fim, dados in self._iterar(inicio):
+            if ate is not None and offset >= ate:
+                break
+            entradas.append((dados, offset, fim))
+        return entradas
+
+    def _somar(self, entradas: list[tuple[dict, int, int]]) -> None:
+        if not entradas:
+            return
+        alterados: dict[str, AgregadoCliente] = {}
+        for dados, offset, _ in entradas:
+            agregado = self._agregado(dados["cliente"]["cnpj"])
+            agregado.somar_pedido(dados, offset)
+            alterados[agregado.cnpj] = agregado
+        self._coberto = max(self._coberto, entradas[-1][2])
+
+        if self._linhas + len(alterados) > max(
+            _MINIMO_COMPACTACAO, _FATOR_COMPACTACAO * len(self._tabela)
+        ):
+            self._compactar()
+            return
+        with self._path.open("ab") as file:
+            inicio = file.tell()
+            file.write("".join(self._linha(a) for a in alterados.values()).encode("utf-8"))
+            self._acompanhamento.anexado(inicio, file.tell())
+        self._linhas += len(alterados)
+
+    def _compactar(self) -> None:
+        temporario = self._path.with_name(self._path.name + ".tmp")
+        with temporario.open("w", encoding="utf-8") as file:
+            file.writelines(self._linha(a) for a in self._tabela.values())
+        os.replace(temporario, self._path)
+        self._acompanhamento.marcar()
+        self._linhas = len(self._tabela)
+
+    def _linha(self, agregado: AgregadoCliente) -> str:
+        return json.dumps({**asdict(agregado), "fim": self._coberto}, ensure_ascii=False) + "\n"
+
+    def _agregado(self, cnpj: str) -> AgregadoCliente:
+        agregado = self._tabela.get(cnpj)
+        if agregado is None:
+            agregado = self._tabela[cnpj] = AgregadoCliente(cnpj)
+        return agregado
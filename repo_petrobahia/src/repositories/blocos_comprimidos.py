@@ -0,0 +1,214 @@
+"""Arquivo de registros em blocos comprimidos, com acesso aleatório por bloco.
+
+Usado para as partes compactadas de ``PedidoRepositoryParticionado``. Os
+registros (já codificados por um ``FormatoRegistro``) são agrupados por
+CNPJ, na ordem de gravação dentro de cada cliente, e divididos em blocos de
+cerca de ``tamanho_bloco`` bytes. Cada bloco é comprimido sozinho, então
+ler os pedidos de um cliente descomprime só os blocos que os contêm.
+
+Layout::
+
+    #petrobahia-blocos:1\\n
+    <bloco 0><bloco 1>...           (comprimidos independentemente)
+    <rodapé JSON>
+    <offset do rodapé: 8 bytes big-endian>
+
+O rodapé guarda o formato e a compressão dos registros, a tabela de blocos
+(offset, tamanho comprimido, ordinal do primeiro registro) e, por CNPJ, a
+faixa de ordinais dos seus registros.
+"""
+
+import gzip
+import json
+import lzma
+import os
+import struct
+from bisect import bisect_right
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator
+
+from src.repositories.formatos import FormatoRegistro, obter_formato
+
+CABECALHO = b"#petrobahia-blocos:1\n"
+TAMANHO_BLOCO_PADRAO = 64 * 1024
+
+_OFFSET_RODAPE = struct.Struct(">Q")
+# Blocos descomprimidos mantidos em memória por arquivo aberto
+_BLOCOS_EM_CACHE = 8
+
+COMPRESSOES: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "nenhuma": (bytes, bytes),
+    "gzip": (lambda dados: gzip.compress(dados, mtime=0), gzip.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+
+def validar_compressao(nome: str) -> str:
+    """Confere o nome da compressão.
+
+    Raises:
+        ValueError: Se a compressão não existir
+    """
+    if nome not in COMPRESSOES:
+        raise ValueError(f"Compressão '{nome}' desconhecida. Opções: {', '.join(COMPRESSOES)}.")
+    return nome
+
+
+def gravar_blocos(
+    destino: Path,
+    clientes: Iterable[tuple[str, Iterable[bytes]]],
+    formato: FormatoRegistro,
+    compressao: str = "nenhuma",
+    tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+) -> int:
+    """Grava os registros de cada cliente, em sequência, em blocos comprimidos.
+
+    ``clientes`` traz (cnpj, registros codificados em ``formato``); os
+    registros de um mesmo CNPJ devem vir juntos. A gravação passa por
+    ``<destino>.tmp`` e termina com ``os.replace``.
+
+    Returns:
+        Quantidade de registros gravados
+
+    Raises:
+        ValueError: Se a compressão não existir ou ``tamanho_bloco`` não for positivo
+    """
+    comprimir = COMPRESSOES[validar_compressao(compressao)][0]
+    if tamanho_bloco < 1:
+        raise ValueError("tamanho_bloco deve ser positivo.")
+
+    temporario = destino.with_name(destino.name + ".tmp")
+    blocos: list[tuple[int, int, int]] = []
+    faixas: dict[str, list[int]] = {}
+    total = 0
+    with temporario.open("wb") as saida:
+        saida.write(CABECALHO)
+        buffer: list[bytes] = []
+        tamanho = primeiro = 0
+
+        def fechar_bloco() -> None:
+            comprimido = comprimir(b"".join(buffer))
+            blocos.append((saida.tell(), len(comprimido), primeiro))
+            saida.write(comprimido)
+
+        for cnpj, registros in clientes:
+            faixa = faixas.setdefault(cnpj, [total, 0])
+            for registro in registros:
+                if tamanho >= tamanho_bloco:
+                    fechar_bloco()
+                    buffer, tamanho, primeiro = [], 0, total
+                buffer.append(registro)
+                tamanho += len(registro)
+                total += 1
+            faixa[1] = total - faixa[0]
+        if buffer:
+            fechar_bloco()
+
+        rodape = {
+            "formato": formato.nome,
+            "compressao": compressao,
+            "registros": total,
+            "blocos": blocos,
+            "clientes": faixas,
+        }
+        posicao = saida.tell()
+        saida.write(json.dumps(rodape, separators=(",", ":")).encode("utf-8"))
+        saida.write(_OFFSET_RODAPE.pack(posicao))
+        saida.flush()
+        os.fsync(saida.fileno())
+    os.replace(temporario, destino)
+    return total
+
+
+class ArquivoBlocos:
+    """Leitura de um arquivo gravado por ``gravar_blocos``.
+
+    O rodapé é lido uma vez, na abertura; cada consulta abre o arquivo,
+    localiza os blocos pela tabela e descomprime só esses (os mais recentes
+    ficam em cache).
+
+    Raises:
+        ValueError: Se o arquivo não for um arquivo de blocos
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        with path.open("rb") as file:
+            if file.read(len(CABECALHO)) != CABECALHO:
+                raise ValueError(f"Arquivo {path} não é um arquivo de blocos.")
+            fim = file.seek(-_OFFSET_RODAPE.size, os.SEEK_END)
+            (posicao,) = _OFFSET_RODAPE.unpack(file.read(_OFFSET_RODAPE.size))
+            file.seek(posicao)
+            rodape = json.loads(file.read(fim - posicao))
+        self.formato = obter_formato(rodape["formato"])
+        self.compressao = rodape["compressao"]
+        self.registros: int = rodape["registros"]
+        self._descomprimir = COMPRESSOES[validar_compressao(self.compressao)][1]
+        self._blocos: list[list[int]] = rodape["blocos"]
+        self._primeiros = [primeiro for _, _, primeiro in self._blocos]
+        self._clientes: dict[str, list[int]] = rodape["clientes"]
+        self._cache: OrderedDict[int, list[bytes]] = OrderedDict()
+
+    @property
+    def caminho(self) -> Path:
+        return self._path
+
+    def cnpjs(self) -> Iterator[str]:
+        """CNPJs com registros no arquivo."""
+        return iter(self._clientes)
+
+    def quantidade(self, cnpj: str) -> int:
+        """Quantidade de registros do CNPJ."""
+        faixa = self._clientes.get(cnpj)
+        return 0 if faixa is None else faixa[1]
+
+    def brutos(self, cnpj: str, desde: int = 0, quantidade: int | None = None) -> list[bytes]:
+        """Registros do CNPJ (bytes, sem decodificar), do ``desde``-ésimo em diante."""
+        faixa = self._clientes.get(cnpj)
+        if faixa is None:
+            return []
+        primeiro, total = faixa
+        fim = primeiro + total
+        inicio = primeiro + min(max(desde, 0), total)
+        if quantidade is not None:
+            fim = min(fim, inicio + quantidade)
+        return self._faixa(inicio, fim)
+
+    def iterar_brutos(self) -> Iterator[bytes]:
+        """Todos os registros, bloco a bloco."""
+        with self._path.open("rb") as file:
+            for numero in range(len(self._blocos)):
+                yield from self._bloco(file, numero)
+
+    def _faixa(self, inicio: int, fim: int) -> list[bytes]:
+        if inicio >= fim:
+            return []
+        resultado: list[bytes] = []
+        numero = bisect_right(self._primeiros, inicio) - 1
+        with self._path.open("rb") as file:
+            while len(resultado) < fim - inicio:
+                primeiro = self._primeiros[numero]
+                registros = self._bloco(file, numero)
+                resultado.extend(registros[max(inicio - primeiro, 0) : fim - primeiro])
+                numero += 1
+        return resultado
+
+    def _bloco(self, file: BinaryIO, numero: int) -> list[bytes]:
+        registros = self._cache.get(numero)
+        if registros is not None:
+            self._cache.move_to_end(numero)
+            return registros
+        offset, tamanho, _ = self._blocos[numero]
+        file.seek(offset)
+        dados = self._descomprimir(file.read(tamanho))
+        buffer, registros, posicao = BytesIO(dados), [], 0
+        while posicao < len(dados):
+            bruto = self.formato.ler_bruto(buffer, posicao)
+            registros.append(bruto)
+            posicao += len(bruto)
+        self._cache[numero] = registros
+        if len(self._cache) > _BLOCOS_EM_CACHE:
+            self._cache.popitem(last=False)
+        return registros
@@ -0,0 +1,145 @@
+"""Cache em memória CNPJ -> Cliente para o repositório em arquivo.
+
+O arquivo é lido uma única vez para montar o mapa CNPJ -> offset. Depois,
+cada consulta só confere ``stat`` do arquivo: se ele cresceu e os últimos
+bytes já lidos continuam iguais, apenas o trecho novo é lido; caso
+contrário (encolheu, foi reescrito ou mudou de mtime sem crescer), o mapa
+é recarregado. ``salvar`` atualiza o cache diretamente.
+
+Sem limite, todos os clientes ficam hidratados em memória. Com
+``max_itens``, só os mais recentemente usados ficam hidratados (LRU); os
+demais são relidos do disco pelo offset, sem varrer o arquivo.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+
+from src.domain.models.cliente import Cliente
+from src.repositories.formatos import ERROS_DECODIFICACAO, FormatoRegistro
+
+# Bytes finais do trecho já lido, comparados para detectar reescritas
+_TAMANHO_ASSINATURA = 32
+
+
+class _ArquivoReescrito(Exception):
+    """O trecho já lido do arquivo mudou desde a última leitura."""
+
+
+class CacheClientes:
+    """Mapa CNPJ -> offset com clientes hidratados sob política LRU opcional."""
+
+    def __init__(
+        self,
+        path: Path,
+        formato: FormatoRegistro,
+        inicio_dados: int,
+        max_itens: int | None = None,
+    ):
+        if max_itens is not None and max_itens <= 0:
+            raise ValueError("max_itens deve ser positivo.")
+        self._path = path
+        self._formato = formato
+        self._inicio_dados = inicio_dados
+        self._max_itens = max_itens
+        self._offsets: dict[str, int] = {}
+        self._clientes: OrderedDict[str, Cliente] = OrderedDict()
+        self._coberto = 0
+        self._assinatura = b""
+        self._mtime: int | None = None
+        self._carregado = False
+
+    def obter(self, cnpj: str) -> Cliente | None:
+        """Retorna o cliente mais recente com o CNPJ, ou None."""
+        self._validar()
+        cliente = self._clientes.get(cnpj)
+        if cliente is not None:
+            self._clientes.move_to_end(cnpj)
+            return cliente
+        offset = self._offsets.get(cnpj)
+        if offset is None:
+            return None
+        with self._path.open("rb") as file:
+            cliente = self._montar(self._formato.ler(file, offset))
+        self._lembrar(cliente)
+        return cliente
+
+    def lembrar(self, cliente: Cliente) -> None:
+        """Mantém hidratado um cliente recém-salvo."""
+        if self._carregado:
+            self._lembrar(cliente)
+
+    def registrar_lote(self, gravados: list[tuple[str, int, int]]) -> None:
+        """Registra offsets de clientes recém-gravados por este processo."""
+        if not self._carregado or not gravados or gravados[0][1] != self._coberto:
+            # Sem carga prévia ou com escrita de terceiros no meio: a próxima
+            # validação lê o trecho novo do arquivo
+            return
+        for cnpj, offset, fim in gravados:
+            self._offsets[cnpj] = offset
+        with self._path.open("rb") as file:
+            self._cobrir(file, gravados[-1][2])
+        self._mtime = self._path.stat().st_mtime_ns
+
+    def invalidar(self) -> None:
+        """Força a recarga completa na próxima consulta."""
+        self._carregado = False
+
+    def _validar(self) -> None:
+        estado = self._path.stat()
+        if (
+            not self._carregado
+            or estado.st_size < self._coberto
+            or (estado.st_size == self._coberto and estado.st_mtime_ns != self._mtime)
+        ):
+            self._recarregar()
+        elif estado.st_size > self._coberto:
+            try:
+                self._ler_de(self._coberto, verificar=True)
+            except (_ArquivoReescrito, *ERROS_DECODIFICACAO):
+                self._recarregar()
+        self._mtime = estado.st_mtime_ns
+
+    def _recarregar(self) -> None:
+        self._offsets.clear()
+        self._clientes.clear()
+        self._coberto = 0
+        self._assinatura = b""
+        self._carregado = True
+        self._ler_de(self._inicio_dados)
+
+    def _ler_de(self, inicio: int, verificar: bool = False) -> None:
+        hidratar = self._max_itens is None
+        with self._path.open("rb") as file:
+            if verificar and self._ler_assinatura(file, self._coberto) != self._assinatura:
+                raise _ArquivoReescrito
+            fim = None
+            for offset, fim, dados in self._formato.iterar(file, max(inicio, self._inicio_dados)):
+                cnpj = dados["cnpj"]
+                self._offsets[cnpj] = offset
+                if hidratar:
+                    self._clientes[cnpj] = self._montar(dados)
+                else:
+                    # Versão antiga hidratada deixaria de refletir o arquivo
+                    self._clientes.pop(cnpj, None)
+            if fim is not None:
+                self._cobrir(file, fim)
+
+    def _cobrir(self, file, fim: int) -> None:
+        self._coberto = fim
+        self._assinatura = self._ler_assinatura(file, fim)
+
+    @staticmethod
+    def _ler_assinatura(file, fim: int) -> bytes:
+        inicio = max(fim - _TAMANHO_ASSINATURA, 0)
+        file.seek(inicio)
+        return file.read(fim - inicio)
+
+    def _lembrar(self, cliente: Cliente) -> None:
+        self._clientes[cliente.cnpj] = cliente
+        self._clientes.move_to_end(cliente.cnpj)
+        if self._max_itens is not None and len(self._clientes) > self._max_itens:
+            self._clientes.popitem(last=False)
+
+    @staticmethod
+    def _montar(dados: dict) -> Cliente:
+        return Cliente(email=dados["email"], nome=dados["nome"], cnpj=dados["cnpj"])
@@ -1,35 +1,191 @@
-import ast
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
+from src.domain.exceptions import ClienteDuplicadoError
 from src.domain.models.cliente import Cliente
+from src.infrastructure.eventos import EVENTOS, RegistroEventos
+from src.infrastructure.metricas import (
+    METRICAS,
+    OPERACAO_REPOSITORIO,
+    Metricas,
+    cronometrado,
+)
+from src.repositories.cache_clientes import CacheClientes
+from src.repositories.escritor_agrupado import ConfiguracaoEscrita, EscritorAgrupado
+from src.repositories.formatos import preparar_arquivo
+from src.repositories.indice_unico_cnpj import IndiceUnicoCnpj, chave_cnpj
 from src.repositories.interfaces.i_cliente_repository import IClienteRepository
+from src.repositories.interfaces.pagina import Pagina
+from src.repositories.paginacao import (
+    codificar_cursor,
+    offset_do_cursor,
+    validar_limite,
+)
+from src.repositories.trava_arquivo import TravaArquivo, anexar_registro
 
 
 class ClienteRepositoryArquivo(IClienteRepository):
-    """Persistência simples em arquivo texto (exemplo).
+    """Persistência simples em arquivo (exemplo).
 
-    Formato dict string.
+    O formato dos registros é definido pelo cabeçalho do arquivo
+    (ver ``src.repositories.formatos``); arquivos legados em dict string
+    continuam sendo lidos.
+
+    Com ``escrita`` informada, ``salvar`` passa a gravar em lotes (ver
+    ``EscritorAgrupado``); use ``flush()``/``close()`` ou ``with``.
+
+    ``buscar_por_cnpj`` usa um cache em memória (ver ``CacheClientes``),
+    limitado a ``max_cache`` clientes hidratados quando informado.
+
+    Como em ``PedidoRepositoryArquivo``, gravações de vários processos são
+    coordenadas pela trava ``<arquivo>.lock`` (ver ``TravaArquivo``).
+
+    ``salvar`` grava uma nova versão do cliente; ``cadastrar`` recusa CNPJ
+    já cadastrado, conferido pelo índice de unicidade (ver
+    ``IndiceUnicoCnpj``), que toda gravação mantém atualizado.
     """
 
-    def __init__(self, caminho_arquivo: str = "clientes.txt"):
+    def __init__(
+        self,
+        caminho_arquivo: str = "clientes.txt",
+        formato: str | None = None,
+        escrita: ConfiguracaoEscrita | None = None,
+        max_cache: int | None = None,
+        metricas: Metricas | None = None,
+        eventos: RegistroEventos | None = None,
+    ):
         self._path = Path(caminho_arquivo)
-        if not self._path.exists():
-            self._path.write_text("", encoding="utf-8")
+        self._metricas = metricas if metricas is not None else METRICAS
+        self._eventos = eventos if eventos is not None else EVENTOS
+        self._trava = TravaArquivo(self._path)
+        with self._trava.exclusiva():
+            self._formato, self._inicio_dados = preparar_arquivo(self._path, formato)
+        self._cache = CacheClientes(self._path, self._formato, self._inicio_dados, max_cache)
+        self._unicos = IndiceUnicoCnpj(self._path, self._iterar_cnpjs)
+        self._escritor = (
+            EscritorAgrupado(self._path, escrita, self._registrar_gravados, self._trava)
+            if escrita
+            else None
+        )
+
+    def __enter__(self) -> "ClienteRepositoryArquivo":
+        return self
 
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="cliente", operacao="flush")
+    def flush(self) -> None:
+        """Grava clientes pendentes do modo de escrita agrupada."""
+        if self._escritor is not None:
+            self._escritor.flush()
+
+    def close(self) -> None:
+        """Grava clientes pendentes e libera o arquivo."""
+        if self._escritor is not None:
+            self._escritor.close()
+        with self._trava.exclusiva():
+            self._unicos.fechar()
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="cliente", operacao="salvar")
     def salvar(self, cliente: Cliente) -> None:  # type: ignore[override]
-        linha = str({"nome": cliente.nome, "email": cliente.email, "cnpj": cliente.cnpj})
-        with self._path.open("a", encoding="utf-8") as file:
-            file.write(linha + "\n")
-        print(f"Cliente salvo: {cliente.cnpj}")
+        registro = self._codificar(cliente)
+        if self._escritor is not None:
+            self._escritor.anexar(registro, cliente.cnpj)
+        else:
+            with self._trava.exclusiva():
+                self._anexar(registro, cliente.cnpj)
+        self._cache.lembrar(cliente)
+        self._eventos.debug("cliente_salvo", "Cliente salvo: {cnpj}", cnpj=cliente.cnpj)
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="cliente", operacao="cadastrar")
+    def cadastrar(self, cliente: Cliente) -> None:
+        """Persiste um cliente novo; CNPJs são comparados só pelos dígitos.
+
+        Com escrita agrupada, o CNPJ é reservado no índice já nesta chamada,
+        antes de o registro chegar ao arquivo.
+
+        Raises:
+            ClienteDuplicadoError: Se o CNPJ já estiver cadastrado
+        """
+        if chave_cnpj(cliente.cnpj) is None:
+            # Fora do padrão de 14 dígitos não entra no índice
+            super().cadastrar(cliente)
+            return
+        registro = self._codificar(cliente)
+        with self._trava.exclusiva():
+            if not self._unicos.reservar(cliente.cnpj):
+                raise ClienteDuplicadoError(cliente.cnpj)
+            if self._escritor is None:
+                self._anexar(registro, cliente.cnpj)
+        if self._escritor is not None:
+            self._escritor.anexar(registro, cliente.cnpj)
+        self._cache.lembrar(cliente)
+        self._eventos.debug("cliente_salvo", "Cliente salvo: {cnpj}", cnpj=cliente.cnpj)
+
+    def cnpj_cadastrado(self, cnpj: str) -> bool:
+        """Se o CNPJ (com ou sem pontuação) já tem cliente, sem ler o arquivo de clientes."""
+        self.flush()
+        with self._trava.exclusiva():
+            return self._unicos.contem(cnpj)
 
     def listar(self) -> Iterable[Cliente]:
+        for _, cliente in self._clientes_desde(self._inicio_dados):
+            yield cliente
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="cliente", operacao="listar_pagina")
+    def listar_pagina(self, limite: int, cursor: str | None = None) -> Pagina[Cliente]:
+        """Até ``limite`` clientes a partir do cursor, na ordem de gravação.
+
+        O cursor guarda o offset do próximo registro: cada página começa com
+        um ``seek`` e lê só os seus registros (mais um, para saber se há
+        próxima), qualquer que seja o tamanho do arquivo.
+
+        Raises:
+            ValueError: Se ``limite`` não for positivo ou o cursor for inválido
+        """
+        validar_limite(limite)
+        inicio = offset_do_cursor(cursor, self._path, self._formato, self._inicio_dados)
+        clientes = []
+        for offset, cliente in self._clientes_desde(inicio):
+            if len(clientes) == limite:
+                return Pagina(clientes, codificar_cursor(offset))
+            clientes.append(cliente)
+        return Pagina(clientes)
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="cliente", operacao="buscar_por_cnpj")
+    def buscar_por_cnpj(self, cnpj: str) -> Cliente | None:
+        """Retorna o cliente pelo CNPJ (registro mais recente), ou None."""
+        self.flush()
+        with self._trava.compartilhada():
+            return self._cache.obter(cnpj)
+
+    def _clientes_desde(self, inicio: int) -> Iterator[tuple[int, Cliente]]:
+        """(offset, cliente) dos registros a partir de ``inicio``."""
         if not self._path.exists():
             return
-        with self._path.open("r", encoding="utf-8") as file:
-            for linha in file:
-                linha = linha.strip()
-                if not linha:
-                    continue
-                dados = ast.literal_eval(linha)
-                yield Cliente(email=dados["email"], nome=dados["nome"], cnpj=dados["cnpj"])
+        self.flush()
+        with self._trava.compartilhada():
+            limite = self._path.stat().st_size
+        with self._path.open("rb") as file:
+            for offset, _, dados in self._formato.iterar_ate(file, inicio, limite):
+                yield offset, Cliente(email=dados["email"], nome=dados["nome"], cnpj=dados["cnpj"])
+
+    def _codificar(self, cliente: Cliente) -> bytes:
+        return self._formato.codificar(
+            {"nome": cliente.nome, "email": cliente.email, "cnpj": cliente.cnpj}
+        )
+
+    def _anexar(self, registro: bytes, cnpj: str) -> None:
+        # Chamado com a trava exclusiva
+        offset = anexar_registro(self._path, registro)
+        self._registrar_gravados([(cnpj, offset, offset + len(registro))])
+
+    def _registrar_gravados(self, gravados: list[tuple[str, int, int]]) -> None:
+        self._cache.registrar_lote(gravados)
+        self._unicos.registrar(gravados)
+
+    def _iterar_cnpjs(self, inicio: int) -> Iterator[tuple[int, str]]:
+        with self._path.open("rb") as file:
+            for _, fim, dados in self._formato.iterar(file, max(inicio, self._inicio_dados)):
+                yield fim, dados["cnpj"]
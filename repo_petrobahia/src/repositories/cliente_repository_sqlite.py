@@ -0,0 +1,127 @@
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from src.domain.exceptions import ClienteDuplicadoError
+from src.domain.models.cliente import Cliente
+from src.domain.services.validar_cliente import normalizar_cnpj
+from src.infrastructure.eventos import EVENTOS, RegistroEventos
+from src.infrastructure.metricas import (
+    METRICAS,
+    OPERACAO_REPOSITORIO,
+    Metricas,
+    cronometrado,
+)
+from src.repositories.conexao_sqlite import conectar, transacao
+from src.repositories.interfaces.i_cliente_repository import IClienteRepository
+from src.repositories.interfaces.pagina import Pagina
+from src.repositories.paginacao import (
+    codificar_cursor,
+    decodificar_cursor,
+    validar_limite,
+)
+
+_INSERIR = "INSERT INTO clientes (cnpj, nome, email) VALUES (?, ?, ?)"
+_BUSCAR_POR_CNPJ = "SELECT nome, email, cnpj FROM clientes WHERE cnpj = ? ORDER BY id DESC LIMIT 1"
+_LISTAR = "SELECT nome, email, cnpj FROM clientes ORDER BY id"
+_PAGINA = "SELECT id, nome, email, cnpj FROM clientes WHERE id >= ? ORDER BY id LIMIT ?"
+# Mesma expressão do índice ix_clientes_cnpj_digitos, para que ele seja usado
+_EXISTE_DIGITOS = (
+    "SELECT 1 FROM clientes WHERE "
+    "replace(replace(replace(replace(cnpj, '.', ''), '/', ''), '-', ''), ' ', '') = ? LIMIT 1"
+)
+
+
+class ClienteRepositorySQLite(IClienteRepository):
+    """Persistência de clientes em SQLite (ver ``src.repositories.conexao_sqlite``).
+
+    Mantém a semântica do repositório em arquivo: cada ``salvar`` acrescenta
+    uma linha e ``buscar_por_cnpj`` devolve a mais recente do CNPJ, via
+    índice em ``clientes.cnpj``.
+    """
+
+    def __init__(
+        self,
+        caminho_banco: str | Path = "petrobahia.db",
+        metricas: Metricas | None = None,
+        eventos: RegistroEventos | None = None,
+    ):
+        self._conexao = conectar(caminho_banco)
+        self._metricas = metricas if metricas is not None else METRICAS
+        self._eventos = eventos if eventos is not None else EVENTOS
+
+    def __enter__(self) -> "ClienteRepositorySQLite":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        """Sem efeito: cada ``salvar`` já é uma transação confirmada."""
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        self._conexao.close()
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="cliente_sqlite", operacao="salvar")
+    def salvar(self, cliente: Cliente) -> None:  # type: ignore[override]
+        with transacao(self._conexao) as conexao:
+            conexao.execute(_INSERIR, (cliente.cnpj, cliente.nome, cliente.email))
+        self._eventos.debug("cliente_salvo", "Cliente salvo: {cnpj}", cnpj=cliente.cnpj)
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="cliente_sqlite", operacao="cadastrar")
+    def cadastrar(self, cliente: Cliente) -> None:
+        """Persiste um cliente novo; CNPJs comparados só pelos dígitos.
+
+        Conferência e inserção ficam na mesma transação ``IMMEDIATE``.
+
+        Raises:
+            ClienteDuplicadoError: Se o CNPJ já estiver cadastrado
+        """
+        digitos = normalizar_cnpj(cliente.cnpj) or cliente.cnpj
+        with transacao(self._conexao) as conexao:
+            if conexao.execute(_EXISTE_DIGITOS, (digitos,)).fetchone() is not None:
+                raise ClienteDuplicadoError(cliente.cnpj)
+            conexao.execute(_INSERIR, (cliente.cnpj, cliente.nome, cliente.email))
+        self._eventos.debug("cliente_salvo", "Cliente salvo: {cnpj}", cnpj=cliente.cnpj)
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="cliente_sqlite", operacao="salvar_lote")
+    def salvar_lote(self, clientes: Iterable[Cliente]) -> int:
+        """Grava vários clientes numa única transação; retorna a quantidade."""
+        return self.inserir_registros(
+            {"nome": c.nome, "email": c.email, "cnpj": c.cnpj} for c in clientes
+        )
+
+    def inserir_registros(self, registros: Iterable[dict]) -> int:
+        """Grava registros já serializados (``nome``/``email``/``cnpj``) com ``executemany``."""
+        linhas = [(r["cnpj"], r["nome"], r["email"]) for r in registros]
+        with transacao(self._conexao) as conexao:
+            conexao.executemany(_INSERIR, linhas)
+        return len(linhas)
+
+    def listar(self) -> Iterator[Cliente]:
+        for nome, email, cnpj in self._conexao.execute(_LISTAR):
+            yield Cliente(email=email, nome=nome, cnpj=cnpj)
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="cliente_sqlite", operacao="listar_pagina")
+    def listar_pagina(self, limite: int, cursor: str | None = None) -> Pagina[Cliente]:
+        """Até ``limite`` clientes a partir do cursor (id do próximo), pela chave primária.
+
+        Raises:
+            ValueError: Se ``limite`` não for positivo ou o cursor for inválido
+        """
+        validar_limite(limite)
+        linhas = self._conexao.execute(_PAGINA, (decodificar_cursor(cursor), limite + 1)).fetchall()
+        proximo = codificar_cursor(linhas.pop()[0]) if len(linhas) > limite else None
+        return Pagina(
+            [Cliente(email=email, nome=nome, cnpj=cnpj) for _, nome, email, cnpj in linhas],
+            proximo,
+        )
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="cliente_sqlite", operacao="buscar_por_cnpj")
+    def buscar_por_cnpj(self, cnpj: str) -> Cliente | None:
+        """Retorna o cliente pelo CNPJ (registro mais recente), ou None."""
+        linha = self._conexao.execute(_BUSCAR_POR_CNPJ, (cnpj,)).fetchone()
+        if linha is None:
+            return None
+        nome, email, cnpj = linha
+        return Cliente(email=email, nome=nome, cnpj=cnpj)
@@ -0,0 +1,90 @@
+"""Conexão e esquema do banco SQLite dos repositórios.
+
+Clientes e pedidos podem compartilhar o mesmo arquivo de banco; cada
+repositório abre sua própria conexão e garante o esquema completo.
+
+O banco roda em WAL (leitores não bloqueiam o escritor) com
+``synchronous=NORMAL``, suficiente para não corromper o banco em queda do
+processo. As consultas usam SQL parametrizado e constante, então o cache
+de statements do ``sqlite3`` reaproveita os statements preparados.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS clientes (
+    id INTEGER PRIMARY KEY,
+    cnpj TEXT NOT NULL,
+    nome TEXT NOT NULL,
+    email TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_clientes_cnpj ON clientes (cnpj);
+CREATE INDEX IF NOT EXISTS ix_clientes_cnpj_digitos
+    ON clientes (replace(replace(replace(replace(cnpj, '.', ''), '/', ''), '-', ''), ' ', ''));
+
+CREATE TABLE IF NOT EXISTS pedidos (
+    id INTEGER PRIMARY KEY,
+    cliente_cnpj TEXT NOT NULL,
+    cliente_nome TEXT NOT NULL,
+    cliente_email TEXT NOT NULL,
+    preco_total REAL NOT NULL,
+    criado_em TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_pedidos_cliente_cnpj ON pedidos (cliente_cnpj);
+
+CREATE TABLE IF NOT EXISTS itens_pedido (
+    pedido_id INTEGER NOT NULL REFERENCES pedidos (id),
+    posicao INTEGER NOT NULL,
+    produto_tipo TEXT NOT NULL,
+    cupom_codigo TEXT,
+    quantidade INTEGER NOT NULL,
+    preco_unitario REAL NOT NULL,
+    desconto_produto REAL NOT NULL,
+    desconto_cupom REAL NOT NULL,
+    preco_final REAL NOT NULL,
+    PRIMARY KEY (pedido_id, posicao)
+) WITHOUT ROWID;
+"""
+
+
+def conectar(caminho_banco: str | Path) -> sqlite3.Connection:
+    """Abre o banco em modo WAL e cria as tabelas que faltarem.
+
+    A conexão fica em autocommit (``isolation_level=None``); as escritas
+    abrem a própria transação (ver ``transacao``). Ela pode ser usada por
+    outra thread (adaptadores assíncronos), desde que uma de cada vez.
+    """
+    conexao = sqlite3.connect(str(caminho_banco), isolation_level=None, check_same_thread=False)
+    conexao.execute("PRAGMA journal_mode=WAL")
+    conexao.execute("PRAGMA synchronous=NORMAL")
+    conexao.execute("PRAGMA foreign_keys=ON")
+    conexao.executescript(ESQUEMA)
+    _atualizar_esquema(conexao)
+    return conexao
+
+
+def _atualizar_esquema(conexao: sqlite3.Connection) -> None:
+    """Acrescenta a bancos criados por versões anteriores as colunas novas."""
+    colunas = {linha[1] for linha in conexao.execute("PRAGMA table_info(pedidos)")}
+    if "criado_em" not in colunas:
+        conexao.execute("ALTER TABLE pedidos ADD COLUMN criado_em TEXT")
+    conexao.execute("CREATE INDEX IF NOT EXISTS ix_pedidos_criado_em ON pedidos (criado_em)")
+
+
+@contextmanager
+def transacao(conexao: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Envolve o bloco em ``BEGIN IMMEDIATE``/``COMMIT`` (``ROLLBACK`` em erro).
+
+    ``IMMEDIATE`` reserva a escrita já no início, evitando que dois
+    processos leiam o mesmo ``MAX(id)`` antes de gravar.
+    """
+    conexao.execute("BEGIN IMMEDIATE")
+    try:
+        yield conexao
+    except BaseException:
+        conexao.execute("ROLLBACK")
+        raise
+    conexao.execute("COMMIT")
@@ -0,0 +1,176 @@
+"""Escrita agrupada (group commit) para os repositórios em arquivo.
+
+Os registros são acumulados em memória e gravados de uma vez quando o
+buffer atinge ``max_bytes`` ou ``max_registros``, ou quando o registro mais
+antigo pendente passa de ``intervalo`` segundos. A política de fsync define
+a durabilidade: nunca, a cada lote gravado ou a cada registro.
+
+Com uma ``TravaArquivo``, cada lote é gravado (e ``ao_gravar`` chamado)
+sob a trava exclusiva, em uma única chamada ``write``.
+"""
+
+import os
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Callable
+
+from src.repositories.trava_arquivo import TravaArquivo, anexar_em
+
+# (chave, offset, fim) de cada registro efetivamente gravado
+AoGravar = Callable[[list[tuple[str, int, int]]], None]
+
+
+class PoliticaFsync(Enum):
+    """Quando forçar os dados gravados até o disco."""
+
+    NUNCA = "nunca"
+    POR_LOTE = "por_lote"
+    POR_REGISTRO = "por_registro"
+
+
+@dataclass(frozen=True)
+class ConfiguracaoEscrita:
+    """Limites do buffer e política de durabilidade da escrita agrupada."""
+
+    max_bytes: int = 64 * 1024
+    max_registros: int = 1000
+    intervalo: float | None = 1.0
+    fsync: PoliticaFsync = PoliticaFsync.NUNCA
+
+    def __post_init__(self):
+        if self.max_bytes <= 0 or self.max_registros <= 0:
+            raise ValueError("Limites do buffer devem ser positivos.")
+        if self.intervalo is not None and self.intervalo <= 0:
+            raise ValueError("Intervalo deve ser positivo.")
+
+
+class EscritorAgrupado:
+    """Mantém o arquivo aberto e grava registros em lotes.
+
+    Com ``intervalo`` definido, uma thread daemon grava lotes antigos mesmo
+    sem novas escritas. Uma falha nessa gravação é guardada e levantada na
+    próxima chamada a ``anexar``, ``flush`` ou ``close``; se a escrita não
+    chegou ao arquivo, os registros continuam no buffer para nova tentativa. Use ``flush()`` ou o
+    gerenciador de contexto para garantir que tudo foi gravado.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        config: ConfiguracaoEscrita,
+        ao_gravar: AoGravar | None = None,
+        trava: TravaArquivo | None = None,
+    ):
+        self._config = config
+        self._ao_gravar = ao_gravar
+        self._trava = trava
+        self._file = path.open("ab")
+        self._buffer = bytearray()
+        self._pendentes: list[tuple[str, int, int]] = []
+        self._primeiro_em: float | None = None
+        self._erro: Exception | None = None
+        self._lock = threading.Lock()
+        self._parar = threading.Event()
+        self._thread = None
+        if config.intervalo is not None and config.fsync is not PoliticaFsync.POR_REGISTRO:
+            self._thread = threading.Thread(target=self._laco_intervalo, daemon=True)
+            self._thread.start()
+
+    def __enter__(self) -> "EscritorAgrupado":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    @property
+    def pendentes(self) -> int:
+        """Quantidade de registros ainda em memória."""
+        return len(self._pendentes)
+
+    def anexar(
+        self, registro: bytes, chave: str = "", ao_enfileirar: Callable[[], None] | None = None
+    ) -> None:
+        """Acumula um registro; grava o lote se algum limite for atingido.
+
+        ``ao_enfileirar`` é chamado sob a mesma trava, logo antes de o registro
+        entrar no buffer: quem acompanha os pendentes em paralelo (ex.: os
+        dados de cada registro para ``ao_gravar``) fica na mesma ordem.
+        """
+        with self._lock:
+            if self._file.closed:
+                raise ValueError("Escritor já foi fechado.")
+            self._levantar_erro()
+            if ao_enfileirar is not None:
+                ao_enfileirar()
+            inicio = len(self._buffer)
+            self._buffer += registro
+            self._pendentes.append((chave, inicio, len(self._buffer)))
+            if self._primeiro_em is None:
+                self._primeiro_em = time.monotonic()
+            if (
+                self._config.fsync is PoliticaFsync.POR_REGISTRO
+                or len(self._buffer) >= self._config.max_bytes
+                or len(self._pendentes) >= self._config.max_registros
+            ):
+                self._descarregar()
+
+    def flush(self) -> None:
+        """Grava imediatamente os registros pendentes."""
+        with self._lock:
+            self._levantar_erro()
+            self._descarregar()
+
+    def close(self) -> None:
+        """Grava o que estiver pendente e fecha o arquivo."""
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._lock:
+            erro, self._erro = self._erro, None
+            if not self._file.closed:
+                try:
+                    self._descarregar()
+                finally:
+                    self._file.close()
+        if erro is not None:
+            raise erro
+
+    def _levantar_erro(self) -> None:
+        if self._erro is not None:
+            erro, self._erro = self._erro, None
+            raise erro
+
+    def _descarregar(self) -> None:
+        if not self._buffer:
+            return
+        with self._trava.exclusiva() if self._trava is not None else nullcontext():
+            base = anexar_em(self._file.fileno(), self._buffer)
+            if self._config.fsync is not PoliticaFsync.NUNCA:
+                os.fsync(self._file.fileno())
+            gravados = [
+                (chave, base + inicio, base + fim) for chave, inicio, fim in self._pendentes
+            ]
+            self._buffer = bytearray()
+            self._pendentes = []
+            self._primeiro_em = None
+            if self._ao_gravar is not None:
+                self._ao_gravar(gravados)
+
+    def _laco_intervalo(self) -> None:
+        intervalo = self._config.intervalo
+        while not self._parar.wait(intervalo / 2):
+            with self._lock:
+                if (
+                    self._primeiro_em is not None
+                    and time.monotonic() - self._primeiro_em >= intervalo
+                    and not self._file.closed
+                    and self._erro is None
+                ):
+                    try:
+                        self._descarregar()
+                    except Exception as error:  # pylint: disable=broad-exception-caught
+                        self._erro = error
@@ -0,0 +1,456 @@
+"""Formatos de serialização dos registros dos repositórios em arquivo.
+
+Cada arquivo começa com um cabeçalho versionado de uma linha,
+``#petrobahia:<formato>:<versao>``, que identifica o formato dos registros
+seguintes. Arquivos sem cabeçalho são do formato legado (``str(dict)`` por
+linha, lido com ``ast.literal_eval``), que continua aceito na leitura.
+
+Formatos disponíveis:
+- ``legado``: dict string por linha (sem cabeçalho)
+- ``jsonl``: um objeto JSON por linha
+- ``binario``: registros prefixados pelo tamanho (4 bytes), com os valores
+  em uma codificação própria com ``struct`` (ver ``FormatoBinario``),
+  estável entre versões do Python
+"""
+
+import ast
+import json
+import struct
+from abc import ABC, abstractmethod
+from mmap import mmap
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+PREFIXO_CABECALHO = b"#petrobahia:"
+FORMATO_PADRAO = "jsonl"
+
+# Conteúdo pesquisável por ``localizar`` (em geral o arquivo mapeado em memória)
+Buffer = bytes | bytearray | mmap
+
+# Erros possíveis ao decodificar bytes que não são um registro válido
+ERROS_DECODIFICACAO = (
+    ValueError,
+    SyntaxError,
+    TypeError,
+    KeyError,
+    EOFError,
+    UnicodeDecodeError,
+)
+
+
+class FormatoRegistro(ABC):
+    """Strategy de codificação de registros (dicts) em bytes."""
+
+    nome: str = ""
+    versao: int = 1
+
+    @property
+    def cabecalho(self) -> bytes:
+        """Linha de cabeçalho gravada no início de arquivos novos."""
+        return PREFIXO_CABECALHO + f"{self.nome}:{self.versao}\n".encode("ascii")
+
+    @abstractmethod
+    def codificar(self, dados: dict) -> bytes:
+        """Retorna o registro pronto para ser anexado ao arquivo."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iterar(self, file: BinaryIO, inicio: int) -> Iterator[tuple[int, int, dict]]:
+        """Percorre os registros a partir de ``inicio`` como (offset, fim, dados)."""
+        raise NotImplementedError
+
+    def iterar_ate(
+        self, file: BinaryIO, inicio: int, limite: int
+    ) -> Iterator[tuple[int, int, dict]]:
+        """Como ``iterar``, só com os registros que começam antes de ``limite``.
+
+        Bytes a partir de ``limite`` (ex.: um registro sendo gravado por outro
+        processo depois que o tamanho foi lido) não precisam ser válidos.
+        """
+        fim = inicio
+        try:
+            for offset, fim, dados in self.iterar(file, inicio):
+                if offset >= limite:
+                    return
+                yield offset, fim, dados
+        except ERROS_DECODIFICACAO:
+            if fim < limite:
+                raise
+
+    def alinhar(self, file: BinaryIO, inicio: int, offset: int) -> int:
+        """Offset do primeiro registro que começa em ``offset`` ou depois.
+
+        ``inicio`` é o offset de um registro conhecido (o primeiro do
+        arquivo); a implementação padrão caminha a partir dele.
+        """
+        fim = inicio
+        for registro_offset, fim, _ in self.iterar(file, inicio):
+            if registro_offset >= offset:
+                return registro_offset
+        return max(fim, offset)
+
+    def agulha(self, valor: str) -> bytes:
+        """Bytes com que um valor de texto aparece dentro de um registro codificado."""
+        return valor.encode("utf-8")
+
+    def localizar(self, buffer: Buffer, inicio: int, agulha: bytes) -> Iterator[tuple[int, int]]:
+        """Faixas (offset, fim) dos registros cujos bytes contêm ``agulha``.
+
+        ``buffer`` é o arquivo inteiro (tipicamente um ``mmap``); só é
+        pesquisado, sem copiar os registros que não contêm a agulha.
+        """
+        raise NotImplementedError
+
+    def decodificar(self, registro: Buffer) -> dict:
+        """Decodifica os bytes de um registro inteiro, como delimitado por ``localizar``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def ler_bruto(self, file: BinaryIO, offset: int) -> bytes:
+        """Bytes do registro que começa em ``offset``, sem decodificá-lo.
+
+        Raises:
+            ValueError: Se ``offset`` não for o início de um registro inteiro
+        """
+        raise NotImplementedError
+
+    def ler(self, file: BinaryIO, offset: int) -> dict:
+        """Lê o registro que começa em ``offset``.
+
+        Raises:
+            ValueError: Se não houver um registro válido no offset
+        """
+        try:
+            for _, _, dados in self.iterar(file, offset):
+                if isinstance(dados, dict):
+                    return dados
+                break
+        except ERROS_DECODIFICACAO as error:
+            raise ValueError(f"Registro inválido no offset {offset}.") from error
+        raise ValueError(f"Registro inválido no offset {offset}.")
+
+
+class _FormatoLinha(FormatoRegistro):
+    """Base para formatos de um registro por linha."""
+
+    def codificar(self, dados: dict) -> bytes:
+        return self._codificar_linha(dados) + b"\n"
+
+    def iterar(self, file: BinaryIO, inicio: int) -> Iterator[tuple[int, int, dict]]:
+        file.seek(inicio)
+        offset = inicio
+        for linha in file:
+            fim = offset + len(linha)
+            if linha.strip():
+                yield offset, fim, self._decodificar_linha(linha)
+            offset = fim
+
+    def localizar(self, buffer: Buffer, inicio: int, agulha: bytes) -> Iterator[tuple[int, int]]:
+        posicao = buffer.find(agulha, inicio)
+        while posicao != -1:
+            offset = max(buffer.rfind(b"\n", inicio, posicao) + 1, inicio)
+            fim = buffer.find(b"\n", posicao)
+            fim = len(buffer) if fim == -1 else fim + 1
+            yield offset, fim
+            posicao = buffer.find(agulha, fim)
+
+    def decodificar(self, registro: Buffer) -> dict:
+        return self._decodificar_linha(bytes(registro))
+
+    def ler_bruto(self, file: BinaryIO, offset: int) -> bytes:
+        # Um registro começa no início do arquivo ou logo após uma quebra de linha
+        file.seek(max(offset - 1, 0))
+        if offset and file.read(1) != b"\n":
+            raise ValueError(f"Registro inválido no offset {offset}.")
+        linha = file.readline()
+        if not linha.endswith(b"\n") or not linha.strip():
+            raise ValueError(f"Registro inválido no offset {offset}.")
+        return linha
+
+    def alinhar(self, file: BinaryIO, inicio: int, offset: int) -> int:
+        if offset <= inicio:
+            return inicio
+        # Se o byte anterior é uma quebra de linha, ``offset`` já inicia um registro
+        file.seek(offset - 1)
+        file.readline()
+        return file.tell()
+
+    @abstractmethod
+    def _codificar_linha(self, dados: dict) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _decodificar_linha(self, linha: bytes) -> dict:
+        raise NotImplementedError
+
+
+class FormatoLegado(_FormatoLinha):
+    """Dict string por linha, sem cabeçalho (formato original)."""
+
+    nome = "legado"
+
+    @property
+    def cabecalho(self) -> bytes:
+        return b""
+
+    def _codificar_linha(self, dados: dict) -> bytes:
+        return str(dados).encode("utf-8")
+
+    def _decodificar_linha(self, linha: bytes) -> dict:
+        return ast.literal_eval(linha.decode("utf-8").strip())
+
+    def agulha(self, valor: str) -> bytes:
+        return repr(valor).encode("utf-8")
+
+
+class FormatoJsonl(_FormatoLinha):
+    """Um objeto JSON compacto por linha."""
+
+    nome = "jsonl"
+
+    def _codificar_linha(self, dados: dict) -> bytes:
+        return json.dumps(dados, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def _decodificar_linha(self, linha: bytes) -> dict:
+        return json.loads(linha)
+
+    def agulha(self, valor: str) -> bytes:
+        return json.dumps(valor, ensure_ascii=False).encode("utf-8")
+
+
+# Valores do formato binário: um byte de tipo seguido do conteúdo, big-endian
+_NULO, _VERDADEIRO, _FALSO = b"N", b"T", b"F"
+_INTEIRO, _REAL, _TEXTO, _LISTA, _MAPA = b"i", b"d", b"s", b"l", b"m"
+_INT64 = struct.Struct(">q")
+_FLOAT64 = struct.Struct(">d")
+_UINT32 = struct.Struct(">I")
+
+
+def _codificar_valor(valor: object, partes: list[bytes]) -> None:
+    if valor is None:
+        partes.append(_NULO)
+    elif valor is True:
+        partes.append(_VERDADEIRO)
+    elif valor is False:
+        partes.append(_FALSO)
+    elif isinstance(valor, str):
+        codificado = valor.encode("utf-8")
+        partes.append(_TEXTO + _UINT32.pack(len(codificado)) + codificado)
+    elif isinstance(valor, int):
+        try:
+            partes.append(_INTEIRO + _INT64.pack(valor))
+        except struct.error:
+            raise ValueError(f"Inteiro fora do intervalo de 64 bits: {valor}.") from None
+    elif isinstance(valor, float):
+        partes.append(_REAL + _FLOAT64.pack(valor))
+    elif isinstance(valor, dict):
+        partes.append(_MAPA + _UINT32.pack(len(valor)))
+        for chave, item in valor.items():
+            _codificar_valor(chave, partes)
+            _codificar_valor(item, partes)
+    elif isinstance(valor, (list, tuple)):
+        partes.append(_LISTA + _UINT32.pack(len(valor)))
+        for item in valor:
+            _codificar_valor(item, partes)
+    else:
+        raise TypeError(f"Tipo não suportado no formato binário: {type(valor).__name__}.")
+
+
+def _decodificar_valor(dados: Buffer | memoryview, posicao: int) -> tuple[object, int]:
+    """Valor que começa em ``posicao`` e a posição logo depois dele."""
+    tipo = dados[posicao : posicao + 1]
+    posicao += 1
+    if tipo == _TEXTO:
+        (tamanho,) = _UINT32.unpack_from(dados, posicao)
+        inicio = posicao + _UINT32.size
+        fim = inicio + tamanho
+        if fim > len(dados):
+            raise ValueError("Texto truncado no registro binário.")
+        return str(dados[inicio:fim], "utf-8"), fim
+    if tipo == _INTEIRO:
+        return _INT64.unpack_from(dados, posicao)[0], posicao + _INT64.size
+    if tipo == _REAL:
+        return _FLOAT64.unpack_from(dados, posicao)[0], posicao + _FLOAT64.size
+    if tipo == _MAPA:
+        (quantidade,) = _UINT32.unpack_from(dados, posicao)
+        posicao += _UINT32.size
+        mapa = {}
+        for _ in range(quantidade):
+            chave, posicao = _decodificar_valor(dados, posicao)
+            mapa[chave], posicao = _decodificar_valor(dados, posicao)
+        return mapa, posicao
+    if tipo == _LISTA:
+        (quantidade,) = _UINT32.unpack_from(dados, posicao)
+        posicao += _UINT32.size
+        lista = []
+        for _ in range(quantidade):
+            item, posicao = _decodificar_valor(dados, posicao)
+            lista.append(item)
+        return lista, posicao
+    if tipo == _NULO:
+        return None, posicao
+    if tipo == _VERDADEIRO:
+        return True, posicao
+    if tipo == _FALSO:
+        return False, posicao
+    raise ValueError(f"Tipo {tipo!r} desconhecido no registro binário.")
+
+
+class FormatoBinario(FormatoRegistro):
+    """Registros prefixados por tamanho big-endian de 4 bytes.
+
+    O corpo codifica o dict com um byte de tipo por valor (nulo, booleanos,
+    inteiro de 64 bits, real de 64 bits, texto UTF-8, lista e mapa, os dois
+    últimos com a quantidade de itens), independente da versão do Python.
+    A versão 1 usava ``marshal`` e não é mais lida.
+    """
+
+    nome = "binario"
+    versao = 2
+    _TAMANHO = struct.Struct(">I")
+
+    def codificar(self, dados: dict) -> bytes:
+        partes: list[bytes] = []
+        _codificar_valor(dados, partes)
+        corpo = b"".join(partes)
+        return self._TAMANHO.pack(len(corpo)) + corpo
+
+    @staticmethod
+    def _decodificar_corpo(corpo: Buffer | memoryview) -> dict:
+        try:
+            dados, fim = _decodificar_valor(corpo, 0)
+        except (struct.error, IndexError) as error:
+            raise ValueError("Registro binário truncado.") from error
+        if fim != len(corpo) or not isinstance(dados, dict):
+            raise ValueError("Registro binário inválido.")
+        return dados
+
+    def iterar(self, file: BinaryIO, inicio: int) -> Iterator[tuple[int, int, dict]]:
+        file.seek(inicio)
+        offset = inicio
+        while True:
+            prefixo = file.read(self._TAMANHO.size)
+            if len(prefixo) < self._TAMANHO.size:
+                return
+            (tamanho,) = self._TAMANHO.unpack(prefixo)
+            corpo = file.read(tamanho)
+            if len(corpo) < tamanho:
+                # Registro incompleto no fim do arquivo
+                return
+            fim = offset + self._TAMANHO.size + tamanho
+            yield offset, fim, self._decodificar_corpo(corpo)
+            offset = fim
+
+    def agulha(self, valor: str) -> bytes:
+        codificado = valor.encode("utf-8")
+        # Tipo e tamanho delimitam o texto: "1" não casa com "11"
+        return _TEXTO + _UINT32.pack(len(codificado)) + codificado
+
+    def localizar(self, buffer: Buffer, inicio: int, agulha: bytes) -> Iterator[tuple[int, int]]:
+        # Sem delimitadores pesquisáveis: caminha pelos prefixos e procura a
+        # agulha dentro da faixa de cada corpo, sem copiá-lo
+        offset, total = inicio, len(buffer)
+        while offset + self._TAMANHO.size <= total:
+            (tamanho,) = self._TAMANHO.unpack_from(buffer, offset)
+            corpo = offset + self._TAMANHO.size
+            fim = corpo + tamanho
+            if fim > total:
+                return
+            if buffer.find(agulha, corpo, fim) != -1:
+                yield offset, fim
+            offset = fim
+
+    def decodificar(self, registro: Buffer) -> dict:
+        return self._decodificar_corpo(memoryview(registro)[self._TAMANHO.size :])
+
+    def ler_bruto(self, file: BinaryIO, offset: int) -> bytes:
+        file.seek(offset)
+        prefixo = file.read(self._TAMANHO.size)
+        if len(prefixo) == self._TAMANHO.size:
+            (tamanho,) = self._TAMANHO.unpack(prefixo)
+            corpo = file.read(tamanho)
+            if len(corpo) == tamanho:
+                return prefixo + corpo
+        raise ValueError(f"Registro inválido no offset {offset}.")
+
+    def alinhar(self, file: BinaryIO, inicio: int, offset: int) -> int:
+        # Só os prefixos de tamanho são lidos; os corpos são pulados
+        atual = inicio
+        file.seek(atual)
+        while atual < offset:
+            prefixo = file.read(self._TAMANHO.size)
+            if len(prefixo) < self._TAMANHO.size:
+                break
+            atual += self._TAMANHO.size + self._TAMANHO.unpack(prefixo)[0]
+            file.seek(atual)
+        return atual
+
+
+FORMATOS: dict[str, FormatoRegistro] = {
+    formato.nome: formato for formato in (FormatoLegado(), FormatoJsonl(), FormatoBinario())
+}
+
+
+def obter_formato(nome: str) -> FormatoRegistro:
+    """Retorna o formato pelo nome.
+
+    Raises:
+        ValueError: Se o formato não existir
+    """
+    formato = FORMATOS.get(nome)
+    if formato is None:
+        raise ValueError(f"Formato '{nome}' desconhecido. Opções: {', '.join(FORMATOS)}.")
+    return formato
+
+
+def detectar_formato(path: Path) -> tuple[FormatoRegistro | None, int]:
+    """Detecta o formato de um arquivo pelo cabeçalho.
+
+    Returns:
+        (formato, offset do primeiro registro); formato é None se o arquivo
+        estiver vazio ou não existir.
+
+    Raises:
+        ValueError: Se o cabeçalho indicar formato ou versão desconhecidos
+    """
+    if not path.exists():
+        return None, 0
+    with path.open("rb") as file:
+        primeira_linha = file.readline()
+    if not primeira_linha:
+        return None, 0
+    if not primeira_linha.startswith(PREFIXO_CABECALHO):
+        return FORMATOS["legado"], 0
+
+    nome, _, versao = (
+        primeira_linha[len(PREFIXO_CABECALHO) :].decode("ascii").strip().partition(":")
+    )
+    formato = obter_formato(nome)
+    if str(formato.versao) != versao:
+        raise ValueError(
+            f"Versão '{versao}' do formato '{nome}' em {path} não suportada "
+            f"(esperada: {formato.versao})."
+        )
+    return formato, len(primeira_linha)
+
+
+def preparar_arquivo(path: Path, nome_formato: str | None = None) -> tuple[FormatoRegistro, int]:
+    """Abre (ou cria) um arquivo de registros e retorna seu formato.
+
+    Arquivos vazios recebem o cabeçalho do formato pedido (``jsonl`` por
+    padrão). Arquivos existentes mantêm o formato em que foram gravados.
+
+    Raises:
+        ValueError: Se o formato pedido divergir do formato do arquivo
+    """
+    formato, inicio = detectar_formato(path)
+    if formato is None:
+        formato = obter_formato(nome_formato or FORMATO_PADRAO)
+        path.write_bytes(formato.cabecalho)
+        return formato, len(formato.cabecalho)
+    if nome_formato and nome_formato != formato.nome:
+        raise ValueError(
+            f"Arquivo {path} está no formato '{formato.nome}'; "
+            f"use migrar_formato para convertê-lo para '{nome_formato}'."
+        )
+    return formato, inicio
@@ -0,0 +1,83 @@
+"""Carga dos arquivos de clientes e pedidos em um banco SQLite.
+
+Uso:
+    python -m src.repositories.importar_sqlite --clientes clientes.txt \\
+        --pedidos pedidos.txt --banco petrobahia.db
+
+Os registros são lidos em streaming (qualquer formato suportado, ver
+``src.repositories.formatos``) e gravados em lotes de ``tamanho_lote``, um
+``executemany`` por tabela e uma transação por lote. Os valores
+persistidos são copiados como estão, sem recalcular preços.
+"""
+
+import argparse
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from src.repositories.cliente_repository_sqlite import ClienteRepositorySQLite
+from src.repositories.formatos import detectar_formato
+from src.repositories.pedido_repository_sqlite import PedidoRepositorySQLite
+
+
+def _registros(caminho: Path) -> Iterator[dict]:
+    formato, inicio = detectar_formato(caminho)
+    if formato is None:
+        raise ValueError(f"Arquivo {caminho} vazio ou inexistente.")
+    with caminho.open("rb") as file:
+        for _, _, dados in formato.iterar(file, inicio):
+            yield dados
+
+
+def _em_lotes(
+    registros: Iterable[dict], inserir: Callable[[Iterable[dict]], int], tamanho_lote: int
+) -> int:
+    total = 0
+    registros = iter(registros)
+    while lote := list(islice(registros, tamanho_lote)):
+        total += inserir(lote)
+    return total
+
+
+def importar(
+    banco: Path,
+    clientes: Path | None = None,
+    pedidos: Path | None = None,
+    tamanho_lote: int = 1000,
+) -> tuple[int, int]:
+    """Copia ``clientes`` e ``pedidos`` (arquivos) para ``banco``.
+
+    Returns:
+        Quantidade de clientes e de pedidos importados
+
+    Raises:
+        ValueError: Se um arquivo informado estiver vazio ou não existir
+    """
+    if tamanho_lote < 1:
+        raise ValueError("tamanho_lote deve ser positivo.")
+    total_clientes = total_pedidos = 0
+    if clientes is not None:
+        with ClienteRepositorySQLite(banco) as repo:
+            total_clientes = _em_lotes(_registros(clientes), repo.inserir_registros, tamanho_lote)
+    if pedidos is not None:
+        with PedidoRepositorySQLite(banco) as repo:
+            total_pedidos = _em_lotes(_registros(pedidos), repo.inserir_registros, tamanho_lote)
+    return total_clientes, total_pedidos
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Importa clientes e pedidos para SQLite.")
+    parser.add_argument("--clientes", type=Path, help="Arquivo de clientes (ex.: clientes.txt)")
+    parser.add_argument("--pedidos", type=Path, help="Arquivo de pedidos (ex.: pedidos.txt)")
+    parser.add_argument("--banco", type=Path, default=Path("petrobahia.db"))
+    parser.add_argument("--tamanho-lote", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    total_clientes, total_pedidos = importar(
+        args.banco, args.clientes, args.pedidos, args.tamanho_lote
+    )
+    print(f"{total_clientes} cliente(s) e {total_pedidos} pedido(s) importados para {args.banco}.")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,169 @@
+"""Índice persistente CNPJ -> offsets de bytes no arquivo de pedidos.
+
+O índice fica em um arquivo auxiliar (sidecar) ao lado do arquivo de dados,
+uma entrada por linha no formato ``cnpj<TAB>offset<TAB>fim``. É somente
+anexado: cada ``salvar`` acrescenta uma entrada, sem reescrever o arquivo.
+
+O maior ``fim`` registrado indica até onde o arquivo de dados está coberto.
+Se o arquivo de dados cresceu (escrita externa), o trecho novo é indexado;
+se encolheu ou o sidecar não existe, o índice é reconstruído do zero.
+
+Com vários processos escrevendo, um mesmo registro pode ser anexado ao
+sidecar por mais de um deles (o próprio escritor e quem indexou o trecho
+novo); entradas repetidas são ignoradas na carga. Antes de indexar um
+trecho anexado por outro processo, o índice lê as entradas que esse
+processo acrescentou ao sidecar, evitando decodificar os registros.
+"""
+
+from bisect import bisect_left
+from pathlib import Path
+from typing import Callable, Iterator
+
+from src.repositories.formatos import ERROS_DECODIFICACAO
+from src.repositories.trava_arquivo import AcompanhamentoSidecar
+
+# (offset, fim, cnpj) de cada registro a partir de um offset inicial
+IteradorRegistros = Callable[[int], Iterator[tuple[int, int, str]]]
+
+
+class IndiceCnpj:
+    """Mapa CNPJ -> offsets, mantido em memória e persistido em sidecar."""
+
+    def __init__(self, caminho_indice: Path, caminho_dados: Path, iterar: IteradorRegistros):
+        self._path = caminho_indice
+        self._dados = caminho_dados
+        self._iterar = iterar
+        self._offsets: dict[str, list[int]] = {}
+        self._coberto = 0
+        self._carregado = False
+        self._acompanhamento = AcompanhamentoSidecar(caminho_indice)
+
+    def offsets(self, cnpj: str) -> list[int]:
+        """Retorna os offsets dos registros do CNPJ, sincronizando antes."""
+        self.sincronizar()
+        return list(self._offsets.get(cnpj, ()))
+
+    def offsets_desde(self, cnpj: str, inicio: int, quantidade: int | None = None) -> list[int]:
+        """Até ``quantidade`` offsets do CNPJ a partir do offset ``inicio``, em ordem.
+
+        Os offsets de cada CNPJ ficam ordenados (o arquivo só cresce), então o
+        ponto de partida é achado por busca binária.
+        """
+        self.sincronizar()
+        offsets = self._offsets.get(cnpj, ())
+        posicao = bisect_left(offsets, inicio)
+        fim = None if quantidade is None else posicao + quantidade
+        return list(offsets[posicao:fim])
+
+    def registrar(self, cnpj: str, offset: int, fim: int) -> None:
+        """Registra um registro recém-anexado ao arquivo de dados."""
+        self.registrar_lote([(cnpj, offset, fim)])
+
+    def registrar_lote(self, entradas: list[tuple[str, int, int]]) -> None:
+        """Registra registros recém-anexados, em ordem de offset."""
+        if not entradas:
+            return
+        if not self._carregado:
+            self._carregar()
+        offset, fim = entradas[0][1], entradas[-1][2]
+        if offset > self._coberto:
+            self._acompanhar()
+        if fim <= self._coberto:
+            # Já indexados pela carga/reconstrução que acabou de ocorrer
+            return
+        if offset < self._coberto:
+            self.reconstruir()
+            return
+        if offset > self._coberto:
+            # Outro escritor anexou registros desde a última sincronização
+            self._indexar_de(self._coberto, ate=offset)
+        self._anexar(entradas)
+
+    def sincronizar(self) -> None:
+        """Garante que o índice cobre o arquivo de dados inteiro."""
+        if not self._carregado:
+            self._carregar()
+        tamanho = self._dados.stat().st_size if self._dados.exists() else 0
+        if tamanho < self._coberto:
+            self.reconstruir()
+        elif tamanho > self._coberto:
+            self._acompanhar()
+        if self._coberto < tamanho:
+            try:
+                self._indexar_de(self._coberto)
+            except ERROS_DECODIFICACAO:
+                # O trecho coberto não termina mais em um registro: arquivo reescrito
+                self.reconstruir()
+
+    def reconstruir(self) -> None:
+        """Descarta o sidecar e reindexa o arquivo de dados inteiro."""
+        self._offsets = {}
+        self._coberto = 0
+        self._carregado = True
+        self._path.write_text("", encoding="utf-8")
+        self._acompanhamento.marcar(0)
+        self._indexar_de(0)
+
+    def _carregar(self) -> None:
+        self._carregado = True
+        if not self._path.exists():
+            self.reconstruir()
+            return
+        vistos = set()
+        with self._path.open("rb") as file:
+            for linha in file:
+                entrada = self._entrada(linha)
+                if entrada is None:
+                    # Entrada truncada por interrupção: o trecho é reindexado
+                    continue
+                cnpj, offset, fim = entrada
+                if offset in vistos:
+                    # Outro processo já havia registrado o mesmo registro
+                    continue
+                vistos.add(offset)
+                self._offsets.setdefault(cnpj, []).append(offset)
+                self._coberto = max(self._coberto, fim)
+            self._acompanhamento.marcar(file.tell())
+
+    def _acompanhar(self) -> None:
+        """Incorpora entradas anexadas ao sidecar por outros processos."""
+        linhas = self._acompanhamento.linhas_novas()
+        for entrada in map(self._entrada, linhas or ()):
+            # Com escritores travados, o sidecar cresce em ordem de offset
+            if entrada is not None and entrada[1] >= self._coberto:
+                cnpj, offset, fim = entrada
+                self._offsets.setdefault(cnpj, []).append(offset)
+                self._coberto = fim
+
+    @staticmethod
+    def _entrada(linha: bytes) -> tuple[str, int, int] | None:
+        partes = linha.rstrip(b"\n").split(b"\t")
+        if len(partes) != 3 or not linha.endswith(b"\n"):
+            return None
+        try:
+            return partes[0].decode("utf-8"), int(partes[1]), int(partes[2])
+        except ValueError:
+            return None
+
+    def _indexar_de(self, inicio: int, ate: int | None = None) -> None:
+        entradas = []
+        for offset, fim, cnpj in self._iterar(inicio):
+            if ate is not None and offset >= ate:
+                break
+            entradas.append((cnpj, offset, fim))
+        self._anexar(entradas)
+
+    def _anexar(self, entradas: list[tuple[str, int, int]]) -> None:
+        if not entradas:
+            return
+        with self._path.open("ab") as file:
+            inicio = file.tell()
+            file.write(
+                "".join(f"{cnpj}\t{offset}\t{fim}\n" for cnpj, offset, fim in entradas).encode(
+                    "utf-8"
+                )
+            )
+            self._acompanhamento.anexado(inicio, file.tell())
+        for cnpj, offset, fim in entradas:
+            self._offsets.setdefault(cnpj, []).append(offset)
+            self._coberto = max(self._coberto, fim)
@@ -0,0 +1,184 @@
+"""Índice esparso de tempo (``criado_em``) sobre o arquivo de pedidos.
+
+O arquivo de dados é dividido em blocos de ``REGISTROS_POR_BLOCO``
+registros consecutivos; o sidecar guarda uma linha por bloco completo,
+``offset<TAB>fim<TAB>menor<TAB>maior``, com a faixa de bytes do bloco e o
+menor e o maior ``criado_em`` (texto ISO em UTC, ver
+``instante_para_texto``) dos seus registros, ou ``-`` se nenhum tiver data.
+É somente anexado, como o índice de CNPJ (ver ``IndiceCnpj``).
+
+Os pedidos são gravados quase sempre em ordem de criação, então o maior
+instante até cada bloco e o menor a partir dele crescem com o offset: a
+faixa de blocos que pode conter um período é achada por busca binária, e
+blocos dentro dela cuja faixa de instantes não cruza o período são
+pulados. Gravações fora de ordem só alargam a faixa de candidatos, sem
+perder registros. Os registros depois do último bloco completo não são
+indexados e são sempre lidos.
+"""
+
+from bisect import bisect_left
+from itertools import accumulate
+from pathlib import Path
+from typing import Callable, Iterator
+
+from src.repositories.formatos import ERROS_DECODIFICACAO
+from src.repositories.trava_arquivo import AcompanhamentoSidecar
+
+REGISTROS_POR_BLOCO = 128
+
+# (offset, fim, criado_em ou None) de cada registro a partir de um offset inicial
+IteradorInstantes = Callable[[int], Iterator[tuple[int, int, str | None]]]
+
+# Limites de um bloco sem datas: nenhum período o alcança
+_SEM_MENOR = "~"
+_SEM_MAIOR = ""
+
+
+class IndiceTempo:
+    """Mapa de zonas (faixa de bytes -> faixa de instantes) por bloco de registros."""
+
+    def __init__(self, caminho_indice: Path, caminho_dados: Path, iterar: IteradorInstantes):
+        self._path = caminho_indice
+        self._dados = caminho_dados
+        self._iterar = iterar
+        # (offset, fim, menor, maior) de cada bloco completo, em ordem de offset
+        self._blocos: list[tuple[int, int, str, str]] = []
+        self._maior_ate: list[str] = []
+        self._menor_desde: list[str] = []
+        self._coberto = 0
+        self._lido_ate = 0
+        self._carregado = False
+        self._acompanhamento = AcompanhamentoSidecar(caminho_indice)
+
+    @property
+    def coberto(self) -> int:
+        """Offset até onde o arquivo de dados está indexado (fim do último bloco)."""
+        return self._coberto
+
+    def faixas(self, inicio: str, fim: str) -> list[tuple[int, int]]:
+        """Faixas de bytes indexadas que podem ter registros com ``inicio <= criado_em < fim``.
+
+        Faixas de blocos vizinhos são unidas. O trecho a partir de
+        ``coberto`` não é indexado e deve ser lido por inteiro.
+        """
+        self.sincronizar()
+        primeiro = bisect_left(self._maior_ate, inicio)
+        ultimo = bisect_left(self._menor_desde, fim)
+        faixas: list[tuple[int, int]] = []
+        for offset, bloco_fim, menor, maior in self._blocos[primeiro:ultimo]:
+            if maior < inicio or menor >= fim:
+                continue
+            if faixas and faixas[-1][1] == offset:
+                faixas[-1] = (faixas[-1][0], bloco_fim)
+            else:
+                faixas.append((offset, bloco_fim))
+        return faixas
+
+    def sincronizar(self) -> None:
+        """Indexa os blocos completos gravados desde a última sincronização."""
+        if not self._carregado:
+            self._carregar()
+        tamanho = self._dados.stat().st_size if self._dados.exists() else 0
+        if tamanho < self._coberto:
+            self.reconstruir()
+            return
+        if tamanho == self._lido_ate:
+            # Nenhum registro novo desde a última leitura da cauda
+            return
+        self._acompanhar()
+        try:
+            self._indexar_de(self._coberto)
+        except ERROS_DECODIFICACAO:
+            # O trecho coberto não termina mais em um registro: arquivo reescrito
+            self.reconstruir()
+
+    def reconstruir(self) -> None:
+        """Descarta o sidecar e reindexa o arquivo de dados inteiro."""
+        self._blocos = []
+        self._coberto = 0
+        self._carregado = True
+        self._path.write_text("", encoding="utf-8")
+        self._acompanhamento.marcar(0)
+        self._recalcular()
+        self._indexar_de(0)
+
+    def _carregar(self) -> None:
+        self._carregado = True
+        if not self._path.exists():
+            self.reconstruir()
+            return
+        with self._path.open("rb") as file:
+            for bloco in map(self._entrada, file):
+                # Entradas truncadas ou repetidas (outro processo indexou antes) são ignoradas
+                if bloco is not None and bloco[0] == self._coberto:
+                    self._blocos.append(bloco)
+                    self._coberto = bloco[1]
+            self._acompanhamento.marcar(file.tell())
+        self._recalcular()
+
+    def _acompanhar(self) -> None:
+        """Incorpora blocos anexados ao sidecar por outros processos."""
+        novos = False
+        for bloco in map(self._entrada, self._acompanhamento.linhas_novas() or ()):
+            if bloco is not None and bloco[0] == self._coberto:
+                self._blocos.append(bloco)
+                self._coberto = bloco[1]
+                novos = True
+        if novos:
+            self._recalcular()
+
+    @staticmethod
+    def _entrada(linha: bytes) -> tuple[int, int, str, str] | None:
+        partes = linha.rstrip(b"\n").split(b"\t")
+        if len(partes) != 4 or not linha.endswith(b"\n"):
+            return None
+        try:
+            offset, fim = int(partes[0]), int(partes[1])
+        except ValueError:
+            return None
+        menor, maior = partes[2].decode("utf-8"), partes[3].decode("utf-8")
+        if menor == "-":
+            menor, maior = _SEM_MENOR, _SEM_MAIOR
+        return offset, fim, menor, maior
+
+    def _indexar_de(self, inicio: int) -> None:
+        novos: list[tuple[int, int, str, str]] = []
+        bloco: list[tuple[int, int, str | None]] = []
+        lido_ate = inicio
+        for registro in self._iterar(inicio):
+            bloco.append(registro)
+            lido_ate = registro[1]
+            if len(bloco) == REGISTROS_POR_BLOCO:
+                novos.append(self._resumir(bloco))
+                bloco = []
+        self._anexar(novos)
+        self._lido_ate = max(lido_ate, self._coberto)
+
+    @staticmethod
+    def _resumir(bloco: list[tuple[int, int, str | None]]) -> tuple[int, int, str, str]:
+        instantes = [instante for _, _, instante in bloco if instante is not None]
+        if not instantes:
+            return bloco[0][0], bloco[-1][1], _SEM_MENOR, _SEM_MAIOR
+        return bloco[0][0], bloco[-1][1], min(instantes), max(instantes)
+
+    def _anexar(self, blocos: list[tuple[int, int, str, str]]) -> None:
+        if not blocos:
+            return
+        linhas = []
+        for offset, fim, menor, maior in blocos:
+            if menor == _SEM_MENOR:
+                menor = maior = "-"
+            linhas.append(f"{offset}\t{fim}\t{menor}\t{maior}\n")
+        with self._path.open("ab") as file:
+            inicio = file.tell()
+            file.write("".join(linhas).encode("utf-8"))
+            self._acompanhamento.anexado(inicio, file.tell())
+        self._blocos.extend(blocos)
+        self._coberto = blocos[-1][1]
+        self._recalcular()
+
+    def _recalcular(self) -> None:
+        # Maior instante até cada bloco e menor a partir dele: ambos não decrescentes
+        self._maior_ate = list(accumulate((bloco[3] for bloco in self._blocos), max))
+        menores = accumulate((bloco[2] for bloco in reversed(self._blocos)), min)
+        self._menor_desde = list(menores)[::-1]
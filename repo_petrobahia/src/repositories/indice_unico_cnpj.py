@@ -0,0 +1,390 @@
+"""Índice de unicidade de CNPJ dos clientes: filtro de Bloom + tabela exata em disco.
+
+Dois sidecars ao lado do arquivo de clientes guardam os CNPJs já
+cadastrados, como inteiros (só os dígitos):
+
+- ``<arquivo>.unicos.log``: as chaves na ordem de inserção, 8 bytes cada;
+- ``<arquivo>.unicos``: tabela hash de endereçamento aberto (sondagem
+  linear, carga máxima de 50%) com as chaves já mescladas do log, acessada
+  via mmap. O cabeçalho guarda a capacidade, o total de chaves no log,
+  quantas delas já estão na tabela e até onde o arquivo de clientes foi
+  indexado.
+
+Em memória ficam só um filtro de Bloom com todas as chaves e as chaves do
+log ainda não mescladas (no máximo ``LIMITE_PENDENTES``). Um CNPJ novo é
+descartado pelo filtro sem sondar a tabela e entra gravando 8 bytes no log;
+só os que o filtro acusa (duplicados, ou ~1% de falsos positivos) são
+conferidos na tabela, em O(1). A cada ``LIMITE_PENDENTES`` inserções o log
+é mesclado na tabela, que é refeita com o dobro da capacidade quando passa
+da carga máxima.
+
+Todas as operações exigem a trava exclusiva do arquivo de clientes
+(``TravaArquivo``): outros processos acrescentam ao mesmo log, e cada
+instância lê as chaves novas antes de responder. Registros gravados sem
+passar pelo índice (arquivo cresceu além do indexado) são indexados na
+próxima operação; se o arquivo encolheu, o índice é reconstruído.
+"""
+
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Callable, Iterator
+
+from src.domain.services.validar_cliente import normalizar_cnpj
+
+# (fim, cnpj) de cada registro do arquivo de clientes a partir de um offset
+IteradorCnpjs = Callable[[int], Iterator[tuple[int, str]]]
+
+_MAGICO = b"PBUNIC01"
+# mágico, capacidade, chaves no log, chaves mescladas, bytes de dados indexados
+_CABECALHO = struct.Struct("<8sQQQQ")
+_POSICAO_TOTAL = 16
+_POSICAO_MESCLADAS = 24
+_POSICAO_COBERTO = 32
+_INICIO_SLOTS = 64
+_CAMPO = struct.Struct("<Q")
+_MASCARA_64 = (1 << 64) - 1
+_FLAGS_LOG = os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0)
+# bits, k, quantidade, capacidade do filtro serializado
+_CABECALHO_FILTRO = struct.Struct("<QIQQ")
+
+CAPACIDADE_INICIAL = 1 << 12
+CARGA_MAXIMA = 0.5
+LIMITE_PENDENTES = 4096
+
+
+def chave_cnpj(cnpj: str | None) -> int | None:
+    """Chave do índice (CNPJ só com dígitos, como inteiro), ou None se fora do padrão."""
+    digitos = normalizar_cnpj(cnpj) if cnpj else None
+    return int(digitos) if digitos is not None else None
+
+
+def _misturar(chave: int) -> int:
+    # splitmix64: CNPJs de uma mesma empresa diferem só nos últimos dígitos
+    z = (chave + 0x9E3779B97F4A7C15) & _MASCARA_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASCARA_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASCARA_64
+    return z ^ (z >> 31)
+
+
+class FiltroBloom:
+    """Conjunto aproximado de inteiros: sem falsos negativos.
+
+    Dimensionado para ``capacidade`` chaves com ``taxa_falsos`` de falsos
+    positivos; as ``k`` posições saem de dois hashes (``h1 + i * h2``).
+    """
+
+    def __init__(self, capacidade: int, taxa_falsos: float = 0.01):
+        if capacidade <= 0 or not 0 < taxa_falsos < 1:
+            raise ValueError("capacidade deve ser positiva e taxa_falsos entre 0 e 1.")
+        bits = max(64, math.ceil(-capacidade * math.log(taxa_falsos) / math.log(2) ** 2))
+        self._bits = bytearray((bits + 7) // 8)
+        self._m = bits
+        self._k = max(1, round(bits / capacidade * math.log(2)))
+        self.capacidade = capacidade
+        self.quantidade = 0
+
+    def adicionar(self, chave: int) -> None:
+        bits = self._bits
+        for posicao in self._posicoes(chave):
+            bits[posicao >> 3] |= 1 << (posicao & 7)
+        self.quantidade += 1
+
+    def __contains__(self, chave: int) -> bool:
+        bits = self._bits
+        for posicao in self._posicoes(chave):
+            if not bits[posicao >> 3] >> (posicao & 7) & 1:
+                return False
+        return True
+
+    def para_bytes(self) -> bytes:
+        """Filtro serializado, para ``de_bytes``."""
+        cabecalho = _CABECALHO_FILTRO.pack(self._m, self._k, self.quantidade, self.capacidade)
+        return cabecalho + bytes(self._bits)
+
+    @classmethod
+    def de_bytes(cls, dados: bytes) -> "FiltroBloom":
+        """Reconstrói um filtro gravado com ``para_bytes``.
+
+        Raises:
+            ValueError: Se os bytes não forem um filtro serializado
+        """
+        if len(dados) < _CABECALHO_FILTRO.size:
+            raise ValueError("Filtro de Bloom serializado inválido.")
+        bits, k, quantidade, capacidade = _CABECALHO_FILTRO.unpack_from(dados)
+        corpo = dados[_CABECALHO_FILTRO.size :]
+        if len(corpo) != (bits + 7) // 8 or k < 1:
+            raise ValueError("Filtro de Bloom serializado inválido.")
+        filtro = cls.__new__(cls)
+        filtro._bits = bytearray(corpo)
+        filtro._m = bits
+        filtro._k = k
+        filtro.capacidade = capacidade
+        filtro.quantidade = quantidade
+        return filtro
+
+    def _posicoes(self, chave: int) -> list[int]:
+        misturado = _misturar(chave)
+        h1, h2 = misturado & 0xFFFFFFFF, misturado >> 32 | 1
+        m = self._m
+        return [p % m for p in range(h1, h1 + self._k * h2, h2)]
+
+
+class IndiceUnicoCnpj:
+    """CNPJs cadastrados: filtro de Bloom em memória sobre tabela hash em disco."""
+
+    def __init__(self, caminho_dados: Path, iterar: IteradorCnpjs, taxa_falsos: float = 0.01):
+        self._dados = caminho_dados
+        self._path = caminho_dados.with_name(caminho_dados.name + ".unicos")
+        self._path_log = caminho_dados.with_name(caminho_dados.name + ".unicos.log")
+        self._iterar = iterar
+        self._taxa_falsos = taxa_falsos
+        self._mapa: mmap.mmap | None = None
+        self._log: int | None = None
+        self._inode: int | None = None
+        self._capacidade = 0
+        self._filtro = FiltroBloom(CAPACIDADE_INICIAL, taxa_falsos)
+        self._lidas = 0
+        self._mescladas = 0
+        self._pendentes: dict[int, int] = {}
+
+    def contem(self, cnpj: str) -> bool:
+        """Se o CNPJ (com ou sem pontuação) já está cadastrado."""
+        chave = chave_cnpj(cnpj)
+        if chave is None:
+            return False
+        self._sincronizar()
+        return self._existe(chave)
+
+    def reservar(self, cnpj: str) -> bool:
+        """Registra o CNPJ se ainda não existir; retorna False se já existia.
+
+        Raises:
+            ValueError: Se o CNPJ não tiver 14 dígitos
+        """
+        chave = chave_cnpj(cnpj)
+        if chave is None:
+            raise ValueError(f"CNPJ fora do padrão: {cnpj}")
+        self._sincronizar()
+        if self._existe(chave):
+            return False
+        self._anexar(chave)
+        return True
+
+    def registrar(self, gravados: list[tuple[str, int, int]]) -> None:
+        """Indexa registros ``(cnpj, offset, fim)`` recém-anexados ao arquivo de clientes."""
+        if not gravados:
+            return
+        self._sincronizar(conferir_dados=False)
+        if gravados[0][1] != self._cabecalho()[4]:
+            # Há registros de terceiros antes destes: indexa o trecho inteiro
+            self._indexar_dados()
+            return
+        for cnpj, _, _ in gravados:
+            chave = chave_cnpj(cnpj)
+            if chave is not None and not self._existe(chave):
+                self._anexar(chave)
+        _CAMPO.pack_into(self._mapa, _POSICAO_COBERTO, gravados[-1][2])
+
+    def reconstruir(self) -> None:
+        """Refaz log e tabela a partir do arquivo de clientes."""
+        tamanho = self._tamanho_dados()
+        chaves = array("Q")
+        if tamanho:
+            vistas = dict.fromkeys(chave_cnpj(cnpj) for _, cnpj in self._iterar(0))
+            vistas.pop(None, None)
+            chaves.extend(vistas)
+        temporario = self._path_log.with_name(self._path_log.name + ".tmp")
+        temporario.write_bytes(_em_bytes(chaves))
+        os.replace(temporario, self._path_log)
+        self._gravar_tabela(chaves, tamanho)
+
+    def fechar(self) -> None:
+        """Libera o mapeamento da tabela e o descritor do log."""
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        if self._log is not None:
+            os.close(self._log)
+            self._log = None
+        self._inode = None
+
+    def _sincronizar(self, conferir_dados: bool = True) -> None:
+        try:
+            inode = os.stat(self._path).st_ino
+        except FileNotFoundError:
+            inode = None
+        if inode is None or inode != self._inode:
+            self._abrir()
+        _, _, total, mescladas, coberto = self._cabecalho()
+        if total > self._lidas:
+            self._ler_log(self._lidas, total)
+        if mescladas > self._mescladas:
+            self._mescladas = mescladas
+            self._pendentes = {c: p for c, p in self._pendentes.items() if p >= mescladas}
+        if conferir_dados and self._tamanho_dados() != coberto:
+            self._indexar_dados()
+
+    def _abrir(self) -> None:
+        self.fechar()
+        if not self._path.exists() or self._path.stat().st_size < _INICIO_SLOTS:
+            self.reconstruir()
+            return
+        with self._path.open("r+b") as file:
+            self._mapa = mmap.mmap(file.fileno(), 0)
+            self._inode = os.fstat(file.fileno()).st_ino
+        magico, capacidade, total, mescladas, _ = self._cabecalho()
+        if magico != _MAGICO:
+            self.reconstruir()
+            return
+        self._capacidade = capacidade
+        self._log = os.open(self._path_log, _FLAGS_LOG, 0o644)
+        if os.fstat(self._log).st_size < total * 8:
+            self.reconstruir()
+            return
+        self._filtro = FiltroBloom(max(2 * total, CAPACIDADE_INICIAL), self._taxa_falsos)
+        self._lidas = self._mescladas = mescladas
+        self._pendentes = {}
+        chaves = self._chaves_do_log(0, mescladas)
+        for chave in chaves:
+            self._filtro.adicionar(chave)
+        self._ler_log(mescladas, total)
+
+    def _ler_log(self, inicio: int, fim: int) -> None:
+        chaves = self._chaves_do_log(inicio, fim)
+        if self._filtro.quantidade + len(chaves) > self._filtro.capacidade:
+            # Filtro cheio perderia precisão: refaz com o dobro, do log inteiro
+            self._filtro = FiltroBloom(2 * fim, self._taxa_falsos)
+            for chave in self._chaves_do_log(0, inicio):
+                self._filtro.adicionar(chave)
+        for posicao, chave in enumerate(chaves, start=inicio):
+            self._filtro.adicionar(chave)
+            if posicao >= self._mescladas:
+                self._pendentes[chave] = posicao
+        self._lidas = fim
+
+    def _chaves_do_log(self, inicio: int, fim: int) -> array:
+        chaves = array("Q")
+        if fim > inicio:
+            chaves.frombytes(_ler_em(self._log, inicio * 8, (fim - inicio) * 8))
+            if sys.byteorder == "big":  # pragma: no cover - plataformas big-endian
+                chaves.byteswap()
+        return chaves
+
+    def _existe(self, chave: int) -> bool:
+        return chave in self._filtro and (chave in self._pendentes or self._na_tabela(chave))
+
+    def _anexar(self, chave: int) -> None:
+        total = self._cabecalho()[2]
+        # Grava na posição do total, não em modo append: uma chave deixada
+        # por um processo que caiu antes de atualizar o cabeçalho é sobrescrita
+        _gravar_em(self._log, total * 8, _CAMPO.pack(chave))
+        _CAMPO.pack_into(self._mapa, _POSICAO_TOTAL, total + 1)
+        self._filtro.adicionar(chave)
+        self._pendentes[chave] = total
+        self._lidas = total + 1
+        if len(self._pendentes) >= LIMITE_PENDENTES:
+            self._mesclar()
+
+    def _mesclar(self) -> None:
+        _, capacidade, total, mescladas, coberto = self._cabecalho()
+        if total > capacidade * CARGA_MAXIMA:
+            self._gravar_tabela(self._chaves_do_log(0, total), coberto)
+            return
+        for chave in self._chaves_do_log(mescladas, total):
+            self._inserir_na_tabela(chave)
+        _CAMPO.pack_into(self._mapa, _POSICAO_MESCLADAS, total)
+        self._mescladas = total
+        self._pendentes.clear()
+
+    def _na_tabela(self, chave: int) -> bool:
+        mapa, mascara, alvo = self._mapa, self._capacidade - 1, chave + 1
+        indice = _misturar(chave) & mascara
+        while True:
+            slot = _CAMPO.unpack_from(mapa, _INICIO_SLOTS + 8 * indice)[0]
+            if slot == alvo:
+                return True
+            if slot == 0:
+                return False
+            indice = (indice + 1) & mascara
+
+    def _inserir_na_tabela(self, chave: int) -> None:
+        mapa, mascara, alvo = self._mapa, self._capacidade - 1, chave + 1
+        indice = _misturar(chave) & mascara
+        while True:
+            posicao = _INICIO_SLOTS + 8 * indice
+            slot = _CAMPO.unpack_from(mapa, posicao)[0]
+            if slot == alvo:
+                return
+            if slot == 0:
+                _CAMPO.pack_into(mapa, posicao, alvo)
+                return
+            indice = (indice + 1) & mascara
+
+    def _gravar_tabela(self, chaves: array, coberto: int) -> None:
+        capacidade = CAPACIDADE_INICIAL
+        while len(chaves) > capacidade * CARGA_MAXIMA:
+            capacidade *= 2
+        mascara = capacidade - 1
+        slots = array("Q", bytes(8 * capacidade))
+        for chave in chaves:
+            indice = _misturar(chave) & mascara
+            while slots[indice] and slots[indice] != chave + 1:
+                indice = (indice + 1) & mascara
+            slots[indice] = chave + 1
+        cabecalho = _CABECALHO.pack(_MAGICO, capacidade, len(chaves), len(chaves), coberto)
+        temporario = self._path.with_name(self._path.name + ".tmp")
+        with temporario.open("wb") as file:
+            file.write(cabecalho.ljust(_INICIO_SLOTS, b"\0"))
+            file.write(_em_bytes(slots))
+        os.replace(temporario, self._path)
+        self._abrir()
+
+    def _indexar_dados(self) -> None:
+        tamanho = self._tamanho_dados()
+        coberto = self._cabecalho()[4]
+        if tamanho < coberto:
+            self.reconstruir()
+            return
+        for _, cnpj in self._iterar(coberto):
+            chave = chave_cnpj(cnpj)
+            if chave is not None and not self._existe(chave):
+                self._anexar(chave)
+        _CAMPO.pack_into(self._mapa, _POSICAO_COBERTO, tamanho)
+
+    def _cabecalho(self) -> tuple[bytes, int, int, int, int]:
+        return _CABECALHO.unpack_from(self._mapa, 0)
+
+    def _tamanho_dados(self) -> int:
+        try:
+            return self._dados.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+
+def _ler_em(fd: int, posicao: int, tamanho: int) -> bytes:
+    # lseek + read em vez de os.pread, que não existe no Windows
+    os.lseek(fd, posicao, os.SEEK_SET)
+    partes = []
+    while tamanho > 0 and (parte := os.read(fd, tamanho)):
+        partes.append(parte)
+        tamanho -= len(parte)
+    return b"".join(partes)
+
+
+def _gravar_em(fd: int, posicao: int, dados: bytes) -> None:
+    os.lseek(fd, posicao, os.SEEK_SET)
+    visao = memoryview(dados)
+    while visao:
+        visao = visao[os.write(fd, visao) :]
+
+
+def _em_bytes(valores: array) -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover - plataformas big-endian
+        valores = array(valores.typecode, valores)
+        valores.byteswap()
+    return valores.tobytes()
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 
+from src.domain.exceptions import ClienteDuplicadoError
 from src.domain.models.cliente import Cliente
+from src.repositories.interfaces.pagina import Pagina
+from src.repositories.paginacao import paginar
 
 
 class IClienteRepository(ABC):
@@ -8,3 +12,39 @@ class IClienteRepository(ABC):
     def salvar(self, cliente: Cliente) -> None:
         """Persiste um cliente."""
         raise NotImplementedError
+
+    @abstractmethod
+    def buscar_por_cnpj(self, cnpj: str) -> Cliente | None:
+        """Retorna o cliente com o CNPJ informado, ou None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def listar(self) -> Iterable[Cliente]:
+        """Percorre os clientes na ordem de gravação."""
+        raise NotImplementedError
+
+    def listar_pagina(self, limite: int, cursor: str | None = None) -> Pagina[Cliente]:
+        """Até ``limite`` clientes a partir do cursor (None: do início).
+
+        Passe ``pagina.proximo`` para obter a página seguinte. A
+        implementação padrão percorre ``listar`` até o cursor; os
+        repositórios em arquivo e SQLite retomam direto na posição.
+
+        Raises:
+            ValueError: Se ``limite`` não for positivo ou o cursor for inválido
+        """
+        return paginar(self.listar(), limite, cursor)
+
+    def cadastrar(self, cliente: Cliente) -> None:
+        """Persiste um cliente novo, recusando CNPJ já cadastrado.
+
+        A implementação padrão consulta ``buscar_por_cnpj`` antes de
+        ``salvar``, sem garantia entre processos; os repositórios em arquivo
+        e SQLite fazem a conferência e a gravação de forma atômica.
+
+        Raises:
+            ClienteDuplicadoError: Se o CNPJ já estiver cadastrado
+        """
+        if self.buscar_por_cnpj(cliente.cnpj) is not None:
+            raise ClienteDuplicadoError(cliente.cnpj)
+        self.salvar(cliente)
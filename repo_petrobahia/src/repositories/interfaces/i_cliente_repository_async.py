@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+
+from src.domain.models.cliente import Cliente
+from src.repositories.interfaces.pagina import Pagina
+
+
+class IClienteRepositoryAsync(ABC):
+    """Interface assíncrona para persistência de clientes."""
+
+    @abstractmethod
+    async def salvar(self, cliente: Cliente) -> None:
+        """Persiste um cliente sem bloquear o event loop."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def cadastrar(self, cliente: Cliente) -> None:
+        """Persiste um cliente novo (ver ``IClienteRepository.cadastrar``)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def listar_pagina(self, limite: int, cursor: str | None = None) -> Pagina[Cliente]:
+        """Página de clientes (ver ``IClienteRepository.listar_pagina``)."""
+        raise NotImplementedError
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterator
 
 from src.domain.models.pedido import Pedido
+from src.repositories.interfaces.pagina import Pagina
+from src.repositories.paginacao import paginar
 
 
 class IPedidoRepository(ABC):
@@ -15,3 +19,28 @@ class IPedidoRepository(ABC):
     def buscar_por_cliente(self, cliente: str) -> list[Pedido]:
         """Retorna todos os pedidos de um cliente."""
         raise NotImplementedError
+
+    @abstractmethod
+    def buscar_por_periodo(
+        self, inicio: datetime, fim: datetime, cnpj: str | None = None
+    ) -> Iterator[Pedido]:
+        """Pedidos criados em ``[inicio, fim)`` (opcionalmente só do ``cnpj``), em fluxo.
+
+        Instantes sem fuso são tratados como UTC. Pedidos gravados sem
+        ``criado_em`` não entram em nenhum período.
+        """
+        raise NotImplementedError
+
+    def buscar_pagina_por_cliente(
+        self, cliente: str, limite: int, cursor: str | None = None
+    ) -> Pagina[Pedido]:
+        """Até ``limite`` pedidos do cliente a partir do cursor (None: do início).
+
+        Passe ``pagina.proximo`` para obter a página seguinte. A
+        implementação padrão pagina o resultado de ``buscar_por_cliente``;
+        os repositórios em arquivo e SQLite leem só os pedidos da página.
+
+        Raises:
+            ValueError: Se ``limite`` não for positivo ou o cursor for inválido
+        """
+        return paginar(self.buscar_por_cliente(cliente), limite, cursor)
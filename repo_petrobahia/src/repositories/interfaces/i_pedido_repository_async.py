@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.domain.models.pedido import Pedido
+from src.repositories.interfaces.pagina import Pagina
+
+
+class IPedidoRepositoryAsync(ABC):
+    """Interface assíncrona para persistência de pedidos."""
+
+    @abstractmethod
+    async def salvar(self, pedido: Pedido) -> None:
+        """Persiste um pedido sem bloquear o event loop."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def buscar_por_cliente(self, cliente: str) -> list[Pedido]:
+        """Retorna todos os pedidos de um cliente."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def buscar_pagina_por_cliente(
+        self, cliente: str, limite: int, cursor: str | None = None
+    ) -> Pagina[Pedido]:
+        """Página de pedidos do cliente (ver ``IPedidoRepository.buscar_pagina_por_cliente``)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def buscar_por_periodo(
+        self, inicio: datetime, fim: datetime, cnpj: str | None = None
+    ) -> list[Pedido]:
+        """Pedidos criados em ``[inicio, fim)`` (ver ``IPedidoRepository.buscar_por_periodo``)."""
+        raise NotImplementedError
@@ -0,0 +1,24 @@
+"""Página de resultados devolvida pelas consultas paginadas dos repositórios."""
+
+from dataclasses import dataclass, field
+from typing import Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class Pagina(Generic[T]):
+    """Itens de uma página e o cursor da seguinte (None na última).
+
+    O cursor é opaco: só o repositório que o gerou sabe interpretá-lo (ver
+    ``src.repositories.paginacao``).
+    """
+
+    itens: list[T] = field(default_factory=list)
+    proximo: str | None = None
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.itens)
+
+    def __len__(self) -> int:
+        return len(self.itens)
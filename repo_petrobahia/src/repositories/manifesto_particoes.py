@@ -0,0 +1,225 @@
+"""Manifesto das partes de um repositório de pedidos particionado por período.
+
+O diretório do repositório guarda um ``manifesto.json`` com a lista de
+partes. Cada parte tem um id único (crescente), o período a que pertence
+(``AAAA-MM`` ou ``AAAA-MM-DD``, conforme a granularidade) e um arquivo:
+
+- ``aberta``: arquivo de pedidos comum (``<periodo>.<id>.txt``), que recebe
+  gravações e tem os sidecars de ``PedidoRepositoryArquivo``;
+- ``compactada``: arquivo de blocos comprimidos (``<periodo>.<id>.blocos``,
+  ver ``blocos_comprimidos``), somente leitura, com um filtro de Bloom dos
+  CNPJs gravado no próprio manifesto.
+
+Alterações são feitas sob a trava exclusiva ``manifesto.json.lock``,
+relendo o arquivo antes e gravando-o de uma vez (arquivo temporário e
+``os.replace``); leitores recarregam o manifesto quando o arquivo muda.
+"""
+
+import base64
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from src.repositories.formatos import FORMATO_PADRAO, obter_formato
+from src.repositories.indice_unico_cnpj import FiltroBloom
+from src.repositories.trava_arquivo import TravaArquivo
+
+NOME_MANIFESTO = "manifesto.json"
+VERSAO = 1
+ABERTA = "aberta"
+COMPACTADA = "compactada"
+GRANULARIDADES = {"mensal": "%Y-%m", "diaria": "%Y-%m-%d"}
+
+
+def chave_filtro(cnpj: str) -> int:
+    """Chave do CNPJ (como gravado nos pedidos) no filtro de Bloom das partes."""
+    return int.from_bytes(hashlib.blake2b(cnpj.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+@dataclass(slots=True)
+class Parte:
+    """Uma parte do repositório particionado, como descrita no manifesto."""
+
+    id: int
+    periodo: str
+    arquivo: str
+    estado: str = ABERTA
+    registros: int | None = None
+    compressao: str | None = None
+    filtro: FiltroBloom | None = None
+
+    @property
+    def aberta(self) -> bool:
+        return self.estado == ABERTA
+
+    def pode_conter(self, cnpj: str) -> bool:
+        """False só se a parte com certeza não tem pedidos do CNPJ."""
+        return self.filtro is None or chave_filtro(cnpj) in self.filtro
+
+    def para_dict(self) -> dict:
+        dados = {
+            "id": self.id,
+            "periodo": self.periodo,
+            "arquivo": self.arquivo,
+            "estado": self.estado,
+        }
+        if not self.aberta:
+            dados["registros"] = self.registros
+            dados["compressao"] = self.compressao
+            dados["filtro"] = base64.b64encode(self.filtro.para_bytes()).decode("ascii")
+        return dados
+
+    @classmethod
+    def de_dict(cls, dados: dict) -> "Parte":
+        filtro = dados.get("filtro")
+        return cls(
+            id=dados["id"],
+            periodo=dados["periodo"],
+            arquivo=dados["arquivo"],
+            estado=dados["estado"],
+            registros=dados.get("registros"),
+            compressao=dados.get("compressao"),
+            filtro=None if filtro is None else FiltroBloom.de_bytes(base64.b64decode(filtro)),
+        )
+
+
+class Manifesto:
+    """Lista de partes de um diretório particionado, sincronizada com ``manifesto.json``.
+
+    Cria o diretório e o manifesto se não existirem.
+
+    Raises:
+        ValueError: Se a granularidade ou o formato pedidos divergirem dos
+            gravados no manifesto existente
+    """
+
+    def __init__(self, diretorio: Path, granularidade: str = "mensal", formato: str | None = None):
+        if granularidade not in GRANULARIDADES:
+            raise ValueError(f"granularidade deve ser uma de {', '.join(GRANULARIDADES)}.")
+        diretorio.mkdir(parents=True, exist_ok=True)
+        self._diretorio = diretorio
+        self._path = diretorio / NOME_MANIFESTO
+        self._trava = TravaArquivo(self._path)
+        self._assinatura: tuple[int, int, int] | None = None
+        self.partes: list[Parte] = []
+        with self._trava.exclusiva():
+            if not self._path.exists():
+                self.granularidade = granularidade
+                self.formato = obter_formato(formato or FORMATO_PADRAO).nome
+                self._proximo_id = 1
+                self._gravar()
+            self._ler()
+        if granularidade != self.granularidade:
+            raise ValueError(
+                f"{diretorio} é particionado com granularidade '{self.granularidade}'."
+            )
+        if formato and formato != self.formato:
+            raise ValueError(f"{diretorio} grava pedidos no formato '{self.formato}'.")
+
+    @property
+    def diretorio(self) -> Path:
+        return self._diretorio
+
+    def periodo(self, instante: datetime) -> str:
+        """Período (na granularidade do manifesto) que contém ``instante``."""
+        return instante.strftime(GRANULARIDADES[self.granularidade])
+
+    def caminho(self, parte: Parte) -> Path:
+        """Arquivo da parte."""
+        return self._diretorio / parte.arquivo
+
+    def obter(self, id_parte: int) -> Parte | None:
+        """Parte com o id informado, ou None se não estiver mais no manifesto."""
+        for parte in self.partes:
+            if parte.id == id_parte:
+                return parte
+        return None
+
+    def atualizar(self) -> bool:
+        """Relê o manifesto se o arquivo mudou; retorna se houve mudança."""
+        if self._assinatura_atual() == self._assinatura:
+            return False
+        with self._trava.compartilhada():
+            self._ler()
+        return True
+
+    def abrir_parte(self, periodo: str) -> Parte:
+        """Parte aberta do período, criada (no manifesto) se ainda não houver."""
+        with self._trava.exclusiva():
+            self._ler()
+            for parte in self.partes:
+                if parte.aberta and parte.periodo == periodo:
+                    return parte
+            parte = Parte(self._reservar_id(), periodo, "")
+            parte.arquivo = f"{periodo}.{parte.id}.txt"
+            self._incluir(parte)
+            self._gravar()
+            return parte
+
+    def reservar_id(self) -> int:
+        """Reserva um id para uma parte ainda a ser criada (ver ``substituir``)."""
+        with self._trava.exclusiva():
+            self._ler()
+            id_parte = self._reservar_id()
+            self._gravar()
+            return id_parte
+
+    def substituir(self, removidas: list[int], nova: Parte) -> bool:
+        """Troca as partes ``removidas`` por ``nova`` em uma única gravação.
+
+        Returns:
+            False (sem alterar nada) se alguma das partes já não estiver no
+            manifesto, por exemplo compactada por outro processo
+        """
+        with self._trava.exclusiva():
+            self._ler()
+            ids = set(removidas)
+            if len(ids) != sum(parte.id in ids for parte in self.partes):
+                return False
+            self.partes = [parte for parte in self.partes if parte.id not in ids]
+            self._incluir(nova)
+            self._gravar()
+            return True
+
+    def _reservar_id(self) -> int:
+        id_parte = self._proximo_id
+        self._proximo_id += 1
+        return id_parte
+
+    def _incluir(self, parte: Parte) -> None:
+        # Ordem de leitura: por período e, dentro dele, pela criação da parte
+        self.partes.append(parte)
+        self.partes.sort(key=lambda item: (item.periodo, item.id))
+
+    def _assinatura_atual(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _ler(self) -> None:
+        dados = json.loads(self._path.read_text(encoding="utf-8"))
+        if dados.get("versao") != VERSAO:
+            raise ValueError(f"Versão do manifesto {self._path} não suportada.")
+        self.granularidade = dados["granularidade"]
+        self.formato = dados["formato"]
+        self._proximo_id = dados["proximo_id"]
+        self.partes = [Parte.de_dict(parte) for parte in dados["partes"]]
+        self._assinatura = self._assinatura_atual()
+
+    def _gravar(self) -> None:
+        dados = {
+            "versao": VERSAO,
+            "granularidade": self.granularidade,
+            "formato": self.formato,
+            "proximo_id": self._proximo_id,
+            "partes": [parte.para_dict() for parte in self.partes],
+        }
+        temporario = self._path.with_name(self._path.name + ".tmp")
+        temporario.write_text(json.dumps(dados, indent=1), encoding="utf-8")
+        os.replace(temporario, self._path)
+        self._assinatura = self._assinatura_atual()
@@ -0,0 +1,64 @@
+"""Conversão em streaming de arquivos de registros entre formatos.
+
+Uso:
+    python -m src.repositories.migrar_formato pedidos.txt --formato jsonl
+    python -m src.repositories.migrar_formato clientes.txt clientes.bin --formato binario
+
+Sem destino, o arquivo é convertido no lugar (via arquivo temporário e
+``os.replace``). O índice ``<arquivo>.idx`` e os totais ``<arquivo>.agg`` do
+destino são removidos, pois seus offsets deixam de valer; eles são
+reconstruídos no próximo acesso.
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+from src.repositories.formatos import FORMATOS, detectar_formato, obter_formato
+
+
+def migrar(origem: Path, destino: Path, nome_formato: str) -> int:
+    """Converte ``origem`` para ``nome_formato`` gravando em ``destino``.
+
+    Lê e escreve um registro por vez, com memória constante.
+
+    Returns:
+        Quantidade de registros convertidos
+
+    Raises:
+        ValueError: Se a origem estiver vazia ou o formato não existir
+    """
+    formato_destino = obter_formato(nome_formato)
+    formato_origem, inicio = detectar_formato(origem)
+    if formato_origem is None:
+        raise ValueError(f"Arquivo {origem} vazio ou inexistente.")
+
+    temporario = destino.with_name(destino.name + ".tmp")
+    total = 0
+    with origem.open("rb") as entrada, temporario.open("wb") as saida:
+        saida.write(formato_destino.cabecalho)
+        for _, _, dados in formato_origem.iterar(entrada, inicio):
+            saida.write(formato_destino.codificar(dados))
+            total += 1
+        saida.flush()
+        os.fsync(saida.fileno())
+
+    os.replace(temporario, destino)
+    for sufixo in (".idx", ".agg", ".tempo"):
+        destino.with_name(destino.name + sufixo).unlink(missing_ok=True)
+    return total
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Converte arquivos de registros entre formatos.")
+    parser.add_argument("origem", type=Path)
+    parser.add_argument("destino", type=Path, nargs="?")
+    parser.add_argument("--formato", choices=sorted(FORMATOS), required=True)
+    args = parser.parse_args(argv)
+
+    total = migrar(args.origem, args.destino or args.origem, args.formato)
+    print(f"{total} registro(s) convertido(s) para '{args.formato}'.")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,110 @@
+"""Migração de um arquivo único de pedidos para o repositório particionado.
+
+Uso:
+    python -m src.repositories.migrar_particoes pedidos.txt pedidos.particoes
+    python -m src.repositories.migrar_particoes pedidos.txt pedidos.particoes \\
+        --periodo 2025-12 --compactar --compressao lzma
+
+Cada registro vai para uma parte do período do seu ``criado_em``; os
+antigos, sem data, vão para o ``--periodo`` informado (por padrão, o da
+última modificação do arquivo).
+Segmentos pendentes (``<arquivo>.segmentos/``) são mesclados antes da
+cópia. O arquivo de origem não é alterado; apague-o (e seus sidecars)
+depois de conferir o resultado. Com ``--compactar``, os períodos já
+encerrados são compactados em seguida (ver
+``PedidoRepositoryParticionado.compactar``).
+"""
+
+import argparse
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.repositories.blocos_comprimidos import COMPRESSOES
+from src.repositories.formatos import detectar_formato, obter_formato, preparar_arquivo
+from src.repositories.manifesto_particoes import GRANULARIDADES, Manifesto
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+from src.repositories.pedido_repository_particionado import PedidoRepositoryParticionado
+from src.repositories.serializacao_pedido import texto_para_instante
+from src.repositories.trava_arquivo import TravaArquivo, anexar_registro
+
+# Registros acumulados por escrita no arquivo da parte
+_LOTE = 1000
+
+
+def migrar(
+    origem: Path, diretorio: Path, periodo: str | None = None, granularidade: str = "mensal"
+) -> int:
+    """Copia os pedidos de ``origem`` para partes abertas em ``diretorio``.
+
+    Lê um registro por vez e grava em lotes por parte, com memória constante.
+
+    Returns:
+        Quantidade de pedidos migrados
+
+    Raises:
+        ValueError: Se a origem estiver vazia ou o diretório tiver outra granularidade
+    """
+    formato_origem, _ = detectar_formato(origem)
+    if formato_origem is None:
+        raise ValueError(f"Arquivo {origem} vazio ou inexistente.")
+
+    manifesto = Manifesto(diretorio, granularidade)
+    if periodo is None:
+        modificado = datetime.fromtimestamp(origem.stat().st_mtime, timezone.utc)
+        periodo = manifesto.periodo(modificado)
+    formato = obter_formato(manifesto.formato)
+
+    total = 0
+    with (
+        PedidoRepositoryArquivo(str(origem), ConfiguracaoArquivo(busca="mmap")) as repository,
+        ExitStack() as pilha,
+    ):
+        # Inclui os registros ainda em segmentos de outros escritores
+        repository.mesclar_segmentos()
+        # Período -> (arquivo da parte, registros ainda não gravados)
+        destinos: dict[str, tuple[Path, list[bytes]]] = {}
+        for dados in repository.iterar_registros():
+            criado_em = texto_para_instante(dados.get("criado_em"))
+            periodo_registro = periodo if criado_em is None else manifesto.periodo(criado_em)
+            if periodo_registro not in destinos:
+                destino = manifesto.caminho(manifesto.abrir_parte(periodo_registro))
+                pilha.enter_context(TravaArquivo(destino).exclusiva())
+                preparar_arquivo(destino, formato.nome)
+                destinos[periodo_registro] = (destino, [])
+            destino, lote = destinos[periodo_registro]
+            lote.append(formato.codificar(dados))
+            total += 1
+            if len(lote) == _LOTE:
+                anexar_registro(destino, b"".join(lote))
+                lote.clear()
+        for destino, lote in destinos.values():
+            if lote:
+                anexar_registro(destino, b"".join(lote))
+    return total
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Migra um arquivo de pedidos para o repositório particionado."
+    )
+    parser.add_argument("origem", type=Path)
+    parser.add_argument("diretorio", type=Path)
+    parser.add_argument("--periodo", help="Período dos pedidos migrados (ex.: 2025-12)")
+    parser.add_argument("--granularidade", choices=sorted(GRANULARIDADES), default="mensal")
+    parser.add_argument("--compactar", action="store_true", help="Compacta períodos encerrados")
+    parser.add_argument("--compressao", choices=sorted(COMPRESSOES), default="nenhuma")
+    args = parser.parse_args(argv)
+
+    total = migrar(args.origem, args.diretorio, args.periodo, args.granularidade)
+    print(f"{total} pedido(s) migrado(s) para '{args.diretorio}'.")
+    if args.compactar:
+        repository = PedidoRepositoryParticionado(
+            str(args.diretorio), granularidade=args.granularidade
+        )
+        periodos = repository.compactar(args.compressao)
+        print(f"Período(s) compactado(s): {', '.join(periodos) or 'nenhum'}.")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
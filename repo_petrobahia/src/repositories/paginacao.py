@@ -0,0 +1,91 @@
+"""Paginação por cursor dos repositórios.
+
+Uma página (``Pagina``, em ``src.repositories.interfaces.pagina``) traz
+até ``limite`` itens e, se houver mais, o cursor da próxima. O cursor é
+opaco para quem consulta: codifica a posição em que a próxima página
+começa (offset de bytes nos repositórios em arquivo, id nos SQLite), de
+modo que continuar não exige reler as páginas anteriores.
+"""
+
+import base64
+import binascii
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, TypeVar
+
+from src.repositories.formatos import FormatoRegistro
+from src.repositories.interfaces.pagina import Pagina
+
+T = TypeVar("T")
+
+_BYTES_POSICAO = 8
+
+
+def codificar_cursor(posicao: int) -> str:
+    """Cursor opaco (base64 url-safe) para a posição ``posicao``."""
+    bruto = posicao.to_bytes(_BYTES_POSICAO, "big")
+    return base64.urlsafe_b64encode(bruto).rstrip(b"=").decode("ascii")
+
+
+def decodificar_cursor(cursor: str | None, inicio: int = 0) -> int:
+    """Posição codificada no cursor, ou ``inicio`` se não houver cursor.
+
+    Raises:
+        ValueError: Se o cursor não tiver sido gerado por ``codificar_cursor``
+    """
+    if cursor is None:
+        return inicio
+    try:
+        bruto = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    except (binascii.Error, ValueError) as error:
+        raise ValueError("Cursor inválido.") from error
+    if len(bruto) != _BYTES_POSICAO:
+        raise ValueError("Cursor inválido.")
+    return max(int.from_bytes(bruto, "big"), inicio)
+
+
+def offset_do_cursor(cursor: str | None, path: Path, formato: FormatoRegistro, inicio: int) -> int:
+    """Offset no arquivo de registros codificado no cursor (``inicio`` se None).
+
+    Raises:
+        ValueError: Se o cursor for inválido ou não apontar para o início de
+            um registro do arquivo
+    """
+    offset = decodificar_cursor(cursor, inicio)
+    if cursor is None or not path.exists():
+        return offset
+    with path.open("rb") as file:
+        if offset < file.seek(0, 2):
+            try:
+                formato.ler_bruto(file, offset)
+            except ValueError as error:
+                raise ValueError("Cursor inválido.") from error
+    return offset
+
+
+def validar_limite(limite: int) -> None:
+    """Confere o tamanho de página pedido.
+
+    Raises:
+        ValueError: Se ``limite`` não for positivo
+    """
+    if limite < 1:
+        raise ValueError("limite deve ser positivo.")
+
+
+def paginar(itens: Iterable[T], limite: int, cursor: str | None = None) -> Pagina[T]:
+    """Página de ``itens`` com cursor pela posição na sequência.
+
+    Implementação genérica das interfaces: percorre (sem guardar) os itens
+    anteriores ao cursor. Os repositórios em arquivo e SQLite a substituem
+    por cursores que retomam a leitura direto na posição.
+
+    Raises:
+        ValueError: Se ``limite`` não for positivo ou o cursor for inválido
+    """
+    validar_limite(limite)
+    posicao = decodificar_cursor(cursor)
+    pagina = list(islice(itens, posicao, posicao + limite + 1))
+    if len(pagina) > limite:
+        return Pagina(pagina[:limite], codificar_cursor(posicao + limite))
+    return Pagina(pagina)
@@ -1,107 +1,530 @@
-import ast
+import os
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Iterable
+from typing import Iterator
 
-from src.domain.models.cliente import Cliente
-from src.domain.models.item_pedido import ItemPedido
 from src.domain.models.pedido import Pedido
-from src.domain.models.produto import Produto
-from src.domain.policies.desconto.politica_desconto_produto_disel import (
-    PoliticaDescontoProdutoDisel,
+from src.infrastructure.eventos import EVENTOS, RegistroEventos
+from src.infrastructure.metricas import (
+    METRICAS,
+    OPERACAO_REPOSITORIO,
+    Metricas,
+    cronometrado,
+    cronometrado_fluxo,
 )
-from src.domain.policies.desconto.politica_desconto_produto_etanol import (
-    PoliticaDescontoProdutoEtanol,
-)
-from src.domain.policies.desconto.politica_desconto_produto_gasolina import (
-    PoliticaDescontoProdutoGasolina,
+from src.repositories.agregados_cliente import AgregadoCliente, AgregadosClientes
+from src.repositories.escritor_agrupado import ConfiguracaoEscrita, EscritorAgrupado
+from src.repositories.formatos import detectar_formato, preparar_arquivo
+from src.repositories.indice_cnpj import IndiceCnpj
+from src.repositories.indice_tempo import IndiceTempo
+from src.repositories.interfaces.i_pedido_repository import IPedidoRepository
+from src.repositories.interfaces.pagina import Pagina
+from src.repositories.paginacao import (
+    codificar_cursor,
+    offset_do_cursor,
+    validar_limite,
 )
-from src.domain.policies.desconto.politica_desconto_produto_none import (
-    PoliticaDescontoProdutoNone,
+from src.repositories.serializacao_pedido import (
+    instante_para_texto,
+    montar_pedido,
+    pedido_para_dict,
 )
-from src.domain.services.cupom_factory import CupomFactory
-from src.repositories.interfaces.i_pedido_repository import IPedidoRepository
+from src.repositories.trava_arquivo import TravaArquivo, anexar_registro
+from src.repositories.varredura_mmap import registros_com
+from src.repositories.visao_pedido import PedidoGravadoView
+
+
+@dataclass(frozen=True)
+class ConfiguracaoArquivo:
+    """Opções de ajuste de ``PedidoRepositoryArquivo``.
+
+    Attributes:
+        formato: Formato de arquivos novos (ver ``src.repositories.formatos``)
+        caminho_indice: Índice de CNPJ (padrão: ``<arquivo>.idx``)
+        escrita: Escrita agrupada (ver ``EscritorAgrupado``); None grava a cada ``salvar``
+        busca: ``"indice"`` ou ``"mmap"``
+        hidratacao: ``"pedido"`` ou ``"visao"``
+        segmento: Nome do segmento próprio em ``<arquivo>.segmentos/``
+        limite_segmento: Bytes no segmento a partir dos quais ``salvar`` o
+            mescla ao arquivo principal
+    """
+
+    formato: str | None = None
+    caminho_indice: str | None = None
+    escrita: ConfiguracaoEscrita | None = None
+    busca: str = "indice"
+    hidratacao: str = "pedido"
+    segmento: str | None = None
+    limite_segmento: int = 4 * 1024 * 1024
+
+    def __post_init__(self):
+        if self.busca not in ("indice", "mmap"):
+            raise ValueError("busca deve ser 'indice' ou 'mmap'.")
+        if self.hidratacao not in ("pedido", "visao"):
+            raise ValueError("hidratacao deve ser 'pedido' ou 'visao'.")
+        segmento = self.segmento
+        if segmento is not None and (not segmento or Path(segmento).name != segmento):
+            raise ValueError("segmento deve ser um nome de arquivo simples.")
+        if self.limite_segmento <= 0:
+            raise ValueError("limite_segmento deve ser positivo.")
 
 
 class PedidoRepositoryArquivo(IPedidoRepository):
-    """Persistência de pedidos em arquivo TXT (formato dict string)."""
+    """Persistência de pedidos em arquivo.
+
+    O formato dos registros é definido pelo cabeçalho do arquivo
+    (ver ``src.repositories.formatos``); arquivos legados em dict string
+    continuam sendo lidos.
+
+    Mantém um índice CNPJ -> offsets em ``<arquivo>.idx`` para que
+    ``buscar_por_cliente`` leia apenas as linhas do cliente consultado, e
+    os totais por cliente em ``<arquivo>.agg`` (ver ``AgregadosClientes``),
+    atualizados a cada ``salvar``. ``buscar_por_periodo`` usa um índice
+    esparso de tempo em ``<arquivo>.tempo`` (ver ``IndiceTempo``), atualizado
+    na consulta.
+
+    As opções de ajuste ficam em ``config`` (ver ``ConfiguracaoArquivo``).
+
+    Com ``escrita`` informada, ``salvar`` passa a gravar em lotes (ver
+    ``EscritorAgrupado``); use ``flush()``/``close()`` ou ``with``.
+
+    Com ``busca="mmap"``, o índice não é mantido e ``buscar_por_cliente``
+    varre o arquivo mapeado em memória (bom para cargas só de escrita ou
+    arquivos consultados raramente); ``buscar_por_periodo`` percorre o
+    arquivo inteiro.
+
+    Com ``hidratacao="visao"``, ``buscar_por_cliente`` devolve
+    ``PedidoGravadoView`` em vez de ``Pedido``: cliente, itens, produtos e
+    cupons só são montados quando acessados. Os registros indexados são
+    decodificados na leitura, para conferir o CNPJ de cada um. Nos dois
+    modos os valores são os gravados, sem recalcular descontos.
 
-    _POLITICAS = {
-        "diesel": PoliticaDescontoProdutoDisel,
-        "gasolina": PoliticaDescontoProdutoGasolina,
-        "etanol": PoliticaDescontoProdutoEtanol,
-    }
+    Vários processos podem gravar no mesmo arquivo: cada registro é anexado
+    em uma única escrita sob a trava ``<arquivo>.lock`` (ver
+    ``TravaArquivo``), junto com a atualização dos sidecars. Para evitar a
+    disputa pela trava, cada processo pode gravar em um segmento próprio
+    (``ConfiguracaoArquivo(segmento="<nome>")``, em ``<arquivo>.segmentos/``).
+    Os segmentos só entram no arquivo principal em ``mesclar_segmentos``:
+    ``salvar`` mescla o próprio segmento quando ele passa de
+    ``limite_segmento`` bytes, e ``close`` mescla o que restou. As leituras
+    não mesclam; consultam só o arquivo principal.
+    """
 
-    def __init__(self, caminho_arquivo: str = "pedidos.txt"):
+    def __init__(
+        self,
+        caminho_arquivo: str = "pedidos.txt",
+        config: ConfiguracaoArquivo | None = None,
+        metricas: Metricas | None = None,
+        eventos: RegistroEventos | None = None,
+    ):
+        config = config if config is not None else ConfiguracaoArquivo()
         self._path = Path(caminho_arquivo)
-        if not self._path.exists():
-            self._path.write_text("", encoding="utf-8")
+        self._metricas = metricas if metricas is not None else METRICAS
+        self._eventos = eventos if eventos is not None else EVENTOS
+        self._visoes = config.hidratacao == "visao"
+        self._trava = TravaArquivo(self._path)
+        with self._trava.exclusiva():
+            self._formato, self._inicio_dados = preparar_arquivo(self._path, config.formato)
+        self._limite_segmento = config.limite_segmento
+        self._segmento_cheio = False
+        self._dir_segmentos = self._path.with_name(self._path.name + ".segmentos")
+        self._segmento = None if config.segmento is None else self._dir_segmentos / config.segmento
+        if self._segmento is not None:
+            self._dir_segmentos.mkdir(exist_ok=True)
+            self._trava_segmento = TravaArquivo(self._segmento)
+            with self._trava_segmento.exclusiva():
+                preparar_arquivo(self._segmento, self._formato.nome)
+        indice_path = (
+            Path(config.caminho_indice)
+            if config.caminho_indice
+            else self._path.with_name(self._path.name + ".idx")
+        )
+        # Na busca por mmap o índice não é consultado, então nem é mantido
+        self._indice = (
+            IndiceCnpj(indice_path, self._path, self._iterar_cnpjs)
+            if config.busca == "indice"
+            else None
+        )
+        self._tempo = (
+            IndiceTempo(
+                self._path.with_name(self._path.name + ".tempo"),
+                self._path,
+                self._iterar_instantes,
+            )
+            if config.busca == "indice"
+            else None
+        )
+        self._agregados = AgregadosClientes(
+            self._path.with_name(self._path.name + ".agg"), self._path, self._iterar_dados
+        )
+        # Registros no buffer do escritor, na ordem em que serão gravados
+        self._pendentes: deque[dict] = deque()
+        self._escritor = None
+        if config.escrita and self._segmento is not None:
+            self._escritor = EscritorAgrupado(
+                self._segmento, config.escrita, self._ao_gravar_segmento, self._trava_segmento
+            )
+        elif config.escrita:
+            self._escritor = EscritorAgrupado(
+                self._path, config.escrita, self._ao_gravar, self._trava
+            )
+
+    @property
+    def caminho(self) -> Path:
+        """Arquivo de pedidos."""
+        return self._path
+
+    def __enter__(self) -> "PedidoRepositoryArquivo":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
 
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="pedido", operacao="flush")
+    def flush(self) -> None:
+        """Grava pedidos pendentes do modo de escrita agrupada."""
+        if self._escritor is not None:
+            self._escritor.flush()
+
+    def close(self) -> None:
+        """Grava pedidos pendentes, mescla o próprio segmento e libera o arquivo."""
+        if self._escritor is not None:
+            self._escritor.close()
+        if self._segmento is not None:
+            self._mesclar(self._segmento)
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="pedido", operacao="salvar")
     def salvar(self, pedido: Pedido) -> None:
-        """Salva pedido em formato dict string."""
-        pedido_dict = {
-            "cliente": {
-                "nome": pedido.cliente.nome,
-                "email": pedido.cliente.email,
-                "cnpj": pedido.cliente.cnpj,
-            },
-            "itens": [
-                {
-                    "produto_tipo": item.produto.tipo,
-                    "quantidade": item.quantidade,
-                    "preco_unitario": item.preco_unitario,
-                    "desconto_produto": item.desconto_produto,
-                    "desconto_cupom": item.desconto_cupom,
-                    "preco_final": item.preco_final,
-                }
-                for item in pedido.itens
-            ],
-            "preco_total": pedido.preco_total,
-        }
-        with self._path.open("a", encoding="utf-8") as file:
-            file.write(str(pedido_dict) + "\n")
-        print(f"Pedido salvo para cliente: {pedido.cliente.nome} (CNPJ: {pedido.cliente.cnpj})")
-
-    def buscar_por_cliente(self, cnpj: str) -> list[Pedido]:
-        """Retorna pedidos de um cliente pelo CNPJ."""
-        pedidos = []
+        """Anexa o pedido no formato do arquivo e atualiza o índice."""
+        pedido_dict = pedido_para_dict(pedido)
+        registro = self._formato.codificar(pedido_dict)
+        if self._escritor is not None and self._segmento is not None:
+            self._escritor.anexar(registro)
+        elif self._escritor is not None:
+            # Sob a trava do escritor: a ordem dos pendentes é a do buffer
+            self._escritor.anexar(
+                registro, pedido.cliente.cnpj, lambda: self._pendentes.append(pedido_dict)
+            )
+        elif self._segmento is not None:
+            with self._trava_segmento.exclusiva():
+                fim = anexar_registro(self._segmento, registro) + len(registro)
+            self._segmento_cheio = fim >= self._limite_segmento
+        else:
+            with self._trava.exclusiva():
+                offset = anexar_registro(self._path, registro)
+                fim = offset + len(registro)
+                if self._indice is not None:
+                    self._indice.registrar(pedido.cliente.cnpj, offset, fim)
+                self._agregados.registrar_lote([(pedido_dict, offset, fim)])
+        if self._segmento_cheio:
+            self._segmento_cheio = False
+            self._mesclar(self._segmento)
+        self._eventos.debug(
+            "pedido_salvo",
+            "Pedido salvo para cliente: {nome} (CNPJ: {cnpj})",
+            nome=pedido.cliente.nome,
+            cnpj=pedido.cliente.cnpj,
+        )
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="pedido", operacao="buscar_por_cliente")
+    def buscar_por_cliente(self, cnpj: str) -> list[Pedido] | list[PedidoGravadoView]:
+        """Retorna pedidos de um cliente pelo CNPJ.
+
+        Usa o índice para ler só as linhas do cliente. Se alguma linha
+        apontada não pertencer ao CNPJ (arquivo reescrito por fora), o índice
+        é reconstruído e a busca refeita. Com ``busca="mmap"``, varre o
+        arquivo mapeado em memória (ver ``varrer_por_cnpj``).
+        """
         if not self._path.exists():
-            return pedidos
+            return []
 
-        with self._path.open("r", encoding="utf-8") as file:
-            for linha in file:
-                linha = linha.strip()
-                if not linha:
-                    continue
+        self.flush()
+        if self._indice is None:
+            return self._hidratar([dados for _, dados in self._varrer(cnpj)])
+        registros, _ = self._ler_indexados(cnpj, self._inicio_dados)
+        return self._hidratar(registros)
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="pedido", operacao="buscar_pagina_por_cliente")
+    def buscar_pagina_por_cliente(
+        self, cnpj: str, limite: int, cursor: str | None = None
+    ) -> Pagina[Pedido] | Pagina[PedidoGravadoView]:
+        """Até ``limite`` pedidos do cliente a partir do cursor, na ordem de gravação.
+
+        O cursor guarda o offset do próximo pedido do cliente. Com o índice,
+        a página começa por busca binária nos offsets do CNPJ e lê só os seus
+        registros; com ``busca="mmap"``, a varredura parte do offset.
+
+        Raises:
+            ValueError: Se ``limite`` não for positivo ou o cursor for inválido
+        """
+        validar_limite(limite)
+        inicio = offset_do_cursor(cursor, self._path, self._formato, self._inicio_dados)
+        if not self._path.exists():
+            return Pagina()
+
+        self.flush()
+        if self._indice is None:
+            encontrados = list(islice(self._varrer(cnpj, inicio), limite + 1))
+            proximo = encontrados.pop()[0] if len(encontrados) > limite else None
+            registros = [dados for _, dados in encontrados]
+        else:
+            registros, proximo = self._ler_indexados(cnpj, inicio, limite)
+        return Pagina(
+            self._hidratar(registros), None if proximo is None else codificar_cursor(proximo)
+        )
 
-                dados = ast.literal_eval(linha)
-                cliente_dados = dados["cliente"]
+    @cronometrado_fluxo(OPERACAO_REPOSITORIO, repositorio="pedido", operacao="buscar_por_periodo")
+    def buscar_por_periodo(
+        self, inicio: datetime, fim: datetime, cnpj: str | None = None
+    ) -> Iterator[Pedido] | Iterator[PedidoGravadoView]:
+        """Pedidos criados em ``[inicio, fim)``, na ordem de gravação, em fluxo.
 
-                if cliente_dados["cnpj"] == cnpj:
-                    cliente = Cliente(
-                        nome=cliente_dados["nome"],
-                        email=cliente_dados["email"],
-                        cnpj=cliente_dados["cnpj"],
+        O índice de tempo limita a leitura aos blocos de registros cuja faixa
+        de instantes cruza o período (mais o trecho final, ainda não
+        indexado). Com ``cnpj`` e o índice de CNPJ, só os registros do
+        cliente dentro desses blocos são lidos. Com ``busca="mmap"``, o
+        arquivo inteiro é percorrido.
+        """
+        inicio_texto, fim_texto = instante_para_texto(inicio), instante_para_texto(fim)
+        if not self._path.exists() or inicio_texto >= fim_texto:
+            return iter(())
+
+        self.flush()
+        offsets = None
+        # Exclusiva: sincronizar os índices pode anexar entradas aos sidecars
+        with self._trava.exclusiva():
+            tamanho = self._path.stat().st_size
+            if self._tempo is None:
+                faixas = [(self._inicio_dados, tamanho)]
+            else:
+                faixas = self._tempo.faixas(inicio_texto, fim_texto)
+                faixas.append((max(self._tempo.coberto, self._inicio_dados), tamanho))
+            if cnpj is not None and self._indice is not None:
+                offsets = self._offsets_nas_faixas(self._indice.offsets(cnpj), faixas)
+        return self._ler_periodo(faixas, offsets, inicio_texto, fim_texto, cnpj)
+
+    def varrer_por_cnpj(self, cnpj: str) -> Iterator[dict]:
+        """Registros do CNPJ por varredura ``mmap``, sem índice.
+
+        Só as linhas que contêm os bytes do CNPJ são decodificadas.
+        """
+        self.flush()
+        for _, dados in self._varrer(cnpj):
+            yield dados
+
+    def iterar_registros(self, inicio: int | None = None, fim: int | None = None) -> Iterator[dict]:
+        """Percorre os registros persistidos, sem montar ``Pedido``.
+
+        Com ``inicio``/``fim`` (offsets alinhados, ver ``particionar``),
+        percorre só os registros que começam nessa faixa.
+        """
+        if not self._path.exists():
+            return
+        self.flush()
+        limite = self._tamanho_confirmado() if fim is None else fim
+        with self._path.open("rb") as file:
+            inicio = self._inicio_dados if inicio is None else max(inicio, self._inicio_dados)
+            for _, _, dados in self._formato.iterar_ate(file, inicio, limite):
+                yield dados
+
+    def particionar(self, partes: int) -> list[tuple[int, int]]:
+        """Divide o arquivo em até ``partes`` faixas de bytes alinhadas a registros."""
+        if partes < 1:
+            raise ValueError("partes deve ser positivo.")
+        self.flush()
+        with self._trava.compartilhada(), self._path.open("rb") as file:
+            tamanho = os.fstat(file.fileno()).st_size
+            limites = [self._inicio_dados]
+            for parte in range(1, partes):
+                alvo = self._inicio_dados + (tamanho - self._inicio_dados) * parte // partes
+                limites.append(max(limites[-1], self._formato.alinhar(file, limites[-1], alvo)))
+            limites.append(tamanho)
+        return [(a, b) for a, b in zip(limites, limites[1:]) if a < b]
+
+    def agregado_cliente(self, cnpj: str) -> AgregadoCliente | None:
+        """Totais dos pedidos do cliente, sem varrer o arquivo; None se não houver."""
+        self.flush()
+        with self._trava.exclusiva():
+            return self._agregados.obter(cnpj)
+
+    def listar_agregados(self) -> Iterator[AgregadoCliente]:
+        """Percorre os totais de todos os clientes."""
+        self.flush()
+        with self._trava.exclusiva():
+            return iter(list(self._agregados.listar()))
+
+    def reconstruir_agregados(self) -> None:
+        """Recalcula os totais por cliente a partir do arquivo (recuperação)."""
+        self.flush()
+        with self._trava.exclusiva():
+            self._agregados.reconstruir()
+
+    def mesclar_segmentos(self) -> int:
+        """Anexa ao arquivo principal os registros gravados em segmentos.
+
+        Cada segmento é copiado de uma vez, sob a trava dele e a do arquivo
+        principal, e depois esvaziado. Um marcador ``<segmento>.mesclando``
+        registra a cópia em andamento: se o processo cair no meio, a próxima
+        mescla completa ou refaz a cópia sem duplicar nem perder registros.
+
+        Returns:
+            Quantidade de bytes incorporados
+        """
+        try:
+            nomes = sorted(os.listdir(self._dir_segmentos))
+        except FileNotFoundError:
+            return 0
+        return sum(
+            self._mesclar(self._dir_segmentos / nome)
+            for nome in nomes
+            if not nome.endswith((".lock", ".mesclando"))
+        )
+
+    def _mesclar(self, segmento: Path) -> int:
+        marcador = segmento.with_name(segmento.name + ".mesclando")
+        with TravaArquivo(segmento).exclusiva(), self._trava.exclusiva():
+            formato, inicio = detectar_formato(segmento)
+            if formato is None:
+                return 0
+            if marcador.exists():
+                base, tamanho = (int(valor) for valor in marcador.read_text().split())
+                if self._path.stat().st_size >= base + tamanho:
+                    # A cópia terminou; só faltou esvaziar o segmento
+                    os.truncate(segmento, inicio)
+                else:
+                    os.truncate(self._path, base)
+            with segmento.open("rb") as file:
+                if formato.nome == self._formato.nome:
+                    file.seek(inicio)
+                    dados = file.read()
+                else:
+                    dados = b"".join(
+                        self._formato.codificar(registro)
+                        for _, _, registro in formato.iterar(file, inicio)
                     )
+            if dados:
+                marcador.write_text(f"{self._path.stat().st_size} {len(dados)}")
+                anexar_registro(self._path, dados)
+                os.truncate(segmento, inicio)
+            marcador.unlink(missing_ok=True)
+            return len(dados)
+
+    def _varrer(self, cnpj: str, inicio: int | None = None) -> Iterator[tuple[int, dict]]:
+        inicio = self._inicio_dados if inicio is None else inicio
+        for offset, _, dados in registros_com(
+            self._path, self._formato, inicio, cnpj, self._tamanho_confirmado()
+        ):
+            if dados["cliente"]["cnpj"] == cnpj:
+                yield offset, dados
+
+    def _hidratar(self, registros: list[dict]) -> list[Pedido] | list[PedidoGravadoView]:
+        """Monta pedidos (ou, no modo de views, views) de registros decodificados."""
+        if not self._visoes:
+            return [montar_pedido(dados) for dados in registros]
+        return [PedidoGravadoView.de_registro(dados) for dados in registros]
+
+    def _ler_indexados(
+        self, cnpj: str, inicio: int, limite: int | None = None
+    ) -> tuple[list[dict], int | None]:
+        """Registros indexados do CNPJ a partir do offset ``inicio``.
+
+        Se algum offset não apontar para um registro do CNPJ (arquivo
+        reescrito por fora), o índice é reconstruído e a leitura refeita.
+
+        Returns:
+            (até ``limite`` registros, offset do registro seguinte ou None)
+        """
+        pedir = None if limite is None else limite + 1
+        # Exclusiva: sincronizar o índice pode anexar entradas ao sidecar
+        with self._trava.exclusiva():
+            for _ in range(2):
+                offsets = self._indice.offsets_desde(cnpj, inicio, pedir)
+                proximo = offsets.pop() if limite is not None and len(offsets) > limite else None
+                registros = self._ler_registros(cnpj, offsets)
+                if registros is not None:
+                    return registros, proximo
+                self._indice.reconstruir()
+        return [], None
+
+    @staticmethod
+    def _offsets_nas_faixas(offsets: list[int], faixas: list[tuple[int, int]]) -> list[int]:
+        """Offsets (ordenados) que caem em alguma das faixas, por busca binária."""
+        selecionados = []
+        for inicio, fim in faixas:
+            selecionados.extend(offsets[bisect_left(offsets, inicio) : bisect_left(offsets, fim)])
+        return selecionados
+
+    def _ler_periodo(
+        self,
+        faixas: list[tuple[int, int]],
+        offsets: list[int] | None,
+        inicio: str,
+        fim: str,
+        cnpj: str | None,
+    ) -> Iterator[Pedido] | Iterator[PedidoGravadoView]:
+        """Monta os pedidos do período lidos das faixas (ou só dos ``offsets``)."""
+        montar = PedidoGravadoView.de_registro if self._visoes else montar_pedido
+        with self._path.open("rb") as file:
+            if offsets is not None:
+                registros = (self._formato.ler(file, offset) for offset in offsets)
+            else:
+                registros = (
+                    dados
+                    for faixa_inicio, faixa_fim in faixas
+                    for _, _, dados in self._formato.iterar_ate(file, faixa_inicio, faixa_fim)
+                )
+            for dados in registros:
+                criado_em = dados.get("criado_em")
+                if criado_em is None or not inicio <= criado_em < fim:
+                    continue
+                if cnpj is None or dados["cliente"]["cnpj"] == cnpj:
+                    yield montar(dados)
+
+    def _tamanho_confirmado(self) -> int:
+        """Tamanho do arquivo sem gravação em andamento; até ele os registros estão inteiros."""
+        with self._trava.compartilhada():
+            return self._path.stat().st_size
+
+    def _ao_gravar(self, gravados: list[tuple[str, int, int]]) -> None:
+        if self._indice is not None:
+            self._indice.registrar_lote(gravados)
+        dados = [self._pendentes.popleft() for _ in gravados]
+        self._agregados.registrar_lote(
+            [(registro, offset, fim) for registro, (_, offset, fim) in zip(dados, gravados)]
+        )
+
+    def _ao_gravar_segmento(self, gravados: list[tuple[str, int, int]]) -> None:
+        # Chamado sob a trava do segmento (talvez na thread do escritor): a
+        # mescla, que precisa dessa trava, fica para o próximo ``salvar``
+        if gravados and gravados[-1][2] >= self._limite_segmento:
+            self._segmento_cheio = True
+
+    def _ler_registros(self, cnpj: str, offsets: list[int]) -> list[dict] | None:
+        """Lê os registros do CNPJ nos offsets; None se o índice estiver obsoleto."""
+        registros = []
+        with self._path.open("rb") as file:
+            for offset in offsets:
+                try:
+                    dados = self._formato.ler(file, offset)
+                except ValueError:
+                    return None
+                if dados.get("cliente", {}).get("cnpj") != cnpj:
+                    return None
+                registros.append(dados)
+        return registros
+
+    def _iterar_cnpjs(self, inicio: int) -> Iterator[tuple[int, int, str]]:
+        for offset, fim, dados in self._iterar_dados(inicio):
+            yield offset, fim, dados["cliente"]["cnpj"]
+
+    def _iterar_instantes(self, inicio: int) -> Iterator[tuple[int, int, str | None]]:
+        for offset, fim, dados in self._iterar_dados(inicio):
+            yield offset, fim, dados.get("criado_em")
 
-                    itens = []
-                    for item_dados in dados["itens"]:
-                        politica_cls = self._POLITICAS.get(
-                            item_dados["produto_tipo"], PoliticaDescontoProdutoNone
-                        )
-                        produto = Produto(
-                            tipo=item_dados["produto_tipo"],
-                            preco=item_dados["preco_unitario"],
-                            politica_desconto=politica_cls(),
-                        )
-                        cupom = CupomFactory.criar(None)
-                        item = ItemPedido(
-                            produto=produto,
-                            quantidade=item_dados["quantidade"],
-                            cupom=cupom,
-                        )
-                        itens.append(item)
-
-                    pedido = Pedido(cliente=cliente, itens=itens)
-                    pedidos.append(pedido)
-
-        return pedidos
+    def _iterar_dados(self, inicio: int) -> Iterator[tuple[int, int, dict]]:
+        with self._path.open("rb") as file:
+            yield from self._formato.iterar(file, max(inicio, self._inicio_dados))
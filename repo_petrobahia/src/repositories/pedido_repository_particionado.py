@@ -0,0 +1,457 @@
+from contextlib import ExitStack, nullcontext
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, ContextManager, Iterator
+
+from src.domain.models.pedido import Pedido
+from src.infrastructure.eventos import RegistroEventos
+from src.infrastructure.metricas import (
+    METRICAS,
+    OPERACAO_REPOSITORIO,
+    Metricas,
+    cronometrado,
+    cronometrado_fluxo,
+)
+from src.repositories.blocos_comprimidos import (
+    TAMANHO_BLOCO_PADRAO,
+    ArquivoBlocos,
+    gravar_blocos,
+    validar_compressao,
+)
+from src.repositories.escritor_agrupado import ConfiguracaoEscrita
+from src.repositories.formatos import FormatoRegistro, detectar_formato, obter_formato
+from src.repositories.indice_unico_cnpj import FiltroBloom
+from src.repositories.interfaces.i_pedido_repository import IPedidoRepository
+from src.repositories.interfaces.pagina import Pagina
+from src.repositories.manifesto_particoes import (
+    COMPACTADA,
+    Manifesto,
+    Parte,
+    chave_filtro,
+)
+from src.repositories.paginacao import (
+    codificar_cursor,
+    decodificar_cursor,
+    validar_limite,
+)
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+from src.repositories.serializacao_pedido import instante_para_texto, montar_pedido, para_utc
+from src.repositories.trava_arquivo import TravaArquivo
+from src.repositories.visao_pedido import PedidoGravadoView
+
+# O cursor guarda o id da parte nos bits altos e a posição nela nos baixos
+_BITS_POSICAO = 40
+_SIDECARS = (".idx", ".agg", ".tempo", ".lock")
+
+
+class PedidoRepositoryParticionado(IPedidoRepository):
+    """Persistência de pedidos em partes por período (mês ou dia), com manifesto.
+
+    Cada pedido é gravado na parte aberta do período em que foi criado
+    (``criado_em``, em UTC; pedidos sem data usam o ``relogio``); ao virar o
+    período, uma parte nova é criada e registrada no manifesto (ver
+    ``Manifesto``). Partes abertas
+    são arquivos de pedidos comuns, lidos e gravados por
+    ``PedidoRepositoryArquivo`` (índice, totais, travas entre processos).
+
+    ``compactar`` regrava os períodos encerrados em arquivos de blocos
+    comprimidos (``gzip``/``lzma`` opcionais, ver ``blocos_comprimidos``),
+    com os pedidos agrupados por cliente: uma consulta descomprime só os
+    blocos do cliente. O filtro de Bloom de cada parte compactada, no
+    manifesto, evita abrir as partes que não têm pedidos do CNPJ.
+
+    Pedidos do mesmo cliente voltam na ordem de gravação. ``iterar_registros``
+    e ``buscar_por_periodo`` percorrem as partes em ordem de período, mas,
+    dentro de uma parte compactada, agrupam os registros por cliente.
+
+    Para migrar um arquivo único existente, ver ``migrar_particoes``.
+    """
+
+    def __init__(
+        self,
+        diretorio: str = "pedidos.particoes",
+        formato: str | None = None,
+        granularidade: str = "mensal",
+        escrita: ConfiguracaoEscrita | None = None,
+        metricas: Metricas | None = None,
+        hidratacao: str = "pedido",
+        relogio: Callable[[], datetime] | None = None,
+        eventos: RegistroEventos | None = None,
+    ):
+        if hidratacao not in ("pedido", "visao"):
+            raise ValueError("hidratacao deve ser 'pedido' ou 'visao'.")
+        self._manifesto = Manifesto(Path(diretorio), granularidade, formato)
+        self._formato = obter_formato(self._manifesto.formato)
+        self._escrita = escrita
+        self._metricas = metricas if metricas is not None else METRICAS
+        self._eventos = eventos
+        self._hidratacao = hidratacao
+        self._relogio = relogio or (lambda: datetime.now(timezone.utc))
+        self._abertas: dict[int, PedidoRepositoryArquivo] = {}
+        self._compactadas: dict[int, ArquivoBlocos] = {}
+        self._parte_escrita: Parte | None = None
+
+    @property
+    def caminho(self) -> Path:
+        """Diretório das partes."""
+        return self._manifesto.diretorio
+
+    @property
+    def partes(self) -> list[Parte]:
+        """Partes atuais, na ordem de leitura."""
+        self._sincronizar()
+        return list(self._manifesto.partes)
+
+    def __enter__(self) -> "PedidoRepositoryParticionado":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        """Grava os pedidos pendentes (escrita agrupada) de todas as partes abertas."""
+        for repository in self._abertas.values():
+            repository.flush()
+
+    def close(self) -> None:
+        """Grava pedidos pendentes e libera os arquivos."""
+        for repository in self._abertas.values():
+            repository.close()
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="pedido_particionado", operacao="salvar")
+    def salvar(self, pedido: Pedido) -> None:
+        """Anexa o pedido à parte aberta do período de criação."""
+        criado_em = self._relogio() if pedido.criado_em is None else para_utc(pedido.criado_em)
+        periodo = self._manifesto.periodo(criado_em)
+        parte = self._parte_escrita
+        if self._sincronizar() or parte is None or parte.periodo != periodo:
+            atual = None if parte is None else self._manifesto.obter(parte.id)
+            if atual is None or not atual.aberta or atual.periodo != periodo:
+                parte = self._parte_escrita = self._manifesto.abrir_parte(periodo)
+        self._aberta(parte, criar=True).salvar(pedido)
+
+    @cronometrado(
+        OPERACAO_REPOSITORIO, repositorio="pedido_particionado", operacao="buscar_por_cliente"
+    )
+    def buscar_por_cliente(self, cnpj: str) -> list[Pedido] | list[PedidoGravadoView]:
+        """Pedidos do cliente, lendo só as partes que podem contê-los."""
+        return self._repetindo_se_compactada(lambda: self._buscar(cnpj))
+
+    @cronometrado(
+        OPERACAO_REPOSITORIO,
+        repositorio="pedido_particionado",
+        operacao="buscar_pagina_por_cliente",
+    )
+    def buscar_pagina_por_cliente(
+        self, cnpj: str, limite: int, cursor: str | None = None
+    ) -> Pagina[Pedido] | Pagina[PedidoGravadoView]:
+        """Até ``limite`` pedidos do cliente a partir do cursor.
+
+        O cursor guarda a parte e a posição nela (offset nas abertas, ordem
+        entre os pedidos do cliente nas compactadas). Cursores de uma parte
+        compactada depois de emitidos deixam de valer.
+
+        Raises:
+            ValueError: Se ``limite`` não for positivo ou o cursor for inválido
+        """
+        validar_limite(limite)
+        return self._repetindo_se_compactada(lambda: self._buscar_pagina(cnpj, limite, cursor))
+
+    @cronometrado_fluxo(
+        OPERACAO_REPOSITORIO, repositorio="pedido_particionado", operacao="buscar_por_periodo"
+    )
+    def buscar_por_periodo(
+        self, inicio: datetime, fim: datetime, cnpj: str | None = None
+    ) -> Iterator[Pedido] | Iterator[PedidoGravadoView]:
+        """Pedidos criados em ``[inicio, fim)``, lendo só as partes dos períodos do intervalo.
+
+        Nas partes abertas, a leitura usa o índice de tempo de cada arquivo
+        (ver ``PedidoRepositoryArquivo.buscar_por_periodo``); com ``cnpj``,
+        partes compactadas sem o cliente são descartadas pelo filtro de Bloom
+        e, nas demais, só os blocos dele são lidos. Se outro processo
+        compactar uma parte durante a iteração, a leitura dela levanta
+        ``FileNotFoundError``; refaça a consulta.
+        """
+        inicio, fim = para_utc(inicio), para_utc(fim)
+        if inicio >= fim:
+            return iter(())
+        self.flush()
+        primeiro, ultimo = self._manifesto.periodo(inicio), self._manifesto.periodo(fim)
+        partes = [
+            parte
+            for parte in self.partes
+            if primeiro <= parte.periodo <= ultimo and (cnpj is None or parte.pode_conter(cnpj))
+        ]
+        return self._ler_periodo(partes, inicio, fim, cnpj)
+
+    def iterar_registros(
+        self, periodo_inicio: str | None = None, periodo_fim: str | None = None
+    ) -> Iterator[dict]:
+        """Percorre os registros, abrindo só as partes do intervalo de períodos (inclusivo)."""
+        self.flush()
+        for parte in self.partes:
+            if periodo_inicio is not None and parte.periodo < periodo_inicio:
+                continue
+            if periodo_fim is not None and parte.periodo > periodo_fim:
+                break
+            if parte.aberta:
+                yield from self._aberta(parte).iterar_registros()
+            else:
+                blocos = self._blocos(parte)
+                for bruto in blocos.iterar_brutos():
+                    yield blocos.formato.decodificar(bruto)
+
+    def compactar(
+        self,
+        compressao: str = "nenhuma",
+        carencia: timedelta = timedelta(days=1),
+        tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+    ) -> list[str]:
+        """Regrava em blocos comprimidos os períodos encerrados há mais de ``carencia``.
+
+        Todas as partes de cada período (abertas e já compactadas) viram uma
+        única parte compactada. A troca no manifesto é atômica; só depois
+        os arquivos antigos são apagados. A ``carencia`` dá tempo a
+        gravações atrasadas (relógios adiantados ou atrasados entre
+        processos) antes que o período seja fechado.
+
+        Returns:
+            Períodos compactados
+
+        Raises:
+            ValueError: Se a compressão não existir
+        """
+        validar_compressao(compressao)
+        self.flush()
+        limite = self._manifesto.periodo(self._relogio() - carencia)
+        compactados = []
+        for periodo in sorted({parte.periodo for parte in self.partes if parte.periodo < limite}):
+            partes = [parte for parte in self._manifesto.partes if parte.periodo == periodo]
+            if len(partes) == 1 and not partes[0].aberta and partes[0].compressao == compressao:
+                continue
+            if self._compactar_periodo(periodo, partes, compressao, tamanho_bloco):
+                compactados.append(periodo)
+        return compactados
+
+    def _compactar_periodo(
+        self, periodo: str, partes: list[Parte], compressao: str, tamanho_bloco: int
+    ) -> bool:
+        nova = Parte(self._manifesto.reservar_id(), periodo, "", COMPACTADA, compressao=compressao)
+        nova.arquivo = f"{periodo}.{nova.id}.blocos"
+        destino = self._manifesto.caminho(nova)
+        with ExitStack() as pilha:
+            # Gravações atrasadas na parte esperam a troca no manifesto
+            for parte in partes:
+                self._fechar(parte)
+                if parte.aberta:
+                    pilha.enter_context(TravaArquivo(self._manifesto.caminho(parte)).exclusiva())
+            fontes = [pilha.enter_context(self._fonte(parte)) for parte in partes]
+            cnpjs = sorted({cnpj for fonte in fontes for cnpj in fonte.cnpjs()})
+            nova.registros = gravar_blocos(
+                destino,
+                ((cnpj, self._brutos_de(fontes, cnpj)) for cnpj in cnpjs),
+                self._formato,
+                compressao,
+                tamanho_bloco,
+            )
+            nova.filtro = FiltroBloom(max(len(cnpjs), 1))
+            for cnpj in cnpjs:
+                nova.filtro.adicionar(chave_filtro(cnpj))
+            if not self._manifesto.substituir([parte.id for parte in partes], nova):
+                destino.unlink(missing_ok=True)
+                return False
+            for parte in partes:
+                self._apagar(parte)
+        return True
+
+    def _buscar(self, cnpj: str) -> list[Pedido] | list[PedidoGravadoView]:
+        pedidos = []
+        for parte in self.partes:
+            if not parte.pode_conter(cnpj):
+                continue
+            if parte.aberta:
+                pedidos.extend(self._aberta(parte).buscar_por_cliente(cnpj))
+            else:
+                blocos = self._blocos(parte)
+                pedidos.extend(self._hidratar(blocos.formato, blocos.brutos(cnpj)))
+        return pedidos
+
+    def _buscar_pagina(
+        self, cnpj: str, limite: int, cursor: str | None
+    ) -> Pagina[Pedido] | Pagina[PedidoGravadoView]:
+        partes = self.partes
+        posicao = 0
+        if cursor is not None:
+            id_parte, posicao = divmod(decodificar_cursor(cursor), 1 << _BITS_POSICAO)
+            ids = [parte.id for parte in partes]
+            if id_parte not in ids:
+                raise ValueError("Cursor inválido.")
+            partes = partes[ids.index(id_parte) :]
+
+        itens: list = []
+        for parte in partes:
+            if len(itens) == limite:
+                # Página cheia: só resta saber se há mais pedidos adiante
+                if self._tem_pedidos(parte, cnpj):
+                    return Pagina(itens, self._cursor(parte, 0))
+                continue
+            lidos, proximo = self._ler_pagina(parte, cnpj, posicao, limite - len(itens))
+            posicao = 0
+            itens.extend(lidos)
+            if proximo is not None:
+                return Pagina(itens, self._cursor(parte, proximo))
+        return Pagina(itens)
+
+    def _ler_pagina(
+        self, parte: Parte, cnpj: str, posicao: int, quantidade: int
+    ) -> tuple[list, int | None]:
+        """Até ``quantidade`` pedidos da parte a partir da posição, e a posição seguinte."""
+        if not parte.pode_conter(cnpj):
+            return [], None
+        if parte.aberta:
+            interno = codificar_cursor(posicao) if posicao else None
+            pagina = self._aberta(parte).buscar_pagina_por_cliente(cnpj, quantidade, interno)
+            proximo = None if pagina.proximo is None else decodificar_cursor(pagina.proximo)
+            return pagina.itens, proximo
+        blocos = self._blocos(parte)
+        brutos = blocos.brutos(cnpj, posicao, quantidade + 1)
+        proximo = posicao + quantidade if len(brutos) > quantidade else None
+        return self._hidratar(blocos.formato, brutos[:quantidade]), proximo
+
+    def _ler_periodo(
+        self, partes: list[Parte], inicio: datetime, fim: datetime, cnpj: str | None
+    ) -> Iterator[Pedido] | Iterator[PedidoGravadoView]:
+        inicio_texto, fim_texto = instante_para_texto(inicio), instante_para_texto(fim)
+        montar = PedidoGravadoView.de_registro if self._hidratacao == "visao" else montar_pedido
+        for parte in partes:
+            if parte.aberta:
+                yield from self._aberta(parte).buscar_por_periodo(inicio, fim, cnpj)
+                continue
+            blocos = self._blocos(parte)
+            brutos = blocos.iterar_brutos() if cnpj is None else blocos.brutos(cnpj)
+            for bruto in brutos:
+                dados = blocos.formato.decodificar(bruto)
+                criado_em = dados.get("criado_em")
+                if criado_em is not None and inicio_texto <= criado_em < fim_texto:
+                    yield montar(dados)
+
+    def _tem_pedidos(self, parte: Parte, cnpj: str) -> bool:
+        if not parte.pode_conter(cnpj):
+            return False
+        if parte.aberta:
+            return len(self._aberta(parte).buscar_pagina_por_cliente(cnpj, 1)) > 0
+        return self._blocos(parte).quantidade(cnpj) > 0
+
+    @staticmethod
+    def _cursor(parte: Parte, posicao: int) -> str:
+        return codificar_cursor(parte.id << _BITS_POSICAO | posicao)
+
+    def _hidratar(
+        self, formato: FormatoRegistro, brutos: list[bytes]
+    ) -> list[Pedido] | list[PedidoGravadoView]:
+        if self._hidratacao == "visao":
+            return [PedidoGravadoView(formato, bruto) for bruto in brutos]
+        return [montar_pedido(formato.decodificar(bruto)) for bruto in brutos]
+
+    def _repetindo_se_compactada(self, consulta: Callable):
+        # Outro processo pode compactar (e apagar) uma parte entre a leitura
+        # do manifesto e a abertura do arquivo: relê o manifesto e refaz
+        try:
+            return consulta()
+        except FileNotFoundError:
+            self._sincronizar()
+            return consulta()
+
+    def _sincronizar(self) -> bool:
+        """Recarrega o manifesto se mudou, descartando partes que saíram dele."""
+        if not self._manifesto.atualizar():
+            return False
+        ids = {parte.id for parte in self._manifesto.partes}
+        for cache in (self._abertas, self._compactadas):
+            for id_parte in [id_parte for id_parte in cache if id_parte not in ids]:
+                repository = cache.pop(id_parte)
+                if isinstance(repository, PedidoRepositoryArquivo):
+                    repository.close()
+        return True
+
+    def _aberta(self, parte: Parte, criar: bool = False) -> PedidoRepositoryArquivo:
+        repository = self._abertas.get(parte.id)
+        if repository is None:
+            path = self._manifesto.caminho(parte)
+            if not criar and not path.exists():
+                # Não recria o arquivo de uma parte já compactada
+                raise FileNotFoundError(path)
+            repository = PedidoRepositoryArquivo(
+                str(path),
+                ConfiguracaoArquivo(
+                    formato=self._formato.nome,
+                    escrita=self._escrita,
+                    hidratacao=self._hidratacao,
+                ),
+                metricas=self._metricas,
+                eventos=self._eventos,
+            )
+            self._abertas[parte.id] = repository
+        return repository
+
+    def _blocos(self, parte: Parte) -> ArquivoBlocos:
+        blocos = self._compactadas.get(parte.id)
+        if blocos is None:
+            blocos = self._compactadas[parte.id] = ArquivoBlocos(self._manifesto.caminho(parte))
+        return blocos
+
+    def _fonte(self, parte: Parte) -> ContextManager["ArquivoBlocos | _RegistrosPorCnpj"]:
+        if parte.aberta:
+            return _RegistrosPorCnpj(self._manifesto.caminho(parte))
+        return nullcontext(ArquivoBlocos(self._manifesto.caminho(parte)))
+
+    def _brutos_de(self, fontes: list, cnpj: str) -> Iterator[bytes]:
+        for fonte in fontes:
+            for bruto in fonte.brutos(cnpj):
+                if fonte.formato is not self._formato:
+                    bruto = self._formato.codificar(fonte.formato.decodificar(bruto))
+                yield bruto
+
+    def _fechar(self, parte: Parte) -> None:
+        repository = self._abertas.pop(parte.id, None)
+        if repository is not None:
+            repository.close()
+        self._compactadas.pop(parte.id, None)
+
+    def _apagar(self, parte: Parte) -> None:
+        """Apaga os arquivos de uma parte que saiu do manifesto."""
+        path = self._manifesto.caminho(parte)
+        path.unlink(missing_ok=True)
+        if parte.aberta:
+            for sufixo in _SIDECARS:
+                path.with_name(path.name + sufixo).unlink(missing_ok=True)
+
+
+class _RegistrosPorCnpj:
+    """Registros de uma parte aberta acessados por CNPJ, para a compactação.
+
+    Uma passada pelo arquivo guarda só os offsets de cada CNPJ; os registros
+    são relidos (sem decodificar) na ordem em que forem pedidos.
+    """
+
+    def __init__(self, path: Path):
+        formato, inicio = detectar_formato(path)
+        self.formato = formato
+        self._file = path.open("rb")
+        self._offsets: dict[str, list[int]] = {}
+        if formato is not None:
+            for offset, _, dados in formato.iterar(self._file, inicio):
+                self._offsets.setdefault(dados["cliente"]["cnpj"], []).append(offset)
+
+    def __enter__(self) -> "_RegistrosPorCnpj":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self._file.close()
+
+    def cnpjs(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def brutos(self, cnpj: str) -> Iterator[bytes]:
+        for offset in self._offsets.get(cnpj, ()):
+            yield self.formato.ler_bruto(self._file, offset)
@@ -0,0 +1,250 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from src.domain.models.pedido import Pedido
+from src.infrastructure.eventos import EVENTOS, RegistroEventos
+from src.infrastructure.metricas import (
+    METRICAS,
+    OPERACAO_REPOSITORIO,
+    Metricas,
+    cronometrado,
+    cronometrado_fluxo,
+)
+from src.repositories.conexao_sqlite import conectar, transacao
+from src.repositories.interfaces.i_pedido_repository import IPedidoRepository
+from src.repositories.interfaces.pagina import Pagina
+from src.repositories.paginacao import (
+    codificar_cursor,
+    decodificar_cursor,
+    validar_limite,
+)
+from src.repositories.serializacao_pedido import (
+    instante_para_texto,
+    montar_pedido,
+    pedido_para_dict,
+)
+from src.repositories.visao_pedido import PedidoGravadoView
+
+_PROXIMO_ID = "SELECT COALESCE(MAX(id), 0) + 1 FROM pedidos"
+_INSERIR_PEDIDO = (
+    "INSERT INTO pedidos (id, cliente_cnpj, cliente_nome, cliente_email, preco_total, criado_em) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_INSERIR_ITEM = (
+    "INSERT INTO itens_pedido (pedido_id, posicao, produto_tipo, cupom_codigo, quantidade, "
+    "preco_unitario, desconto_produto, desconto_cupom, preco_final) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SELECIONAR = (
+    "SELECT p.id, p.cliente_cnpj, p.cliente_nome, p.cliente_email, p.preco_total, p.criado_em, "
+    "i.produto_tipo, i.cupom_codigo, i.quantidade, i.preco_unitario, i.desconto_produto, "
+    "i.desconto_cupom, i.preco_final "
+    "FROM pedidos p JOIN itens_pedido i ON i.pedido_id = p.id "
+)
+_BUSCAR_POR_CLIENTE = _SELECIONAR + "WHERE p.cliente_cnpj = ? ORDER BY p.id, i.posicao"
+_LISTAR = _SELECIONAR + "ORDER BY p.id, i.posicao"
+# Páginas por cliente: ids pelo índice (cliente_cnpj, id), depois a faixa com os itens
+_IDS_POR_CLIENTE = "SELECT id FROM pedidos WHERE cliente_cnpj = ? AND id >= ? ORDER BY id LIMIT ?"
+_FAIXA_POR_CLIENTE = (
+    _SELECIONAR + "WHERE p.cliente_cnpj = ? AND p.id BETWEEN ? AND ? ORDER BY p.id, i.posicao"
+)
+# Períodos: faixa pelo índice de criado_em (textos ISO em UTC ordenam como os instantes)
+_POR_PERIODO = _SELECIONAR + "WHERE p.criado_em >= ? AND p.criado_em < ? ORDER BY p.id, i.posicao"
+_POR_PERIODO_E_CLIENTE = (
+    _SELECIONAR
+    + "WHERE p.criado_em >= ? AND p.criado_em < ? AND p.cliente_cnpj = ? ORDER BY p.id, i.posicao"
+)
+
+
+class PedidoRepositorySQLite(IPedidoRepository):
+    """Persistência de pedidos em SQLite (ver ``src.repositories.conexao_sqlite``).
+
+    Pedidos e itens ficam em tabelas normalizadas (``pedidos`` e
+    ``itens_pedido``), com índice em ``pedidos.cliente_cnpj``. Os ids dos
+    pedidos são atribuídos dentro da transação, o que permite gravar um
+    lote inteiro com um ``executemany`` por tabela.
+
+    Com ``hidratacao="visao"``, ``buscar_por_cliente`` devolve
+    ``PedidoGravadoView`` sobre as linhas lidas, sem montar ``Pedido``.
+    """
+
+    def __init__(
+        self,
+        caminho_banco: str | Path = "petrobahia.db",
+        metricas: Metricas | None = None,
+        hidratacao: str = "pedido",
+        eventos: RegistroEventos | None = None,
+    ):
+        if hidratacao not in ("pedido", "visao"):
+            raise ValueError("hidratacao deve ser 'pedido' ou 'visao'.")
+        self._hidratar = PedidoGravadoView.de_registro if hidratacao == "visao" else montar_pedido
+        self._conexao = conectar(caminho_banco)
+        self._metricas = metricas if metricas is not None else METRICAS
+        self._eventos = eventos if eventos is not None else EVENTOS
+
+    def __enter__(self) -> "PedidoRepositorySQLite":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        """Sem efeito: cada ``salvar`` já é uma transação confirmada."""
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        self._conexao.close()
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="pedido_sqlite", operacao="salvar")
+    def salvar(self, pedido: Pedido) -> None:
+        """Grava o pedido e seus itens numa transação."""
+        self.inserir_registros([pedido_para_dict(pedido)])
+        self._eventos.debug(
+            "pedido_salvo",
+            "Pedido salvo para cliente: {nome} (CNPJ: {cnpj})",
+            nome=pedido.cliente.nome,
+            cnpj=pedido.cliente.cnpj,
+        )
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="pedido_sqlite", operacao="salvar_lote")
+    def salvar_lote(self, pedidos: Iterable[Pedido]) -> int:
+        """Grava vários pedidos numa única transação; retorna a quantidade."""
+        return self.inserir_registros(pedido_para_dict(pedido) for pedido in pedidos)
+
+    def inserir_registros(self, registros: Iterable[dict]) -> int:
+        """Grava registros já serializados (ver ``pedido_para_dict``).
+
+        Returns:
+            Quantidade de pedidos gravados
+        """
+        registros = list(registros)
+        with transacao(self._conexao) as conexao:
+            (proximo,) = conexao.execute(_PROXIMO_ID).fetchone()
+            pedidos = []
+            itens = []
+            for pedido_id, dados in enumerate(registros, proximo):
+                cliente = dados["cliente"]
+                pedidos.append(
+                    (
+                        pedido_id,
+                        cliente["cnpj"],
+                        cliente["nome"],
+                        cliente["email"],
+                        dados["preco_total"],
+                        dados.get("criado_em"),
+                    )
+                )
+                itens.extend(
+                    (
+                        pedido_id,
+                        posicao,
+                        item["produto_tipo"],
+                        item.get("cupom_codigo"),
+                        item["quantidade"],
+                        item["preco_unitario"],
+                        item["desconto_produto"],
+                        item["desconto_cupom"],
+                        item["preco_final"],
+                    )
+                    for posicao, item in enumerate(dados["itens"])
+                )
+            conexao.executemany(_INSERIR_PEDIDO, pedidos)
+            conexao.executemany(_INSERIR_ITEM, itens)
+        return len(registros)
+
+    @cronometrado(OPERACAO_REPOSITORIO, repositorio="pedido_sqlite", operacao="buscar_por_cliente")
+    def buscar_por_cliente(self, cnpj: str) -> list[Pedido] | list[PedidoGravadoView]:
+        """Retorna pedidos de um cliente pelo CNPJ, na ordem de gravação."""
+        linhas = self._conexao.execute(_BUSCAR_POR_CLIENTE, (cnpj,))
+        return [self._hidratar(dados) for dados in self._agrupar(linhas)]
+
+    @cronometrado(
+        OPERACAO_REPOSITORIO, repositorio="pedido_sqlite", operacao="buscar_pagina_por_cliente"
+    )
+    def buscar_pagina_por_cliente(
+        self, cnpj: str, limite: int, cursor: str | None = None
+    ) -> Pagina[Pedido] | Pagina[PedidoGravadoView]:
+        """Até ``limite`` pedidos do cliente a partir do cursor (id do próximo pedido).
+
+        Raises:
+            ValueError: Se ``limite`` não for positivo ou o cursor for inválido
+        """
+        validar_limite(limite)
+        ids = [
+            pedido_id
+            for (pedido_id,) in self._conexao.execute(
+                _IDS_POR_CLIENTE, (cnpj, decodificar_cursor(cursor), limite + 1)
+            )
+        ]
+        if not ids:
+            return Pagina()
+        proximo = codificar_cursor(ids.pop()) if len(ids) > limite else None
+        linhas = self._conexao.execute(_FAIXA_POR_CLIENTE, (cnpj, ids[0], ids[-1]))
+        return Pagina([self._hidratar(dados) for dados in self._agrupar(linhas)], proximo)
+
+    @cronometrado_fluxo(
+        OPERACAO_REPOSITORIO, repositorio="pedido_sqlite", operacao="buscar_por_periodo"
+    )
+    def buscar_por_periodo(
+        self, inicio: datetime, fim: datetime, cnpj: str | None = None
+    ) -> Iterator[Pedido] | Iterator[PedidoGravadoView]:
+        """Pedidos criados em ``[inicio, fim)``, na ordem de gravação.
+
+        A faixa é localizada pelo índice ``ix_pedidos_criado_em``.
+        """
+        faixa = (instante_para_texto(inicio), instante_para_texto(fim))
+        linhas = (
+            self._conexao.execute(_POR_PERIODO, faixa)
+            if cnpj is None
+            else self._conexao.execute(_POR_PERIODO_E_CLIENTE, (*faixa, cnpj))
+        )
+        return (self._hidratar(dados) for dados in self._agrupar(linhas))
+
+    def iterar_registros(self) -> Iterator[dict]:
+        """Percorre os pedidos gravados como registros, sem montar ``Pedido``."""
+        return self._agrupar(self._conexao.execute(_LISTAR))
+
+    @staticmethod
+    def _agrupar(linhas: Iterable[tuple]) -> Iterator[dict]:
+        """Junta as linhas pedido x item (ordenadas por pedido) em registros."""
+        atual_id = None
+        atual: dict | None = None
+        for (
+            pedido_id,
+            cnpj,
+            nome,
+            email,
+            preco_total,
+            criado_em,
+            produto_tipo,
+            cupom_codigo,
+            quantidade,
+            preco_unitario,
+            desconto_produto,
+            desconto_cupom,
+            preco_final,
+        ) in linhas:
+            if pedido_id != atual_id:
+                if atual is not None:
+                    yield atual
+                atual_id = pedido_id
+                atual = {
+                    "cliente": {"nome": nome, "email": email, "cnpj": cnpj},
+                    "itens": [],
+                    "preco_total": preco_total,
+                    "criado_em": criado_em,
+                }
+            atual["itens"].append(
+                {
+                    "produto_tipo": produto_tipo,
+                    "cupom_codigo": cupom_codigo,
+                    "quantidade": quantidade,
+                    "preco_unitario": preco_unitario,
+                    "desconto_produto": desconto_produto,
+                    "desconto_cupom": desconto_cupom,
+                    "preco_final": preco_final,
+                }
+            )
+        if atual is not None:
+            yield atual
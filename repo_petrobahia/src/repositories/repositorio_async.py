@@ -0,0 +1,146 @@
+"""Adapters assíncronos sobre os repositórios síncronos.
+
+A E/S roda em uma thread dedicada por adapter, de modo que o event loop
+nunca bloqueia e a ordem das escritas é preservada. Chamadas ``salvar``
+concorrentes são agrupadas: enquanto um lote está sendo gravado, as
+seguintes se acumulam e seguem juntas no próximo job do executor.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Generic, TypeVar
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.pedido import Pedido
+from src.repositories.interfaces.i_cliente_repository import IClienteRepository
+from src.repositories.interfaces.i_cliente_repository_async import IClienteRepositoryAsync
+from src.repositories.interfaces.i_pedido_repository import IPedidoRepository
+from src.repositories.interfaces.i_pedido_repository_async import IPedidoRepositoryAsync
+from src.repositories.interfaces.pagina import Pagina
+
+T = TypeVar("T")
+
+
+class _GravadorEmLote(Generic[T]):
+    """Agrupa chamadas concorrentes e executa um lote por vez no executor."""
+
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor,
+        gravar: Callable[[T], None],
+        concluir: Callable[[], None],
+    ):
+        self._executor = executor
+        self._gravar = gravar
+        self._concluir = concluir
+        self._pendentes: list[tuple[T, asyncio.Future]] = []
+        self._em_execucao = False
+
+    async def submeter(self, item: T) -> None:
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        self._pendentes.append((item, futuro))
+        if not self._em_execucao:
+            self._em_execucao = True
+            # Deixa as demais corrotinas prontas entrarem no mesmo lote
+            loop.call_soon(self._disparar, loop)
+        await futuro
+
+    def _disparar(self, loop: asyncio.AbstractEventLoop) -> None:
+        lote, self._pendentes = self._pendentes, []
+        job = loop.run_in_executor(self._executor, self._executar, [item for item, _ in lote])
+        job.add_done_callback(lambda concluido: self._finalizar(loop, lote, concluido))
+
+    def _executar(self, itens: list[T]) -> list[BaseException | None]:
+        erros: list[BaseException | None] = []
+        for item in itens:
+            try:
+                self._gravar(item)
+                erros.append(None)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                erros.append(error)
+        self._concluir()
+        return erros
+
+    def _finalizar(self, loop, lote, concluido: asyncio.Future) -> None:
+        falha = concluido.exception()
+        erros = [falha] * len(lote) if falha else concluido.result()
+        for (_, futuro), erro in zip(lote, erros):
+            if futuro.done():
+                continue
+            if erro is None:
+                futuro.set_result(None)
+            else:
+                futuro.set_exception(erro)
+        if self._pendentes:
+            self._disparar(loop)
+        else:
+            self._em_execucao = False
+
+
+class _AdapterAsync:
+    """Base dos adapters: executor de uma thread e flush ao fim de cada lote."""
+
+    def __init__(self, repository):
+        self._repository = repository
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="repositorio-io")
+
+    async def aclose(self) -> None:
+        """Encerra o executor após concluir as escritas em andamento."""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    async def _executar(self, funcao: Callable[..., T], *args) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, funcao, *args)
+
+    def _flush(self) -> None:
+        # Repositórios com escrita agrupada gravam o lote inteiro de uma vez
+        flush = getattr(self._repository, "flush", None)
+        if flush is not None:
+            flush()
+
+
+class ClienteRepositoryAsync(_AdapterAsync, IClienteRepositoryAsync):
+    """Adapter assíncrono para qualquer ``IClienteRepository``."""
+
+    def __init__(self, repository: IClienteRepository):
+        super().__init__(repository)
+        self._gravador = _GravadorEmLote(self._executor, repository.salvar, self._flush)
+        self._cadastro = _GravadorEmLote(self._executor, repository.cadastrar, self._flush)
+
+    async def salvar(self, cliente: Cliente) -> None:
+        await self._gravador.submeter(cliente)
+
+    async def cadastrar(self, cliente: Cliente) -> None:
+        await self._cadastro.submeter(cliente)
+
+    async def listar_pagina(self, limite: int, cursor: str | None = None) -> Pagina[Cliente]:
+        return await self._executar(self._repository.listar_pagina, limite, cursor)
+
+
+class PedidoRepositoryAsync(_AdapterAsync, IPedidoRepositoryAsync):
+    """Adapter assíncrono para qualquer ``IPedidoRepository``."""
+
+    def __init__(self, repository: IPedidoRepository):
+        super().__init__(repository)
+        self._gravador = _GravadorEmLote(self._executor, repository.salvar, self._flush)
+
+    async def salvar(self, pedido: Pedido) -> None:
+        await self._gravador.submeter(pedido)
+
+    async def buscar_por_cliente(self, cliente: str) -> list[Pedido]:
+        return await self._executar(self._repository.buscar_por_cliente, cliente)
+
+    async def buscar_pagina_por_cliente(
+        self, cliente: str, limite: int, cursor: str | None = None
+    ) -> Pagina[Pedido]:
+        return await self._executar(
+            self._repository.buscar_pagina_por_cliente, cliente, limite, cursor
+        )
+
+    async def buscar_por_periodo(
+        self, inicio: datetime, fim: datetime, cnpj: str | None = None
+    ) -> list[Pedido]:
+        return await self._executar(
+            lambda: list(self._repository.buscar_por_periodo(inicio, fim, cnpj))
+        )
@@ -0,0 +1,96 @@
+"""Conversão entre ``Pedido`` e o registro persistido (dict).
+
+Compartilhada pelos repositórios de pedidos (arquivo e SQLite) para que
+todos gravem e hidratem pedidos da mesma forma.
+
+O momento de criação é gravado em ``criado_em`` como texto ISO 8601 em UTC
+com largura fixa (ver ``instante_para_texto``), de modo que a ordem dos
+textos é a ordem cronológica; registros antigos não têm o campo.
+"""
+
+from datetime import datetime, timezone
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.produto_factory import ProdutoFactory
+
+
+def pedido_para_dict(pedido: Pedido) -> dict:
+    """Registro persistido do pedido, com os valores já calculados."""
+    return {
+        "cliente": {
+            "nome": pedido.cliente.nome,
+            "email": pedido.cliente.email,
+            "cnpj": pedido.cliente.cnpj,
+        },
+        "itens": [
+            {
+                "produto_tipo": item.produto.tipo,
+                "cupom_codigo": item.cupom.codigo,
+                "quantidade": item.quantidade,
+                "preco_unitario": item.preco_unitario,
+                "desconto_produto": item.desconto_produto,
+                "desconto_cupom": item.desconto_cupom,
+                "preco_final": item.preco_final,
+            }
+            for item in pedido.itens
+        ],
+        "preco_total": pedido.preco_total,
+        "criado_em": instante_para_texto(pedido.criado_em),
+    }
+
+
+def montar_pedido(dados: dict) -> Pedido:
+    """Hidrata um ``Pedido`` a partir do registro persistido.
+
+    Os itens recebem os valores gravados (ver ``ItemPedido.restaurar``), sem
+    recalcular descontos, e o cupom do código gravado.
+    """
+    return Pedido(
+        cliente=montar_cliente(dados["cliente"]),
+        itens=[montar_item(item_dados) for item_dados in dados["itens"]],
+        criado_em=texto_para_instante(dados.get("criado_em")),
+    )
+
+
+def montar_cliente(dados: dict) -> Cliente:
+    """Hidrata o ``Cliente`` de um registro de pedido."""
+    return Cliente(nome=dados["nome"], email=dados["email"], cnpj=dados["cnpj"])
+
+
+def montar_item(dados: dict) -> ItemPedido:
+    """Hidrata um ``ItemPedido`` com os valores gravados.
+
+    Registros legados não têm ``cupom_codigo``; o item fica com o cupom nulo
+    (o desconto de cupom gravado é mantido).
+    """
+    return ItemPedido.restaurar(
+        produto=ProdutoFactory.criar(dados["produto_tipo"], dados["preco_unitario"]),
+        quantidade=dados["quantidade"],
+        cupom=CupomFactory.obter(dados.get("cupom_codigo")),
+        preco_unitario=dados["preco_unitario"],
+        desconto_produto=dados["desconto_produto"],
+        desconto_cupom=dados["desconto_cupom"],
+        preco_final=dados["preco_final"],
+    )
+
+
+def para_utc(instante: datetime) -> datetime:
+    """``instante`` em UTC; instantes sem fuso são tratados como UTC."""
+    if instante.tzinfo is None:
+        return instante.replace(tzinfo=timezone.utc)
+    return instante.astimezone(timezone.utc)
+
+
+def instante_para_texto(instante: datetime | None) -> str | None:
+    """Texto gravado em ``criado_em`` (ex.: ``2026-10-18T12:00:00.000000+00:00``)."""
+    if instante is None:
+        return None
+    return para_utc(instante).isoformat(timespec="microseconds")
+
+
+def texto_para_instante(texto: str | None) -> datetime | None:
+    """Inverso de ``instante_para_texto``; None para registros sem o campo."""
+    return None if texto is None else datetime.fromisoformat(texto)
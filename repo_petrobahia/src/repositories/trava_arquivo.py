@@ -0,0 +1,176 @@
+"""Trava consultiva entre processos e escrita atômica de registros.
+
+Vários processos podem anexar ao mesmo arquivo de registros desde que
+todos usem ``TravaArquivo``: o escritor segura a trava exclusiva enquanto
+grava o registro (uma única chamada ``write`` em modo append) e atualiza
+os sidecars (índice, totais), de modo que offsets e sidecars nunca se
+misturam com os de outro escritor. Leitores que percorrem o arquivo
+seguram a trava compartilhada para não encontrar um registro pela metade.
+
+A trava é um arquivo ``<arquivo>.lock`` ao lado dos dados, travado com
+``fcntl.flock`` (POSIX) ou ``msvcrt.locking`` (Windows, onde a trava
+compartilhada também é exclusiva). Threads do mesmo processo são
+serializadas por um ``threading.Lock``.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+_FLAGS_APPEND = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+class _Modo:
+    """Gerenciador de contexto reutilizável de um modo da trava (sem alocação por uso)."""
+
+    __slots__ = ("_trava", "_exclusiva")
+
+    def __init__(self, trava: "TravaArquivo", exclusiva: bool):
+        self._trava = trava
+        self._exclusiva = exclusiva
+
+    def __enter__(self) -> None:
+        self._trava._adquirir(self._exclusiva)
+
+    def __exit__(self, *_exc) -> None:
+        self._trava._liberar()
+
+
+class TravaArquivo:
+    """Trava consultiva (exclusiva ou compartilhada) associada a um arquivo."""
+
+    def __init__(self, caminho_dados: Path):
+        self._path = caminho_dados.with_name(caminho_dados.name + ".lock")
+        self._lock = threading.Lock()
+        self._fd: int | None = None
+        self._pid: int | None = None
+        self._modo_exclusivo = _Modo(self, exclusiva=True)
+        self._modo_compartilhado = _Modo(self, exclusiva=False)
+
+    def exclusiva(self) -> _Modo:
+        """Contexto que segura a trava exclusiva durante o bloco."""
+        return self._modo_exclusivo
+
+    def compartilhada(self) -> _Modo:
+        """Contexto que segura a trava compartilhada durante o bloco."""
+        return self._modo_compartilhado
+
+    def _adquirir(self, exclusiva: bool) -> None:
+        self._lock.acquire()
+        try:
+            _travar(self._descritor(), exclusiva)
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def _liberar(self) -> None:
+        try:
+            _destravar(self._fd)
+        finally:
+            self._lock.release()
+
+    def _descritor(self) -> int:
+        # Um processo filho (fork) herdaria a mesma descrição de arquivo, e
+        # ``flock`` não separaria pai e filho: cada processo abre a sua
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    def __del__(self):
+        if self._fd is not None and self._pid == os.getpid():
+            os.close(self._fd)
+
+
+def anexar_registro(path: Path, dados: bytes) -> int:
+    """Anexa ``dados`` ao fim do arquivo e retorna o offset onde começaram.
+
+    Os bytes vão em uma única chamada ``write`` (repetida só se o sistema
+    gravar parcialmente). O offset só é confiável com a trava exclusiva.
+    """
+    fd = os.open(path, _FLAGS_APPEND, 0o644)
+    try:
+        return anexar_em(fd, dados)
+    finally:
+        os.close(fd)
+
+
+def anexar_em(fd: int, dados: bytes) -> int:
+    """Como ``anexar_registro``, em um descritor já aberto em modo append."""
+    offset = os.fstat(fd).st_size
+    visao = memoryview(dados)
+    while visao:
+        visao = visao[os.write(fd, visao) :]
+    return offset
+
+
+def _travar(fd: int, exclusiva: bool) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusiva else fcntl.LOCK_SH)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)  # pragma: no cover - Windows
+    while True:  # pragma: no cover - Windows
+        try:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK desiste após ~10 s de espera; continua aguardando
+            continue
+
+
+def _destravar(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)  # pragma: no cover - Windows
+    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)  # pragma: no cover - Windows
+
+
+class AcompanhamentoSidecar:
+    """Posição já lida de um sidecar só anexado, para ler o que outros processos acrescentaram.
+
+    Se o sidecar foi substituído (compactação, reconstrução) ou encolheu, a
+    posição deixa de valer e ``linhas_novas`` retorna None.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._inode: int | None = None
+        self._posicao = 0
+
+    def marcar(self, posicao: int | None = None) -> None:
+        """Registra que o sidecar atual foi lido até ``posicao`` (padrão: o fim)."""
+        try:
+            estado = self._path.stat()
+        except FileNotFoundError:
+            self._inode = None
+            return
+        self._inode = estado.st_ino
+        self._posicao = estado.st_size if posicao is None else posicao
+
+    def anexado(self, inicio: int, fim: int) -> None:
+        """Registra bytes ``[inicio, fim)`` anexados por este processo."""
+        if inicio == self._posicao:
+            self._posicao = fim
+
+    def linhas_novas(self) -> list[bytes] | None:
+        """Linhas completas anexadas desde a última leitura, ou None se o sidecar mudou."""
+        try:
+            estado = self._path.stat()
+        except FileNotFoundError:
+            return None
+        if estado.st_ino != self._inode or estado.st_size < self._posicao:
+            return None
+        with self._path.open("rb") as file:
+            file.seek(self._posicao)
+            linhas = file.read(estado.st_size - self._posicao).splitlines(keepends=True)
+        if linhas and not linhas[-1].endswith(b"\n"):
+            linhas.pop()
+        self._posicao += sum(len(linha) for linha in linhas)
+        return linhas
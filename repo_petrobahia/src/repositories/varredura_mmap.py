@@ -0,0 +1,36 @@
+"""Varredura de arquivos de registros mapeados em memória (``mmap``).
+
+Em vez de ler e decodificar registro por registro, o arquivo inteiro é
+mapeado e pesquisado pelos bytes do valor procurado (ver
+``FormatoRegistro.agulha``/``localizar``). Só os registros que contêm
+esses bytes são copiados e decodificados; o restante do arquivo nunca sai
+do page cache do sistema operacional.
+
+Uma ocorrência dos bytes não garante que o valor está no campo esperado
+(ex.: o CNPJ dentro do nome): quem consome confere o campo decodificado.
+"""
+
+import mmap
+from pathlib import Path
+from typing import Iterator
+
+from src.repositories.formatos import FormatoRegistro
+
+
+def registros_com(
+    path: Path, formato: FormatoRegistro, inicio: int, valor: str, tamanho: int | None = None
+) -> Iterator[tuple[int, int, dict]]:
+    """Registros (offset, fim, dados) a partir de ``inicio`` que contêm ``valor``.
+
+    Com ``tamanho``, só os primeiros ``tamanho`` bytes do arquivo são mapeados.
+    """
+    if not path.exists():
+        return
+    with path.open("rb") as file:
+        tamanho = file.seek(0, 2) if tamanho is None else min(tamanho, file.seek(0, 2))
+        if tamanho <= inicio:
+            # mmap não aceita arquivos vazios
+            return
+        with mmap.mmap(file.fileno(), tamanho, access=mmap.ACCESS_READ) as buffer:
+            for offset, fim in formato.localizar(buffer, inicio, formato.agulha(valor)):
+                yield offset, fim, formato.decodificar(buffer[offset:fim])
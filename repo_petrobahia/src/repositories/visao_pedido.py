@@ -0,0 +1,151 @@
+"""Views leves sobre pedidos gravados, sem remontar o modelo de domínio.
+
+``PedidoGravadoView`` guarda os bytes do registro como lidos do arquivo e só
+os decodifica no primeiro acesso a um campo; cliente, itens, produtos e
+cupons são criados apenas quando consultados. Os valores expostos são os
+gravados no momento da venda (preço unitário, descontos e preço final),
+sem recalcular políticas de desconto.
+
+Use ``para_pedido`` quando precisar de um ``Pedido`` completo.
+"""
+
+from datetime import datetime
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.pedido import Pedido
+from src.domain.models.produto import Produto
+from src.domain.policies.cupom import Cupom
+from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.produto_factory import ProdutoFactory
+from src.repositories.formatos import FormatoRegistro
+from src.repositories.serializacao_pedido import (
+    montar_cliente,
+    montar_pedido,
+    texto_para_instante,
+)
+
+
+class ItemGravadoView:
+    """Item de um registro de pedido com a interface de leitura de ``ItemPedido``."""
+
+    __slots__ = ("_dados", "_produto", "_cupom")
+
+    def __init__(self, dados: dict):
+        self._dados = dados
+        self._produto: Produto | None = None
+        self._cupom: Cupom | None = None
+
+    @property
+    def produto_tipo(self) -> str:
+        return self._dados["produto_tipo"]
+
+    @property
+    def cupom_codigo(self) -> str | None:
+        return self._dados.get("cupom_codigo")
+
+    @property
+    def produto(self) -> Produto:
+        if self._produto is None:
+            self._produto = ProdutoFactory.criar(self.produto_tipo, self.preco_unitario)
+        return self._produto
+
+    @property
+    def cupom(self) -> Cupom:
+        if self._cupom is None:
+            self._cupom = CupomFactory.obter(self.cupom_codigo)
+        return self._cupom
+
+    @property
+    def quantidade(self) -> int:
+        return self._dados["quantidade"]
+
+    @property
+    def preco_unitario(self) -> float:
+        return self._dados["preco_unitario"]
+
+    @property
+    def preco_bruto(self) -> float:
+        return self._dados["preco_unitario"] * self._dados["quantidade"]
+
+    @property
+    def desconto_produto(self) -> float:
+        return self._dados["desconto_produto"]
+
+    @property
+    def desconto_cupom(self) -> float:
+        return self._dados["desconto_cupom"]
+
+    @property
+    def preco_final(self) -> float:
+        return self._dados["preco_final"]
+
+    def __repr__(self) -> str:
+        return (
+            f"ItemGravadoView(produto={self.produto_tipo!r}, quantidade={self.quantidade}, "
+            f"preco_final={self.preco_final})"
+        )
+
+
+class PedidoGravadoView:
+    """Registro de pedido com a interface de leitura de ``Pedido``, decodificado sob demanda.
+
+    Args:
+        formato: Formato em que ``bruto`` foi gravado
+        bruto: Bytes do registro (ver ``FormatoRegistro.ler_bruto``)
+    """
+
+    __slots__ = ("_formato", "_bruto", "_dados", "_cliente", "_itens")
+
+    def __init__(self, formato: FormatoRegistro, bruto: bytes):
+        self._formato = formato
+        self._bruto = bruto
+        self._dados: dict | None = None
+        self._cliente: Cliente | None = None
+        self._itens: list[ItemGravadoView] | None = None
+
+    @classmethod
+    def de_registro(cls, dados: dict) -> "PedidoGravadoView":
+        """View sobre um registro já decodificado (ex.: lido do SQLite)."""
+        view = cls.__new__(cls)
+        view._formato = None
+        view._bruto = None
+        view._dados = dados
+        view._cliente = None
+        view._itens = None
+        return view
+
+    @property
+    def registro(self) -> dict:
+        """Registro decodificado (no primeiro acesso)."""
+        if self._dados is None:
+            self._dados = self._formato.decodificar(self._bruto)
+            self._bruto = None
+        return self._dados
+
+    @property
+    def cliente(self) -> Cliente:
+        if self._cliente is None:
+            self._cliente = montar_cliente(self.registro["cliente"])
+        return self._cliente
+
+    @property
+    def itens(self) -> list[ItemGravadoView]:
+        if self._itens is None:
+            self._itens = [ItemGravadoView(item) for item in self.registro["itens"]]
+        return self._itens
+
+    @property
+    def preco_total(self) -> float:
+        return self.registro["preco_total"]
+
+    @property
+    def criado_em(self) -> datetime | None:
+        return texto_para_instante(self.registro.get("criado_em"))
+
+    def para_pedido(self) -> Pedido:
+        """``Pedido`` com os valores gravados (ver ``montar_pedido``)."""
+        return montar_pedido(self.registro)
+
+    def __repr__(self) -> str:
+        cnpj = self.registro["cliente"]["cnpj"]
+        return f"PedidoGravadoView(cnpj={cnpj!r}, preco_total={self.preco_total})"
@@ -0,0 +1,153 @@
+"""Testes para os serviços e repositórios assíncronos usando pytest."""
+
+import asyncio
+
+import pytest
+
+from src.application.services.cliente_service import ClienteService
+from src.application.services.pedido_service import PedidoService
+from src.domain.exceptions import ValidationError
+from src.domain.models.cliente import Cliente
+from src.domain.services.produto_factory import ProdutoFactory
+from src.repositories.interfaces.i_cliente_repository import IClienteRepository
+from src.repositories.interfaces.i_pedido_repository import IPedidoRepository
+from src.repositories.pedido_repository import PedidoRepositoryArquivo
+from src.repositories.repositorio_async import ClienteRepositoryAsync, PedidoRepositoryAsync
+
+
+class RepositorioPedidoMemoria(IPedidoRepository):
+    """Repositório em memória que registra os lotes gravados."""
+
+    def __init__(self, falhar_cnpj: str | None = None):
+        self.pedidos = []
+        self.flushes = 0
+        self._falhar_cnpj = falhar_cnpj
+
+    def salvar(self, pedido):
+        if pedido.cliente.cnpj == self._falhar_cnpj:
+            raise OSError("disco cheio")
+        self.pedidos.append(pedido)
+
+    def buscar_por_cliente(self, cliente):
+        return [p for p in self.pedidos if p.cliente.cnpj == cliente]
+
+    def buscar_por_periodo(self, inicio, fim, cnpj=None):
+        return iter(
+            p
+            for p in self.pedidos
+            if inicio <= p.criado_em < fim and cnpj in (None, p.cliente.cnpj)
+        )
+
+    def flush(self):
+        self.flushes += 1
+
+
+class RepositorioClienteMemoria(IClienteRepository):
+    """Repositório de clientes em memória."""
+
+    def __init__(self):
+        self.clientes = []
+
+    def salvar(self, cliente):
+        self.clientes.append(cliente)
+
+    def buscar_por_cnpj(self, cnpj):
+        return next((c for c in reversed(self.clientes) if c.cnpj == cnpj), None)
+
+    def listar(self):
+        return iter(self.clientes)
+
+
+ITENS = [{"produto_tipo": "diesel", "quantidade": 600, "cupom_codigo": "MEGA10"}]
+
+
+class TestPedidoServiceAsync:
+    """Testes para os métodos assíncronos de PedidoService."""
+
+    def test_pedidos_concorrentes_sao_agrupados(self):
+        """Deve gravar todos os pedidos concorrentes em poucos lotes."""
+        repository = RepositorioPedidoMemoria()
+        service = PedidoService(repository, PedidoRepositoryAsync(repository))
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        clientes = [Cliente(email="a@b.com", nome=f"C{i}", cnpj=str(i)) for i in range(50)]
+
+        async def executar():
+            return await asyncio.gather(
+                *(service.processar_e_salvar_async(c, ITENS, catalogo) for c in clientes)
+            )
+
+        pedidos = asyncio.run(executar())
+
+        assert len(pedidos) == 50
+        assert [p.cliente.cnpj for p in repository.pedidos] == [str(i) for i in range(50)]
+        assert repository.flushes < 50
+
+    def test_erro_de_gravacao_afeta_somente_o_pedido(self):
+        """Deve propagar a falha apenas para o pedido que falhou."""
+        repository = RepositorioPedidoMemoria(falhar_cnpj="1")
+        service = PedidoService(repository, PedidoRepositoryAsync(repository))
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        clientes = [Cliente(email="a@b.com", nome=f"C{i}", cnpj=str(i)) for i in range(3)]
+
+        async def executar():
+            return await asyncio.gather(
+                *(service.processar_e_salvar_async(c, ITENS, catalogo) for c in clientes),
+                return_exceptions=True,
+            )
+
+        resultados = asyncio.run(executar())
+
+        assert isinstance(resultados[1], OSError)
+        assert [p.cliente.cnpj for p in repository.pedidos] == ["0", "2"]
+
+    def test_buscar_em_arquivo(self, tmp_path):
+        """Deve salvar e buscar pedidos no repositório em arquivo."""
+        repository = PedidoRepositoryArquivo(str(tmp_path / "pedidos.txt"))
+        service = PedidoService(repository, PedidoRepositoryAsync(repository))
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        cliente = Cliente(email="a@b.com", nome="TransLog", cnpj="1")
+
+        async def executar():
+            await service.processar_e_salvar_async(cliente, ITENS, catalogo)
+            pedidos = await service.buscar_pedidos_cliente_async("1")
+            await service.repository_async.aclose()
+            return pedidos
+
+        pedidos = asyncio.run(executar())
+
+        assert len(pedidos) == 1
+        assert pedidos[0].cliente.nome == "TransLog"
+
+    def test_sem_repositorio_assincrono(self):
+        """Deve exigir o repositório assíncrono só nos métodos assíncronos."""
+        service = PedidoService(RepositorioPedidoMemoria())
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        cliente = Cliente(email="a@b.com", nome="TransLog", cnpj="1")
+
+        with pytest.raises(RuntimeError, match="pedido_repository_async"):
+            asyncio.run(service.processar_e_salvar_async(cliente, ITENS, catalogo))
+        assert len(service.buscar_pedidos_cliente("1")) == 0
+
+
+class TestClienteServiceAsync:
+    """Testes para os métodos assíncronos de ClienteService."""
+
+    def test_criar_cliente_async(self):
+        """Deve validar e persistir o cliente."""
+        repository = RepositorioClienteMemoria()
+        service = ClienteService(repository, ClienteRepositoryAsync(repository))
+
+        cliente = asyncio.run(
+            service.criar_cliente_async("a@b.com", "TransLog", "04.252.011/0001-10")
+        )
+
+        assert repository.clientes == [cliente]
+
+    def test_criar_cliente_async_invalido(self):
+        """Deve rejeitar email inválido sem persistir."""
+        repository = RepositorioClienteMemoria()
+        service = ClienteService(repository, ClienteRepositoryAsync(repository))
+
+        with pytest.raises(ValidationError):
+            asyncio.run(service.criar_cliente_async("invalido", "TransLog", "1"))
+        assert repository.clientes == []
@@ -0,0 +1,47 @@
+"""Testes para a suíte de benchmarks usando pytest."""
+
+from benchmarks.suite import ResultadoBenchmark, comparar, executar_suite, para_json
+
+
+def _resultado(ops: float, p95: float) -> ResultadoBenchmark:
+    return ResultadoBenchmark("item_pedido", 1, 100, 1.0, ops, 1.0, p95, 2.0)
+
+
+class TestComparacaoBaseline:
+    """Testes para a detecção de regressões."""
+
+    def test_sem_regressao_dentro_da_tolerancia(self):
+        """Deve aceitar variações menores que a tolerância."""
+        baseline = para_json([_resultado(1000, 10.0)])
+
+        assert comparar([_resultado(950, 10.5)], baseline, tolerancia=0.10) == []
+
+    def test_regressao_de_vazao_e_latencia(self):
+        """Deve apontar queda de vazão e aumento do p95."""
+        baseline = para_json([_resultado(1000, 10.0)])
+
+        regressoes = comparar([_resultado(500, 20.0)], baseline, tolerancia=0.10)
+
+        assert [r.metrica for r in regressoes] == ["ops_por_segundo", "p95_us"]
+        assert regressoes[0].variacao == -0.5
+
+    def test_benchmark_novo_e_ignorado(self):
+        """Deve ignorar benchmarks ausentes na baseline."""
+        assert comparar([_resultado(1, 1.0)], {"resultados": []}) == []
+
+
+def test_executar_suite_pequena():
+    """Deve medir os benchmarks de repositório no tamanho pedido."""
+    resultados = executar_suite((50,), filtro="_buscar_por_")
+
+    assert {r.nome for r in resultados} == {
+        "pedido_buscar_por_cliente",
+        "pedido_buscar_por_cliente_visao",
+        "pedido_buscar_por_periodo",
+        "particionado_buscar_por_cliente",
+        "cliente_buscar_por_cnpj",
+        "sqlite_pedido_buscar_por_cliente",
+        "sqlite_pedido_buscar_por_periodo",
+        "sqlite_cliente_buscar_por_cnpj",
+    }
+    assert all(r.tamanho == 50 and r.ops_por_segundo > 0 for r in resultados)
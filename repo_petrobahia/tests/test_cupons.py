@@ -0,0 +1,216 @@
+"""Testes da tabela de cupons e do registro com recarga a quente usando unittest."""
+
+import json
+import os
+import threading
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from src.domain.models.cliente import Cliente
+from src.domain.policies.cupom import (
+    CUPOM_NULO,
+    CupomLubrificante,
+    CupomPercentual,
+    CupomValorFixo,
+)
+from src.domain.policies.cupom.tabela_cupons import CAMINHO_PADRAO, carregar_definicoes
+from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.montagem_pedido import MontadorPedido
+from src.domain.services.precificacao_lote import PrecificadorLote
+from src.domain.services.produto_factory import ProdutoFactory
+from src.domain.services.registro_cupons import RegistroCupons
+
+
+def _gravar(caminho: Path, cupons) -> None:
+    caminho.write_text(json.dumps(cupons), encoding="utf-8")
+
+
+class TestRegistroCupons(unittest.TestCase):
+    """Testes para RegistroCupons e a tabela de cupons."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.arquivo = Path(self.temp_dir.name) / "cupons.json"
+        _gravar(self.arquivo, {"MEGA10": {"tipo": "percentual", "valor": 0.10}})
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def test_arquivo_padrao_tem_cupons_historicos(self):
+        """Deve trazer no arquivo padrão os cupons antes fixos no código."""
+        self.assertEqual(
+            carregar_definicoes(CAMINHO_PADRAO),
+            {
+                "MEGA10": ("percentual", 0.10),
+                "NOVO5": ("percentual", 0.05),
+                "LUB2": ("lubrificante", 2.0),
+            },
+        )
+
+    def test_cupom_nulo_compartilhado_e_contagem(self):
+        """Deve compartilhar instâncias e contar usos e códigos inválidos."""
+        registro = RegistroCupons(self.arquivo)
+
+        self.assertIs(registro.criar(None), CUPOM_NULO)
+        self.assertIs(registro.criar(""), CUPOM_NULO)
+        self.assertIs(registro.criar("INVALIDO"), CUPOM_NULO)
+        self.assertIs(registro.criar("MEGA10"), registro.criar("MEGA10"))
+        self.assertEqual(registro.usos(), {"MEGA10": 2})
+        self.assertEqual(registro.invalidos, 1)
+        self.assertEqual(registro.criar("MEGA10").codigo, "MEGA10")
+        self.assertIsNone(CupomPercentual(0.10).codigo)
+        self.assertIsNone(CUPOM_NULO.codigo)
+
+    def test_obter_nao_conta_uso(self):
+        """Deve devolver o mesmo cupom de ``criar`` sem contar a consulta."""
+        registro = RegistroCupons(self.arquivo)
+
+        self.assertIs(registro.obter("MEGA10"), registro.criar("MEGA10"))
+        self.assertIs(registro.obter("INVALIDO"), CUPOM_NULO)
+        self.assertIs(registro.obter(None), CUPOM_NULO)
+        self.assertEqual(registro.usos(), {"MEGA10": 1})
+        self.assertEqual(registro.invalidos, 0)
+
+    def test_recarrega_quando_arquivo_muda(self):
+        """Deve recarregar a tabela quando o arquivo muda, mantendo os códigos."""
+        registro = RegistroCupons(self.arquivo, intervalo_verificacao=0)
+        mega = registro.criar("MEGA10")
+
+        _gravar(
+            self.arquivo,
+            {
+                "MEGA10": {"tipo": "percentual", "valor": 0.10},
+                "FROTA50": {"tipo": "fixo", "valor": 50},
+            },
+        )
+        frota = registro.criar("FROTA50")
+
+        self.assertIsInstance(frota, CupomValorFixo)
+        self.assertEqual(frota.calcular_desconto(100.0), 50.0)
+        self.assertIs(registro.criar("MEGA10"), mega)  # definição igual: mesma instância
+        self.assertEqual(registro.codigos(), ["MEGA10", "FROTA50"])
+
+        _gravar(self.arquivo, {"MEGA10": {"tipo": "percentual", "valor": 0.15}})
+        self.assertAlmostEqual(registro.criar("MEGA10").calcular_desconto(100.0), 15.0)
+        self.assertIs(registro.criar("FROTA50"), CUPOM_NULO)
+        # Itens criados antes da recarga continuam gravando seus códigos
+        self.assertEqual(mega.codigo, "MEGA10")
+        self.assertEqual(frota.codigo, "FROTA50")
+        self.assertEqual(registro.usos(), {"MEGA10": 3, "FROTA50": 1})
+
+    def test_sem_intervalo_so_recarrega_sob_pedido(self):
+        """Deve ignorar mudanças no arquivo até ``recarregar``."""
+        registro = RegistroCupons(self.arquivo, intervalo_verificacao=None)
+        _gravar(self.arquivo, {"LUB5": {"tipo": "lubrificante", "valor": 5}})
+
+        self.assertIs(registro.criar("LUB5"), CUPOM_NULO)
+        registro.recarregar()
+        self.assertIsInstance(registro.criar("LUB5"), CupomLubrificante)
+
+    def test_arquivo_invalido_mantem_tabela_atual(self):
+        """Deve manter a tabela anterior se o arquivo ficar inválido ou sumir."""
+        registro = RegistroCupons(self.arquivo, intervalo_verificacao=0)
+        _gravar(self.arquivo, {"MEGA10": {"tipo": "percentual", "valor": 2}})
+
+        self.assertIsInstance(registro.criar("MEGA10"), CupomPercentual)
+        self.assertIsInstance(registro.ultimo_erro, ValueError)
+        with self.assertRaisesRegex(ValueError, "MEGA10"):
+            registro.recarregar()
+
+        self.arquivo.write_text("{", encoding="utf-8")
+        self.assertEqual(registro.criar("MEGA10").calcular_desconto(100.0), 10.0)
+        self.arquivo.unlink()
+        self.assertEqual(registro.criar("MEGA10").calcular_desconto(100.0), 10.0)
+        self.assertIsInstance(registro.ultimo_erro, FileNotFoundError)
+
+    def test_carregar_rejeita_cupons_invalidos(self):
+        """Deve recusar arquivos com tipo, valor ou estrutura inválidos."""
+        invalidos = [
+            [],
+            {"X": {"tipo": "brinde", "valor": 1}},
+            {"X": {"tipo": "fixo"}},
+            {"X": {"tipo": "fixo", "valor": -1}},
+            {"X": {"tipo": "percentual", "valor": "dez"}},
+        ]
+        for cupons in invalidos:
+            with self.subTest(cupons=cupons):
+                _gravar(self.arquivo, cupons)
+                with self.assertRaises(ValueError):
+                    RegistroCupons(self.arquivo)
+
+    def test_consultas_concorrentes_durante_recargas(self):
+        """Deve achar o cupom e contar todos os usos durante recargas."""
+        registro = RegistroCupons(self.arquivo, intervalo_verificacao=0)
+        consultas, threads = 2000, 4
+        erros = []
+
+        def consultar():
+            for _ in range(consultas):
+                cupom = registro.criar("MEGA10")
+                if cupom is CUPOM_NULO:
+                    erros.append("MEGA10 sumiu durante a recarga")
+
+        trabalhadores = [threading.Thread(target=consultar) for _ in range(threads)]
+        for trabalhador in trabalhadores:
+            trabalhador.start()
+        for valor in range(1, 50):
+            _gravar(self.arquivo, {"MEGA10": {"tipo": "percentual", "valor": valor / 100}})
+        for trabalhador in trabalhadores:
+            trabalhador.join()
+
+        self.assertEqual(erros, [])
+        self.assertEqual(registro.usos(), {"MEGA10": consultas * threads})
+
+
+class TestCupomFactoryRegistro(unittest.TestCase):
+    """Testes para CupomFactory com o registro configurado."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.arquivo = Path(self.temp_dir.name) / "cupons.json"
+        _gravar(self.arquivo, {"MEGA10": {"tipo": "percentual", "valor": 0.10}})
+        self.registro_anterior = CupomFactory._registro
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        CupomFactory._registro = self.registro_anterior
+        self.temp_dir.cleanup()
+
+    def test_factory_usa_arquivo_configurado(self):
+        """Deve carregar o arquivo de ``PETROBAHIA_CUPONS``."""
+        with mock.patch.dict(os.environ, {"PETROBAHIA_CUPONS": str(self.arquivo)}):
+            registro = CupomFactory.configurar_cupons()
+
+        self.assertEqual(registro.caminho, self.arquivo)
+        self.assertIs(CupomFactory.criar("NOVO5"), CUPOM_NULO)
+        cupom = CupomFactory.criar("MEGA10")
+        self.assertEqual(cupom.codigo, "MEGA10")
+        self.assertEqual(CupomFactory.usos(), {"MEGA10": 1})
+
+    def test_precificacao_unitaria_e_em_lote_contam_os_mesmos_usos(self):
+        """Deve contar os mesmos usos em ``MontadorPedido`` e ``precificar_itens``."""
+        registro = CupomFactory.configurar_cupons(self.arquivo)
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        tipos = ["diesel", "diesel", "gasolina", "diesel"]
+        quantidades = [100, 200, 50, 10]
+        codigos = ["MEGA10", "MEGA10", "INVALIDO", None]
+        cliente = Cliente(email="a@empresa.com", nome="TransLog", cnpj="11222333000181")
+
+        MontadorPedido.montar(
+            cliente,
+            [
+                {"produto_tipo": tipo, "quantidade": quantidade, "cupom_codigo": codigo}
+                for tipo, quantidade, codigo in zip(tipos, quantidades, codigos)
+            ],
+            catalogo,
+        )
+        unitaria = (registro.usos(), registro.invalidos)
+        PrecificadorLote.precificar_itens(tipos, quantidades, codigos, catalogo)
+
+        self.assertEqual(unitaria, ({"MEGA10": 2}, 1))
+        self.assertEqual((registro.usos(), registro.invalidos), ({"MEGA10": 4}, 2))
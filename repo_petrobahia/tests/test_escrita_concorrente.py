@@ -0,0 +1,120 @@
+"""Testes de escrita concorrente nos repositórios em arquivo usando pytest."""
+
+import pytest
+
+from benchmarks.bench_concorrencia import estressar
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.produto_factory import ProdutoFactory
+from src.repositories.escritor_agrupado import ConfiguracaoEscrita
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+
+
+def _pedido(cnpj: str, quantidade: int) -> Pedido:
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    cliente = Cliente(email="c@empresa.com", nome="Cliente", cnpj=cnpj)
+    return Pedido(
+        cliente=cliente,
+        itens=[ItemPedido(catalogo["diesel"], quantidade, CupomFactory.criar(None))],
+    )
+
+
+@pytest.mark.parametrize(
+    "segmentos, escrita",
+    [
+        (False, None),
+        (True, None),
+        (False, ConfiguracaoEscrita(max_registros=7, intervalo=None)),
+        (True, ConfiguracaoEscrita(max_registros=7, intervalo=None)),
+    ],
+    ids=["arquivo", "segmentos", "arquivo-agrupada", "segmentos-agrupada"],
+)
+def test_escritores_paralelos_nao_perdem_nem_corrompem(tmp_path, segmentos, escrita):
+    """Deve gravar todos os pedidos de N processos, íntegros e indexados."""
+    resultado = estressar(
+        tmp_path / "pedidos.txt",
+        processos=4,
+        pedidos_por_processo=40,
+        itens_por_pedido=60,
+        segmentos=segmentos,
+        escrita=escrita,
+    )
+
+    assert resultado.erros == []
+    assert resultado.pedidos == 160
+    assert resultado.pedidos_por_segundo > 0
+
+
+def test_leitura_nao_mescla_segmentos(tmp_path):
+    """Deve consultar só o arquivo principal até os segmentos serem mesclados."""
+    caminho = tmp_path / "pedidos.txt"
+    escritor = PedidoRepositoryArquivo(str(caminho), ConfiguracaoArquivo(segmento="w1"))
+    leitor = PedidoRepositoryArquivo(str(caminho))
+    escritor.salvar(_pedido("11111111000199", 10))
+    escritor.salvar(_pedido("11111111000199", 20))
+
+    assert leitor.buscar_por_cliente("11111111000199") == []
+    assert leitor.mesclar_segmentos() > 0
+
+    pedidos = leitor.buscar_por_cliente("11111111000199")
+    assert [p.itens[0].quantidade for p in pedidos] == [10, 20]
+    assert leitor.agregado_cliente("11111111000199").pedidos == 2
+    assert leitor.mesclar_segmentos() == 0
+
+
+@pytest.mark.parametrize(
+    "escrita",
+    [None, ConfiguracaoEscrita(max_registros=1, intervalo=None)],
+    ids=["direta", "agrupada"],
+)
+def test_segmento_mesclado_ao_passar_do_limite_e_no_close(tmp_path, escrita):
+    """Deve mesclar o segmento no ``salvar`` que passa do limite e no ``close``."""
+    caminho = tmp_path / "pedidos.txt"
+    config = ConfiguracaoArquivo(segmento="w1", escrita=escrita, limite_segmento=2000)
+    escritor = PedidoRepositoryArquivo(str(caminho), config)
+    leitor = PedidoRepositoryArquivo(str(caminho))
+
+    quantidade = 0
+    while not leitor.buscar_por_cliente("11111111000199"):
+        quantidade += 1
+        assert quantidade < 100
+        escritor.salvar(_pedido("11111111000199", quantidade))
+    mesclados = len(leitor.buscar_por_cliente("11111111000199"))
+    assert mesclados == quantidade
+    escritor.salvar(_pedido("11111111000199", quantidade + 1))
+    assert len(leitor.buscar_por_cliente("11111111000199")) == mesclados
+
+    escritor.close()
+
+    assert len(leitor.buscar_por_cliente("11111111000199")) == quantidade + 1
+
+
+def test_mescla_interrompida_nao_duplica(tmp_path):
+    """Deve concluir uma mescla interrompida após a cópia sem duplicar registros."""
+    caminho = tmp_path / "pedidos.txt"
+    escritor = PedidoRepositoryArquivo(str(caminho), ConfiguracaoArquivo(segmento="w1"))
+    escritor.salvar(_pedido("11111111000199", 10))
+    segmento = tmp_path / "pedidos.txt.segmentos" / "w1"
+    cabecalho = caminho.read_bytes()
+    dados = segmento.read_bytes()[len(cabecalho) :]
+    # Simula queda entre a cópia para o arquivo principal e o esvaziamento do segmento
+    (tmp_path / "pedidos.txt.segmentos" / "w1.mesclando").write_text(
+        f"{len(cabecalho)} {len(dados)}"
+    )
+    with caminho.open("ab") as file:
+        file.write(dados)
+
+    leitor = PedidoRepositoryArquivo(str(caminho))
+    assert leitor.mesclar_segmentos() == 0
+    pedidos = leitor.buscar_por_cliente("11111111000199")
+
+    assert len(pedidos) == 1
+    assert not (tmp_path / "pedidos.txt.segmentos" / "w1.mesclando").exists()
+
+
+def test_segmento_com_nome_invalido():
+    """Deve recusar nomes de segmento com caminho."""
+    with pytest.raises(ValueError):
+        ConfiguracaoArquivo(segmento="../w1")
@@ -0,0 +1,205 @@
+"""Testes para a escrita agrupada dos repositórios usando unittest."""
+
+import random
+import threading
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.models.produto import Produto
+from src.domain.policies.cupom import CupomNulo
+from src.domain.policies.desconto.politica_desconto_produto_none import PoliticaDescontoProdutoNone
+from src.repositories import escritor_agrupado
+from src.repositories.cliente_repository import ClienteRepositoryArquivo
+from src.repositories.escritor_agrupado import (
+    ConfiguracaoEscrita,
+    EscritorAgrupado,
+    PoliticaFsync,
+)
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+
+
+class TestEscritorAgrupado(unittest.TestCase):
+    """Testes para EscritorAgrupado."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.arquivo_path = Path(self.temp_dir.name) / "dados.txt"
+        self.arquivo_path.write_bytes(b"")
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def test_acumula_ate_limite_de_registros(self):
+        """Deve gravar somente quando o limite de registros for atingido."""
+        config = ConfiguracaoEscrita(max_registros=3, intervalo=None)
+        with EscritorAgrupado(self.arquivo_path, config) as escritor:
+            escritor.anexar(b"a\n")
+            escritor.anexar(b"b\n")
+            self.assertEqual(self.arquivo_path.read_bytes(), b"")
+            escritor.anexar(b"c\n")
+            self.assertEqual(self.arquivo_path.read_bytes(), b"a\nb\nc\n")
+            self.assertEqual(escritor.pendentes, 0)
+
+    def test_flush_e_contexto(self):
+        """Deve gravar pendentes em flush() e ao sair do contexto."""
+        config = ConfiguracaoEscrita(intervalo=None)
+        with EscritorAgrupado(self.arquivo_path, config) as escritor:
+            escritor.anexar(b"a\n")
+            escritor.flush()
+            self.assertEqual(self.arquivo_path.read_bytes(), b"a\n")
+            escritor.anexar(b"b\n")
+        self.assertEqual(self.arquivo_path.read_bytes(), b"a\nb\n")
+
+    def test_grava_apos_intervalo(self):
+        """Deve gravar lote antigo mesmo sem novas escritas."""
+        config = ConfiguracaoEscrita(intervalo=0.05)
+        with EscritorAgrupado(self.arquivo_path, config) as escritor:
+            escritor.anexar(b"a\n")
+            limite = time.monotonic() + 2.0
+            while not self.arquivo_path.read_bytes() and time.monotonic() < limite:
+                time.sleep(0.01)
+            self.assertEqual(self.arquivo_path.read_bytes(), b"a\n")
+
+    def test_fsync_por_registro_grava_imediatamente(self):
+        """Deve gravar cada registro na hora com fsync por registro."""
+        config = ConfiguracaoEscrita(fsync=PoliticaFsync.POR_REGISTRO)
+        with EscritorAgrupado(self.arquivo_path, config) as escritor:
+            escritor.anexar(b"a\n")
+            self.assertEqual(self.arquivo_path.read_bytes(), b"a\n")
+
+    def test_informa_offsets_gravados(self):
+        """Deve informar chave e offsets absolutos de cada registro gravado."""
+        self.arquivo_path.write_bytes(b"xx\n")
+        gravados = []
+        config = ConfiguracaoEscrita(intervalo=None)
+        with EscritorAgrupado(self.arquivo_path, config, gravados.extend) as escritor:
+            escritor.anexar(b"a\n", "1")
+            escritor.anexar(b"bb\n", "2")
+        self.assertEqual(gravados, [("1", 3, 5), ("2", 5, 8)])
+
+    def test_falha_na_thread_levantada_na_proxima_chamada(self):
+        """Deve levantar em anexar/flush a falha da gravação por intervalo e manter o lote."""
+        config = ConfiguracaoEscrita(intervalo=0.02)
+        original = escritor_agrupado.anexar_em
+        tentativas = []
+
+        def falhar_uma_vez(fd, dados):
+            tentativas.append(bytes(dados))
+            if len(tentativas) == 1:
+                raise OSError("disco cheio")
+            return original(fd, dados)
+
+        with mock.patch.object(escritor_agrupado, "anexar_em", side_effect=falhar_uma_vez):
+            with EscritorAgrupado(self.arquivo_path, config) as escritor:
+                escritor.anexar(b"a\n")
+                limite = time.monotonic() + 2.0
+                while not tentativas and time.monotonic() < limite:
+                    time.sleep(0.01)
+                with self.assertRaisesRegex(OSError, "disco cheio"):
+                    escritor.anexar(b"b\n")
+                escritor.anexar(b"b\n")
+                escritor.flush()
+
+        self.assertEqual(self.arquivo_path.read_bytes(), b"a\nb\n")
+
+    def test_configuracao_invalida(self):
+        """Deve rejeitar limites não positivos."""
+        with self.assertRaises(ValueError):
+            ConfiguracaoEscrita(max_bytes=0)
+
+
+class TestRepositoriosComEscritaAgrupada(unittest.TestCase):
+    """Testes dos repositórios em modo de escrita agrupada."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.dir = Path(self.temp_dir.name)
+        self.config = ConfiguracaoEscrita(intervalo=None)
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def test_pedidos_agrupados_sao_indexados(self):
+        """Deve indexar pedidos gravados em lote e encontrá-los na busca."""
+        caminho = self.dir / "pedidos.txt"
+        produto = Produto(tipo="diesel", preco=5.5, politica_desconto=PoliticaDescontoProdutoNone())
+        with PedidoRepositoryArquivo(
+            str(caminho), ConfiguracaoArquivo(escrita=self.config)
+        ) as repository:
+            for cnpj, quantidade in (("1", 10), ("2", 20), ("1", 30)):
+                cliente = Cliente(email="teste@empresa.com", nome="Empresa", cnpj=cnpj)
+                item = ItemPedido(produto=produto, quantidade=quantidade, cupom=CupomNulo())
+                repository.salvar(Pedido(cliente=cliente, itens=[item]))
+            pedidos = repository.buscar_por_cliente("1")
+
+        self.assertEqual([p.itens[0].quantidade for p in pedidos], [10, 30])
+        indice = (self.dir / "pedidos.txt.idx").read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(indice), 3)
+
+    def test_pedidos_concorrentes_pareados_com_os_offsets(self):
+        """Deve somar cada pedido ao próprio cliente com várias threads gravando."""
+        caminho = self.dir / "pedidos.txt"
+        produto = Produto(tipo="diesel", preco=1.0, politica_desconto=PoliticaDescontoProdutoNone())
+        config = ConfiguracaoEscrita(max_registros=7, intervalo=None)
+
+        def gravar(repository, cnpj, quantidade):
+            cliente = Cliente(email="teste@empresa.com", nome="Empresa", cnpj=cnpj)
+            for _ in range(200):
+                item = ItemPedido(produto=produto, quantidade=quantidade, cupom=CupomNulo())
+                repository.salvar(Pedido(cliente=cliente, itens=[item]))
+
+        anexar = EscritorAgrupado.anexar
+
+        def anexar_com_atraso(escritor, *args):
+            # Outra thread pode salvar entre a chamada e a trava do escritor
+            time.sleep(0.0005 * random.random())
+            anexar(escritor, *args)
+
+        with (
+            mock.patch.object(EscritorAgrupado, "anexar", anexar_com_atraso),
+            PedidoRepositoryArquivo(
+                str(caminho), ConfiguracaoArquivo(escrita=config)
+            ) as repository,
+        ):
+            threads = [
+                threading.Thread(target=gravar, args=(repository, str(indice), indice))
+                for indice in range(1, 9)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        repository = PedidoRepositoryArquivo(str(caminho))
+        incrementais = [repository.agregado_cliente(str(indice)) for indice in range(1, 9)]
+        repository.reconstruir_agregados()
+        for indice, incremental in enumerate(incrementais, start=1):
+            agregado = repository.agregado_cliente(str(indice))
+            self.assertEqual((agregado.pedidos, agregado.total), (200, 200.0 * indice))
+            # O offset do último pedido é o do registro do próprio cliente
+            self.assertEqual(incremental, agregado)
+            quantidades = {
+                p.itens[0].quantidade for p in repository.buscar_por_cliente(str(indice))
+            }
+            self.assertEqual(quantidades, {indice})
+
+    def test_clientes_agrupados_sao_listados(self):
+        """Deve listar clientes ainda pendentes no buffer."""
+        caminho = self.dir / "clientes.txt"
+        with ClienteRepositoryArquivo(str(caminho), escrita=self.config) as repository:
+            repository.salvar(Cliente(email="a@empresa.com", nome="A", cnpj="1"))
+            self.assertEqual([c.nome for c in repository.listar()], ["A"])
+
+
+if __name__ == "__main__":
+    unittest.main()
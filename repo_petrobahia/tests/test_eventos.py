@@ -0,0 +1,186 @@
+"""Testes dos eventos estruturados sobre ``logging`` usando unittest."""
+
+import io
+import json
+import logging
+import os
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from src.application.services.cliente_service import ClienteService
+from src.application.services.pedido_service import PedidoService
+from src.domain.services.produto_factory import ProdutoFactory
+from src.infrastructure.eventos import (
+    EVENTOS,
+    LOGGER,
+    ManipuladorConsole,
+    Nivel,
+    RegistroEventos,
+    eventos_configurados,
+    nivel_configurado,
+)
+from src.main import main
+from src.repositories.cliente_repository import ClienteRepositoryArquivo
+from src.repositories.pedido_repository import PedidoRepositoryArquivo
+
+
+class TestRegistroEventos(unittest.TestCase):
+    """Testes para RegistroEventos e eventos_configurados."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.diretorio = Path(self.temp_dir.name)
+        self.saida = io.StringIO()
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def _processar(self, eventos: RegistroEventos | None = None) -> None:
+        cliente_service = ClienteService(
+            ClienteRepositoryArquivo(str(self.diretorio / "clientes.txt"), eventos=eventos),
+            eventos=eventos,
+        )
+        pedido_service = PedidoService(
+            PedidoRepositoryArquivo(str(self.diretorio / "pedidos.txt"), eventos=eventos),
+            eventos=eventos,
+        )
+        cliente = cliente_service.criar_cliente("a@empresa.com", "TransLog", "11222333000181")
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        pedido_service.processar_e_salvar(
+            cliente, [{"produto_tipo": "diesel", "quantidade": 100}], catalogo
+        )
+
+    def test_console_mantem_as_mensagens_de_antes(self):
+        """Deve escrever no console as mesmas mensagens dos antigos ``print``."""
+        with redirect_stdout(self.saida), eventos_configurados("debug"):
+            self._processar()
+
+        self.assertEqual(
+            self.saida.getvalue().splitlines(),
+            [
+                "Cliente salvo: 11222333000181",
+                "Cliente criado: 11222333000181",
+                "Pedido criado para TransLog com total: 550.00",
+                "Pedido salvo para cliente: TransLog (CNPJ: 11222333000181)",
+            ],
+        )
+
+    def test_eventos_estruturados_e_filtro_por_nivel(self):
+        """Deve emitir registros com tipo e dados, formatando só com dados."""
+        with self.assertLogs(LOGGER, level=logging.DEBUG) as capturados:
+            self._processar()
+            EVENTOS.aviso("teste", "Chaves {{literais}} e {valor}", valor=1)
+
+        registros = capturados.records
+        self.assertEqual(
+            [registro.tipo for registro in registros],
+            ["cliente_salvo", "cliente_criado", "pedido_criado", "pedido_salvo", "teste"],
+        )
+        self.assertEqual(
+            registros[2].dados, {"nome": "TransLog", "cnpj": "11222333000181", "total": 550.0}
+        )
+        avisos = [r.getMessage() for r in registros if r.levelno >= Nivel.AVISO]
+        self.assertEqual(avisos, ["Chaves {literais} e 1"])
+
+    def test_nivel_abaixo_do_logger_nao_formata(self):
+        """Deve descartar eventos abaixo do nível sem formatar a mensagem."""
+        eventos = RegistroEventos(logging.getLogger("petrobahia.teste_silencio"))
+
+        with redirect_stdout(self.saida), eventos_configurados("silencio"):
+            self._processar(eventos)
+            eventos.erro("teste", "{nao_existe}")
+            self.assertFalse(eventos.ativo(Nivel.ERRO))
+
+        self.assertEqual(self.saida.getvalue(), "")
+
+    def test_jsonl_grava_em_segundo_plano(self):
+        """Deve gravar em JSON lines só os eventos do nível configurado."""
+        caminho = self.diretorio / "eventos.jsonl"
+
+        with eventos_configurados("info", caminho):
+            for indice in range(500):
+                EVENTOS.debug("ignorado", "nunca gravado")
+                EVENTOS.info("pedido", "Pedido {indice}", indice=indice)
+
+        linhas = [json.loads(linha) for linha in caminho.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual([linha["dados"]["indice"] for linha in linhas], list(range(500)))
+        self.assertEqual(linhas[0]["nivel"], "info")
+        self.assertEqual(linhas[0]["mensagem"], "Pedido 0")
+        self.assertEqual(linhas[0]["tipo"], "pedido")
+
+    def test_configuracao_restaura_o_logger(self):
+        """Deve devolver handlers, nível e propagação do logger ao sair."""
+        handlers, nivel, propagacao = list(LOGGER.handlers), LOGGER.level, LOGGER.propagate
+
+        with eventos_configurados("aviso") as logger:
+            self.assertIs(logger, LOGGER)
+            self.assertEqual(LOGGER.level, Nivel.AVISO)
+            self.assertFalse(LOGGER.propagate)
+            self.assertEqual(len(LOGGER.handlers), len(handlers) + 1)
+
+        self.assertEqual(
+            (LOGGER.handlers, LOGGER.level, LOGGER.propagate), (handlers, nivel, propagacao)
+        )
+
+    def test_console_escreve_na_saida_informada(self):
+        """Deve escrever na saída passada a ``ManipuladorConsole``."""
+        logger = logging.getLogger("petrobahia.teste_console")
+        logger.addHandler(ManipuladorConsole(self.saida))
+        try:
+            RegistroEventos(logger).aviso("teste", "olá")
+        finally:
+            logger.handlers.clear()
+
+        self.assertEqual(self.saida.getvalue(), "olá\n")
+
+
+class TestEventosMain(unittest.TestCase):
+    """Testes para a configuração dos eventos pelo ``main``."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.diretorio_anterior = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        self.saida = io.StringIO()
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        os.chdir(self.diretorio_anterior)
+        self.temp_dir.cleanup()
+
+    def test_main_configura_os_eventos(self):
+        """Deve gravar os eventos do ``main`` no JSON lines, e nada no console."""
+        with redirect_stdout(self.saida):
+            main(["--eventos-jsonl", "eventos.jsonl", "--eventos-nivel", "info"])
+
+        self.assertEqual(self.saida.getvalue(), "")
+        with open("eventos.jsonl", encoding="utf-8") as file:
+            linhas = [json.loads(linha) for linha in file]
+        self.assertEqual({linha["nivel"] for linha in linhas}, {"info"})
+        self.assertIn(
+            "✓ Pedido criado para TransLog: R$ 5280.00", [linha["mensagem"] for linha in linhas]
+        )
+
+        with redirect_stdout(self.saida):
+            main(["--eventos-nivel", "silencio"])
+        self.assertEqual(self.saida.getvalue(), "")
+
+    def test_nivel_do_ambiente_validado_ao_configurar(self):
+        """Deve validar ``PETROBAHIA_EVENTOS`` e recusar níveis desconhecidos."""
+        with mock.patch.dict(os.environ, {"PETROBAHIA_EVENTOS": "Aviso"}):
+            self.assertIs(nivel_configurado(), Nivel.AVISO)
+            self.assertIs(nivel_configurado("erro"), Nivel.ERRO)
+
+        erros = io.StringIO()
+        with mock.patch.dict(os.environ, {"PETROBAHIA_EVENTOS": "verboso"}):
+            with self.assertRaisesRegex(ValueError, "desconhecido"):
+                nivel_configurado()
+            with redirect_stderr(erros), self.assertRaises(SystemExit):
+                main(["relatorio"])
+        self.assertIn("verboso", erros.getvalue())
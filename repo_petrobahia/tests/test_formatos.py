@@ -0,0 +1,170 @@
+"""Testes para formatos de serialização e migração usando unittest."""
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.models.produto import Produto
+from src.domain.policies.cupom import CupomNulo
+from src.domain.policies.desconto.politica_desconto_produto_none import PoliticaDescontoProdutoNone
+from src.repositories.cliente_repository import ClienteRepositoryArquivo
+from src.repositories.formatos import FORMATOS, detectar_formato
+from src.repositories.migrar_formato import migrar
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+
+
+class TestFormatos(unittest.TestCase):
+    """Testes para leitura e escrita nos formatos suportados."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def test_ida_e_volta_em_todos_os_formatos(self):
+        """Deve ler de volta os clientes gravados em cada formato."""
+        for nome in FORMATOS:
+            with self.subTest(formato=nome):
+                caminho = self.dir / f"clientes_{nome}.txt"
+                repository = ClienteRepositoryArquivo(str(caminho), formato=nome)
+                repository.salvar(Cliente(email="a@empresa.com", nome="Ação Ltda", cnpj="1"))
+                repository.salvar(Cliente(email="b@empresa.com", nome="Beta", cnpj="2"))
+
+                clientes = list(ClienteRepositoryArquivo(str(caminho)).listar())
+
+                self.assertEqual([c.nome for c in clientes], ["Ação Ltda", "Beta"])
+                self.assertEqual(detectar_formato(caminho)[0].nome, nome)
+
+    def test_arquivo_novo_recebe_cabecalho_padrao(self):
+        """Deve gravar cabeçalho jsonl em arquivos novos."""
+        caminho = self.dir / "clientes.txt"
+        ClienteRepositoryArquivo(str(caminho))
+        self.assertEqual(caminho.read_bytes(), b"#petrobahia:jsonl:1\n")
+
+    def test_le_arquivo_legado_sem_cabecalho(self):
+        """Deve continuar lendo arquivos dict string sem cabeçalho."""
+        caminho = self.dir / "clientes.txt"
+        caminho.write_text(
+            "{'nome': 'TransLog', 'email': 'translog@empresa.com', 'cnpj': '04.252.011/0001-10'}\n",
+            encoding="utf-8",
+        )
+
+        clientes = list(ClienteRepositoryArquivo(str(caminho)).listar())
+
+        self.assertEqual(clientes[0].cnpj, "04.252.011/0001-10")
+
+    def test_formato_divergente_do_arquivo(self):
+        """Deve rejeitar formato diferente do gravado no arquivo."""
+        caminho = self.dir / "clientes.txt"
+        ClienteRepositoryArquivo(str(caminho), formato="binario")
+        with self.assertRaises(ValueError):
+            ClienteRepositoryArquivo(str(caminho), formato="jsonl")
+
+    def test_localizar_registros_por_bytes(self):
+        """Deve delimitar só os registros que contêm o valor, em cada formato."""
+        registros = [{"cnpj": "1", "nome": "A"}, {"cnpj": "11", "nome": "B"}, {"cnpj": "1"}]
+        for nome, formato in FORMATOS.items():
+            with self.subTest(formato=nome):
+                conteudo = formato.cabecalho + b"".join(map(formato.codificar, registros))
+                inicio = len(formato.cabecalho)
+
+                faixas = list(formato.localizar(conteudo, inicio, formato.agulha("1")))
+                encontrados = [formato.decodificar(conteudo[a:b]) for a, b in faixas]
+
+                self.assertEqual(encontrados, [registros[0], registros[2]])
+
+    def test_ler_bruto_no_inicio_de_registro(self):
+        """Deve devolver os bytes do registro e rejeitar offsets desalinhados."""
+        registros = [{"cnpj": "1", "nome": "A"}, {"cnpj": "2", "nome": "B"}]
+        for nome, formato in FORMATOS.items():
+            with self.subTest(formato=nome):
+                caminho = self.dir / f"registros_{nome}.txt"
+                codificados = [formato.codificar(registro) for registro in registros]
+                caminho.write_bytes(formato.cabecalho + b"".join(codificados))
+                segundo = len(formato.cabecalho) + len(codificados[0])
+
+                with caminho.open("rb") as file:
+                    bruto = formato.ler_bruto(file, segundo)
+                    with self.assertRaises(ValueError):
+                        formato.ler_bruto(file, segundo + 2)
+
+                self.assertEqual(bruto, codificados[1])
+                self.assertEqual(formato.decodificar(bruto), registros[1])
+
+    def test_binario_codificacao_explicita(self):
+        """Deve gravar bytes fixos (sem marshal) e ler de volta todos os tipos."""
+        formato = FORMATOS["binario"]
+        registro = {
+            "texto": "Ação",
+            "inteiro": -7,
+            "real": 1.5,
+            "nulo": None,
+            "flags": [True, False],
+            "itens": [{"quantidade": 2**40}],
+        }
+
+        self.assertEqual(
+            formato.codificar({"a": 1}),
+            b"\x00\x00\x00\x14m\x00\x00\x00\x01s\x00\x00\x00\x01ai" + (1).to_bytes(8, "big"),
+        )
+        self.assertEqual(formato.decodificar(formato.codificar(registro)), registro)
+        with self.assertRaises(ValueError):
+            formato.decodificar(formato.codificar(registro)[:-1])
+        with self.assertRaises(ValueError):
+            formato.codificar({"grande": 2**64})
+
+    def test_binario_versao_marshal_rejeitada(self):
+        """Deve recusar com mensagem clara arquivos binários da versão 1 (marshal)."""
+        caminho = self.dir / "clientes.bin"
+        caminho.write_bytes(b"#petrobahia:binario:1\n")
+        with self.assertRaisesRegex(ValueError, "Versão '1' do formato 'binario'"):
+            ClienteRepositoryArquivo(str(caminho))
+
+    def test_versao_desconhecida(self):
+        """Deve rejeitar cabeçalho com versão não suportada."""
+        caminho = self.dir / "clientes.txt"
+        caminho.write_bytes(b"#petrobahia:jsonl:99\n")
+        with self.assertRaises(ValueError):
+            ClienteRepositoryArquivo(str(caminho))
+
+
+class TestMigrarFormato(unittest.TestCase):
+    """Testes para a ferramenta de migração."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.caminho = Path(self.temp_dir.name) / "pedidos.txt"
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def test_migrar_legado_no_lugar(self):
+        """Deve converter arquivo legado e manter as buscas funcionando."""
+        repository = PedidoRepositoryArquivo(
+            str(self.caminho), ConfiguracaoArquivo(formato="legado")
+        )
+        produto = Produto(tipo="diesel", preco=5.5, politica_desconto=PoliticaDescontoProdutoNone())
+        for cnpj, quantidade in (("1", 10), ("2", 20), ("1", 30)):
+            cliente = Cliente(email="teste@empresa.com", nome="Empresa", cnpj=cnpj)
+            item = ItemPedido(produto=produto, quantidade=quantidade, cupom=CupomNulo())
+            repository.salvar(Pedido(cliente=cliente, itens=[item]))
+
+        total = migrar(self.caminho, self.caminho, "binario")
+
+        self.assertEqual(total, 3)
+        self.assertEqual(detectar_formato(self.caminho)[0].nome, "binario")
+        pedidos = PedidoRepositoryArquivo(str(self.caminho)).buscar_por_cliente("1")
+        self.assertEqual([p.itens[0].quantidade for p in pedidos], [10, 30])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Testes para a importação em massa usando pytest."""
+
+import json
+import logging
+
+import pytest
+
+from src.application.services.importacao_service import ImportacaoService
+from src.domain.models.cliente import Cliente
+from src.infrastructure.eventos import LOGGER, eventos_configurados
+from src.repositories.cliente_repository import ClienteRepositoryArquivo
+from src.repositories.pedido_repository import PedidoRepositoryArquivo
+
+CNPJ_1 = "04.252.011/0001-10"
+CNPJ_2 = "11222333000181"
+
+
+@pytest.fixture
+def arquivos(tmp_path):
+    """Cria arquivos de entrada com linhas inválidas de cada tipo."""
+    clientes = tmp_path / "clientes.csv"
+    clientes.write_text(
+        "nome,email,cnpj\n"
+        f"TransLog,translog@empresa.com,{CNPJ_1}\n"
+        f"MoveMais,movemais@empresa.com,{CNPJ_2}\n"
+        "SemEmail,,11.222.333/0001-81\n"
+        "DigitoErrado,digito@empresa.com,11.222.333/0001-82\n",
+        encoding="utf-8",
+    )
+    linhas = [
+        {"cnpj": CNPJ_1, "itens": [{"produto_tipo": "diesel", "quantidade": 1200}]},
+        {"cnpj": CNPJ_2, "itens": [{"produto_tipo": "querosene", "quantidade": 10}]},
+        {"cnpj": "9", "itens": [{"produto_tipo": "diesel", "quantidade": 10}]},
+        {"cnpj": CNPJ_2, "itens": [{"produto_tipo": "gasolina", "quantidade": 300}]},
+        {
+            "cnpj": CNPJ_1,
+            "itens": [{"produto_tipo": "etanol", "quantidade": 90, "cupom_codigo": "NOVO5"}],
+        },
+    ]
+    pedidos = tmp_path / "pedidos.jsonl"
+    pedidos.write_text(
+        "".join(json.dumps(l) + "\n" for l in linhas) + "{invalido\n", encoding="utf-8"
+    )
+    return tmp_path, clientes, pedidos
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_importar_clientes_e_pedidos(arquivos, workers):
+    """Deve persistir linhas válidas em ordem e rejeitar as inválidas."""
+    diretorio, clientes, pedidos = arquivos
+    cliente_repo = ClienteRepositoryArquivo(str(diretorio / "clientes.txt"))
+    pedido_repo = PedidoRepositoryArquivo(str(diretorio / "pedidos.txt"))
+    rejeitados = diretorio / "rejeitados.jsonl"
+
+    resumo = ImportacaoService(cliente_repo, pedido_repo).importar(
+        clientes, pedidos, rejeitados, workers=workers, tamanho_lote=2
+    )
+
+    assert (resumo.clientes_importados, resumo.clientes_rejeitados) == (2, 2)
+    assert (resumo.pedidos_importados, resumo.pedidos_rejeitados) == (3, 3)
+    assert [p.itens[0].produto.tipo for p in pedido_repo.buscar_por_cliente(CNPJ_1)] == [
+        "diesel",
+        "etanol",
+    ]
+    linhas = [json.loads(l) for l in rejeitados.read_text(encoding="utf-8").splitlines()]
+    assert [(l["origem"], l["linha"]) for l in linhas] == [
+        ("clientes", 4),
+        ("clientes", 5),
+        ("pedidos", 2),
+        ("pedidos", 3),
+        ("pedidos", 6),
+    ]
+    assert linhas[1]["erro"] == "CNPJ inválido: dígito verificador não confere."
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_importar_grava_codigo_do_cupom(arquivos, workers):
+    """Deve gravar o código do cupom mesmo com itens precificados em outro processo."""
+    diretorio, clientes, pedidos = arquivos
+    pedido_repo = PedidoRepositoryArquivo(str(diretorio / "pedidos.txt"))
+
+    ImportacaoService(
+        ClienteRepositoryArquivo(str(diretorio / "clientes.txt")), pedido_repo
+    ).importar(clientes, pedidos, diretorio / "rejeitados.jsonl", workers=workers)
+
+    diesel, etanol = pedido_repo.buscar_por_cliente(CNPJ_1)
+    assert diesel.itens[0].cupom.codigo is None
+    assert etanol.itens[0].cupom.codigo == "NOVO5"
+    assert etanol.itens[0].desconto_cupom > 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_importar_descarta_eventos_por_registro(arquivos, workers, capfd):
+    """Deve calar os eventos de nível DEBUG, inclusive nos workers, e restaurar o nível."""
+    diretorio, clientes, pedidos = arquivos
+    service = ImportacaoService(
+        ClienteRepositoryArquivo(str(diretorio / "clientes.txt")),
+        PedidoRepositoryArquivo(str(diretorio / "pedidos.txt")),
+    )
+
+    with eventos_configurados("debug"):
+        service.importar(clientes, pedidos, diretorio / "rejeitados.jsonl", workers=workers)
+        nivel = LOGGER.level
+
+    assert capfd.readouterr().out == ""
+    assert nivel == logging.DEBUG
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_importar_acha_cliente_com_cnpj_formatado_ou_nao(tmp_path, workers):
+    """Deve achar o cliente cadastrado com o CNPJ escrito de outra forma."""
+    cliente_repo = ClienteRepositoryArquivo(str(tmp_path / "clientes.txt"))
+    pedido_repo = PedidoRepositoryArquivo(str(tmp_path / "pedidos.txt"))
+    cliente_repo.cadastrar(Cliente(email="a@empresa.com", nome="TransLog", cnpj=CNPJ_1))
+    pedidos = tmp_path / "pedidos.jsonl"
+    pedidos.write_text(
+        json.dumps(
+            {"cnpj": "04252011000110", "itens": [{"produto_tipo": "diesel", "quantidade": 10}]}
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    resumo = ImportacaoService(cliente_repo, pedido_repo).importar(
+        None, pedidos, tmp_path / "rejeitados.jsonl", workers=workers
+    )
+
+    assert (resumo.pedidos_importados, resumo.pedidos_rejeitados) == (1, 0)
+    assert pedido_repo.buscar_por_cliente(CNPJ_1)[0].cliente.cnpj == CNPJ_1
+
+
+def test_importar_parametros_invalidos(tmp_path):
+    """Deve rejeitar quantidade de workers não positiva."""
+    service = ImportacaoService(
+        ClienteRepositoryArquivo(str(tmp_path / "c.txt")),
+        PedidoRepositoryArquivo(str(tmp_path / "p.txt")),
+    )
+    with pytest.raises(ValueError):
+        service.importar(None, None, tmp_path / "r.jsonl", workers=0)
@@ -0,0 +1,174 @@
+"""Testes do índice de unicidade de CNPJ e de ``cadastrar`` usando pytest."""
+
+import contextlib
+import multiprocessing
+import os
+
+import pytest
+
+from src.application.services.cliente_service import ClienteService
+from src.domain.exceptions import ClienteDuplicadoError
+from src.domain.models.cliente import Cliente
+from src.repositories import indice_unico_cnpj
+from src.repositories.cliente_repository import ClienteRepositoryArquivo
+from src.repositories.cliente_repository_sqlite import ClienteRepositorySQLite
+from src.repositories.escritor_agrupado import ConfiguracaoEscrita
+from src.repositories.indice_unico_cnpj import FiltroBloom
+
+
+def _cliente(indice: int, cnpj: str | None = None) -> Cliente:
+    return Cliente(
+        email=f"c{indice}@empresa.com", nome=f"Cliente {indice}", cnpj=cnpj or f"{indice:014d}"
+    )
+
+
+@pytest.fixture
+def indice_pequeno(monkeypatch):
+    """Reduz tabela e log pendente para exercitar mesclas e crescimento."""
+    monkeypatch.setattr(indice_unico_cnpj, "CAPACIDADE_INICIAL", 16)
+    monkeypatch.setattr(indice_unico_cnpj, "LIMITE_PENDENTES", 8)
+
+
+def test_filtro_bloom_sem_falsos_negativos():
+    filtro = FiltroBloom(10_000, taxa_falsos=0.01)
+    for chave in range(0, 20_000, 2):
+        filtro.adicionar(chave)
+
+    assert all(chave in filtro for chave in range(0, 20_000, 2))
+    falsos = sum(chave in filtro for chave in range(1, 20_000, 2))
+    assert falsos < 300
+
+    copia = FiltroBloom.de_bytes(filtro.para_bytes())
+    assert [chave in copia for chave in range(2_000)] == [chave in filtro for chave in range(2_000)]
+    assert copia.quantidade == 10_000
+    with pytest.raises(ValueError, match="Bloom"):
+        FiltroBloom.de_bytes(filtro.para_bytes()[:-1])
+
+
+def test_cadastrar_recusa_cnpj_repetido(tmp_path, capsys):
+    repository = ClienteRepositoryArquivo(str(tmp_path / "clientes.txt"))
+    repository.cadastrar(_cliente(1, "04.252.011/0001-10"))
+
+    with pytest.raises(ClienteDuplicadoError, match="04252011000110"):
+        repository.cadastrar(_cliente(2, "04252011000110"))
+
+    assert [c.nome for c in repository.listar()] == ["Cliente 1"]
+    assert repository.cnpj_cadastrado("04252011000110")
+    assert not repository.cnpj_cadastrado("11222333000181")
+
+
+def test_salvar_atualiza_e_conta_para_unicidade(tmp_path, capsys):
+    repository = ClienteRepositoryArquivo(str(tmp_path / "clientes.txt"))
+    repository.salvar(_cliente(1))
+    repository.salvar(_cliente(2, f"{1:014d}"))
+
+    with pytest.raises(ClienteDuplicadoError):
+        repository.cadastrar(_cliente(3, f"{1:014d}"))
+    assert repository.buscar_por_cnpj(f"{1:014d}").nome == "Cliente 2"
+
+
+def test_indice_persistido_e_crescimento(tmp_path, capsys, indice_pequeno):
+    caminho = str(tmp_path / "clientes.txt")
+    repository = ClienteRepositoryArquivo(caminho)
+    for indice in range(200):
+        repository.cadastrar(_cliente(indice))
+    repository.close()
+
+    reaberto = ClienteRepositoryArquivo(caminho)
+    for indice in range(0, 200, 7):
+        with pytest.raises(ClienteDuplicadoError):
+            reaberto.cadastrar(_cliente(indice))
+    reaberto.cadastrar(_cliente(200))
+
+    assert sum(1 for _ in reaberto.listar()) == 201
+    assert (tmp_path / "clientes.txt.unicos").stat().st_size > 16 * 8
+
+
+def test_indice_reconstruido_do_arquivo(tmp_path, capsys, indice_pequeno):
+    caminho = tmp_path / "clientes.txt"
+    repository = ClienteRepositoryArquivo(str(caminho))
+    for indice in range(30):
+        repository.salvar(_cliente(indice))
+    repository.close()
+    os.remove(tmp_path / "clientes.txt.unicos")
+    os.remove(tmp_path / "clientes.txt.unicos.log")
+
+    reaberto = ClienteRepositoryArquivo(str(caminho))
+    with pytest.raises(ClienteDuplicadoError):
+        reaberto.cadastrar(_cliente(29))
+
+    # Arquivo de clientes reescrito (menor): o índice acompanha
+    caminho.write_bytes(caminho.read_bytes()[: caminho.stat().st_size // 2])
+    outro = ClienteRepositoryArquivo(str(caminho))
+    outro.cadastrar(_cliente(29))
+
+
+def test_instancias_enxergam_cadastros_uma_da_outra(tmp_path, capsys, indice_pequeno):
+    caminho = str(tmp_path / "clientes.txt")
+    primeira = ClienteRepositoryArquivo(caminho)
+    segunda = ClienteRepositoryArquivo(caminho)
+    primeira.cadastrar(_cliente(0))
+    segunda.cadastrar(_cliente(1))
+
+    for indice in range(2, 40):
+        (primeira if indice % 2 else segunda).cadastrar(_cliente(indice))
+        with pytest.raises(ClienteDuplicadoError):
+            (segunda if indice % 2 else primeira).cadastrar(_cliente(indice))
+
+
+def test_escrita_agrupada_reserva_antes_do_flush(tmp_path, capsys):
+    caminho = str(tmp_path / "clientes.txt")
+    escrita = ConfiguracaoEscrita(max_registros=100, intervalo=None)
+    with ClienteRepositoryArquivo(caminho, escrita=escrita) as repository:
+        repository.cadastrar(_cliente(1))
+        with pytest.raises(ClienteDuplicadoError):
+            repository.cadastrar(_cliente(1))
+        with pytest.raises(ClienteDuplicadoError):
+            ClienteRepositoryArquivo(caminho).cadastrar(_cliente(1))
+
+    assert [c.nome for c in ClienteRepositoryArquivo(caminho).listar()] == ["Cliente 1"]
+
+
+def _cadastrar_todos(caminho: str, inicio: int, largada) -> None:
+    repository = ClienteRepositoryArquivo(caminho)
+    largada.wait()
+    with open(os.devnull, "w", encoding="utf-8") as nulo, contextlib.redirect_stdout(nulo):
+        for indice in range(inicio, inicio + 150):
+            with contextlib.suppress(ClienteDuplicadoError):
+                repository.cadastrar(_cliente(indice))
+
+
+def test_processos_concorrentes_nao_duplicam(tmp_path):
+    caminho = str(tmp_path / "clientes.txt")
+    ClienteRepositoryArquivo(caminho)
+    largada = multiprocessing.Event()
+    # Faixas sobrepostas: cada CNPJ é disputado por dois ou três processos
+    processos = [
+        multiprocessing.Process(target=_cadastrar_todos, args=(caminho, inicio, largada))
+        for inicio in (0, 50, 100, 100)
+    ]
+    for processo in processos:
+        processo.start()
+    largada.set()
+    for processo in processos:
+        processo.join()
+
+    assert [processo.exitcode for processo in processos] == [0, 0, 0, 0]
+    cnpjs = [c.cnpj for c in ClienteRepositoryArquivo(caminho).listar()]
+    assert sorted(cnpjs) == [f"{indice:014d}" for indice in range(250)]
+
+
+def test_sqlite_cadastrar_compara_digitos(tmp_path, capsys):
+    with ClienteRepositorySQLite(tmp_path / "banco.db") as repository:
+        repository.cadastrar(_cliente(1, "04.252.011/0001-10"))
+        with pytest.raises(ClienteDuplicadoError):
+            repository.cadastrar(_cliente(2, "04252011000110"))
+        assert [c.nome for c in repository.listar()] == ["Cliente 1"]
+
+
+def test_service_recusa_cliente_duplicado(tmp_path, capsys):
+    service = ClienteService(ClienteRepositoryArquivo(str(tmp_path / "clientes.txt")))
+    service.criar_cliente("a@b.com", "TransLog", "04.252.011/0001-10")
+
+    with pytest.raises(ClienteDuplicadoError):
+        service.criar_cliente("outro@b.com", "TransLog 2", "04.252.011/0001-10")
@@ -0,0 +1,186 @@
+"""Testes para as métricas de latência usando pytest."""
+
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from src.application.services.pedido_service import PedidoService
+from src.domain.models.cliente import Cliente
+from src.domain.services.produto_factory import ProdutoFactory
+from src.infrastructure.metricas import (
+    ETAPA_PEDIDO,
+    OPERACAO_REPOSITORIO,
+    PEDIDOS_CRIADOS,
+    PEDIDOS_REJEITADOS,
+    Histograma,
+    Metricas,
+    cronometrado_fluxo,
+)
+from src.repositories.pedido_repository import PedidoRepositoryArquivo
+
+ITENS = [{"produto_tipo": "diesel", "quantidade": 600, "cupom_codigo": "MEGA10"}]
+CLIENTE = Cliente(email="a@b.com", nome="TransLog", cnpj="1")
+
+
+def _histogramas(metricas: Metricas) -> dict:
+    return {
+        (h["nome"], tuple(sorted(h["rotulos"].items()))): h
+        for h in metricas.snapshot()["histogramas"]
+    }
+
+
+class TestHistograma:
+    """Testes para o histograma de buckets fixos."""
+
+    def test_buckets_e_percentis(self):
+        """Deve acumular contagens e estimar percentis pelos limites."""
+        histograma = Histograma((0.1, 1.0))
+        for valor in (0.05, 0.05, 0.5, 2.0):
+            histograma.observar(valor)
+
+        assert histograma.acumulados() == [2, 3, 4]
+        assert histograma.percentil(0.5) == 0.1
+        assert histograma.percentil(0.99) == float("inf")
+        assert histograma.soma == pytest.approx(2.6)
+
+
+class TestMetricasPedidoService:
+    """Testes para a instrumentação de PedidoService."""
+
+    def test_desligadas_nao_registram(self):
+        """Deve criar pedidos sem observar nada com métricas desligadas."""
+        metricas = Metricas()
+        PedidoService(None, metricas=metricas).criar_pedido(
+            CLIENTE, ITENS, ProdutoFactory.criar_catalogo_padrao()
+        )
+
+        snapshot = metricas.snapshot()
+        assert snapshot["contadores"] == []
+        assert all(h["contagem"] == 0 for h in snapshot["histogramas"])
+
+    def test_etapas_e_contadores(self, tmp_path):
+        """Deve registrar cada etapa, o salvar e os contadores de pedidos."""
+        metricas = Metricas(ativo=True)
+        repository = PedidoRepositoryArquivo(str(tmp_path / "pedidos.txt"), metricas=metricas)
+        service = PedidoService(repository, metricas=metricas)
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+
+        service.processar_e_salvar(CLIENTE, ITENS, catalogo)
+        with pytest.raises(ValueError):
+            service.criar_pedido(
+                CLIENTE, [{"produto_tipo": "querosene", "quantidade": 1}], catalogo
+            )
+        repository.buscar_por_cliente("1")
+
+        histogramas = _histogramas(metricas)
+        for etapa in ("catalogo", "cupom", "precificacao", "validacao", "salvar"):
+            assert histogramas[(ETAPA_PEDIDO, (("etapa", etapa),))]["contagem"] >= 1
+        for operacao in ("salvar", "buscar_por_cliente"):
+            chave = (OPERACAO_REPOSITORIO, (("operacao", operacao), ("repositorio", "pedido")))
+            assert histogramas[chave]["contagem"] == 1
+        contadores = {c["nome"]: c for c in metricas.snapshot()["contadores"]}
+        assert contadores[PEDIDOS_CRIADOS]["valor"] == 1
+        assert contadores[PEDIDOS_REJEITADOS]["rotulos"] == {"motivo": "ValueError"}
+
+
+class TestExportacao:
+    """Testes para a exportação em Prometheus e JSON."""
+
+    def test_texto_prometheus(self, tmp_path):
+        """Deve gerar séries de histograma e contador no formato de exposição."""
+        metricas = Metricas(ativo=True, limites=(0.1,))
+        metricas.observar("latencia_segundos", 0.05, etapa='a"b')
+        metricas.incrementar("eventos_total", 2)
+
+        caminho = tmp_path / "metricas.prom"
+        metricas.gravar_prometheus(caminho)
+        linhas = caminho.read_text(encoding="utf-8").splitlines()
+
+        assert "# TYPE latencia_segundos histogram" in linhas
+        assert 'latencia_segundos_bucket{etapa="a\\"b",le="0.1"} 1' in linhas
+        assert 'latencia_segundos_bucket{etapa="a\\"b",le="+Inf"} 1' in linhas
+        assert 'latencia_segundos_count{etapa="a\\"b"} 1' in linhas
+        assert "eventos_total 2" in linhas
+
+    def test_snapshot_json(self, tmp_path):
+        """Deve gravar o snapshot com percentis estimados."""
+        metricas = Metricas(ativo=True)
+        metricas.observar("latencia_segundos", 0.002)
+
+        caminho = tmp_path / "metricas.json"
+        metricas.gravar_json(caminho)
+        dados = json.loads(caminho.read_text(encoding="utf-8"))
+
+        assert dados["histogramas"][0]["contagem"] == 1
+        assert dados["histogramas"][0]["p50"] == 0.0025
+
+    def test_zerar_preserva_histogramas_obtidos(self):
+        """Deve zerar valores sem invalidar histogramas já obtidos."""
+        metricas = Metricas(ativo=True)
+        histograma = metricas.histograma("latencia_segundos")
+        histograma.observar(0.1)
+
+        metricas.zerar()
+        histograma.observar(0.2)
+
+        assert _histogramas(metricas)[("latencia_segundos", ())]["contagem"] == 1
+
+
+class TestCronometradoFluxo:
+    """Testes para a medição de métodos que devolvem iteradores."""
+
+    class Fonte:
+        def __init__(self, metricas: Metricas):
+            self._metricas = metricas
+            self.fechada = False
+
+        @cronometrado_fluxo("fonte_segundos")
+        def ler(self, total: int):
+            try:
+                for indice in range(total):
+                    time.sleep(0.01)
+                    yield indice
+            finally:
+                self.fechada = True
+
+    def test_observa_ao_esgotar_o_iterador(self):
+        """Deve medir o tempo dentro do iterador, sem o tempo de quem consome."""
+        metricas = Metricas(ativo=True)
+        itens = self.Fonte(metricas).ler(3)
+        assert _histogramas(metricas)[("fonte_segundos", ())]["contagem"] == 0
+
+        for _ in itens:
+            time.sleep(0.1)
+
+        histograma = _histogramas(metricas)[("fonte_segundos", ())]
+        assert histograma["contagem"] == 1
+        assert 0.03 <= histograma["soma"] < 0.2
+
+    def test_fechamento_antecipado_fecha_a_origem(self):
+        """Deve observar e repassar o ``close`` quando o consumidor para antes."""
+        metricas = Metricas(ativo=True)
+        fonte = self.Fonte(metricas)
+        itens = fonte.ler(10)
+        next(itens)
+        itens.close()
+
+        assert fonte.fechada
+        assert _histogramas(metricas)[("fonte_segundos", ())]["contagem"] == 1
+
+    def test_buscar_por_periodo_observado_apos_a_iteracao(self, tmp_path):
+        """Deve registrar ``buscar_por_periodo`` só depois de percorrido."""
+        metricas = Metricas(ativo=True)
+        repository = PedidoRepositoryArquivo(str(tmp_path / "pedidos.txt"), metricas=metricas)
+        service = PedidoService(repository, metricas=metricas)
+        service.processar_e_salvar(CLIENTE, ITENS, ProdutoFactory.criar_catalogo_padrao())
+        chave = (
+            OPERACAO_REPOSITORIO,
+            (("operacao", "buscar_por_periodo"), ("repositorio", "pedido")),
+        )
+
+        pedidos = repository.buscar_por_periodo(datetime(2000, 1, 1), datetime(2100, 1, 1))
+        assert _histogramas(metricas)[chave]["contagem"] == 0
+        assert len(list(pedidos)) == 1
+        assert _histogramas(metricas)[chave]["contagem"] == 1
@@ -4,6 +4,7 @@ import pytest
 
 from src.domain.models.cliente import Cliente
 from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.lote_pedidos import PedidoBatch
 from src.domain.models.pedido import Pedido
 from src.domain.models.produto import Produto
 from src.domain.policies.cupom import CupomNulo, CupomPercentual, CupomValorFixo
@@ -13,6 +14,9 @@ from src.domain.policies.desconto.politica_desconto_produto_disel import (
 from src.domain.policies.desconto.politica_desconto_produto_none import (
     PoliticaDescontoProdutoNone,
 )
+from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.precificacao_lote import PrecificadorLote
+from src.domain.services.produto_factory import ProdutoFactory
 
 
 class TestCliente:
@@ -135,3 +139,98 @@ class TestPedido:
         cliente = Cliente(email="teste@empresa.com", nome="Cliente Teste", cnpj="12345678000199")
         pedido = Pedido(cliente=cliente, itens=[])
         assert pedido.preco_total == 0.0
+
+
+class TestModelosSlots:
+    """Testes para a representação compacta dos modelos."""
+
+    def test_modelos_sem_dict_por_instancia(self):
+        """Deve usar __slots__ em vez de __dict__ por instância."""
+        cliente = Cliente(email="teste@empresa.com", nome="Cliente Teste", cnpj="1")
+        produto = Produto(tipo="diesel", preco=5.5)
+        item = ItemPedido(produto=produto, quantidade=10)
+        pedido = Pedido(cliente=cliente, itens=[item])
+
+        for objeto in (cliente, produto, item, pedido, item.cupom):
+            assert not hasattr(objeto, "__dict__")
+
+
+class TestPedidoBatch:
+    """Testes para os lotes colunares de pedidos e itens."""
+
+    def test_views_reproduzem_pedidos(self):
+        """Deve expor os mesmos valores dos pedidos originais."""
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        cliente1 = Cliente(email="a@empresa.com", nome="A", cnpj="1")
+        cliente2 = Cliente(email="b@empresa.com", nome="B", cnpj="2")
+        pedidos = [
+            Pedido(
+                cliente=cliente1,
+                itens=[
+                    ItemPedido(catalogo["diesel"], 1200, CupomFactory.criar("MEGA10")),
+                    ItemPedido(catalogo["lubrificante"], 3, CupomFactory.criar("LUB2")),
+                ],
+            ),
+            Pedido(cliente=cliente2, itens=[ItemPedido(catalogo["etanol"], 90)]),
+        ]
+
+        lote = PedidoBatch.de_pedidos(pedidos)
+
+        assert len(lote) == 2
+        assert len(lote.clientes) == 2
+        for original, view in zip(pedidos, lote):
+            assert view.cliente == original.cliente
+            assert view.preco_total == original.preco_total
+            for item, item_view in zip(original.itens, view.itens, strict=True):
+                assert item_view.produto is item.produto
+                assert item_view.quantidade == item.quantidade
+                assert item_view.desconto_produto == item.desconto_produto
+                assert item_view.desconto_cupom == item.desconto_cupom
+                assert item_view.preco_final == item.preco_final
+        assert isinstance(lote[1].itens[0].cupom, CupomNulo)
+
+    def test_itens_precificados_em_lote(self):
+        """Deve precificar colunas com os mesmos valores de ItemPedido."""
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        lote = PrecificadorLote.precificar_itens(
+            ["diesel", "gasolina", "lubrificante"], [600, 300, 2], [None, "NOVO5", "LUB2"], catalogo
+        )
+
+        esperado = ItemPedido(catalogo["gasolina"], 300, CupomFactory.criar("NOVO5"))
+        assert lote[1].preco_final == esperado.preco_final
+        assert lote[-1].desconto_cupom == 2.0
+        assert len(lote.produtos) == 3
+        assert lote.nbytes() == 3 * (4 + 4 + 8 + 5 * 8)
+
+    def test_cupons_iguais_ocupam_uma_posicao(self):
+        """Deve guardar uma vez cupons com o mesmo código, mesmo em instâncias distintas."""
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        cupom = CupomFactory.criar("MEGA10")
+        copia = CupomPercentual(0.10, "MEGA10")
+        sem_codigo = [CupomValorFixo(5.0), CupomValorFixo(5.0)]
+        itens = [ItemPedido(catalogo["diesel"], 10, c) for c in (cupom, copia, *sem_codigo)]
+        cliente = Cliente(email="a@empresa.com", nome="A", cnpj="1")
+
+        lote = PedidoBatch.de_pedidos([Pedido(cliente=cliente, itens=itens)])
+
+        assert len(lote.itens.cupons) == 4
+        assert list(lote.itens.cupom_idx) == [1, 1, 2, 3]
+        assert lote.itens.cupom_idx.typecode == "I"
+
+    def test_cliente_divergente_com_mesmo_cnpj(self):
+        """Deve recusar cliente com CNPJ repetido e dados diferentes."""
+        item = ItemPedido(ProdutoFactory.criar_catalogo_padrao()["diesel"], 10)
+        lote = PedidoBatch()
+        lote.adicionar(Pedido(Cliente(email="a@empresa.com", nome="A", cnpj="1"), [item]))
+        lote.adicionar(Pedido(Cliente(email="a@empresa.com", nome="A", cnpj="1"), [item]))
+
+        with pytest.raises(ValueError, match="divergentes"):
+            lote.adicionar(Pedido(Cliente(email="a@empresa.com", nome="Outro", cnpj="1"), [item]))
+
+        assert len(lote) == 2
+        assert len(lote.clientes) == 1
+
+    def test_indice_fora_do_lote(self):
+        """Deve lançar IndexError para linha inexistente."""
+        with pytest.raises(IndexError):
+            PedidoBatch()[0]
@@ -0,0 +1,304 @@
+"""Testes do despacho de notificações em segundo plano usando unittest."""
+
+import io
+import json
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src.application.services.notificacao_service import NotificacaoService
+from src.application.services.pedido_service import PedidoService
+from src.domain.models.cliente import Cliente
+from src.domain.services.produto_factory import ProdutoFactory
+from src.infrastructure.eventos import Nivel, eventos_configurados
+from src.infrastructure.metricas import NOTIFICACOES, Metricas
+from src.infrastructure.notificacoes import (
+    ConfiguracaoDespacho,
+    DespachanteNotificacoes,
+    DestinoArquivo,
+    DestinoConsole,
+    DestinoNotificacao,
+    DestinoWebhook,
+    Notificacao,
+    PoliticaFilaCheia,
+)
+from src.repositories.pedido_repository import PedidoRepositoryArquivo
+
+
+class DestinoMemoria(DestinoNotificacao):
+    """Guarda os lotes recebidos; com ``portao``, cada envio espera a liberação."""
+
+    def __init__(self, nome: str = "memoria", portao: threading.Event | None = None):
+        self.nome = nome
+        self.lotes: list[list[str]] = []
+        self.entrou = threading.Event()
+        self._portao = portao
+
+    def enviar(self, lote):
+        self.entrou.set()
+        if self._portao is not None:
+            self._portao.wait(5)
+        self.lotes.append([notificacao.mensagem for notificacao in lote])
+
+
+class DestinoInstavel(DestinoMemoria):
+    """Falha no primeiro lote."""
+
+    def enviar(self, lote):
+        if not self.lotes and not self.entrou.is_set():
+            self.entrou.set()
+            raise OSError("webhook fora do ar")
+        super().enviar(lote)
+
+
+def _notificacao(indice: int) -> Notificacao:
+    return Notificacao("teste", f"n{indice}", {"indice": indice})
+
+
+class TestDespachanteNotificacoes(unittest.TestCase):
+    """Testes para DespachanteNotificacoes."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.portao = threading.Event()
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        # Libera destinos ainda presos, para as threads terminarem
+        self.portao.set()
+
+    def test_agrupa_em_lotes_e_entrega_tudo_ao_fechar(self):
+        """Deve agrupar em lotes de ``max_lote`` e entregar tudo ao fechar."""
+        destino = DestinoMemoria()
+        config = ConfiguracaoDespacho(max_lote=100, intervalo=1.0)
+        with DespachanteNotificacoes([destino], config) as despachante:
+            for indice in range(250):
+                self.assertTrue(despachante.publicar(_notificacao(indice)))
+
+        self.assertEqual([len(lote) for lote in destino.lotes], [100, 100, 50])
+        self.assertEqual(sum(destino.lotes, []), [f"n{indice}" for indice in range(250)])
+        with self.assertRaisesRegex(ValueError, "fechado"):
+            despachante.publicar(_notificacao(0))
+
+    def test_destino_lento_nao_atrasa_quem_publica_nem_outros_destinos(self):
+        """Deve descartar no destino lento sem bloquear quem publica."""
+        lento, rapido = DestinoMemoria("lento", self.portao), DestinoMemoria("rapido")
+        config = ConfiguracaoDespacho(
+            capacidade=10, max_lote=1, intervalo=0, politica=PoliticaFilaCheia.DESCARTAR
+        )
+        despachante = DespachanteNotificacoes([lento, rapido], config)
+
+        despachante.publicar(_notificacao(0))
+        self.assertTrue(lento.entrou.wait(5))
+        inicio = time.perf_counter()
+        aceitas = [despachante.publicar(_notificacao(indice)) for indice in range(1, 50)]
+        duracao = time.perf_counter() - inicio
+
+        self.assertLess(duracao, 0.5)
+        # False sempre que algum destino descartou (o rápido também pode, se atrasar)
+        self.assertGreaterEqual(aceitas.count(False), 39)
+        self.portao.set()
+        despachante.fechar()
+        estatisticas = despachante.estatisticas()
+        self.assertEqual(estatisticas["lento"], {"enviadas": 11, "descartadas": 39, "falhas": 0})
+        # O destino rápido só descarta se a própria thread ficar para trás
+        self.assertEqual(
+            estatisticas["rapido"]["enviadas"] + estatisticas["rapido"]["descartadas"], 50
+        )
+
+    def test_politica_bloquear_aplica_contrapressao(self):
+        """Deve bloquear quem publica enquanto a fila estiver cheia."""
+        destino = DestinoMemoria(portao=self.portao)
+        config = ConfiguracaoDespacho(capacidade=2, max_lote=1, intervalo=0)
+        despachante = DespachanteNotificacoes([destino], config)
+        publicador = threading.Thread(
+            target=lambda: [despachante.publicar(_notificacao(indice)) for indice in range(10)]
+        )
+
+        publicador.start()
+        publicador.join(0.2)
+        self.assertTrue(publicador.is_alive())
+        self.portao.set()
+        publicador.join(5)
+        despachante.fechar()
+
+        self.assertEqual(sum(destino.lotes, []), [f"n{indice}" for indice in range(10)])
+        self.assertEqual(despachante.estatisticas()["memoria"]["descartadas"], 0)
+
+    def test_fechar_com_timeout_nao_bloqueia_com_a_fila_cheia(self):
+        """Deve respeitar um único prazo mesmo sem vaga para o marcador de fim."""
+        destinos = [DestinoMemoria("a", self.portao), DestinoMemoria("b", self.portao)]
+        config = ConfiguracaoDespacho(capacidade=1, max_lote=1, intervalo=0)
+        despachante = DespachanteNotificacoes(destinos, config)
+        despachante.publicar(_notificacao(0))
+        for destino in destinos:
+            self.assertTrue(destino.entrou.wait(5))
+        despachante.publicar(_notificacao(1))  # ocupa a única vaga de cada fila
+
+        inicio = time.monotonic()
+        despachante.fechar(timeout=0.2)
+        duracao = time.monotonic() - inicio
+
+        self.assertLess(duracao, 1.0)
+
+    def test_falha_de_destino_descarta_o_lote_e_segue(self):
+        """Deve contar a falha, descartar o lote e continuar entregando."""
+        metricas = Metricas(ativo=True)
+        instavel = DestinoInstavel("webhook")
+        config = ConfiguracaoDespacho(max_lote=1, intervalo=0)
+        with DespachanteNotificacoes([instavel], config, metricas) as despachante:
+            for indice in range(3):
+                despachante.publicar(_notificacao(indice))
+                despachante.flush()
+
+        self.assertEqual(instavel.lotes, [["n1"], ["n2"]])
+        self.assertEqual(
+            despachante.estatisticas()["webhook"], {"enviadas": 2, "descartadas": 0, "falhas": 1}
+        )
+        contadores = {
+            contador["rotulos"]["resultado"]: contador["valor"]
+            for contador in metricas.snapshot()["contadores"]
+            if contador["nome"] == NOTIFICACOES
+        }
+        self.assertEqual(contadores, {"enviada": 2, "falha": 1})
+
+    def test_configuracao_invalida(self):
+        """Deve recusar capacidade não positiva e intervalo negativo."""
+        with self.assertRaisesRegex(ValueError, "positivos"):
+            ConfiguracaoDespacho(capacidade=0)
+        with self.assertRaisesRegex(ValueError, "negativo"):
+            ConfiguracaoDespacho(intervalo=-1)
+
+
+class TestDestinos(unittest.TestCase):
+    """Testes para os destinos de console, arquivo e webhook."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.arquivo_path = Path(self.temp_dir.name) / "notificacoes.jsonl"
+        self.recebidos = []
+        recebidos = self.recebidos
+
+        class Receptor(BaseHTTPRequestHandler):
+            def do_POST(self):  # pylint: disable=invalid-name
+                tamanho = int(self.headers["Content-Length"])
+                recebidos.extend(json.loads(self.rfile.read(tamanho)))
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, *_args):
+                pass
+
+        self.servidor = ThreadingHTTPServer(("127.0.0.1", 0), Receptor)
+        threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        self.temp_dir.cleanup()
+
+    def test_destinos_console_arquivo_e_webhook(self):
+        """Deve entregar as mesmas notificações aos três destinos."""
+        saida = io.StringIO()
+        destinos = [
+            DestinoConsole(saida),
+            DestinoArquivo(self.arquivo_path),
+            DestinoWebhook(f"http://127.0.0.1:{self.servidor.server_port}/notificacoes"),
+        ]
+        with DespachanteNotificacoes(destinos) as despachante:
+            for indice in range(3):
+                despachante.publicar(_notificacao(indice))
+
+        self.assertEqual(saida.getvalue(), "n0\nn1\nn2\n")
+        linhas = self.arquivo_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(
+            [json.loads(linha)["dados"] for linha in linhas], [{"indice": i} for i in range(3)]
+        )
+        self.assertEqual(
+            [notificacao["mensagem"] for notificacao in self.recebidos], ["n0", "n1", "n2"]
+        )
+        self.assertEqual(
+            {estatistica["falhas"] for estatistica in despachante.estatisticas().values()}, {0}
+        )
+
+
+class TestNotificacaoService(unittest.TestCase):
+    """Testes para NotificacaoService."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.diretorio = Path(self.temp_dir.name)
+        self.cliente = Cliente(email="a@empresa.com", nome="TransLog", cnpj="11222333000181")
+        self.catalogo = ProdutoFactory.criar_catalogo_padrao()
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def test_pedido_service_notifica_em_segundo_plano(self):
+        """Deve entregar as notificações de pedidos ao despachante, sem console."""
+        destino = DestinoMemoria()
+        despachante = DespachanteNotificacoes([destino])
+        service = PedidoService(
+            PedidoRepositoryArquivo(str(self.diretorio / "pedidos.txt")),
+            notificacoes=NotificacaoService(despachante),
+        )
+
+        saida = io.StringIO()
+        with redirect_stdout(saida), eventos_configurados(Nivel.INFO):
+            for quantidade in (100, 2000):
+                service.processar_e_salvar(
+                    self.cliente,
+                    [{"produto_tipo": "diesel", "quantidade": quantidade}],
+                    self.catalogo,
+                )
+        despachante.fechar()
+
+        mensagens = sum(destino.lotes, [])
+        self.assertEqual(
+            [mensagem.split(":")[0] for mensagem in mensagens],
+            ["✓ Pedido criado para TransLog", "✓ Pedido criado para TransLog", "⚠ ALERTA"],
+        )
+        self.assertNotIn("✓ Pedido criado", saida.getvalue())
+
+    def test_despachantes_de_servicos_diferentes_sao_independentes(self):
+        """Deve publicar só no despachante injetado no serviço."""
+        destino_a, destino_b = DestinoMemoria("a"), DestinoMemoria("b")
+        with (
+            DespachanteNotificacoes([destino_a]) as despachante_a,
+            DespachanteNotificacoes([destino_b]) as despachante_b,
+        ):
+            NotificacaoService(despachante_a).notificar_cliente_criado(self.cliente)
+
+        self.assertEqual(destino_a.lotes, [["✓ Cliente cadastrado: TransLog (a@empresa.com)"]])
+        self.assertEqual(destino_b.lotes, [])
+        self.assertEqual(despachante_b.estatisticas()["b"]["enviadas"], 0)
+
+    def test_notificacao_sem_despachante_vira_evento(self):
+        """Deve emitir a notificação como evento, com a mensagem intacta."""
+        cliente = Cliente(email="{a}@empresa.com", nome="TransLog", cnpj="11222333000181")
+        service = NotificacaoService()
+        jsonl = self.diretorio / "eventos.jsonl"
+
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            with eventos_configurados(Nivel.INFO):
+                service.notificar_cliente_criado(cliente)
+            with eventos_configurados(Nivel.INFO, jsonl=jsonl):
+                service.notificar_cliente_criado(cliente)
+            # Abaixo do nível configurado, nada é escrito
+            with eventos_configurados(Nivel.AVISO):
+                service.notificar_cliente_criado(cliente)
+
+        self.assertEqual(saida.getvalue(), "✓ Cliente cadastrado: TransLog ({a}@empresa.com)\n")
+        evento = json.loads(jsonl.read_text(encoding="utf-8"))
+        self.assertEqual(evento["nivel"], "info")
+        self.assertEqual(evento["tipo"], "cliente_criado")
+        self.assertEqual(evento["dados"]["cnpj"], "11222333000181")
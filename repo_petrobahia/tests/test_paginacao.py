@@ -0,0 +1,192 @@
+"""Testes da paginação por cursor dos repositórios usando pytest."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from src.application.services.pedido_service import PedidoService
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.services.produto_factory import ProdutoFactory
+from src.repositories.cliente_repository import ClienteRepositoryArquivo
+from src.repositories.cliente_repository_sqlite import ClienteRepositorySQLite
+from src.repositories.formatos import FormatoJsonl
+from src.repositories.interfaces.i_pedido_repository import IPedidoRepository
+from src.repositories.paginacao import codificar_cursor, decodificar_cursor, paginar
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+from src.repositories.pedido_repository_sqlite import PedidoRepositorySQLite
+from src.repositories.repositorio_async import PedidoRepositoryAsync
+
+CNPJ = "11222333000181"
+OUTRO = "04252011000110"
+
+
+def _pedido(cnpj: str, quantidade: int) -> Pedido:
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    cliente = Cliente(email="a@empresa.com", nome=f"Empresa {cnpj}", cnpj=cnpj)
+    return Pedido(cliente=cliente, itens=[ItemPedido(catalogo["diesel"], quantidade)])
+
+
+def _todas_as_paginas(buscar, limite: int) -> list[list]:
+    paginas, cursor = [], None
+    while True:
+        pagina = buscar(limite, cursor)
+        paginas.append(list(pagina))
+        if pagina.proximo is None:
+            return paginas
+        cursor = pagina.proximo
+
+
+@pytest.fixture
+def pedidos_arquivo(tmp_path, capsys):
+    caminho = tmp_path / "pedidos.txt"
+    repository = PedidoRepositoryArquivo(str(caminho))
+    # Pedidos do cliente intercalados com os de outro cliente
+    for quantidade in range(1, 24):
+        repository.salvar(_pedido(CNPJ if quantidade % 3 else OUTRO, quantidade))
+    return caminho
+
+
+def test_cursor_ida_e_volta_e_invalido():
+    assert decodificar_cursor(codificar_cursor(123_456)) == 123_456
+    assert decodificar_cursor(None, inicio=20) == 20
+    for invalido in ("x", "!!!!", codificar_cursor(1) + "AAAA"):
+        with pytest.raises(ValueError, match="Cursor"):
+            decodificar_cursor(invalido)
+    with pytest.raises(ValueError, match="limite"):
+        paginar([1, 2], 0)
+
+
+def test_paginar_generico():
+    primeira = paginar(range(5), 2)
+    assert list(primeira) == [0, 1]
+    segunda = paginar(range(5), 2, primeira.proximo)
+    assert list(segunda) == [2, 3]
+    ultima = paginar(range(5), 2, segunda.proximo)
+    assert list(ultima) == [4] and ultima.proximo is None
+
+
+@pytest.mark.parametrize("busca", ["indice", "mmap"])
+@pytest.mark.parametrize("hidratacao", ["pedido", "visao"])
+def test_paginas_de_pedidos_no_arquivo(pedidos_arquivo, busca, hidratacao):
+    repository = PedidoRepositoryArquivo(
+        str(pedidos_arquivo), ConfiguracaoArquivo(busca=busca, hidratacao=hidratacao)
+    )
+
+    paginas = _todas_as_paginas(
+        lambda limite, cursor: repository.buscar_pagina_por_cliente(CNPJ, limite, cursor), 4
+    )
+
+    assert [len(pagina) for pagina in paginas] == [4, 4, 4, 4]
+    quantidades = [p.itens[0].quantidade for pagina in paginas for p in pagina]
+    assert quantidades == [q for q in range(1, 24) if q % 3]
+    assert all(p.cliente.cnpj == CNPJ for pagina in paginas for p in pagina)
+    assert len(repository.buscar_pagina_por_cliente("99", 4)) == 0
+
+
+def test_pagina_le_so_os_registros_dela(pedidos_arquivo):
+    repository = PedidoRepositoryArquivo(str(pedidos_arquivo))
+    primeira = repository.buscar_pagina_por_cliente(CNPJ, 3)
+
+    with mock.patch.object(FormatoJsonl, "ler", autospec=True, side_effect=FormatoJsonl.ler) as ler:
+        segunda = repository.buscar_pagina_por_cliente(CNPJ, 3, primeira.proximo)
+
+    assert ler.call_count == 3
+    assert [p.itens[0].quantidade for p in segunda] == [5, 7, 8]
+
+
+def test_cursor_continua_apos_novas_gravacoes(pedidos_arquivo):
+    repository = PedidoRepositoryArquivo(str(pedidos_arquivo))
+    pagina = repository.buscar_pagina_por_cliente(CNPJ, 14)
+    repository.salvar(_pedido(CNPJ, 100))
+
+    seguinte = repository.buscar_pagina_por_cliente(CNPJ, 14, pagina.proximo)
+
+    assert [p.itens[0].quantidade for p in seguinte] == [22, 23, 100]
+    assert seguinte.proximo is None
+    desalinhado = codificar_cursor(decodificar_cursor(pagina.proximo) + 3)
+    with pytest.raises(ValueError, match="Cursor"):
+        repository.buscar_pagina_por_cliente(CNPJ, 14, desalinhado)
+
+
+def test_paginas_de_clientes_no_arquivo(tmp_path, capsys):
+    repository = ClienteRepositoryArquivo(str(tmp_path / "clientes.txt"))
+    for indice in range(10):
+        repository.salvar(Cliente(email=f"c{indice}@b.com", nome=f"C{indice}", cnpj=f"{indice}"))
+
+    primeira = repository.listar_pagina(4)
+    repository.salvar(Cliente(email="novo@b.com", nome="Novo", cnpj="10"))
+    segunda = repository.listar_pagina(4, primeira.proximo)
+    terceira = repository.listar_pagina(4, segunda.proximo)
+
+    assert [c.nome for c in primeira] == ["C0", "C1", "C2", "C3"]
+    assert [c.nome for c in segunda] == ["C4", "C5", "C6", "C7"]
+    assert [c.nome for c in terceira] == ["C8", "C9", "Novo"]
+    assert terceira.proximo is None
+    desalinhado = codificar_cursor(decodificar_cursor(primeira.proximo) + 1)
+    with pytest.raises(ValueError, match="Cursor"):
+        repository.listar_pagina(4, desalinhado)
+
+
+def test_paginas_no_sqlite(tmp_path, capsys):
+    banco = tmp_path / "banco.db"
+    with ClienteRepositorySQLite(banco) as clientes, PedidoRepositorySQLite(banco) as pedidos:
+        clientes.salvar_lote(
+            Cliente(email=f"c{i}@b.com", nome=f"C{i}", cnpj=f"{i}") for i in range(7)
+        )
+        for quantidade in range(1, 12):
+            pedidos.salvar(_pedido(CNPJ if quantidade % 3 else OUTRO, quantidade))
+
+        paginas_clientes = _todas_as_paginas(clientes.listar_pagina, 3)
+        paginas_pedidos = _todas_as_paginas(
+            lambda limite, cursor: pedidos.buscar_pagina_por_cliente(CNPJ, limite, cursor), 3
+        )
+
+    assert [[c.nome for c in pagina] for pagina in paginas_clientes] == [
+        ["C0", "C1", "C2"],
+        ["C3", "C4", "C5"],
+        ["C6"],
+    ]
+    assert [[p.itens[0].quantidade for p in pagina] for pagina in paginas_pedidos] == [
+        [1, 2, 4],
+        [5, 7, 8],
+        [10, 11],
+    ]
+
+
+def test_service_pagina_pelo_adapter_assincrono(pedidos_arquivo):
+    repository = PedidoRepositoryArquivo(str(pedidos_arquivo))
+    service = PedidoService(repository, PedidoRepositoryAsync(repository))
+
+    async def buscar():
+        primeira = await service.buscar_pagina_pedidos_cliente_async(CNPJ, 2)
+        return primeira, await service.buscar_pagina_pedidos_cliente_async(
+            CNPJ, 2, primeira.proximo
+        )
+
+    primeira, segunda = asyncio.run(buscar())
+
+    assert [p.itens[0].quantidade for p in primeira] == [1, 2]
+    assert [p.itens[0].quantidade for p in segunda] == [4, 5]
+    assert service.buscar_pagina_pedidos_cliente(CNPJ, 2, segunda.proximo).proximo is not None
+
+
+def test_interface_pagina_implementacao_sem_cursor_proprio():
+    class Memoria(IPedidoRepository):
+        def salvar(self, pedido):
+            raise NotImplementedError
+
+        def buscar_por_cliente(self, cliente):
+            return [_pedido(cliente, quantidade) for quantidade in (1, 2, 3)]
+
+        def buscar_por_periodo(self, inicio, fim, cnpj=None):
+            raise NotImplementedError
+
+    pagina = Memoria().buscar_pagina_por_cliente(CNPJ, 2)
+
+    assert [p.itens[0].quantidade for p in pagina] == [1, 2]
+    assert [
+        p.itens[0].quantidade for p in Memoria().buscar_pagina_por_cliente(CNPJ, 2, pagina.proximo)
+    ] == [3]
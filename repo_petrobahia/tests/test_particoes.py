@@ -0,0 +1,243 @@
+"""Testes do repositório de pedidos particionado por período usando pytest."""
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.services.produto_factory import ProdutoFactory
+from src.main import main
+from src.repositories import migrar_particoes
+from src.repositories.blocos_comprimidos import ArquivoBlocos
+from src.repositories.formatos import FormatoJsonl
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+from src.repositories.pedido_repository_particionado import PedidoRepositoryParticionado
+from src.repositories.visao_pedido import PedidoGravadoView
+
+CNPJ = "11222333000181"
+OUTRO = "04252011000110"
+
+
+class Relogio:
+    """Relógio controlado pelo teste."""
+
+    def __init__(self, ano: int, mes: int, dia: int = 10):
+        self.agora = datetime(ano, mes, dia, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.agora
+
+    def ir_para(self, ano: int, mes: int, dia: int = 10) -> None:
+        self.agora = datetime(ano, mes, dia, tzinfo=timezone.utc)
+
+
+def _pedido(cnpj: str, quantidade: int, criado_em: datetime | None = None) -> Pedido:
+    """Pedido sem data (gravado no período do relógio) ou criado em ``criado_em``."""
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    cliente = Cliente(email="a@empresa.com", nome=f"Empresa {cnpj}", cnpj=cnpj)
+    return Pedido(
+        cliente=cliente, itens=[ItemPedido(catalogo["diesel"], quantidade)], criado_em=criado_em
+    )
+
+
+def _quantidades(pedidos) -> list[int]:
+    return [pedido.itens[0].quantidade for pedido in pedidos]
+
+
+def _todas_as_paginas(repository, cnpj: str, limite: int) -> list[list[int]]:
+    paginas, cursor = [], None
+    while True:
+        pagina = repository.buscar_pagina_por_cliente(cnpj, limite, cursor)
+        paginas.append(_quantidades(pagina))
+        if pagina.proximo is None:
+            return paginas
+        cursor = pagina.proximo
+
+
+@pytest.fixture
+def relogio():
+    return Relogio(2026, 7)
+
+
+@pytest.fixture
+def repository(tmp_path, relogio, capsys):
+    """Pedidos de dois clientes intercalados em julho, agosto e setembro de 2026."""
+    repository = PedidoRepositoryParticionado(str(tmp_path / "pedidos"), relogio=relogio)
+    for quantidade in range(1, 31):
+        if quantidade in (11, 21):
+            relogio.ir_para(2026, 7 + quantidade // 10)
+        criado_em = relogio() + timedelta(hours=quantidade)
+        repository.salvar(_pedido(CNPJ if quantidade % 3 else OUTRO, quantidade, criado_em))
+    return repository
+
+
+ESPERADAS = [quantidade for quantidade in range(1, 31) if quantidade % 3]
+
+
+def test_grava_uma_parte_por_mes_e_reabre_pelo_manifesto(repository, tmp_path, relogio):
+    assert [(parte.periodo, parte.aberta) for parte in repository.partes] == [
+        ("2026-07", True),
+        ("2026-08", True),
+        ("2026-09", True),
+    ]
+    reaberto = PedidoRepositoryParticionado(str(tmp_path / "pedidos"), relogio=relogio)
+
+    assert _quantidades(reaberto.buscar_por_cliente(CNPJ)) == ESPERADAS
+    assert len(list(reaberto.iterar_registros("2026-08", "2026-08"))) == 10
+    with pytest.raises(ValueError, match="granularidade"):
+        PedidoRepositoryParticionado(str(tmp_path / "pedidos"), granularidade="diaria")
+
+
+@pytest.mark.parametrize("compressao", ["nenhuma", "gzip", "lzma"])
+def test_compactar_periodos_encerrados(repository, relogio, compressao):
+    relogio.ir_para(2026, 9, 1)  # agosto ainda dentro da carência de um dia
+
+    assert repository.compactar(compressao) == ["2026-07"]
+    relogio.ir_para(2026, 9, 2)
+    assert repository.compactar(compressao) == ["2026-08"]
+
+    partes = repository.partes
+    assert [(parte.periodo, parte.aberta) for parte in partes] == [
+        ("2026-07", False),
+        ("2026-08", False),
+        ("2026-09", True),
+    ]
+    assert [parte.registros for parte in partes[:2]] == [10, 10]
+    assert sorted(path.suffix for path in repository.caminho.glob("2026-0[78].*")) == [
+        ".blocos",
+        ".blocos",
+    ]
+    assert _quantidades(repository.buscar_por_cliente(CNPJ)) == ESPERADAS
+    assert _quantidades(repository.buscar_por_cliente(OUTRO)) == list(range(3, 31, 3))
+    assert repository.compactar(compressao) == []
+
+
+def test_paginas_atravessam_partes_abertas_e_compactadas(repository, relogio):
+    relogio.ir_para(2026, 8, 15)
+    repository.compactar("gzip")
+
+    assert _todas_as_paginas(repository, CNPJ, 7) == [
+        ESPERADAS[:7],
+        ESPERADAS[7:14],
+        ESPERADAS[14:],
+    ]
+    # A página que termina junto com uma parte não devolve cursor vazio
+    assert _todas_as_paginas(repository, OUTRO, 3) == [[3, 6, 9], [12, 15, 18], [21, 24, 27], [30]]
+    assert _todas_as_paginas(repository, "00000000000000", 5) == [[]]
+
+
+def test_cursor_de_parte_compactada_depois_deixa_de_valer(repository, relogio):
+    pagina = repository.buscar_pagina_por_cliente(CNPJ, 2)
+    relogio.ir_para(2026, 12)
+    repository.compactar()
+
+    with pytest.raises(ValueError, match="Cursor"):
+        repository.buscar_pagina_por_cliente(CNPJ, 2, pagina.proximo)
+
+
+def test_consulta_so_abre_partes_e_blocos_necessarios(tmp_path, relogio, capsys):
+    repository = PedidoRepositoryParticionado(str(tmp_path / "pedidos"), relogio=relogio)
+    for indice in range(200):
+        repository.salvar(_pedido(f"{indice:014d}", 1))
+    relogio.ir_para(2026, 8)
+    repository.salvar(_pedido(CNPJ, 2))
+    relogio.ir_para(2026, 9)
+    repository.compactar("lzma", tamanho_bloco=1024)
+
+    with mock.patch.object(
+        ArquivoBlocos, "_bloco", autospec=True, side_effect=ArquivoBlocos._bloco
+    ) as bloco:
+        assert _quantidades(repository.buscar_por_cliente(CNPJ)) == [2]
+        # Só o bloco do cliente na parte de agosto; julho é descartada pelo filtro
+        assert bloco.call_count == 1
+        assert _quantidades(repository.buscar_por_cliente(f"{150:014d}")) == [1]
+        assert bloco.call_count == 2
+
+
+def test_visoes_de_partes_compactadas(repository, relogio):
+    relogio.ir_para(2026, 8, 15)
+    repository.compactar("gzip")
+    visoes = PedidoRepositoryParticionado(
+        str(repository.caminho), hidratacao="visao", relogio=relogio
+    )
+
+    pedidos = visoes.buscar_por_cliente(CNPJ)
+
+    assert all(isinstance(pedido, PedidoGravadoView) for pedido in pedidos)
+    assert _quantidades(pedidos) == ESPERADAS
+    assert [p.preco_total for p in pedidos] == [
+        p.preco_total for p in repository.buscar_por_cliente(CNPJ)
+    ]
+
+
+def test_gravacao_atrasada_em_periodo_compactado(repository, relogio):
+    relogio.ir_para(2026, 10)
+    repository.compactar()
+    relogio.ir_para(2026, 8, 31)
+    repository.salvar(_pedido(CNPJ, 100))
+    com_atrasado = ESPERADAS[:14] + [100] + ESPERADAS[14:]
+
+    assert [(parte.periodo, parte.aberta) for parte in repository.partes[1:3]] == [
+        ("2026-08", False),
+        ("2026-08", True),
+    ]
+    assert _quantidades(repository.buscar_por_cliente(CNPJ)) == com_atrasado
+
+    relogio.ir_para(2026, 10)
+    assert repository.compactar() == ["2026-08"]
+    assert _quantidades(repository.buscar_por_cliente(CNPJ)) == com_atrasado
+
+
+def test_instancia_com_manifesto_antigo_rele_apos_compactacao(repository, tmp_path, relogio):
+    leitor = PedidoRepositoryParticionado(str(tmp_path / "pedidos"), relogio=relogio)
+    assert _quantidades(leitor.buscar_por_cliente(CNPJ)) == ESPERADAS
+
+    relogio.ir_para(2026, 12)
+    repository.compactar("gzip")
+
+    assert _quantidades(leitor.buscar_por_cliente(CNPJ)) == ESPERADAS
+    assert not any(path.suffix == ".txt" for path in (tmp_path / "pedidos").iterdir())
+
+
+def test_migrar_arquivo_unico(tmp_path, relogio, capsys):
+    origem = tmp_path / "pedidos.txt"
+    legado = PedidoRepositoryArquivo(str(origem))
+    segmentado = PedidoRepositoryArquivo(str(origem), ConfiguracaoArquivo(segmento="worker-1"))
+    for quantidade in range(1, 11):
+        (segmentado if quantidade > 8 else legado).salvar(_pedido(CNPJ, quantidade))
+
+    total = migrar_particoes.migrar(origem, tmp_path / "pedidos", "2026-06")
+    repository = PedidoRepositoryParticionado(str(tmp_path / "pedidos"), relogio=relogio)
+    repository.salvar(_pedido(CNPJ, 11))
+
+    assert total == 10
+    assert [parte.periodo for parte in repository.partes] == ["2026-06", "2026-07"]
+    assert _quantidades(repository.buscar_por_cliente(CNPJ)) == list(range(1, 12))
+    assert _quantidades(legado.buscar_por_cliente(CNPJ)) == list(range(1, 11))
+    with pytest.raises(ValueError, match="vazio"):
+        migrar_particoes.migrar(tmp_path / "nada.txt", tmp_path / "pedidos")
+
+
+def test_cli_de_migracao_e_compactacao(tmp_path, capsys):
+    origem = tmp_path / "pedidos.txt"
+    with PedidoRepositoryArquivo(str(origem), ConfiguracaoArquivo(formato="binario")) as legado:
+        for quantidade in range(1, 6):
+            legado.salvar(_pedido(OUTRO, quantidade))
+    diretorio = tmp_path / "pedidos"
+
+    migrar_particoes.main([str(origem), str(diretorio), "--periodo", "2020-01", "--compactar"])
+    main(["compactar", "--pedidos", str(diretorio), "--compressao", "lzma"])
+
+    saida = capsys.readouterr().out
+    assert "5 pedido(s) migrado(s)" in saida
+    assert "Período(s) compactado(s): 2020-01." in saida
+    repository = PedidoRepositoryParticionado(str(diretorio))
+    assert [(p.compressao, p.registros) for p in repository.partes] == [("lzma", 5)]
+    assert _quantidades(repository.buscar_por_cliente(OUTRO)) == [1, 2, 3, 4, 5]
+    assert (
+        FormatoJsonl().agulha(OUTRO)
+        in ArquivoBlocos(diretorio / repository.partes[0].arquivo).brutos(OUTRO)[0]
+    )
@@ -0,0 +1,258 @@
+"""Testes da consulta de pedidos por período de criação usando unittest."""
+
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from src.application.services.pedido_service import PedidoService
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.services.produto_factory import ProdutoFactory
+from src.repositories import indice_tempo
+from src.repositories.formatos import FormatoJsonl
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+from src.repositories.pedido_repository_particionado import PedidoRepositoryParticionado
+from src.repositories.pedido_repository_sqlite import PedidoRepositorySQLite
+from src.repositories.repositorio_async import PedidoRepositoryAsync
+from src.repositories.visao_pedido import PedidoGravadoView
+
+CNPJ = "11222333000181"
+OUTRO = "04252011000110"
+INICIO = datetime(2026, 7, 1, tzinfo=timezone.utc)
+
+
+def _pedido(quantidade: int, criado_em: datetime | None) -> Pedido:
+    """Pedido do ``CNPJ`` (múltiplos de 3 são do ``OUTRO``) criado em ``criado_em``."""
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    cnpj = OUTRO if quantidade % 3 == 0 else CNPJ
+    cliente = Cliente(email="a@empresa.com", nome=f"Empresa {cnpj}", cnpj=cnpj)
+    return Pedido(
+        cliente=cliente, itens=[ItemPedido(catalogo["diesel"], quantidade)], criado_em=criado_em
+    )
+
+
+def _horas(quantidade: int) -> datetime:
+    return INICIO + timedelta(hours=quantidade)
+
+
+def _quantidades(pedidos) -> list[int]:
+    return [pedido.itens[0].quantidade for pedido in pedidos]
+
+
+def _esperadas(primeira: int, ultima: int, cnpj: str | None = None) -> list[int]:
+    """Quantidades dos pedidos criados de ``_horas(primeira)`` a ``_horas(ultima)`` exclusive."""
+    return [
+        quantidade
+        for quantidade in range(primeira, ultima)
+        if cnpj is None or (cnpj == OUTRO) == (quantidade % 3 == 0)
+    ]
+
+
+class _DiretorioTemporario(unittest.TestCase):
+    """Diretório temporário e blocos de 8 registros no índice de tempo."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.diretorio = Path(self.temp_dir.name)
+        # Blocos pequenos, para o índice de tempo ter vários blocos
+        bloco_pequeno = mock.patch.object(indice_tempo, "REGISTROS_POR_BLOCO", 8)
+        bloco_pequeno.start()
+        self.addCleanup(bloco_pequeno.stop)
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+
+class TestPeriodoArquivo(_DiretorioTemporario):
+    """Testes para PedidoRepositoryArquivo.buscar_por_periodo."""
+
+    def setUp(self):
+        """200 pedidos, um por hora a partir de ``INICIO``."""
+        super().setUp()
+        self.caminho = self.diretorio / "pedidos.txt"
+        self.repository = PedidoRepositoryArquivo(
+            str(self.caminho), ConfiguracaoArquivo(formato="jsonl")
+        )
+        for quantidade in range(1, 201):
+            self.repository.salvar(_pedido(quantidade, _horas(quantidade)))
+
+        # Offsets dos registros lidos pelas varreduras de faixas de bytes
+        self.leituras = []
+        original = FormatoJsonl.iterar_ate
+        leituras = self.leituras
+
+        def contar(formato, file, inicio, limite):
+            for registro in original(formato, file, inicio, limite):
+                leituras.append(registro[0])
+                yield registro
+
+        varredura = mock.patch.object(FormatoJsonl, "iterar_ate", contar)
+        varredura.start()
+        self.addCleanup(varredura.stop)
+
+    def test_periodo_le_so_os_blocos_do_intervalo(self):
+        """Deve ler só os blocos cuja faixa de instantes cruza o período."""
+        pedidos = self.repository.buscar_por_periodo(_horas(50), _horas(70))
+        self.assertEqual(_quantidades(pedidos), _esperadas(50, 70))
+        # 20 registros de 3 a 4 blocos de 8, mais o trecho final (200 = 25 blocos completos)
+        self.assertLessEqual(len(self.leituras), 32)
+
+        self.leituras.clear()
+        self.assertEqual(
+            _quantidades(self.repository.buscar_por_periodo(_horas(300), _horas(400))), []
+        )
+        self.assertEqual(self.leituras, [])
+
+    def test_periodo_com_cnpj_le_so_os_registros_do_cliente(self):
+        """Deve ler só os registros do cliente dentro dos blocos do período."""
+        pedidos = list(self.repository.buscar_por_periodo(_horas(10), _horas(100), OUTRO))
+
+        self.assertEqual(_quantidades(pedidos), _esperadas(10, 100, OUTRO))
+        self.assertEqual({pedido.cliente.cnpj for pedido in pedidos}, {OUTRO})
+        self.assertEqual(self.leituras, [])
+
+    def test_periodo_inclui_trecho_nao_indexado_e_gravacao_fora_de_ordem(self):
+        """Deve achar pedidos do trecho final e gravados com relógio atrasado."""
+        self.repository.salvar(_pedido(201, _horas(201)))
+        self.repository.salvar(_pedido(1000, _horas(55)))  # relógio atrasado de outro processo
+
+        self.assertEqual(
+            _quantidades(self.repository.buscar_por_periodo(_horas(199), _horas(300))),
+            [199, 200, 201],
+        )
+        self.assertEqual(
+            _quantidades(self.repository.buscar_por_periodo(_horas(54), _horas(56))),
+            [54, 55, 1000],
+        )
+
+    def test_periodo_sem_fuso_e_pedidos_sem_data(self):
+        """Deve tratar instantes sem fuso como UTC e ignorar pedidos sem data."""
+        self.repository.salvar(_pedido(500, None))
+        naive = _horas(10).replace(tzinfo=None)
+        em_brasilia = _horas(20).astimezone(timezone(timedelta(hours=-3)))
+
+        self.assertEqual(
+            _quantidades(self.repository.buscar_por_periodo(naive, em_brasilia)),
+            _esperadas(10, 20),
+        )
+        self.assertNotIn(
+            500, _quantidades(self.repository.buscar_por_periodo(_horas(0), datetime.max))
+        )
+        self.assertEqual(list(self.repository.buscar_por_periodo(_horas(20), _horas(10))), [])
+
+    def test_indice_de_tempo_persistido_e_reconstruido(self):
+        """Deve reaproveitar o sidecar ao reabrir e reconstruí-lo se o arquivo mudar."""
+        list(self.repository.buscar_por_periodo(_horas(1), _horas(2)))
+        sidecar = self.diretorio / "pedidos.txt.tempo"
+        self.assertEqual(len(sidecar.read_text(encoding="utf-8").splitlines()), 25)
+
+        reaberto = PedidoRepositoryArquivo(str(self.caminho))
+        self.leituras.clear()
+        self.assertEqual(
+            _quantidades(reaberto.buscar_por_periodo(_horas(100), _horas(104))),
+            list(range(100, 104)),
+        )
+        self.assertLessEqual(len(self.leituras), 16)
+
+        # Arquivo reescrito (menor): o índice acompanha
+        linhas = self.caminho.read_bytes().splitlines(keepends=True)
+        self.caminho.write_bytes(b"".join(linhas[:51]))
+        outro = PedidoRepositoryArquivo(str(self.caminho))
+        self.assertEqual(
+            _quantidades(outro.buscar_por_periodo(_horas(45), _horas(100))), _esperadas(45, 51)
+        )
+
+    def test_service_busca_pedidos_do_periodo(self):
+        """Deve devolver os mesmos pedidos nas buscas síncrona e assíncrona."""
+        service = PedidoService(self.repository, PedidoRepositoryAsync(self.repository))
+
+        sincrono = service.buscar_pedidos_periodo(_horas(10), _horas(20), CNPJ)
+        assincrono = asyncio.run(service.buscar_pedidos_periodo_async(_horas(10), _horas(20), CNPJ))
+
+        self.assertEqual(_quantidades(sincrono), _esperadas(10, 20, CNPJ))
+        self.assertEqual(_quantidades(assincrono), _esperadas(10, 20, CNPJ))
+
+
+class TestPeriodoOutrosRepositorios(_DiretorioTemporario):
+    """Testes de buscar_por_periodo em outros modos e repositórios."""
+
+    def test_periodo_em_outros_modos(self):
+        """Deve filtrar o período com visões e com a busca por mmap."""
+        caminho = str(self.diretorio / "pedidos.txt")
+        with PedidoRepositoryArquivo(caminho, ConfiguracaoArquivo(formato="binario")) as gravador:
+            for quantidade in range(1, 41):
+                gravador.salvar(_pedido(quantidade, _horas(quantidade)))
+
+        for busca, hidratacao in [("indice", "visao"), ("mmap", "pedido")]:
+            with self.subTest(busca=busca, hidratacao=hidratacao):
+                repository = PedidoRepositoryArquivo(
+                    caminho, ConfiguracaoArquivo(busca=busca, hidratacao=hidratacao)
+                )
+
+                pedidos = list(repository.buscar_por_periodo(_horas(5), _horas(30), CNPJ))
+
+                self.assertEqual(_quantidades(pedidos), _esperadas(5, 30, CNPJ))
+                self.assertEqual(pedidos[0].criado_em, _horas(5))
+                self.assertEqual(isinstance(pedidos[0], PedidoGravadoView), hidratacao == "visao")
+
+    def test_periodo_no_sqlite(self):
+        """Deve usar o índice por data do SQLite, com e sem CNPJ."""
+        with PedidoRepositorySQLite(self.diretorio / "banco.db") as repository:
+            for quantidade in range(1, 31):
+                repository.salvar(_pedido(quantidade, _horas(quantidade)))
+            repository.salvar(_pedido(31, None))
+
+            do_periodo = repository.buscar_por_periodo(_horas(5), _horas(12))
+            do_outro = repository.buscar_por_periodo(_horas(0), _horas(99), OUTRO)
+
+            self.assertEqual(_quantidades(do_periodo), _esperadas(5, 12))
+            self.assertEqual(_quantidades(do_outro), list(range(3, 31, 3)))
+            self.assertEqual(repository.buscar_por_cliente(CNPJ)[0].criado_em, _horas(1))
+
+    def test_periodo_no_particionado_le_so_partes_do_intervalo(self):
+        """Deve abrir só as partes dos períodos do intervalo."""
+        repository = PedidoRepositoryParticionado(
+            str(self.diretorio / "pedidos"),
+            relogio=lambda: datetime(2026, 12, 1, tzinfo=timezone.utc),
+        )
+        # Um pedido a cada 12 horas: julho a outubro de 2026
+        for quantidade in range(1, 240):
+            repository.salvar(_pedido(quantidade, _horas(12 * quantidade)))
+        repository.compactar("gzip")
+        repository.salvar(_pedido(1000, _horas(12 * 70) + timedelta(minutes=1)))
+
+        self.assertEqual(
+            [(parte.periodo, parte.aberta) for parte in repository.partes],
+            [
+                ("2026-07", False),
+                ("2026-08", False),
+                ("2026-08", True),
+                ("2026-09", False),
+                ("2026-10", False),
+            ],
+        )
+        agosto = datetime(2026, 8, 1, tzinfo=timezone.utc)
+        setembro = datetime(2026, 9, 1, tzinfo=timezone.utc)
+        with mock.patch.object(
+            PedidoRepositoryParticionado,
+            "_blocos",
+            autospec=True,
+            side_effect=PedidoRepositoryParticionado._blocos,
+        ) as blocos:
+            do_outro = _quantidades(repository.buscar_por_periodo(agosto, setembro, OUTRO))
+            depois_do_atraso = _quantidades(
+                repository.buscar_por_periodo(_horas(12 * 70), setembro)
+            )
+
+        self.assertEqual(sorted(do_outro), [q for q in range(62, 124) if q % 3 == 0])
+        self.assertEqual(sorted(depois_do_atraso), [*range(70, 124), 1000])
+        # Julho e outubro nem são abertas; setembro entra porque o fim cai no seu início
+        self.assertEqual(
+            {chamada.args[1].periodo for chamada in blocos.call_args_list}, {"2026-08", "2026-09"}
+        )
@@ -0,0 +1,191 @@
+"""Testes para a política de desconto por faixas usando pytest."""
+
+import json
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.policies.desconto.politica_desconto_faixas import (
+    FaixaDesconto,
+    PoliticaDescontoFaixas,
+)
+from src.domain.policies.desconto.politica_desconto_produto_disel import (
+    PoliticaDescontoProdutoDisel,
+)
+from src.domain.policies.desconto.politica_desconto_produto_etanol import (
+    PoliticaDescontoProdutoEtanol,
+)
+from src.domain.policies.desconto.politica_desconto_produto_gasolina import (
+    PoliticaDescontoProdutoGasolina,
+)
+from src.domain.policies.desconto.tabela_descontos import carregar_tabela
+from src.domain.services.produto_factory import ProdutoFactory
+
+
+# Regras anteriores à tabela, escritas como cadeias de ``if``
+def _diesel(preco, quantidade):
+    if quantidade > 1000:
+        return preco * quantidade * 0.10
+    if quantidade > 500:
+        return preco * quantidade * 0.05
+    return 0.0
+
+
+def _etanol(preco, quantidade):
+    return preco * quantidade * 0.03 if quantidade > 80 else 0.0
+
+
+def _gasolina(preco, quantidade):
+    return 100.0 if quantidade > 200 else 0.0
+
+
+@pytest.mark.parametrize(
+    "politica, regra, preco",
+    [
+        (PoliticaDescontoProdutoDisel(), _diesel, 5.5),
+        (PoliticaDescontoProdutoEtanol(), _etanol, 4.8),
+        (PoliticaDescontoProdutoGasolina(), _gasolina, 6.2),
+    ],
+    ids=["diesel", "etanol", "gasolina"],
+)
+def test_resultados_identicos_as_regras_anteriores(politica, regra, preco):
+    """Deve reproduzir bit a bit os descontos das regras codificadas."""
+    quantidades = list(range(1, 2501))
+    esperado = [regra(preco, q) for q in quantidades]
+
+    individuais = [
+        politica.calcular_desconto(SimpleNamespace(preco_unitario=preco, quantidade=q))
+        for q in quantidades
+    ]
+    lote = politica.calcular_descontos_lote([preco] * len(quantidades), quantidades)
+
+    assert individuais == esperado
+    assert lote == esperado
+
+
+class TestPoliticaDescontoFaixas:
+    """Testes para a compilação e resolução das faixas."""
+
+    def test_limites_sao_exclusivos_e_faixas_ordenadas(self):
+        """Deve aplicar a faixa só acima do limite, independente da ordem declarada."""
+        politica = PoliticaDescontoFaixas(
+            [FaixaDesconto(100, "fixo", 20.0), FaixaDesconto(10, "percentual", 0.5)]
+        )
+
+        descontos = politica.calcular_descontos_lote([2.0] * 4, [10, 11, 100, 101])
+
+        assert descontos == [0.0, 11.0, 100.0, 20.0]
+        assert [f.acima_de for f in politica.faixas] == [10, 100]
+
+    def test_limites_repetidos_rejeitados(self):
+        """Deve recusar duas faixas com o mesmo limite."""
+        with pytest.raises(ValueError):
+            PoliticaDescontoFaixas(
+                [FaixaDesconto(10, "fixo", 1.0), FaixaDesconto(10, "percentual", 0.1)]
+            )
+
+    @pytest.mark.parametrize(
+        "acima_de, tipo, valor",
+        [
+            (10, "progressivo", 0.1),
+            (-1, "fixo", 1.0),
+            (10.5, "fixo", 1.0),
+            (10, "percentual", 1.5),
+            (10, "fixo", -1),
+            (10, "fixo", float("inf")),
+        ],
+    )
+    def test_faixa_invalida(self, acima_de, tipo, valor):
+        """Deve recusar tipo, limite ou valor inválidos."""
+        with pytest.raises(ValueError):
+            FaixaDesconto(acima_de, tipo, valor)
+
+    def test_copia_serializada_calcula_igual(self):
+        """Deve calcular igual depois de ir e voltar por pickle (workers da importação)."""
+        politica = PoliticaDescontoProdutoDisel()
+
+        copia = pickle.loads(pickle.dumps(politica))
+
+        assert type(copia) is PoliticaDescontoProdutoDisel
+        assert copia.faixas == politica.faixas
+        assert copia.calcular_descontos_lote([5.5] * 3, [500, 501, 1001]) == [
+            0.0,
+            _diesel(5.5, 501),
+            _diesel(5.5, 1001),
+        ]
+
+
+class TestTabelaDescontos:
+    """Testes para o carregamento da tabela de faixas."""
+
+    def test_carregar_arquivo(self, tmp_path):
+        """Deve compilar uma política por produto do arquivo."""
+        caminho = tmp_path / "descontos.json"
+        caminho.write_text(
+            json.dumps({"diesel": [{"acima_de": 0, "tipo": "percentual", "valor": 0.2}]})
+        )
+
+        tabela = carregar_tabela(caminho)
+
+        item = SimpleNamespace(preco_unitario=5.0, quantidade=10)
+        assert tabela["diesel"].calcular_desconto(item) == 10.0
+
+    def test_arquivo_invalido(self, tmp_path):
+        """Deve apontar o produto com faixas inválidas."""
+        caminho = tmp_path / "descontos.json"
+        caminho.write_text(json.dumps({"diesel": [{"acima_de": 10, "tipo": "percentual"}]}))
+
+        with pytest.raises(ValueError, match="diesel"):
+            carregar_tabela(caminho)
+
+    @pytest.mark.parametrize("acima_de", [1000.5, "500", True])
+    def test_limite_nao_inteiro_rejeitado(self, tmp_path, acima_de):
+        """Deve recusar limites não inteiros em vez de truncá-los."""
+        caminho = tmp_path / "descontos.json"
+        faixa = {"acima_de": acima_de, "tipo": "fixo", "valor": 1}
+        caminho.write_text(json.dumps({"diesel": [faixa]}))
+
+        with pytest.raises(ValueError, match="inteiro"):
+            carregar_tabela(caminho)
+
+    def test_limite_inteiro_em_float_aceito(self, tmp_path):
+        """Deve aceitar limites inteiros escritos como ``1000.0``."""
+        caminho = tmp_path / "descontos.json"
+        caminho.write_text(
+            json.dumps({"diesel": [{"acima_de": 1000.0, "tipo": "fixo", "valor": 1}]})
+        )
+
+        assert carregar_tabela(caminho)["diesel"].faixas == (FaixaDesconto(1000, "fixo", 1.0),)
+
+    def test_politicas_nomeadas_usam_arquivo_configurado(self, tmp_path, monkeypatch):
+        """Deve ler as faixas das políticas nomeadas de ``PETROBAHIA_DESCONTOS``."""
+        caminho = tmp_path / "descontos.json"
+        caminho.write_text(json.dumps({"diesel": [{"acima_de": 10, "tipo": "fixo", "valor": 3}]}))
+        monkeypatch.setenv("PETROBAHIA_DESCONTOS", str(caminho))
+
+        politica = PoliticaDescontoProdutoDisel()
+
+        assert politica.faixas == (FaixaDesconto(10, "fixo", 3.0),)
+
+    def test_factory_usa_tabela_configurada(self, tmp_path):
+        """Deve criar produtos com as faixas do arquivo configurado."""
+        caminho = tmp_path / "descontos.json"
+        caminho.write_text(
+            json.dumps({"lubrificante": [{"acima_de": 5, "tipo": "fixo", "valor": 7}]})
+        )
+        try:
+            ProdutoFactory.configurar_descontos(str(caminho))
+            produto = ProdutoFactory.criar("lubrificante")
+            sem_faixa = ProdutoFactory.criar("diesel")
+        finally:
+            ProdutoFactory.configurar_descontos()
+
+        item = SimpleNamespace(preco_unitario=35.0, quantidade=6)
+        assert produto.politica_desconto.calcular_desconto(item) == 7.0
+        assert (
+            sem_faixa.politica_desconto.calcular_desconto(
+                SimpleNamespace(preco_unitario=5.5, quantidade=2000)
+            )
+            == 0.0
+        )
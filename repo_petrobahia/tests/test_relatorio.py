@@ -0,0 +1,108 @@
+"""Testes para os relatórios de vendas em streaming usando pytest."""
+
+import pytest
+
+from src.application.services.pedido_service import PedidoService
+from src.application.services.relatorio_service import (
+    CUPOM_NAO_REGISTRADO,
+    SEM_CUPOM,
+    AgregadorVendas,
+    RelatorioService,
+)
+from src.domain.models.cliente import Cliente
+from src.domain.services.produto_factory import ProdutoFactory
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+
+PEDIDOS = [
+    ("1", [("diesel", 1200, "MEGA10"), ("gasolina", 300, None)]),
+    ("2", [("etanol", 100, "NOVO5")]),
+    ("1", [("lubrificante", 12, "LUB2")]),
+    ("3", [("diesel", 600, None)]),
+]
+
+
+@pytest.fixture(name="pedidos_salvos", params=["jsonl", "binario", "legado"])
+def fixture_pedidos_salvos(tmp_path, request):
+    repository = PedidoRepositoryArquivo(
+        str(tmp_path / "pedidos.txt"), ConfiguracaoArquivo(formato=request.param)
+    )
+    service = PedidoService(repository)
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    pedidos = []
+    for repeticao in range(5):
+        for cnpj, itens in PEDIDOS:
+            cliente = Cliente(email="a@b.com", nome=f"Cliente {cnpj}", cnpj=cnpj)
+            itens_dados = [
+                {"produto_tipo": tipo, "quantidade": quantidade + repeticao, "cupom_codigo": cupom}
+                for tipo, quantidade, cupom in itens
+            ]
+            pedido = service.processar_e_salvar(cliente, itens_dados, catalogo)
+            pedidos.append(pedido)
+    return repository, pedidos
+
+
+@pytest.fixture(name="repository")
+def fixture_repository(pedidos_salvos):
+    return pedidos_salvos[0]
+
+
+class TestRelatorioService:
+    """Testes para RelatorioService."""
+
+    def test_totais_conferem_com_pedidos(self, pedidos_salvos):
+        """Deve somar os mesmos valores gravados em cada pedido."""
+        repository, pedidos = pedidos_salvos
+        relatorio = RelatorioService(repository).gerar()
+
+        assert relatorio.totais.pedidos == len(pedidos) == 20
+        assert relatorio.totais.itens == 25
+        assert relatorio.totais.receita == pytest.approx(sum(p.preco_total for p in pedidos))
+        assert relatorio.por_produto["diesel"].pedidos == 10
+        assert relatorio.por_cupom[SEM_CUPOM].pedidos == 10
+        assert relatorio.por_cupom["MEGA10"].desconto_cupom > 0
+
+    def test_top_n(self, repository):
+        """Deve ordenar clientes e produtos por receita."""
+        relatorio = RelatorioService(repository).gerar(top_n=2)
+
+        assert [cnpj for cnpj, _, _ in relatorio.top_clientes] == ["1", "3"]
+        assert relatorio.top_clientes[0][1] == "Cliente 1"
+        assert [tipo for tipo, _ in relatorio.top_produtos] == ["diesel", "gasolina"]
+
+    def test_multiprocesso_igual_ao_sequencial(self, repository):
+        """Deve produzir o mesmo relatório ao agregar faixas em paralelo."""
+        sequencial = RelatorioService(repository).gerar()
+        paralelo = RelatorioService(repository).gerar(workers=3)
+
+        assert paralelo.totais.pedidos == sequencial.totais.pedidos
+        assert paralelo.totais.receita == pytest.approx(sequencial.totais.receita)
+        assert paralelo.por_cupom.keys() == sequencial.por_cupom.keys()
+
+
+class TestParticionar:
+    """Testes para a divisão do arquivo em faixas alinhadas."""
+
+    def test_faixas_cobrem_todos_os_registros(self, repository):
+        """Deve percorrer cada registro exatamente uma vez."""
+        faixas = repository.particionar(7)
+        registros = [r for inicio, fim in faixas for r in repository.iterar_registros(inicio, fim)]
+
+        assert len(faixas) > 1
+        assert registros == list(repository.iterar_registros())
+
+
+def test_registro_antigo_sem_codigo_de_cupom():
+    """Deve separar descontos de cupom sem código persistido."""
+    item = {
+        "produto_tipo": "diesel",
+        "quantidade": 10,
+        "preco_unitario": 5.5,
+        "desconto_produto": 0.0,
+        "desconto_cupom": 5.5,
+        "preco_final": 49.5,
+    }
+    registro = {"cliente": {"nome": "A", "email": "a@b.com", "cnpj": "1"}, "itens": [item]}
+
+    relatorio = AgregadorVendas().consumir([registro]).relatorio()
+
+    assert relatorio.por_cupom[CUPOM_NAO_REGISTRADO].desconto_cupom == 5.5
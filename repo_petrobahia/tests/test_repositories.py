@@ -1,8 +1,10 @@
 """Testes para repositórios usando unittest com mocks."""
 
+import os
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest import mock
 
 from src.domain.models.cliente import Cliente
 from src.domain.models.item_pedido import ItemPedido
@@ -10,8 +12,13 @@ from src.domain.models.pedido import Pedido
 from src.domain.models.produto import Produto
 from src.domain.policies.cupom import CupomNulo
 from src.domain.policies.desconto.politica_desconto_produto_none import PoliticaDescontoProdutoNone
+from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.produto_factory import ProdutoFactory
 from src.repositories.cliente_repository import ClienteRepositoryArquivo
-from src.repositories.pedido_repository import PedidoRepositoryArquivo
+from src.repositories.escritor_agrupado import ConfiguracaoEscrita
+from src.repositories.formatos import FormatoJsonl
+from src.repositories.pedido_repository import ConfiguracaoArquivo, PedidoRepositoryArquivo
+from src.repositories.visao_pedido import PedidoGravadoView
 
 
 class TestClienteRepository(unittest.TestCase):
@@ -60,6 +67,56 @@ class TestClienteRepository(unittest.TestCase):
         clientes = list(self.repository.listar())
         self.assertEqual(len(clientes), 0)
 
+    def test_buscar_por_cnpj(self):
+        """Deve encontrar cliente pelo CNPJ e retornar None se ausente."""
+        self.repository.salvar(Cliente(email="a@empresa.com", nome="Empresa 1", cnpj="1"))
+        self.repository.salvar(Cliente(email="b@empresa.com", nome="Empresa 2", cnpj="2"))
+
+        self.assertEqual(self.repository.buscar_por_cnpj("2").nome, "Empresa 2")
+        self.assertIsNone(self.repository.buscar_por_cnpj("3"))
+
+    def test_buscar_por_cnpj_ve_escrita_externa(self):
+        """Deve enxergar clientes gravados por outra instância após a carga."""
+        self.repository.salvar(Cliente(email="a@empresa.com", nome="Empresa 1", cnpj="1"))
+        self.assertIsNone(self.repository.buscar_por_cnpj("2"))
+
+        outro = ClienteRepositoryArquivo(str(self.arquivo_path))
+        outro.salvar(Cliente(email="b@empresa.com", nome="Empresa 2", cnpj="2"))
+
+        self.assertEqual(self.repository.buscar_por_cnpj("2").nome, "Empresa 2")
+
+    def test_buscar_por_cnpj_apos_reescrita(self):
+        """Deve recarregar o cache se o arquivo for reescrito."""
+        self.repository.salvar(Cliente(email="a@empresa.com", nome="Empresa 1", cnpj="1"))
+        self.repository.buscar_por_cnpj("1")
+        conteudo = self.arquivo_path.read_text(encoding="utf-8")
+        self.arquivo_path.write_text(conteudo.replace("Empresa 1", "Empresa X"), encoding="utf-8")
+        # Garante mtime diferente mesmo em sistemas de arquivos de baixa resolução
+        estado = self.arquivo_path.stat()
+        os.utime(self.arquivo_path, ns=(estado.st_atime_ns, estado.st_mtime_ns + 10**9))
+
+        self.assertEqual(self.repository.buscar_por_cnpj("1").nome, "Empresa X")
+
+    def test_buscar_por_cnpj_apos_reescrita_maior(self):
+        """Deve recarregar o cache se o arquivo reescrito ficar maior."""
+        self.repository.salvar(Cliente(email="a@empresa.com", nome="Empresa 1", cnpj="1"))
+        self.repository.buscar_por_cnpj("1")
+        conteudo = self.arquivo_path.read_text(encoding="utf-8")
+        self.arquivo_path.write_text(conteudo.replace("Empresa 1", "Empresa Um"), encoding="utf-8")
+
+        self.assertEqual(self.repository.buscar_por_cnpj("1").nome, "Empresa Um")
+
+    def test_buscar_por_cnpj_com_limite_lru(self):
+        """Deve reler do disco clientes expulsos do cache limitado."""
+        repository = ClienteRepositoryArquivo(str(self.arquivo_path), max_cache=2)
+        for i in range(5):
+            repository.salvar(Cliente(email="a@empresa.com", nome=f"Empresa {i}", cnpj=str(i)))
+
+        nomes = [repository.buscar_por_cnpj(str(i)).nome for i in range(5)]
+
+        self.assertEqual(nomes, [f"Empresa {i}" for i in range(5)])
+        self.assertLessEqual(len(repository._cache._clientes), 2)
+
 
 class TestPedidoRepository(unittest.TestCase):
     """Testes para PedidoRepositoryArquivo."""
@@ -120,6 +177,257 @@ class TestPedidoRepository(unittest.TestCase):
         pedidos = self.repository.buscar_por_cliente("99999999000199")
         self.assertEqual(len(pedidos), 0)
 
+    def _salvar_pedido(self, repository, cnpj: str, quantidade: int = 10):
+        cliente = Cliente(email="teste@empresa.com", nome=f"Empresa {cnpj}", cnpj=cnpj)
+        produto = Produto(tipo="diesel", preco=5.5, politica_desconto=PoliticaDescontoProdutoNone())
+        item = ItemPedido(produto=produto, quantidade=quantidade, cupom=CupomNulo())
+        repository.salvar(Pedido(cliente=cliente, itens=[item]))
+
+    def test_salvar_atualiza_indice(self):
+        """Deve registrar no sidecar o offset de cada pedido salvo."""
+        self._salvar_pedido(self.repository, "11111111000199")
+        self._salvar_pedido(self.repository, "22222222000199")
+
+        indice_path = Path(str(self.arquivo_path) + ".idx")
+        linhas = indice_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(
+            [linha.split("\t")[0] for linha in linhas], ["11111111000199", "22222222000199"]
+        )
+        dados = self.arquivo_path.read_bytes()
+        for linha in linhas:
+            offset = int(linha.split("\t")[1])
+            self.assertTrue(dados[offset:].startswith(b"{"))
+
+    def test_indice_reconstruido_se_ausente(self):
+        """Deve reconstruir o índice quando o sidecar não existir."""
+        self._salvar_pedido(self.repository, "11111111000199", quantidade=10)
+        self._salvar_pedido(self.repository, "22222222000199")
+        self._salvar_pedido(self.repository, "11111111000199", quantidade=20)
+        Path(str(self.arquivo_path) + ".idx").unlink()
+
+        pedidos = PedidoRepositoryArquivo(str(self.arquivo_path)).buscar_por_cliente(
+            "11111111000199"
+        )
+
+        self.assertEqual([p.itens[0].quantidade for p in pedidos], [10, 20])
+
+    def test_indice_acompanha_escrita_externa(self):
+        """Deve indexar pedidos anexados por outra instância do repositório."""
+        self._salvar_pedido(self.repository, "11111111000199")
+        self.repository.buscar_por_cliente("11111111000199")
+
+        outro = PedidoRepositoryArquivo(
+            str(self.arquivo_path),
+            ConfiguracaoArquivo(caminho_indice=str(self.arquivo_path) + ".outro"),
+        )
+        self._salvar_pedido(outro, "11111111000199", quantidade=30)
+
+        pedidos = self.repository.buscar_por_cliente("11111111000199")
+        self.assertEqual([p.itens[0].quantidade for p in pedidos], [10, 30])
+
+    def test_indice_obsoleto_apos_reescrita(self):
+        """Deve reconstruir o índice se o arquivo de dados for reescrito."""
+        self._salvar_pedido(self.repository, "11111111000199")
+        self._salvar_pedido(self.repository, "22222222000199")
+        linhas = self.arquivo_path.read_text(encoding="utf-8").splitlines(keepends=True)
+        self.arquivo_path.write_text(linhas[0] + linhas[2] + linhas[1], encoding="utf-8")
+
+        pedidos = self.repository.buscar_por_cliente("22222222000199")
+
+        self.assertEqual(len(pedidos), 1)
+        self.assertEqual(pedidos[0].cliente.cnpj, "22222222000199")
+
+    def test_busca_mmap_igual_a_indice(self):
+        """Deve achar os mesmos pedidos varrendo o arquivo mapeado em memória."""
+        self._salvar_pedido(self.repository, "1", quantidade=10)
+        self._salvar_pedido(self.repository, "11")
+        # CNPJ procurado aparece em outro campo de outro cliente
+        cliente = Cliente(email="1@empresa.com", nome="1", cnpj="22")
+        produto = Produto(tipo="diesel", preco=5.5, politica_desconto=PoliticaDescontoProdutoNone())
+        self.repository.salvar(Pedido(cliente=cliente, itens=[ItemPedido(produto, 1, CupomNulo())]))
+        self._salvar_pedido(self.repository, "1", quantidade=20)
+
+        repository = PedidoRepositoryArquivo(
+            str(self.arquivo_path), ConfiguracaoArquivo(busca="mmap")
+        )
+        pedidos = repository.buscar_por_cliente("1")
+
+        self.assertEqual([p.itens[0].quantidade for p in pedidos], [10, 20])
+        self.assertEqual(repository.buscar_por_cliente("99"), [])
+        self.assertEqual(
+            [p.cliente.cnpj for p in pedidos],
+            [p.cliente.cnpj for p in self.repository.buscar_por_cliente("1")],
+        )
+
+    def test_busca_mmap_nao_mantem_indice(self):
+        """Deve dispensar o sidecar de índice no modo mmap."""
+        repository = PedidoRepositoryArquivo(
+            str(self.arquivo_path), ConfiguracaoArquivo(busca="mmap")
+        )
+        self._salvar_pedido(repository, "1")
+
+        self.assertFalse(Path(str(self.arquivo_path) + ".idx").exists())
+        self.assertEqual(len(repository.buscar_por_cliente("1")), 1)
+
+    def test_buscar_preserva_valores_e_cupom_gravados(self):
+        """Deve devolver os valores da venda, sem recalcular descontos."""
+        cliente = Cliente(email="a@empresa.com", nome="Empresa A", cnpj="11111111000199")
+        # Sem desconto de produto na venda; a política atual do diesel daria 10%
+        produto = Produto(tipo="diesel", preco=5.5, politica_desconto=PoliticaDescontoProdutoNone())
+        pedido = Pedido(cliente, [ItemPedido(produto, 1200, CupomFactory.criar("MEGA10"))])
+        self.repository.salvar(pedido)
+
+        (lido,) = self.repository.buscar_por_cliente("11111111000199")
+
+        item = lido.itens[0]
+        self.assertEqual(item.desconto_produto, 0.0)
+        self.assertEqual(item.desconto_cupom, pedido.itens[0].desconto_cupom)
+        self.assertEqual(item.preco_final, pedido.itens[0].preco_final)
+        self.assertEqual(lido.preco_total, pedido.preco_total)
+        self.assertIs(item.cupom, pedido.itens[0].cupom)
+        self.assertEqual(item.cupom.codigo, "MEGA10")
+
+    def test_hidratacao_em_visoes(self):
+        """Deve devolver views que decodificam cada registro uma única vez, na leitura."""
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        cliente = Cliente(email="a@empresa.com", nome="Empresa A", cnpj="11111111000199")
+        pedido = Pedido(
+            cliente,
+            [
+                ItemPedido(catalogo["diesel"], 1200, CupomFactory.criar("MEGA10")),
+                ItemPedido(catalogo["lubrificante"], 3, CupomFactory.criar("LUB2")),
+            ],
+        )
+        self.repository.salvar(pedido)
+        self._salvar_pedido(self.repository, "22222222000199")
+        repository = PedidoRepositoryArquivo(
+            str(self.arquivo_path), ConfiguracaoArquivo(hidratacao="visao")
+        )
+
+        with mock.patch.object(
+            FormatoJsonl, "ler", autospec=True, side_effect=FormatoJsonl.ler
+        ) as ler:
+            (view,) = repository.buscar_por_cliente("11111111000199")
+            self.assertIsInstance(view, PedidoGravadoView)
+            self.assertEqual(view.preco_total, pedido.preco_total)
+            self.assertEqual(view.cliente.cnpj, "11111111000199")
+            self.assertEqual(ler.call_count, 1)
+
+        self.assertEqual(view.cliente, cliente)
+        self.assertEqual([i.cupom_codigo for i in view.itens], ["MEGA10", "LUB2"])
+        for original, item in zip(pedido.itens, view.itens, strict=True):
+            self.assertEqual(item.produto.tipo, original.produto.tipo)
+            self.assertEqual(item.preco_bruto, original.preco_bruto)
+            self.assertEqual(item.desconto_produto, original.desconto_produto)
+            self.assertEqual(item.desconto_cupom, original.desconto_cupom)
+            self.assertEqual(item.preco_final, original.preco_final)
+        self.assertEqual(view.para_pedido().preco_total, pedido.preco_total)
+
+    def test_visoes_com_indice_obsoleto_e_mmap(self):
+        """Deve reconstruir o índice e varrer por mmap também no modo de views."""
+        self._salvar_pedido(self.repository, "11111111000199", quantidade=10)
+        self._salvar_pedido(self.repository, "22222222000199", quantidade=20)
+        linhas = self.arquivo_path.read_text(encoding="utf-8").splitlines(keepends=True)
+        self.arquivo_path.write_text(linhas[0] + linhas[2] + linhas[1], encoding="utf-8")
+
+        for busca in ("indice", "mmap"):
+            with self.subTest(busca=busca):
+                repository = PedidoRepositoryArquivo(
+                    str(self.arquivo_path), ConfiguracaoArquivo(busca=busca, hidratacao="visao")
+                )
+                pedidos = self.repository.buscar_por_cliente("22222222000199")
+                views = repository.buscar_por_cliente("22222222000199")
+
+                self.assertEqual([v.itens[0].quantidade for v in views], [20])
+                self.assertEqual(views[0].preco_total, pedidos[0].preco_total)
+
+        with self.assertRaises(ValueError):
+            ConfiguracaoArquivo(hidratacao="dict")
+
+    def test_visoes_com_offset_em_registro_que_cita_o_cnpj(self):
+        """Deve conferir o CNPJ decodificado, não só a presença dos bytes no registro."""
+        self._salvar_pedido(self.repository, "11111111000199", quantidade=10)
+        # Registro de outro cliente que contém o CNPJ procurado em outro campo
+        cliente = Cliente(email="a@empresa.com", nome="11111111000199", cnpj="22222222000199")
+        produto = Produto(tipo="diesel", preco=5.5, politica_desconto=PoliticaDescontoProdutoNone())
+        self.repository.salvar(
+            Pedido(cliente=cliente, itens=[ItemPedido(produto, 20, CupomNulo())])
+        )
+        linhas = self.arquivo_path.read_text(encoding="utf-8").splitlines(keepends=True)
+        self.arquivo_path.write_text(linhas[0] + linhas[2] + linhas[1], encoding="utf-8")
+
+        repository = PedidoRepositoryArquivo(
+            str(self.arquivo_path), ConfiguracaoArquivo(hidratacao="visao")
+        )
+        views = repository.buscar_por_cliente("11111111000199")
+
+        self.assertEqual([v.cliente.cnpj for v in views], ["11111111000199"])
+        self.assertEqual([v.itens[0].quantidade for v in views], [10])
+
+    def test_agregados_atualizados_ao_salvar(self):
+        """Deve somar cada pedido salvo nos totais do cliente."""
+        self._salvar_pedido(self.repository, "11111111000199", quantidade=10)
+        self._salvar_pedido(self.repository, "22222222000199")
+        self._salvar_pedido(self.repository, "11111111000199", quantidade=20)
+
+        agregado = self.repository.agregado_cliente("11111111000199")
+
+        self.assertEqual(agregado.pedidos, 2)
+        self.assertEqual(agregado.quantidade, 30)
+        self.assertAlmostEqual(agregado.total, 30 * 5.5)
+        self.assertAlmostEqual(agregado.ultimo_pedido_total, 20 * 5.5)
+        self.assertIsNone(self.repository.agregado_cliente("99999999000199"))
+
+        recarregado = PedidoRepositoryArquivo(str(self.arquivo_path))
+        self.assertEqual(recarregado.agregado_cliente("11111111000199"), agregado)
+
+    def test_agregados_acompanham_escrita_externa(self):
+        """Deve somar pedidos anexados por outra instância do repositório."""
+        self._salvar_pedido(self.repository, "11111111000199")
+        self.repository.agregado_cliente("11111111000199")
+
+        self._salvar_pedido(PedidoRepositoryArquivo(str(self.arquivo_path)), "11111111000199")
+
+        self.assertEqual(self.repository.agregado_cliente("11111111000199").pedidos, 2)
+
+    def test_agregados_reconstruidos(self):
+        """Deve recalcular os totais se o sidecar for perdido ou reconstruído."""
+        for quantidade in (10, 20, 30):
+            self._salvar_pedido(self.repository, "11111111000199", quantidade=quantidade)
+        esperado = self.repository.agregado_cliente("11111111000199")
+        Path(str(self.arquivo_path) + ".agg").unlink()
+
+        repository = PedidoRepositoryArquivo(str(self.arquivo_path))
+        self.assertEqual(repository.agregado_cliente("11111111000199"), esperado)
+        repository.reconstruir_agregados()
+        self.assertEqual(repository.agregado_cliente("11111111000199"), esperado)
+
+    def test_agregados_com_escrita_agrupada(self):
+        """Deve atualizar os totais quando o lote for gravado."""
+        with PedidoRepositoryArquivo(
+            str(self.arquivo_path),
+            ConfiguracaoArquivo(escrita=ConfiguracaoEscrita(max_registros=2, intervalo=None)),
+        ) as repository:
+            for quantidade in (10, 20, 30):
+                self._salvar_pedido(repository, "11111111000199", quantidade=quantidade)
+
+            self.assertEqual(repository.agregado_cliente("11111111000199").quantidade, 60)
+
+    def test_sidecar_de_agregados_compactado(self):
+        """Deve manter o sidecar proporcional à quantidade de clientes."""
+        for _ in range(1100):
+            self._salvar_pedido(self.repository, "11111111000199")
+
+        linhas = Path(str(self.arquivo_path) + ".agg").read_text(encoding="utf-8").splitlines()
+
+        self.assertLess(len(linhas), 1024)
+        self.assertEqual(
+            PedidoRepositoryArquivo(str(self.arquivo_path))
+            .agregado_cliente("11111111000199")
+            .pedidos,
+            1100,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
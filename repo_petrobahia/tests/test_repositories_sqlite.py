@@ -0,0 +1,201 @@
+"""Testes para os repositórios SQLite usando unittest."""
+
+import sqlite3
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.item_pedido import ItemPedido
+from src.domain.models.pedido import Pedido
+from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.produto_factory import ProdutoFactory
+from src.main import criar_repositorios
+from src.repositories.cliente_repository import ClienteRepositoryArquivo
+from src.repositories.cliente_repository_sqlite import ClienteRepositorySQLite
+from src.repositories.importar_sqlite import importar
+from src.repositories.pedido_repository import PedidoRepositoryArquivo
+from src.repositories.pedido_repository_sqlite import PedidoRepositorySQLite
+
+
+def _pedido(cnpj: str, quantidade: int = 100, cupom: str | None = None) -> Pedido:
+    catalogo = ProdutoFactory.criar_catalogo_padrao()
+    cliente = Cliente(email=f"{cnpj}@empresa.com", nome=f"Empresa {cnpj}", cnpj=cnpj)
+    itens = [
+        ItemPedido(catalogo["diesel"], quantidade, CupomFactory.criar(cupom)),
+        ItemPedido(catalogo["etanol"], 10, CupomFactory.criar(None)),
+    ]
+    return Pedido(cliente=cliente, itens=itens)
+
+
+class TestClienteRepositorySQLite(unittest.TestCase):
+    """Testes para ClienteRepositorySQLite."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.banco = Path(self.temp_dir.name) / "teste.db"
+        self.repository = ClienteRepositorySQLite(self.banco)
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.repository.close()
+        self.temp_dir.cleanup()
+
+    def test_salvar_e_buscar_por_cnpj(self):
+        """Deve buscar o cliente salvo pelo CNPJ."""
+        self.repository.salvar(Cliente("a@empresa.com", "Empresa A", "11111111000199"))
+
+        cliente = self.repository.buscar_por_cnpj("11111111000199")
+
+        self.assertEqual(cliente.nome, "Empresa A")
+        self.assertIsNone(self.repository.buscar_por_cnpj("99999999000199"))
+
+    def test_buscar_por_cnpj_retorna_mais_recente(self):
+        """Deve retornar o último registro do CNPJ, como no arquivo."""
+        self.repository.salvar(Cliente("a@empresa.com", "Antigo", "11111111000199"))
+        self.repository.salvar(Cliente("a@empresa.com", "Novo", "11111111000199"))
+
+        self.assertEqual(self.repository.buscar_por_cnpj("11111111000199").nome, "Novo")
+
+    def test_salvar_lote_e_listar(self):
+        """Deve gravar o lote e listar na ordem de gravação."""
+        clientes = [Cliente(f"c{i}@empresa.com", f"Empresa {i}", f"{i:014d}") for i in range(5)]
+
+        self.assertEqual(self.repository.salvar_lote(clientes), 5)
+
+        self.assertEqual([c.cnpj for c in self.repository.listar()], [c.cnpj for c in clientes])
+
+    def test_banco_em_wal_com_indice_de_cnpj(self):
+        """Deve abrir o banco em WAL e indexar o CNPJ."""
+        conexao = sqlite3.connect(self.banco)
+        try:
+            (modo,) = conexao.execute("PRAGMA journal_mode").fetchone()
+            indices = {linha[1] for linha in conexao.execute("PRAGMA index_list(clientes)")}
+        finally:
+            conexao.close()
+
+        self.assertEqual(modo, "wal")
+        self.assertIn("ix_clientes_cnpj", indices)
+
+
+class TestPedidoRepositorySQLite(unittest.TestCase):
+    """Testes para PedidoRepositorySQLite."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.banco = Path(self.temp_dir.name) / "teste.db"
+        self.repository = PedidoRepositorySQLite(self.banco)
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.repository.close()
+        self.temp_dir.cleanup()
+
+    def test_salvar_e_buscar_por_cliente(self):
+        """Deve buscar só os pedidos do CNPJ, com todos os itens."""
+        self.repository.salvar(_pedido("11111111000199", 100))
+        self.repository.salvar(_pedido("22222222000199", 200))
+        self.repository.salvar(_pedido("11111111000199", 300))
+
+        pedidos = self.repository.buscar_por_cliente("11111111000199")
+
+        self.assertEqual([p.itens[0].quantidade for p in pedidos], [100, 300])
+        self.assertEqual([i.produto.tipo for i in pedidos[0].itens], ["diesel", "etanol"])
+        self.assertEqual(self.repository.buscar_por_cliente("99999999000199"), [])
+
+    def test_salvar_lote(self):
+        """Deve gravar o lote numa transação e numerar os pedidos em sequência."""
+        self.repository.salvar(_pedido("11111111000199"))
+
+        total = self.repository.salvar_lote([_pedido(f"{i:014d}") for i in range(3)])
+
+        self.assertEqual(total, 3)
+        self.assertEqual(len(list(self.repository.iterar_registros())), 4)
+
+    def test_registros_preservam_valores_gravados(self):
+        """Deve devolver os valores persistidos, inclusive o cupom."""
+        pedido = _pedido("11111111000199", 1200, "MEGA10")
+        self.repository.salvar(pedido)
+
+        (registro,) = self.repository.iterar_registros()
+
+        self.assertEqual(registro["preco_total"], pedido.preco_total)
+        self.assertEqual(registro["itens"][0]["cupom_codigo"], "MEGA10")
+        self.assertEqual(registro["itens"][0]["desconto_cupom"], pedido.itens[0].desconto_cupom)
+
+    def test_buscar_preserva_cupom_e_hidrata_visoes(self):
+        """Deve hidratar pedidos com o cupom gravado, como Pedido ou como view."""
+        pedido = _pedido("11111111000199", 1200, "MEGA10")
+        self.repository.salvar(pedido)
+
+        (lido,) = self.repository.buscar_por_cliente("11111111000199")
+        with PedidoRepositorySQLite(self.banco, hidratacao="visao") as repository:
+            (view,) = repository.buscar_por_cliente("11111111000199")
+
+        self.assertEqual(lido.itens[0].cupom.codigo, "MEGA10")
+        self.assertEqual(lido.preco_total, pedido.preco_total)
+        self.assertEqual(view.itens[0].cupom_codigo, "MEGA10")
+        self.assertEqual(view.preco_total, pedido.preco_total)
+        self.assertEqual(view.cliente, pedido.cliente)
+
+    def test_dados_visiveis_em_nova_conexao(self):
+        """Deve persistir os pedidos para outras conexões ao banco."""
+        self.repository.salvar(_pedido("11111111000199"))
+
+        with PedidoRepositorySQLite(self.banco) as outro:
+            self.assertEqual(len(outro.buscar_por_cliente("11111111000199")), 1)
+
+
+class TestImportacaoSQLite(unittest.TestCase):
+    """Testes para a carga dos arquivos no banco SQLite."""
+
+    def setUp(self):
+        """Configuração antes de cada teste."""
+        self.temp_dir = TemporaryDirectory()
+        self.diretorio = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def test_importar_arquivos(self):
+        """Deve copiar clientes e pedidos com os mesmos valores dos arquivos."""
+        clientes_txt = self.diretorio / "clientes.txt"
+        pedidos_txt = self.diretorio / "pedidos.txt"
+        cliente_arquivo = ClienteRepositoryArquivo(str(clientes_txt))
+        pedido_arquivo = PedidoRepositoryArquivo(str(pedidos_txt))
+        for i in range(5):
+            cliente_arquivo.salvar(Cliente(f"c{i}@empresa.com", f"Empresa {i}", f"{i % 2:014d}"))
+            pedido_arquivo.salvar(_pedido(f"{i % 2:014d}", 100 + i, "NOVO5"))
+        banco = self.diretorio / "teste.db"
+
+        totais = importar(banco, clientes_txt, pedidos_txt, tamanho_lote=2)
+
+        self.assertEqual(totais, (5, 5))
+        with (
+            ClienteRepositorySQLite(banco) as cliente_sqlite,
+            PedidoRepositorySQLite(banco) as pedido_sqlite,
+        ):
+            self.assertEqual(cliente_sqlite.buscar_por_cnpj(f"{0:014d}").nome, "Empresa 4")
+            self.assertEqual(
+                list(pedido_sqlite.iterar_registros()), list(pedido_arquivo.iterar_registros())
+            )
+
+    def test_importar_arquivo_inexistente(self):
+        """Deve recusar arquivo de origem inexistente."""
+        with self.assertRaises(ValueError):
+            importar(self.diretorio / "teste.db", clientes=self.diretorio / "nao_existe.txt")
+
+    def test_repositorio_selecionavel_no_main(self):
+        """Deve instanciar os repositórios SQLite pelo nome."""
+        cliente_repo, pedido_repo = criar_repositorios("sqlite", str(self.diretorio / "teste.db"))
+        try:
+            self.assertIsInstance(cliente_repo, ClienteRepositorySQLite)
+            self.assertIsInstance(pedido_repo, PedidoRepositorySQLite)
+        finally:
+            cliente_repo.close()
+            pedido_repo.close()
+        with self.assertRaises(ValueError):
+            criar_repositorios("postgres")
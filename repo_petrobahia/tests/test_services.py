@@ -14,6 +14,8 @@ from src.domain.policies.cupom import (
 )
 from src.domain.policies.desconto.politica_desconto_produto_none import PoliticaDescontoProdutoNone
 from src.domain.services.cupom_factory import CupomFactory
+from src.domain.services.montagem_pedido import MontadorPedido
+from src.domain.services.precificacao_lote import PrecificadorLote
 from src.domain.services.produto_factory import ProdutoFactory
 from src.domain.services.validar_pedido import ValidadorPedido
 
@@ -109,3 +111,100 @@ class TestValidadorPedido:
 
         with pytest.raises(ValidationError, match="Pedido deve ter no mínimo 1 item"):
             ValidadorPedido.validar(pedido)
+
+
+class TestMontadorPedido:
+    """Testes para MontadorPedido."""
+
+    def test_montar_precifica_e_valida(self):
+        """Deve montar o pedido com os itens precificados."""
+        cliente = Cliente(email="teste@empresa.com", nome="Cliente Teste", cnpj="12345678000199")
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+
+        pedido = MontadorPedido.montar(
+            cliente, [{"produto_tipo": "diesel", "quantidade": 100}], catalogo
+        )
+
+        assert pedido.cliente is cliente
+        assert pedido.preco_total == 550.0
+
+    def test_montar_produto_inexistente(self):
+        """Deve rejeitar produto fora do catálogo."""
+        cliente = Cliente(email="teste@empresa.com", nome="Cliente Teste", cnpj="12345678000199")
+
+        with pytest.raises(ValueError, match="não encontrado"):
+            MontadorPedido.montar(cliente, [{"produto_tipo": "querosene", "quantidade": 1}], {})
+
+
+class TestPrecificadorLote:
+    """Testes para precificação em lote."""
+
+    def test_lote_igual_a_item_pedido(self):
+        """Deve reproduzir exatamente os valores calculados por ItemPedido."""
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        tipos, qtds, cupons = [], [], []
+        for tipo in catalogo:
+            for quantidade in (1, 80, 81, 200, 201, 500, 501, 1000, 1001, 1200):
+                for codigo in (None, "MEGA10", "NOVO5", "LUB2", "INVALIDO"):
+                    tipos.append(tipo)
+                    qtds.append(quantidade)
+                    cupons.append(codigo)
+
+        resultado = PrecificadorLote.precificar(tipos, qtds, cupons, catalogo)
+
+        assert len(resultado) == len(tipos)
+        for i, (tipo, quantidade, codigo) in enumerate(zip(tipos, qtds, cupons)):
+            item = ItemPedido(
+                produto=catalogo[tipo], quantidade=quantidade, cupom=CupomFactory.criar(codigo)
+            )
+            assert resultado.preco_bruto[i] == item.preco_bruto
+            assert resultado.desconto_produto[i] == item.desconto_produto
+            assert resultado.desconto_cupom[i] == item.desconto_cupom
+            assert resultado.preco_final[i] == item.preco_final
+
+    def test_lote_conta_um_uso_de_cupom_por_item(self):
+        """Deve contar os usos de cupom como a precificação item a item."""
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        tipos = ["diesel"] * 1000 + ["lubrificante", "etanol", "diesel"]
+        qtds = [600] * len(tipos)
+        cupons = ["MEGA10"] * 1000 + ["LUB2", "INVALIDO", None]
+
+        def contar(precificar) -> tuple[dict[str, int], int]:
+            registro = CupomFactory.configurar_cupons(intervalo_verificacao=None)
+            precificar()
+            return registro.usos(), registro.invalidos
+
+        anterior = CupomFactory._registro
+        try:
+            por_item = contar(
+                lambda: [
+                    ItemPedido(catalogo[tipo], qtd, CupomFactory.criar(codigo))
+                    for tipo, qtd, codigo in zip(tipos, qtds, cupons)
+                ]
+            )
+            lote = contar(lambda: PrecificadorLote.precificar(tipos, qtds, cupons, catalogo))
+            itens = contar(lambda: PrecificadorLote.precificar_itens(tipos, qtds, cupons, catalogo))
+        finally:
+            CupomFactory._registro = anterior
+
+        assert por_item == ({"MEGA10": 1000, "NOVO5": 0, "LUB2": 1}, 1)
+        assert lote == por_item
+        assert itens == por_item
+
+    def test_lote_produto_inexistente(self):
+        """Deve rejeitar produto fora do catálogo."""
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        with pytest.raises(ValueError, match="não encontrado"):
+            PrecificadorLote.precificar(["querosene"], [10], [None], catalogo)
+
+    def test_lote_colunas_desalinhadas(self):
+        """Deve rejeitar colunas de tamanhos diferentes."""
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        with pytest.raises(ValueError, match="mesmo tamanho"):
+            PrecificadorLote.precificar(["diesel", "etanol"], [10], [None, None], catalogo)
+
+    def test_lote_quantidade_invalida(self):
+        """Deve rejeitar quantidade zero ou negativa."""
+        catalogo = ProdutoFactory.criar_catalogo_padrao()
+        with pytest.raises(ValueError, match="Quantidade deve ser positiva"):
+            PrecificadorLote.precificar(["diesel"], [0], [None], catalogo)
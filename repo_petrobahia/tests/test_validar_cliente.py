@@ -1,9 +1,10 @@
 """Testes unitários para validação de clientes usando unittest."""
 
+import random
 import unittest
 
 from src.domain.exceptions import ValidationError
-from src.domain.services.validar_cliente import ClienteValidator
+from src.domain.services.validar_cliente import ClienteValidator, ErroCliente
 
 
 class TestClienteValidator(unittest.TestCase):
@@ -32,11 +33,24 @@ class TestClienteValidator(unittest.TestCase):
             ClienteValidator.validar_email("")
 
     def test_validar_cnpj_valido(self):
-        """Deve aceitar CNPJ não vazio."""
-        try:
-            ClienteValidator.validar_cnpj("12.345.678/0001-90")
-        except ValidationError:
-            self.fail("CNPJ válido não deveria lançar exceção")
+        """Deve aceitar CNPJ com dígitos verificadores corretos, com ou sem pontuação."""
+        for cnpj in ("12.345.678/0001-95", "11222333000181", " 04.252.011/0001-10 "):
+            try:
+                ClienteValidator.validar_cnpj(cnpj)
+            except ValidationError:
+                self.fail(f"CNPJ válido {cnpj} não deveria lançar exceção")
+
+    def test_validar_cnpj_digito_errado(self):
+        """Deve rejeitar CNPJ cujo dígito verificador não confere."""
+        for cnpj in ("12.345.678/0001-90", "11222333000182", "11111111111111"):
+            with self.assertRaises(ValidationError):
+                ClienteValidator.validar_cnpj(cnpj)
+
+    def test_validar_cnpj_formato(self):
+        """Deve rejeitar CNPJ sem 14 dígitos."""
+        for cnpj in ("1", "12.345.678/0001-9", "12.345.678/0001-955", "12.345.678/0001-9x"):
+            with self.assertRaises(ValidationError):
+                ClienteValidator.validar_cnpj(cnpj)
 
     def test_validar_cnpj_vazio(self):
         """Deve rejeitar CNPJ vazio."""
@@ -49,5 +63,77 @@ class TestClienteValidator(unittest.TestCase):
             ClienteValidator.validar_cnpj(None)
 
 
+class TestValidarLote(unittest.TestCase):
+    """Testes para ClienteValidator.validar_lote."""
+
+    def test_erros_por_linha(self):
+        """Deve apontar os erros de cada linha sem parar na primeira falha."""
+        resultado = ClienteValidator.validar_lote(
+            ["a@b.com", "", "sem-arroba", "c@d.com", "e@f.com", None],
+            [
+                "12.345.678/0001-95",
+                "11222333000181",
+                None,
+                "123",
+                "11222333000182",
+                "00000000000000",
+            ],
+        )
+
+        self.assertEqual(
+            list(resultado.erros),
+            [
+                0,
+                ErroCliente.EMAIL_VAZIO,
+                ErroCliente.EMAIL_FORMATO | ErroCliente.CNPJ_VAZIO,
+                ErroCliente.CNPJ_FORMATO,
+                ErroCliente.CNPJ_DIGITO,
+                ErroCliente.EMAIL_VAZIO | ErroCliente.CNPJ_DIGITO,
+            ],
+        )
+        self.assertEqual(resultado.validos(), [0])
+        self.assertEqual(
+            resultado.cnpjs,
+            ["12345678000195", "11222333000181", None, None, "11222333000182", "00000000000000"],
+        )
+        self.assertEqual(resultado.mensagens(0), [])
+        self.assertEqual(resultado.mensagens(2), ["Email inválido.", "CNPJ inválido."])
+
+    def test_confere_com_validacao_individual(self):
+        """Deve concordar com validar_cnpj em CNPJs aleatórios."""
+        aleatorio = random.Random(7)
+        cnpjs = [f"{aleatorio.randrange(10**14):014d}" for _ in range(2000)]
+        cnpjs += [c[:12] + _digitos(c[:12]) for c in cnpjs[:500]]
+        cnpjs.append("12\n345678000195")
+
+        resultado = ClienteValidator.validar_lote(["a@b.com"] * len(cnpjs), cnpjs)
+
+        for cnpj, erro in zip(cnpjs, resultado.erros):
+            try:
+                ClienteValidator.validar_cnpj(cnpj)
+                valido = True
+            except ValidationError:
+                valido = False
+            self.assertEqual(valido, not erro, cnpj)
+        self.assertGreaterEqual(len(resultado.validos()), 500)
+
+    def test_colunas_de_tamanhos_diferentes(self):
+        """Deve rejeitar colunas desalinhadas."""
+        with self.assertRaises(ValueError):
+            ClienteValidator.validar_lote(["a@b.com"], [])
+
+    def test_lote_vazio(self):
+        """Deve aceitar lote vazio."""
+        self.assertEqual(len(ClienteValidator.validar_lote([], [])), 0)
+
+
+def _digitos(base: str) -> str:
+    """Dígitos verificadores calculados pela definição (referência dos testes)."""
+    for pesos in ((5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)):
+        resto = sum(int(d) * p for d, p in zip(base, pesos)) % 11
+        base += str(0 if resto < 2 else 11 - resto)
+    return base[12:]
+
+
 if __name__ == "__main__":
     unittest.main()